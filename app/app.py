@@ -1,22 +1,42 @@
+import time
+
+# Отметка начала импорта модуля (для измерения времени старта)
+_IMPORT_STARTED = time.perf_counter()
+
 from flask import Flask, jsonify
 from flask_restful import Api
 from database.db import db, init_db
-from resources.item_resource import ItemListResource, ItemResource
+from database.group_commit import init_group_commit
+from database.sharding import init_sharding
+from metrics import metrics, init_process_metrics
+from middleware import init_tracing, init_rate_limiting, init_load_shedding, init_request_metrics
+from health import init_health_checks
+from models.item import Item
+from resources.item_resource import ItemListResource, ItemResource, ItemBulkResource
+from schemas.item_schema import ItemSchema
 from config import config
 import logging
 import os
 from datetime import datetime
 
-# Настройка логирования
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
+# Время импорта модуля вместе с зависимостями
+_IMPORT_SECONDS = time.perf_counter() - _IMPORT_STARTED
+
 logger = logging.getLogger(__name__)
 
+def configure_logging():
+    """Настройка логирования (выполняется при создании приложения, а не при импорте)."""
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    )
+
 def create_app(config_name=None):
     """Фабрика приложений Flask."""
     
+    started = time.perf_counter()
+    configure_logging()
+    
     if config_name is None:
         config_name = os.getenv('FLASK_ENV', 'development')
     
@@ -27,6 +47,13 @@ def create_app(config_name=None):
     
     # Инициализация расширений
     init_db(app)
+    init_sharding(app, Item)
+    init_group_commit(app, Item, ItemSchema().dump)
+    init_tracing(app)
+    init_rate_limiting(app)
+    init_load_shedding(app)
+    init_request_metrics(app)
+    init_process_metrics(app)
     
     # Настройка API
     api = Api(app)
@@ -34,6 +61,7 @@ def create_app(config_name=None):
     # Регистрация ресурсов
     api.add_resource(ItemListResource, '/api/items')
     api.add_resource(ItemResource, '/api/items/<int:item_id>')
+    api.add_resource(ItemBulkResource, '/api/items/bulk')
     
     # Health check эндпоинт
     @app.route('/health')
@@ -44,6 +72,14 @@ def create_app(config_name=None):
             'environment': config_name
         })
     
+    # Проверки готовности с обращением к БД (/ready, /health/deep)
+    init_health_checks(app)
+    
+    # Метрики процесса (размеры пачек группового коммита и т.п.)
+    @app.route('/metrics')
+    def metrics_snapshot():
+        return jsonify(metrics.snapshot())
+    
     # Обработчик ошибок 404
     @app.errorhandler(404)
     def not_found(error):
@@ -55,12 +91,24 @@ def create_app(config_name=None):
         db.session.rollback()
         return jsonify({'error': 'Internal server error'}), 500
     
+    # Время старта: импорт модуля и создание приложения
+    create_seconds = time.perf_counter() - started
+    metrics.register_gauge('startup.import_seconds', lambda: _IMPORT_SECONDS)
+    metrics.register_gauge('startup.create_app_seconds', lambda: create_seconds)
+    
     logger.info(f"✅ Application started in {config_name} mode")
     logger.info(f"   Database: {app.config['SQLALCHEMY_DATABASE_URI']}")
+    logger.info(f"   Startup: import {_IMPORT_SECONDS * 1000:.0f}ms, create_app {create_seconds * 1000:.0f}ms")
     
     return app
 
-app = create_app()
+def __getattr__(name):
+    """Ленивое создание приложения при первом обращении к `app` (например, `gunicorn app:app`)."""
+    if name == 'app':
+        application = create_app()
+        globals()['app'] = application
+        return application
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 if __name__ == '__main__':
-    app.run(host='0.0.0.0', port=5000, debug=True)
\ No newline at end of file
+    create_app().run(host='0.0.0.0', port=5000, debug=True)
\ No newline at end of file
@@ -3,6 +3,10 @@ from dotenv import load_dotenv
 
 load_dotenv()
 
+def _split_list(value):
+    """Разбор списка из переменной окружения (через запятую)."""
+    return [part.strip() for part in (value or '').split(',') if part.strip()]
+
 class Config:
     """Базовый класс конфигурации."""
     
@@ -11,6 +15,56 @@ class Config:
     JSON_SORT_KEYS = False
     JSON_AS_ASCII = False  # Для поддержки кириллицы
     MAX_CONTENT_LENGTH = 16 * 1024 * 1024  # 16MB max request size
+    
+    # Быстрый старт: без create_all и Flask-Migrate при запуске воркера,
+    # схема создается заранее командой `python manage.py migrate`
+    FAST_STARTUP = os.getenv('FAST_STARTUP', 'false').lower() == 'true'
+    
+    # Шардирование таблицы товаров: каждый URL - отдельный шард (bind shard_N),
+    # основная БД хранит последовательность ID
+    SHARD_DATABASE_URLS = _split_list(os.getenv('SHARD_DATABASE_URLS'))
+    SQLALCHEMY_BINDS = {f'shard_{index}': url for index, url in enumerate(SHARD_DATABASE_URLS)}
+    SHARD_STRATEGY = os.getenv('SHARD_STRATEGY', 'hash')  # hash | range
+    SHARD_RANGE_SIZE = int(os.getenv('SHARD_RANGE_SIZE', '1000000'))
+    SHARD_ID_BLOCK_SIZE = int(os.getenv('SHARD_ID_BLOCK_SIZE', '100'))
+    # Наибольшее смещение (page - 1) * per_page в шардированном режиме: дальше - курсор after_id
+    SHARD_MAX_OFFSET = int(os.getenv('SHARD_MAX_OFFSET', '10000'))
+    
+    # Групповой коммит при создании товаров (write-behind batching)
+    GROUP_COMMIT_ENABLED = os.getenv('GROUP_COMMIT_ENABLED', 'false').lower() == 'true'
+    GROUP_COMMIT_MAX_BATCH = int(os.getenv('GROUP_COMMIT_MAX_BATCH', '50'))
+    GROUP_COMMIT_MAX_DELAY_MS = float(os.getenv('GROUP_COMMIT_MAX_DELAY_MS', '5'))
+    GROUP_COMMIT_TIMEOUT = float(os.getenv('GROUP_COMMIT_TIMEOUT', '10'))
+    
+    # Максимальный размер пачки при массовом создании товаров (POST /api/items/bulk)
+    BULK_MAX_ITEMS = int(os.getenv('BULK_MAX_ITEMS', '1000'))
+    
+    # Ограничение частоты запросов (token bucket), запросов в секунду
+    RATE_LIMIT_ENABLED = os.getenv('RATE_LIMIT_ENABLED', 'false').lower() == 'true'
+    RATE_LIMIT_PER_CLIENT = float(os.getenv('RATE_LIMIT_PER_CLIENT', '50'))
+    RATE_LIMIT_PER_CLIENT_BURST = float(os.getenv('RATE_LIMIT_PER_CLIENT_BURST', '100'))
+    RATE_LIMIT_GLOBAL = float(os.getenv('RATE_LIMIT_GLOBAL', '500'))
+    RATE_LIMIT_GLOBAL_BURST = float(os.getenv('RATE_LIMIT_GLOBAL_BURST', '1000'))
+    RATE_LIMIT_CLIENT_HEADER = os.getenv('RATE_LIMIT_CLIENT_HEADER')  # например, X-Forwarded-For
+    
+    # Сброс нагрузки (503) при перегрузке воркера
+    LOAD_SHEDDING_ENABLED = os.getenv('LOAD_SHEDDING_ENABLED', 'false').lower() == 'true'
+    LOAD_SHEDDING_MAX_IN_FLIGHT = int(os.getenv('LOAD_SHEDDING_MAX_IN_FLIGHT', '64'))
+    LOAD_SHEDDING_MAX_POOL_UTILIZATION = float(os.getenv('LOAD_SHEDDING_MAX_POOL_UTILIZATION', '0.9'))
+    LOAD_SHEDDING_RETRY_AFTER = int(os.getenv('LOAD_SHEDDING_RETRY_AFTER', '1'))
+    
+    # Проверки готовности (/ready, /health/deep)
+    HEALTH_DB_TIMEOUT = float(os.getenv('HEALTH_DB_TIMEOUT', '1.0'))  # секунды
+    HEALTH_CACHE_TTL = float(os.getenv('HEALTH_CACHE_TTL', '2.0'))  # секунды
+    HEALTH_MAX_POOL_UTILIZATION = float(os.getenv('HEALTH_MAX_POOL_UTILIZATION', '0.95'))
+    HEALTH_P99_BUDGET_MS = float(os.getenv('HEALTH_P99_BUDGET_MS', '1000'))
+    HEALTH_MIN_SAMPLES = int(os.getenv('HEALTH_MIN_SAMPLES', '20'))
+    HEALTH_LATENCY_WINDOW = float(os.getenv('HEALTH_LATENCY_WINDOW', '60'))  # секунды
+    
+    # Трассировка запросов: X-Request-ID, спаны в Server-Timing и/или в локальном файле (JSON Lines)
+    TRACING_ENABLED = os.getenv('TRACING_ENABLED', 'true').lower() == 'true'
+    TRACE_SERVER_TIMING = os.getenv('TRACE_SERVER_TIMING', 'true').lower() == 'true'
+    TRACE_SINK_FILE = os.getenv('TRACE_SINK_FILE', '')
 
 class DevelopmentConfig(Config):
     """Конфигурация для разработки."""
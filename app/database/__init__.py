@@ -1,4 +1,7 @@
 # Инициализация пакета database
-from .db import db, init_db
+from .db import db, init_db, init_migrate, pool_status
+from .group_commit import GroupCommitter, GroupCommitTimeout, init_group_commit
+from .sharding import ShardedItemStore, ShardPageTooDeep, get_item_shards, init_sharding
 
-__all__ = ['db', 'init_db']
\ No newline at end of file
+__all__ = ['db', 'init_db', 'init_migrate', 'pool_status', 'GroupCommitter', 'GroupCommitTimeout', 'init_group_commit',
+           'ShardedItemStore', 'ShardPageTooDeep', 'get_item_shards', 'init_sharding']
\ No newline at end of file
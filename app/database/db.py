@@ -1,14 +1,52 @@
+import os
 from flask_sqlalchemy import SQLAlchemy
-from flask_migrate import Migrate
 
 db = SQLAlchemy()
-migrate = Migrate()
+
+# Каталог миграций Alembic
+MIGRATIONS_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'migrations')
+
+def init_migrate(app):
+    """Подключение Flask-Migrate (тяжелый импорт alembic выполняется только здесь)."""
+    from flask_migrate import Migrate
+    return Migrate(app, db, directory=MIGRATIONS_DIR)
 
 def init_db(app):
     """Инициализация базы данных."""
     db.init_app(app)
-    migrate.init_app(app, db)
     
+    # Быстрый старт: схема создается разовой командой `python manage.py migrate`,
+    # а не create_all при запуске каждого воркера
+    if app.config.get('FAST_STARTUP'):
+        return
+    
+    init_migrate(app)
+    
+    # Только bind'ы этого приложения: метаданные bind'ов хранятся в общем db
+    # и остаются от других приложений процесса (например, с другим числом шардов)
     with app.app_context():
-        db.create_all()
-        print("✅ Database tables created/verified")
\ No newline at end of file
+        db.create_all(bind_key=list(db.engines))
+        print("✅ Database tables created/verified")
+
+def pool_status(engine):
+    """
+    Состояние пула соединений движка.
+    
+    Для пулов без ограничения размера (NullPool, StaticPool и т.п.)
+    возвращается только тип пула.
+    """
+    pool = engine.pool
+    status = {'pool': type(pool).__name__}
+    
+    if not hasattr(pool, 'checkedout') or not hasattr(pool, 'size'):
+        return status
+    
+    capacity = pool.size() + max(getattr(pool, '_max_overflow', 0), 0)
+    checked_out = pool.checkedout()
+    status.update({
+        'size': pool.size(),
+        'checked_out': checked_out,
+        'capacity': capacity,
+        'utilization': checked_out / capacity if capacity else 0.0
+    })
+    return status
\ No newline at end of file
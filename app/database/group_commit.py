@@ -0,0 +1,189 @@
+import logging
+import os
+import queue
+import threading
+import time
+from database.db import db
+from metrics import metrics
+
+logger = logging.getLogger(__name__)
+
+# Состояния записи: в очереди, взята в пачку фоновым потоком, снята с очереди по таймауту
+QUEUED, CLAIMED, CANCELLED = 'queued', 'claimed', 'cancelled'
+
+
+class GroupCommitTimeout(TimeoutError):
+    """Запись не попала в пачку за timeout секунд и снята с очереди: в БД ее нет, запрос можно повторить."""
+
+
+class _PendingWrite:
+    """Запись, ожидающая группового коммита."""
+    
+    __slots__ = ('data', 'done', 'result', 'error', 'state')
+    
+    def __init__(self, data):
+        self.data = data
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+        self.state = QUEUED
+
+
+class GroupCommitter:
+    """
+    Групповой коммит (write-behind batching) для создания записей.
+    
+    Конкурентные запросы внутри одного воркера ставятся в очередь,
+    фоновый поток сбрасывает их одной транзакцией каждые max_delay секунд
+    или при накоплении max_batch_size записей. Каждый вызывающий получает
+    свою сериализованную запись (с присвоенным ID).
+    
+    Если запись не взята в пачку за timeout секунд, она снимается с очереди
+    и submit выбрасывает GroupCommitTimeout: фоновый поток ее пропустит,
+    поэтому повтор запроса клиентом не создаст дубликат. Запись, уже
+    взятая в пачку, дожидается результата коммита.
+    """
+    
+    def __init__(self, app, factory, serializer, max_batch_size=50, max_delay=0.005, timeout=10.0):
+        self.app = app
+        self.factory = factory
+        self.serializer = serializer
+        self.max_batch_size = max_batch_size
+        self.max_delay = max_delay
+        self.timeout = timeout
+        self._lock = threading.Lock()
+        self._state_lock = threading.Lock()
+        self._queue = None
+        self._pid = None
+    
+    def _ensure_started(self):
+        """Ленивый запуск фонового потока (с учетом fork в gunicorn)."""
+        if self._pid == os.getpid():
+            return
+        with self._lock:
+            if self._pid == os.getpid():
+                return
+            self._queue = queue.Queue()
+            worker = threading.Thread(
+                target=self._run,
+                args=(self._queue,),
+                name='group-commit',
+                daemon=True
+            )
+            worker.start()
+            self._pid = os.getpid()
+    
+    def submit(self, data):
+        """Постановка записи в очередь и ожидание ее коммита."""
+        self._ensure_started()
+        pending = _PendingWrite(data)
+        self._queue.put(pending)
+        
+        if not pending.done.wait(self.timeout):
+            if self._transition(pending, CANCELLED):
+                metrics.inc('group_commit.timeouts')
+                raise GroupCommitTimeout(f"Group commit timed out after {self.timeout}s")
+            # Запись уже в сбрасываемой пачке: ответ должен соответствовать результату коммита
+            pending.done.wait()
+        if pending.error is not None:
+            raise pending.error
+        return pending.result
+    
+    def _transition(self, pending, state):
+        """Перевод записи из очереди в state; False, если ее уже взял поток или сняли с очереди."""
+        with self._state_lock:
+            if pending.state != QUEUED:
+                return False
+            pending.state = state
+            return True
+    
+    def _run(self, pending_queue):
+        """Цикл фонового потока: сбор пачки и ее сброс."""
+        while True:
+            batch = [pending_queue.get()]
+            deadline = time.monotonic() + self.max_delay
+            
+            while len(batch) < self.max_batch_size:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(pending_queue.get(timeout=remaining))
+                except queue.Empty:
+                    break
+            
+            # Записи, снятые с очереди по таймауту, не сбрасываются
+            batch = [pending for pending in batch if self._transition(pending, CLAIMED)]
+            if not batch:
+                continue
+            
+            try:
+                self._flush(batch)
+            except Exception as e:
+                logger.error(f"Group commit flush failed: {str(e)}")
+                for pending in batch:
+                    if pending.result is None and pending.error is None:
+                        pending.error = e
+            finally:
+                for pending in batch:
+                    pending.done.set()
+    
+    def _flush(self, batch):
+        """Сброс пачки одной транзакцией."""
+        started = time.perf_counter()
+        
+        with self.app.app_context():
+            try:
+                self._commit(batch)
+            except Exception as e:
+                db.session.rollback()
+                if len(batch) == 1:
+                    batch[0].error = e
+                    return
+                # Пачка откатилась целиком: повторяем поштучно,
+                # чтобы одна проблемная запись не роняла остальные
+                logger.warning(f"Group commit of {len(batch)} items failed, retrying one by one: {str(e)}")
+                metrics.inc('group_commit.fallbacks')
+                for pending in batch:
+                    try:
+                        self._commit([pending])
+                    except Exception as item_error:
+                        db.session.rollback()
+                        pending.error = item_error
+        
+        metrics.inc('group_commit.flushes')
+        metrics.observe('group_commit.batch_size', len(batch))
+        metrics.observe('group_commit.flush_seconds', time.perf_counter() - started)
+    
+    def _commit(self, batch):
+        """Вставка и коммит записей пачки, сериализация результатов."""
+        instances = [self.factory(**pending.data) for pending in batch]
+        db.session.add_all(instances)
+        db.session.commit()
+        
+        for pending, instance in zip(batch, instances):
+            pending.result = self.serializer(instance)
+
+
+def init_group_commit(app, factory, serializer):
+    """Включение группового коммита, если он разрешен конфигурацией."""
+    if not app.config.get('GROUP_COMMIT_ENABLED'):
+        return None
+    
+    # В шардированном режиме записи распределяются по разным БД,
+    # общий коммит пачки невозможен
+    if 'item_shards' in app.extensions:
+        print("⚠️ Group commit is not supported with sharding, disabled")
+        return None
+    
+    committer = GroupCommitter(
+        app,
+        factory,
+        serializer,
+        max_batch_size=app.config['GROUP_COMMIT_MAX_BATCH'],
+        max_delay=app.config['GROUP_COMMIT_MAX_DELAY_MS'] / 1000,
+        timeout=app.config['GROUP_COMMIT_TIMEOUT']
+    )
+    app.extensions['group_commit'] = committer
+    print(f"✅ Group commit enabled (batch={committer.max_batch_size}, delay={committer.max_delay * 1000:.1f}ms)")
+    return committer
\ No newline at end of file
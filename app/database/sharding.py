@@ -0,0 +1,250 @@
+import heapq
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from flask import current_app
+from flask.globals import app_ctx
+from sqlalchemy import Column, Integer, MetaData, String, Table, delete, func, select, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session, scoped_session, sessionmaker
+from database.db import db
+
+# Таблица блоков ID хранится в основной БД (координатор шардов)
+id_metadata = MetaData()
+id_blocks = Table(
+    'id_blocks',
+    id_metadata,
+    Column('name', String(50), primary_key=True),
+    Column('next_value', Integer, nullable=False)
+)
+
+
+class ShardPageTooDeep(ValueError):
+    """Страница списка дальше SHARD_MAX_OFFSET: ее нужно запрашивать курсором after_id."""
+
+
+def shard_bind_key(index):
+    """Ключ bind для шарда с номером index."""
+    return f'shard_{index}'
+
+
+class IdAllocator:
+    """
+    Выделение ID без коллизий между воркерами (схема HiLo).
+    
+    Воркер атомарно резервирует в основной БД блок из block_size
+    идентификаторов и раздает их локально, обращаясь к БД только
+    при исчерпании блока.
+    """
+    
+    def __init__(self, engine, name, block_size=100):
+        self.engine = engine
+        self.name = name
+        self.block_size = block_size
+        self._lock = threading.Lock()
+        self._next = 0
+        self._limit = 0
+    
+    def ensure_sequence(self, start):
+        """Создание строки последовательности (если ее еще нет)."""
+        id_metadata.create_all(self.engine)
+        try:
+            with self.engine.begin() as connection:
+                exists = connection.execute(
+                    select(id_blocks.c.name).where(id_blocks.c.name == self.name)
+                ).first()
+                if exists is None:
+                    connection.execute(id_blocks.insert().values(name=self.name, next_value=start))
+        except IntegrityError:
+            # Строку параллельно создал другой воркер
+            pass
+    
+    def _reserve_block(self):
+        with self.engine.begin() as connection:
+            connection.execute(
+                update(id_blocks)
+                .where(id_blocks.c.name == self.name)
+                .values(next_value=id_blocks.c.next_value + self.block_size)
+            )
+            end = connection.execute(
+                select(id_blocks.c.next_value).where(id_blocks.c.name == self.name)
+            ).scalar_one()
+        self._next = end - self.block_size
+        self._limit = end
+    
+    def next_id(self):
+        """Следующий свободный ID."""
+        with self._lock:
+            if self._next >= self._limit:
+                self._reserve_block()
+            value = self._next
+            self._next += 1
+            return value
+
+
+class ShardRouter:
+    """Выбор шарда по ID: по хэшу (остаток от деления) или по диапазону."""
+    
+    def __init__(self, shard_count, strategy='hash', range_size=1000000):
+        if strategy not in ('hash', 'range'):
+            raise ValueError(f"Unknown sharding strategy: {strategy}")
+        self.shard_count = shard_count
+        self.strategy = strategy
+        self.range_size = range_size
+    
+    def shard_for(self, item_id):
+        """Номер шарда для ID."""
+        if self.strategy == 'range':
+            return min(max(item_id - 1, 0) // self.range_size, self.shard_count - 1)
+        return item_id % self.shard_count
+
+
+class ShardedItemStore:
+    """
+    Шардированное хранилище товаров.
+    
+    Операции с конкретным товаром направляются в шард по item_id,
+    списки собираются со всех шардов параллельно (scatter-gather)
+    с объединением отсортированных по ID результатов.
+    """
+    
+    def __init__(self, app, model, shard_count, strategy, range_size, id_block_size, max_offset=10000):
+        self.app = app
+        self.model = model
+        self.max_offset = max_offset
+        self.router = ShardRouter(shard_count, strategy, range_size)
+        self.bind_keys = [shard_bind_key(i) for i in range(shard_count)]
+        
+        with app.app_context():
+            self.engines = [db.engines[key] for key in self.bind_keys]
+            default_engine = db.engines[None]
+        
+        # Сессии шардов живут в пределах контекста приложения (как db.session)
+        self.sessions = [
+            scoped_session(sessionmaker(bind=engine), scopefunc=lambda: id(app_ctx._get_current_object()))
+            for engine in self.engines
+        ]
+        self.allocator = IdAllocator(default_engine, model.__tablename__, id_block_size)
+        self._executor = ThreadPoolExecutor(max_workers=shard_count, thread_name_prefix='shard')
+    
+    def create_tables(self):
+        """Создание таблицы товаров в каждом шарде и последовательности ID."""
+        for engine in self.engines:
+            self.model.__table__.create(engine, checkfirst=True)
+        
+        # Новая последовательность продолжается после уже существующих ID
+        max_id = 0
+        for engine in self.engines:
+            with engine.connect() as connection:
+                max_id = max(max_id, connection.execute(select(func.max(self.model.id))).scalar() or 0)
+        self.allocator.ensure_sequence(max_id + 1)
+    
+    def allocate_id(self):
+        """Новый ID товара (без коллизий между воркерами и шардами)."""
+        return self.allocator.next_id()
+    
+    def session_for(self, item_id):
+        """Сессия шарда, в котором хранится товар."""
+        return self.sessions[self.router.shard_for(item_id)]()
+    
+    def add_all(self, items):
+        """
+        Добавление пачки товаров: ID выделяются заранее, каждый товар
+        попадает в сессию своего шарда. Возвращает затронутые сессии
+        (коммит выполняет вызывающий).
+        """
+        sessions = {}
+        for item in items:
+            item.id = self.allocate_id()
+            index = self.router.shard_for(item.id)
+            if index not in sessions:
+                sessions[index] = self.sessions[index]()
+            sessions[index].add(item)
+        return list(sessions.values())
+    
+    def _delete_shard(self, engine, criteria):
+        with engine.begin() as connection:
+            return connection.execute(delete(self.model).where(*criteria)).rowcount
+    
+    def delete_where(self, *criteria):
+        """Удаление товаров по условию во всех шардах параллельно; возвращает число удаленных."""
+        return sum(self._executor.map(
+            lambda engine: self._delete_shard(engine, criteria),
+            self.engines
+        ))
+    
+    def remove_sessions(self, exc=None):
+        """Закрытие сессий шардов в конце контекста приложения."""
+        for session in self.sessions:
+            session.remove()
+    
+    def _query_shard(self, engine, params, limit):
+        with Session(engine, expire_on_commit=False) as session:
+            query = self.model.apply_filters(session.query(self.model), params)
+            total = query.order_by(None).count()
+            items = query.order_by(self.model.id).limit(limit).all()
+            session.expunge_all()
+            return items, total
+    
+    def list_items(self, params):
+        """
+        Страница товаров со всех шардов.
+        
+        Каждый шард отдает первые page * per_page подходящих записей,
+        упорядоченных по ID; после слияния берется нужная страница.
+        Чтение растет с номером страницы (shard_count * page * per_page
+        строк), поэтому смещение ограничено max_offset (ShardPageTooDeep):
+        глубокие страницы читаются курсором after_id, для которого каждый
+        шард отдает не больше per_page записей (page с курсором отклоняет
+        ItemQuerySchema). Возвращает кортеж (items, total).
+        """
+        per_page = params['per_page']
+        if params.get('after_id') is not None:
+            page = 1
+        else:
+            page = params['page']
+            if (page - 1) * per_page > self.max_offset:
+                raise ShardPageTooDeep(
+                    f"Offset pagination is limited to {self.max_offset} items with sharding, use after_id"
+                )
+        limit = page * per_page
+        
+        results = list(self._executor.map(
+            lambda engine: self._query_shard(engine, params, limit),
+            self.engines
+        ))
+        
+        total = sum(shard_total for _, shard_total in results)
+        merged = heapq.merge(*(items for items, _ in results), key=lambda item: item.id)
+        page_items = list(merged)[(page - 1) * per_page:limit]
+        return page_items, total
+
+
+def get_item_shards():
+    """Шардированное хранилище текущего приложения (None, если шардирование выключено)."""
+    return current_app.extensions.get('item_shards')
+
+
+def init_sharding(app, model):
+    """Включение шардирования товаров, если заданы SHARD_DATABASE_URLS."""
+    shard_urls = app.config.get('SHARD_DATABASE_URLS') or []
+    if not shard_urls:
+        return None
+    
+    store = ShardedItemStore(
+        app,
+        model,
+        shard_count=len(shard_urls),
+        strategy=app.config['SHARD_STRATEGY'],
+        range_size=app.config['SHARD_RANGE_SIZE'],
+        id_block_size=app.config['SHARD_ID_BLOCK_SIZE'],
+        max_offset=app.config['SHARD_MAX_OFFSET']
+    )
+    app.extensions['item_shards'] = store
+    app.teardown_appcontext(store.remove_sessions)
+    
+    # При быстром старте таблицы шардов создает `python manage.py migrate`
+    if not app.config.get('FAST_STARTUP'):
+        store.create_tables()
+    
+    print(f"✅ Sharding enabled: {len(shard_urls)} shards ({store.router.strategy})")
+    return store
\ No newline at end of file
@@ -0,0 +1,4 @@
+# Инициализация пакета health
+from .checks import HealthChecker, init_health_checks
+
+__all__ = ['HealthChecker', 'init_health_checks']
\ No newline at end of file
@@ -0,0 +1,151 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeout
+from datetime import datetime
+from flask import jsonify
+from sqlalchemy import text
+from database.db import db, pool_status
+from metrics import metrics, percentile
+from middleware.request_metrics import REQUEST_LATENCY
+
+
+class HealthChecker:
+    """
+    Глубокая проверка готовности воркера к приему трафика.
+    
+    Проверяются соединение с БД (с таймаутом), заполненность пула
+    соединений и p99 времени ответа за последние latency_window секунд:
+    старые замеры не учитываются, поэтому после всплеска задержек воркер
+    снова становится готов, когда всплеск выходит из окна.
+    Результат кэшируется на cache_ttl секунд, поэтому частые пробы
+    оркестратора не создают дополнительной нагрузки на БД.
+    """
+    
+    def __init__(self, app, db_timeout=1.0, cache_ttl=2.0, max_pool_utilization=0.95,
+                 p99_budget_ms=1000.0, min_samples=20, latency_window=60.0, histogram=None):
+        self.app = app
+        self.db_timeout = db_timeout
+        self.cache_ttl = cache_ttl
+        self.max_pool_utilization = max_pool_utilization
+        self.p99_budget_ms = p99_budget_ms
+        self.min_samples = min_samples
+        self.latency_window = latency_window
+        # Гистограмма времени ответа (по умолчанию - общая гистограмма запросов из реестра)
+        self.histogram = histogram
+        self._lock = threading.Lock()
+        self._cached = None
+        self._cached_at = 0.0
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='health-db')
+        self._pending_ping = None
+    
+    def _ping_database(self):
+        with self.app.app_context():
+            for engine in db.engines.values():
+                with engine.connect() as connection:
+                    connection.execute(text('SELECT 1'))
+    
+    def check_database(self):
+        """Проверка соединения со всеми БД приложения с таймаутом."""
+        # Предыдущая проверка еще висит - БД не отвечает, новую не запускаем
+        if self._pending_ping is not None and not self._pending_ping.done():
+            return {'status': 'fail', 'error': 'Previous check still running'}
+        
+        started = time.perf_counter()
+        self._pending_ping = self._executor.submit(self._ping_database)
+        try:
+            self._pending_ping.result(timeout=self.db_timeout)
+        except FutureTimeout:
+            return {'status': 'fail', 'error': f"Timed out after {self.db_timeout}s"}
+        except Exception as e:
+            return {'status': 'fail', 'error': str(e)}
+        
+        return {'status': 'ok', 'latency_ms': round((time.perf_counter() - started) * 1000, 2)}
+    
+    def check_pool(self):
+        """Проверка заполненности пулов соединений."""
+        with self.app.app_context():
+            pools = {
+                str(bind_key or 'default'): pool_status(engine)
+                for bind_key, engine in db.engines.items()
+            }
+        
+        saturated = [
+            name for name, status in pools.items()
+            if status.get('utilization', 0.0) >= self.max_pool_utilization
+        ]
+        return {
+            'status': 'fail' if saturated else 'ok',
+            'max_utilization': self.max_pool_utilization,
+            'pools': pools
+        }
+    
+    def check_latency(self):
+        """Сравнение p99 времени ответа за последние latency_window секунд с бюджетом."""
+        histogram = self.histogram or metrics.histogram(REQUEST_LATENCY)
+        values = histogram.recent(self.latency_window)
+        p99 = percentile(values, 99)
+        result = {'budget_ms': self.p99_budget_ms, 'window_s': self.latency_window, 'samples': len(values)}
+        
+        # Мало данных в окне (только что запущенный или простаивающий воркер) - не отказываем в готовности
+        if p99 is None or len(values) < self.min_samples:
+            result['status'] = 'ok'
+            result['p99_ms'] = None if p99 is None else round(p99 * 1000, 2)
+            return result
+        
+        result['p99_ms'] = round(p99 * 1000, 2)
+        result['status'] = 'ok' if result['p99_ms'] <= self.p99_budget_ms else 'fail'
+        return result
+    
+    def run(self):
+        """Выполнение всех проверок (с кэшированием результата)."""
+        with self._lock:
+            now = time.monotonic()
+            if self._cached is not None and now - self._cached_at < self.cache_ttl:
+                return self._cached
+            
+            checks = {
+                'database': self.check_database(),
+                'pool': self.check_pool(),
+                'latency': self.check_latency()
+            }
+            ready = all(check['status'] == 'ok' for check in checks.values())
+            
+            self._cached = {
+                'status': 'ready' if ready else 'not_ready',
+                'timestamp': datetime.utcnow().isoformat(),
+                'checks': checks
+            }
+            self._cached_at = time.monotonic()
+            metrics.inc('health.checks_executed')
+            return self._cached
+
+
+def init_health_checks(app):
+    """Регистрация эндпоинтов /ready и /health/deep."""
+    checker = HealthChecker(
+        app,
+        db_timeout=app.config['HEALTH_DB_TIMEOUT'],
+        cache_ttl=app.config['HEALTH_CACHE_TTL'],
+        max_pool_utilization=app.config['HEALTH_MAX_POOL_UTILIZATION'],
+        p99_budget_ms=app.config['HEALTH_P99_BUDGET_MS'],
+        min_samples=app.config['HEALTH_MIN_SAMPLES'],
+        latency_window=app.config['HEALTH_LATENCY_WINDOW']
+    )
+    app.extensions['health_checker'] = checker
+    
+    @app.route('/ready')
+    def ready():
+        result = checker.run()
+        status_code = 200 if result['status'] == 'ready' else 503
+        return jsonify({
+            'status': result['status'],
+            'checks': {name: check['status'] for name, check in result['checks'].items()}
+        }), status_code
+    
+    @app.route('/health/deep')
+    def deep_health():
+        result = checker.run()
+        status_code = 200 if result['status'] == 'ready' else 503
+        return jsonify(result), status_code
+    
+    return checker
\ No newline at end of file
@@ -0,0 +1,63 @@
+"""
+Служебные команды приложения.
+    
+    python manage.py migrate      - применение миграций (разовый шаг перед запуском воркеров)
+    python manage.py create-all   - создание таблиц без миграций (для локальной разработки)
+"""
+import argparse
+import os
+
+# Команды управляют схемой сами, поэтому create_all при создании приложения не нужен
+os.environ['FAST_STARTUP'] = 'true'
+
+from sqlalchemy import inspect
+from app import create_app
+from database.db import db, init_migrate
+
+# Ревизия, соответствующая схеме, которую создавал db.create_all()
+BASELINE_REVISION = '0001'
+
+def migrate(app):
+    """Применение миграций Alembic до последней ревизии."""
+    from flask_migrate import stamp, upgrade
+    
+    init_migrate(app)
+    with app.app_context():
+        tables = inspect(db.engine).get_table_names()
+        
+        # БД, созданная ранее через create_all, помечается базовой ревизией
+        if 'items' in tables and 'alembic_version' not in tables:
+            stamp(revision=BASELINE_REVISION)
+            print(f"✅ Existing schema stamped with revision {BASELINE_REVISION}")
+        
+        upgrade()
+        print("✅ Database migrated")
+    
+    # Таблицы шардов и последовательность ID (если шардирование включено)
+    shards = app.extensions.get('item_shards')
+    if shards is not None:
+        shards.create_tables()
+        print(f"✅ Shard tables created/verified ({len(shards.engines)} shards)")
+
+def create_all(app):
+    """Создание таблиц по моделям."""
+    with app.app_context():
+        db.create_all()
+        print("✅ Database tables created/verified")
+    
+    shards = app.extensions.get('item_shards')
+    if shards is not None:
+        shards.create_tables()
+
+COMMANDS = {
+    'migrate': migrate,
+    'create-all': create_all
+}
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Служебные команды приложения")
+    parser.add_argument('command', choices=sorted(COMMANDS))
+    parser.add_argument('--config', default=None, help="Имя конфигурации (development, testing, production)")
+    args = parser.parse_args()
+    
+    COMMANDS[args.command](create_app(args.config))
\ No newline at end of file
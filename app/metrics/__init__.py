@@ -0,0 +1,5 @@
+# Инициализация пакета metrics
+from .registry import metrics, MetricsRegistry, Histogram, percentile
+from .process import init_process_metrics
+
+__all__ = ['metrics', 'MetricsRegistry', 'Histogram', 'percentile', 'init_process_metrics']
\ No newline at end of file
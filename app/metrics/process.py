@@ -0,0 +1,46 @@
+import os
+import threading
+from .registry import metrics
+
+
+def _rss_bytes():
+    """Резидентная память процесса (Linux: /proc/self/statm)."""
+    with open('/proc/self/statm') as f:
+        return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+
+
+def _open_fds():
+    """Число открытых файловых дескрипторов (сокеты, файлы БД и т.п.)."""
+    return len(os.listdir('/proc/self/fd'))
+
+
+def _pool_totals(db):
+    """Суммарные выданные и открытые соединения пулов всех движков."""
+    checked_out = connections = 0
+    for engine in db.engines.values():
+        pool = engine.pool
+        if hasattr(pool, 'checkedout'):
+            checked_out += pool.checkedout()
+            connections += pool.checkedout() + pool.checkedin()
+    return checked_out, connections
+
+
+def init_process_metrics(app):
+    """
+    Gauge состояния процесса воркера для длительных (soak) прогонов:
+    память, дескрипторы, потоки и соединения пула БД.
+    
+    У каждого воркера gunicorn свой процесс: process.pid позволяет
+    разделить ряды замеров разных воркеров. Вне Linux (без /proc)
+    значения памяти и дескрипторов - None.
+    """
+    # Импорт при подключении: пакет metrics импортируется модулями database
+    from database.db import db
+    
+    metrics.register_gauge('process.pid', os.getpid)
+    metrics.register_gauge('process.rss_bytes', _rss_bytes)
+    metrics.register_gauge('process.open_fds', _open_fds)
+    metrics.register_gauge('process.threads', threading.active_count)
+    # Пул читается при снятии снимка (в запросе /metrics, в контексте приложения)
+    metrics.register_gauge('db.pool.checked_out', lambda: _pool_totals(db)[0])
+    metrics.register_gauge('db.pool.connections', lambda: _pool_totals(db)[1])
\ No newline at end of file
@@ -0,0 +1,130 @@
+import math
+import threading
+import time
+from collections import deque
+
+
+def percentile(sorted_values, p):
+    """Перцентиль по отсортированному списку (nearest-rank: ранг ceil(p * n), как у клиентов нагрузки)."""
+    if not sorted_values:
+        return None
+    index = min(len(sorted_values) - 1, max(0, int(math.ceil(p / 100 * len(sorted_values))) - 1))
+    return sorted_values[index]
+
+
+class Histogram:
+    """
+    Скользящее окно наблюдений для расчета перцентилей.
+    
+    Хранится не больше window последних наблюдений с моментом добавления
+    (clock - монотонные часы), поэтому перцентили можно считать и только
+    за последние max_age секунд.
+    """
+    
+    def __init__(self, window=2048, clock=time.monotonic):
+        self._values = deque(maxlen=window)
+        self._clock = clock
+        self._lock = threading.Lock()
+        self.count = 0
+        self.total = 0.0
+        self.max = None
+    
+    def observe(self, value):
+        """Добавление наблюдения."""
+        with self._lock:
+            self._values.append((self._clock(), value))
+            self.count += 1
+            self.total += value
+            if self.max is None or value > self.max:
+                self.max = value
+    
+    def recent(self, max_age=None):
+        """Отсортированные наблюдения окна; с max_age - только за последние max_age секунд."""
+        with self._lock:
+            if max_age is None:
+                values = [value for _, value in self._values]
+            else:
+                since = self._clock() - max_age
+                values = [value for observed, value in self._values if observed >= since]
+        values.sort()
+        return values
+    
+    def percentile(self, p, max_age=None):
+        """Перцентиль по последним наблюдениям (None, если данных нет)."""
+        return percentile(self.recent(max_age), p)
+    
+    def snapshot(self):
+        """Сводка по гистограмме."""
+        values = self.recent()
+        with self._lock:
+            count, total, max_value = self.count, self.total, self.max
+        
+        return {
+            'count': count,
+            'sum': total,
+            'avg': total / count if count else None,
+            'max': max_value,
+            'p50': percentile(values, 50),
+            'p95': percentile(values, 95),
+            'p99': percentile(values, 99)
+        }
+
+
+class MetricsRegistry:
+    """Потокобезопасный реестр метрик процесса (счетчики, гистограммы, gauge)."""
+    
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._counters = {}
+        self._histograms = {}
+        self._gauges = {}
+    
+    def inc(self, name, value=1):
+        """Увеличение счетчика."""
+        with self._lock:
+            self._counters[name] = self._counters.get(name, 0) + value
+    
+    def histogram(self, name):
+        """Получение (или создание) гистограммы по имени."""
+        with self._lock:
+            if name not in self._histograms:
+                self._histograms[name] = Histogram()
+            return self._histograms[name]
+    
+    def observe(self, name, value):
+        """Добавление наблюдения в гистограмму."""
+        self.histogram(name).observe(value)
+    
+    def register_gauge(self, name, func):
+        """Регистрация gauge, значение которого вычисляется при снятии снимка."""
+        with self._lock:
+            self._gauges[name] = func
+    
+    def snapshot(self):
+        """Снимок всех метрик в виде словаря."""
+        with self._lock:
+            counters = dict(self._counters)
+            histograms = dict(self._histograms)
+            gauges = dict(self._gauges)
+        
+        gauge_values = {}
+        for name, func in gauges.items():
+            try:
+                gauge_values[name] = func()
+            except Exception:
+                gauge_values[name] = None
+        
+        return {
+            'counters': counters,
+            'gauges': gauge_values,
+            'histograms': {name: h.snapshot() for name, h in histograms.items()}
+        }
+    
+    def reset(self):
+        """Сброс всех счетчиков и гистограмм (gauge сохраняются)."""
+        with self._lock:
+            self._counters.clear()
+            self._histograms.clear()
+
+
+metrics = MetricsRegistry()
\ No newline at end of file
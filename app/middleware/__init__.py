@@ -0,0 +1,26 @@
+# Инициализация пакета middleware
+from .rate_limit import (
+    RateLimitBackend,
+    InMemoryRateLimitBackend,
+    RateLimiter,
+    init_rate_limiting,
+    is_exempt
+)
+from .load_shedding import LoadShedder, init_load_shedding
+from .request_metrics import REQUEST_LATENCY, init_request_metrics
+from .tracing import REQUEST_ID_HEADER, span, init_tracing
+
+__all__ = [
+    'RateLimitBackend',
+    'InMemoryRateLimitBackend',
+    'RateLimiter',
+    'init_rate_limiting',
+    'is_exempt',
+    'LoadShedder',
+    'init_load_shedding',
+    'REQUEST_LATENCY',
+    'init_request_metrics',
+    'REQUEST_ID_HEADER',
+    'span',
+    'init_tracing'
+]
\ No newline at end of file
@@ -0,0 +1,78 @@
+import threading
+from flask import g, request, jsonify
+from database.db import db, pool_status
+from metrics import metrics
+from .rate_limit import is_exempt
+
+
+class LoadShedder:
+    """
+    Сброс нагрузки: ранний ответ 503, когда воркер перегружен.
+    
+    Перегрузкой считается превышение числа одновременно обрабатываемых
+    запросов или заполненность пула соединений БД выше порога
+    (дальше новые запросы будут стоять в очереди за соединением).
+    """
+    
+    def __init__(self, max_in_flight, max_pool_utilization, retry_after):
+        self.max_in_flight = max_in_flight
+        self.max_pool_utilization = max_pool_utilization
+        self.retry_after = retry_after
+        self._lock = threading.Lock()
+        self.in_flight = 0
+    
+    def pool_utilization(self):
+        """Максимальная заполненность пулов всех движков приложения."""
+        return max(
+            (pool_status(engine).get('utilization', 0.0) for engine in db.engines.values()),
+            default=0.0
+        )
+    
+    def before_request(self):
+        if is_exempt(request.path):
+            return None
+        
+        with self._lock:
+            overloaded = self.in_flight >= self.max_in_flight
+            if not overloaded:
+                self.in_flight += 1
+        
+        if overloaded:
+            metrics.inc('load_shedding.rejected.in_flight')
+            return self._reject()
+        
+        g.load_shedding_tracked = True
+        
+        if self.pool_utilization() >= self.max_pool_utilization:
+            metrics.inc('load_shedding.rejected.db_pool')
+            return self._reject()
+        
+        return None
+    
+    def teardown_request(self, exc=None):
+        if g.pop('load_shedding_tracked', False):
+            with self._lock:
+                self.in_flight -= 1
+    
+    def _reject(self):
+        response = jsonify({'error': 'Service overloaded'})
+        response.status_code = 503
+        response.headers['Retry-After'] = str(self.retry_after)
+        return response
+
+
+def init_load_shedding(app):
+    """Подключение сброса нагрузки, если он включен конфигурацией."""
+    if not app.config.get('LOAD_SHEDDING_ENABLED'):
+        return None
+    
+    shedder = LoadShedder(
+        max_in_flight=app.config['LOAD_SHEDDING_MAX_IN_FLIGHT'],
+        max_pool_utilization=app.config['LOAD_SHEDDING_MAX_POOL_UTILIZATION'],
+        retry_after=app.config['LOAD_SHEDDING_RETRY_AFTER']
+    )
+    app.extensions['load_shedder'] = shedder
+    app.before_request(shedder.before_request)
+    app.teardown_request(shedder.teardown_request)
+    metrics.register_gauge('requests.in_flight', lambda: shedder.in_flight)
+    return shedder
\ No newline at end of file
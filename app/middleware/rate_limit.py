@@ -0,0 +1,153 @@
+import math
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from flask import request, jsonify
+from metrics import metrics
+
+# Служебные эндпоинты не ограничиваются (пробы оркестратора, метрики)
+EXEMPT_PATHS = ('/health', '/ready', '/metrics')
+
+
+def is_exempt(path):
+    """Служебный путь: совпадает с EXEMPT_PATHS или вложен в него (/health/deep, но не /healthz)."""
+    return any(path == prefix or path.startswith(prefix + '/') for prefix in EXEMPT_PATHS)
+
+
+class RateLimitBackend(ABC):
+    """
+    Интерфейс хранилища состояния token bucket.
+    
+    Реализация по умолчанию хранит состояние в памяти процесса;
+    для общего лимита между воркерами можно подключить свой backend
+    (например, на Redis), реализовав метод consume.
+    """
+    
+    @abstractmethod
+    def consume(self, buckets, tokens=1):
+        """
+        Попытка списать токены сразу из нескольких корзин.
+        
+        buckets - список (key, rate, burst). Токены списываются, только
+        если их хватает во всех корзинах; иначе не списываются ни из одной.
+        Возвращает кортеж (denied, retry_after): denied - ключ первой
+        корзины без токенов (None, если запрос разрешен), retry_after -
+        через сколько секунд токенов хватит во всех корзинах.
+        """
+
+
+class InMemoryRateLimitBackend(RateLimitBackend):
+    """
+    Token bucket в памяти процесса.
+    
+    Корзины упорядочены по времени последнего обновления (LRU). Когда их
+    становится больше max_keys, удаляются самые давние - до low_water
+    корзин за раз, чтобы не чистить словарь на каждом запросе. Давно не
+    обновленные корзины обычно уже заполнены (клиент неактивен); удаленная
+    корзина при следующем запросе клиента создается заново полной.
+    """
+    
+    def __init__(self, max_keys=10000, low_water=None):
+        self._lock = threading.Lock()
+        # key -> (доступно токенов, время обновления, время полного заполнения корзины)
+        self._buckets = OrderedDict()
+        self.max_keys = max_keys
+        self.low_water = max_keys * 9 // 10 if low_water is None else low_water
+    
+    def consume(self, buckets, tokens=1):
+        now = time.monotonic()
+        
+        with self._lock:
+            available = {}
+            denied, retry_after = None, 0.0
+            for key, rate, burst in buckets:
+                current, updated, _ = self._buckets.get(key, (burst, now, 0.0))
+                available[key] = min(burst, current + (now - updated) * rate)
+                if available[key] < tokens:
+                    denied = denied or key
+                    retry_after = max(retry_after, (tokens - available[key]) / rate)
+            
+            spent = 0 if denied else tokens
+            for key, rate, burst in buckets:
+                self._buckets[key] = (available[key] - spent, now, burst / rate)
+                self._buckets.move_to_end(key)
+            
+            if len(self._buckets) > self.max_keys:
+                self._evict()
+        
+        return denied, retry_after
+    
+    def _evict(self):
+        """Удаление самых давно обновленных корзин до low_water."""
+        while len(self._buckets) > self.low_water:
+            self._buckets.popitem(last=False)
+
+
+class RateLimiter:
+    """Ограничение частоты запросов: на клиента и глобально на воркер."""
+    
+    def __init__(self, backend, client_rate, client_burst, global_rate, global_burst, client_header=None):
+        if min(client_rate, client_burst, global_rate, global_burst) <= 0:
+            raise ValueError("Rate limits and bursts must be > 0")
+        self.backend = backend
+        self.client_rate = client_rate
+        self.client_burst = client_burst
+        self.global_rate = global_rate
+        self.global_burst = global_burst
+        self.client_header = client_header
+    
+    def client_key(self):
+        """Идентификатор клиента: заголовок (за прокси) или адрес."""
+        if self.client_header:
+            value = request.headers.get(self.client_header)
+            if value:
+                return value.split(',')[0].strip()
+        return request.remote_addr or 'unknown'
+    
+    def check(self):
+        """Проверка лимитов для текущего запроса (None - запрос пропускается)."""
+        if is_exempt(request.path):
+            return None
+        
+        # Обе корзины проверяются до списания: отказ по глобальному лимиту
+        # не расходует токен клиента, и наоборот
+        denied, retry_after = self.backend.consume([
+            (f"client:{self.client_key()}", self.client_rate, self.client_burst),
+            ('global', self.global_rate, self.global_burst)
+        ])
+        if denied is not None:
+            metrics.inc('rate_limit.rejected.global' if denied == 'global' else 'rate_limit.rejected.client')
+            return self._reject(retry_after)
+        
+        return None
+    
+    @staticmethod
+    def _reject(retry_after):
+        response = jsonify({'error': 'Too many requests'})
+        response.status_code = 429
+        response.headers['Retry-After'] = str(max(1, math.ceil(retry_after)))
+        return response
+
+
+def init_rate_limiting(app, backend=None):
+    """Подключение ограничения частоты запросов, если оно включено конфигурацией."""
+    if not app.config.get('RATE_LIMIT_ENABLED'):
+        return None
+    
+    # Нулевая скорость означала бы деление на ноль при расчете Retry-After
+    for key in ('RATE_LIMIT_PER_CLIENT', 'RATE_LIMIT_PER_CLIENT_BURST', 'RATE_LIMIT_GLOBAL', 'RATE_LIMIT_GLOBAL_BURST'):
+        if app.config[key] <= 0:
+            raise ValueError(f"{key} must be > 0, got {app.config[key]}")
+    
+    limiter = RateLimiter(
+        backend or InMemoryRateLimitBackend(),
+        client_rate=app.config['RATE_LIMIT_PER_CLIENT'],
+        client_burst=app.config['RATE_LIMIT_PER_CLIENT_BURST'],
+        global_rate=app.config['RATE_LIMIT_GLOBAL'],
+        global_burst=app.config['RATE_LIMIT_GLOBAL_BURST'],
+        client_header=app.config.get('RATE_LIMIT_CLIENT_HEADER')
+    )
+    app.extensions['rate_limiter'] = limiter
+    app.before_request(limiter.check)
+    return limiter
\ No newline at end of file
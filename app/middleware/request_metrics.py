@@ -0,0 +1,36 @@
+import time
+from flask import g, request
+from metrics import metrics
+from .rate_limit import is_exempt
+
+# Имя гистограммы времени обработки запросов API (секунды)
+REQUEST_LATENCY = 'request.latency_seconds'
+
+
+def init_request_metrics(app):
+    """
+    Учет ответов и времени обработки запросов (для проверок бюджета задержки).
+    
+    Подключается после rate limiting и сброса нагрузки: запрос, отклоненный
+    ими (429, 503), не доходит до start_timer, но after_request выполняется
+    и для него. Такой ответ учитывается в responses.<N>xx и
+    responses.rejected.<код> без замера времени: быстрые отказы под
+    перегрузкой не должны занижать p99 проверки готовности.
+    """
+    
+    @app.before_request
+    def start_timer():
+        g.request_started = time.perf_counter()
+    
+    @app.after_request
+    def record_latency(response):
+        started = g.pop('request_started', None)
+        if is_exempt(request.path):
+            return response
+        
+        metrics.inc(f"responses.{response.status_code // 100}xx")
+        if started is None:
+            metrics.inc(f"responses.rejected.{response.status_code}")
+        else:
+            metrics.observe(REQUEST_LATENCY, time.perf_counter() - started)
+        return response
\ No newline at end of file
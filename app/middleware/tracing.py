@@ -0,0 +1,134 @@
+import atexit
+import json
+import re
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+from flask import g, has_request_context, request
+from .rate_limit import is_exempt
+
+# Заголовок идентификатора запроса: передается клиентом и возвращается в ответе
+REQUEST_ID_HEADER = 'X-Request-ID'
+
+# Идентификатор от клиента принимается только такого вида (попадает в заголовки и файл),
+# иначе генерируется новый
+_REQUEST_ID_PATTERN = re.compile(r'[A-Za-z0-9._:-]{1,128}')
+
+
+class Trace:
+    """Спаны обработки одного запроса: имя, начало от начала запроса и длительность (секунды)."""
+    
+    def __init__(self, request_id):
+        self.request_id = request_id
+        self.started = time.perf_counter()
+        self.wall_started = time.time()
+        self.spans = []
+    
+    @contextmanager
+    def span(self, name):
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.spans.append((name, started - self.started, time.perf_counter() - started))
+    
+    def server_timing(self, duration):
+        """Значение заголовка Server-Timing (миллисекунды; start - нестандартный параметр)."""
+        entries = [f"{name};dur={spent * 1000:.3f};start={start * 1000:.3f}" for name, start, spent in self.spans]
+        entries.append(f"total;dur={duration * 1000:.3f}")
+        return ', '.join(entries)
+    
+    def to_dict(self, status, duration):
+        return {
+            'request_id': self.request_id,
+            'method': request.method,
+            'path': request.path,
+            'status': status,
+            'start': round(self.wall_started, 6),
+            'duration_ms': round(duration * 1000, 3),
+            'spans': [
+                {'name': name, 'start_ms': round(start * 1000, 3), 'duration_ms': round(spent * 1000, 3)}
+                for name, start, spent in self.spans
+            ]
+        }
+
+
+class TraceFileSink:
+    """
+    Запись трасс в локальный файл JSON Lines (одна строка на запрос, дописывается).
+    
+    Файл открывается один раз в режиме построчной буферизации: каждая
+    запись сразу видна читателям файла (тестам), без открытия файла
+    на каждый запрос.
+    """
+    
+    def __init__(self, path):
+        self.path = path
+        self._lock = threading.Lock()
+        self._file = open(path, 'a', buffering=1, encoding='utf-8')
+        atexit.register(self.close)
+    
+    def write(self, record):
+        line = json.dumps(record, ensure_ascii=False) + '\n'
+        with self._lock:
+            if not self._file.closed:
+                self._file.write(line)
+    
+    def close(self):
+        with self._lock:
+            self._file.close()
+
+
+@contextmanager
+def span(name):
+    """
+    Спан обработки текущего запроса:
+        
+        with span('db'):
+            session.commit()
+    
+    Вне запроса или с выключенной трассировкой ничего не делает.
+    """
+    trace = g.get('trace') if has_request_context() else None
+    if trace is None:
+        yield
+        return
+    with trace.span(name):
+        yield
+
+
+def init_tracing(app):
+    """
+    Трассировка запросов: идентификатор запроса и спаны обработки.
+    
+    Идентификатор берется из X-Request-ID (или генерируется) и возвращается
+    в ответе; спаны (validate, db, serialize в ресурсах товаров) отдаются
+    в заголовке Server-Timing и, если задан TRACE_SINK_FILE, пишутся
+    в локальный файл - без отдельного сервиса сбора.
+    """
+    if not app.config['TRACING_ENABLED']:
+        return
+    
+    server_timing = app.config['TRACE_SERVER_TIMING']
+    sink = TraceFileSink(app.config['TRACE_SINK_FILE']) if app.config['TRACE_SINK_FILE'] else None
+    
+    @app.before_request
+    def start_trace():
+        request_id = request.headers.get(REQUEST_ID_HEADER, '')
+        if not _REQUEST_ID_PATTERN.fullmatch(request_id):
+            request_id = uuid.uuid4().hex
+        g.trace = Trace(request_id)
+    
+    @app.after_request
+    def finish_trace(response):
+        trace = g.pop('trace', None)
+        if trace is None:
+            return response
+        duration = time.perf_counter() - trace.started
+        response.headers[REQUEST_ID_HEADER] = trace.request_id
+        if server_timing:
+            response.headers['Server-Timing'] = trace.server_timing(duration)
+        if sink is not None and not is_exempt(request.path):
+            sink.write(trace.to_dict(response.status_code, duration))
+        return response
\ No newline at end of file
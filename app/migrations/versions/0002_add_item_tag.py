@@ -0,0 +1,35 @@
+"""add item tag
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-19 18:12:40.512093
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '0002'
+down_revision = '0001'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # БД, созданная через create_all уже с колонкой tag, помечается ревизией 0001
+    # (см. manage.py), поэтому колонка и индекс добавляются только при отсутствии
+    inspector = sa.inspect(op.get_bind())
+    columns = {column['name'] for column in inspector.get_columns('items')}
+    indexes = {index['name'] for index in inspector.get_indexes('items')}
+    
+    if 'tag' not in columns:
+        op.add_column('items', sa.Column('tag', sa.String(length=64), nullable=True))
+    if op.f('ix_items_tag') not in indexes:
+        op.create_index(op.f('ix_items_tag'), 'items', ['tag'], unique=False)
+
+
+def downgrade():
+    op.drop_index(op.f('ix_items_tag'), table_name='items')
+    with op.batch_alter_table('items') as batch_op:
+        batch_op.drop_column('tag')
\ No newline at end of file
@@ -11,9 +11,32 @@ class Item(db.Model):
     price = db.Column(db.Float, nullable=False)
     description = db.Column(db.String(500))
     in_stock = db.Column(db.Boolean, default=True)
+    # Тег (пространство имен) набора данных, например тестовой сессии
+    tag = db.Column(db.String(64), index=True)
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
     updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
     
+    @classmethod
+    def apply_filters(cls, query, params):
+        """Применение фильтров списка (ItemQuerySchema) к запросу."""
+        if params.get('tag') is not None:
+            query = query.filter_by(tag=params['tag'])
+        
+        if params.get('in_stock') is not None:
+            query = query.filter_by(in_stock=params['in_stock'])
+        
+        if params.get('min_price') is not None:
+            query = query.filter(cls.price >= params['min_price'])
+        
+        if params.get('max_price') is not None:
+            query = query.filter(cls.price <= params['max_price'])
+        
+        # Курсор: только товары после указанного ID
+        if params.get('after_id') is not None:
+            query = query.filter(cls.id > params['after_id'])
+        
+        return query
+    
     def to_dict(self):
         """Преобразование в словарь."""
         return {
@@ -22,6 +45,7 @@ class Item(db.Model):
             'price': self.price,
             'description': self.description,
             'in_stock': self.in_stock,
+            'tag': self.tag,
             'created_at': self.created_at.isoformat() if self.created_at else None,
             'updated_at': self.updated_at.isoformat() if self.updated_at else None
         }
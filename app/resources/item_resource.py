@@ -1,13 +1,24 @@
-from flask import request
+from flask import request, current_app
 from flask_restful import Resource
 from marshmallow import ValidationError
+from sqlalchemy import delete
+from sqlalchemy.orm.exc import StaleDataError
 from database.db import db
+from database.group_commit import GroupCommitTimeout
+from database.sharding import ShardPageTooDeep, get_item_shards
+from middleware.tracing import span
 from models.item import Item
-from schemas.item_schema import ItemSchema, ItemQuerySchema
+from schemas.item_schema import ItemSchema, ItemQuerySchema, ItemBulkSchema, ItemBulkDeleteSchema
 import logging
+import math
 
 logger = logging.getLogger(__name__)
 
+def session_for(item_id):
+    """Сессия БД, в которой хранится товар (шард или основная БД)."""
+    shards = get_item_shards()
+    return shards.session_for(item_id) if shards is not None else db.session
+
 class ItemListResource(Resource):
     """Ресурс для работы со списком товаров."""
     
@@ -15,42 +26,44 @@ class ItemListResource(Resource):
         """Получение списка товаров с фильтрацией и пагинацией."""
         try:
             # Валидация query параметров
-            query_schema = ItemQuerySchema()
-            params = query_schema.load(request.args)
-            
-            # Базовый запрос
-            query = Item.query
-            
-            # Применение фильтров
-            if params.get('in_stock') is not None:
-                query = query.filter_by(in_stock=params['in_stock'])
-            
-            if params.get('min_price') is not None:
-                query = query.filter(Item.price >= params['min_price'])
-            
-            if params.get('max_price') is not None:
-                query = query.filter(Item.price <= params['max_price'])
+            with span('validate'):
+                query_schema = ItemQuerySchema()
+                params = query_schema.load(request.args)
             
-            # Пагинация
             page = params['page']
             per_page = params['per_page']
-            paginated = query.paginate(page=page, per_page=per_page, error_out=False)
+            
+            with span('db'):
+                shards = get_item_shards()
+                if shards is not None:
+                    # Шардированное хранилище: сбор страницы со всех шардов
+                    page_items, total = shards.list_items(params)
+                    pages = math.ceil(total / per_page)
+                else:
+                    # Запрос с фильтрами и пагинацией (порядок по ID для стабильных страниц)
+                    query = Item.apply_filters(Item.query, params).order_by(Item.id)
+                    paginated = query.paginate(page=page, per_page=per_page, error_out=False)
+                    page_items, total, pages = paginated.items, paginated.total, paginated.pages
             
             # Сериализация
-            item_schema = ItemSchema(many=True)
-            items = item_schema.dump(paginated.items)
+            with span('serialize'):
+                item_schema = ItemSchema(many=True)
+                items = item_schema.dump(page_items)
             
             return {
                 'items': items,
-                'total': paginated.total,
+                'total': total,
                 'page': page,
                 'per_page': per_page,
-                'pages': paginated.pages
+                'pages': pages
             }, 200
             
         except ValidationError as e:
             logger.warning(f"Validation error: {e.messages}")
             return {'errors': e.messages}, 400
+        except ShardPageTooDeep as e:
+            logger.warning(f"Validation error: {e}")
+            return {'errors': {'page': [str(e)]}}, 400
         except Exception as e:
             logger.error(f"Unexpected error: {str(e)}")
             return {'error': 'Internal server error'}, 500
@@ -59,22 +72,42 @@ class ItemListResource(Resource):
         """Создание нового товара."""
         try:
             # Валидация входных данных
-            schema = ItemSchema()
-            data = schema.load(request.get_json())
-            
-            # Создание товара
-            item = Item(**data)
-            db.session.add(item)
-            db.session.commit()
+            with span('validate'):
+                schema = ItemSchema()
+                data = schema.load(request.get_json(silent=True))
+            
+            # Групповой коммит: запись сбрасывается пачкой фоновым потоком
+            committer = current_app.extensions.get('group_commit')
+            if committer is not None:
+                with span('db'):
+                    created = committer.submit(data)
+                logger.info(f"Item created: {created['id']} (group commit)")
+                return created, 201
+            
+            # Создание товара (в шардированном режиме ID выделяется заранее,
+            # чтобы по нему выбрать шард)
+            with span('db'):
+                item = Item(**data)
+                shards = get_item_shards()
+                if shards is not None:
+                    item.id = shards.allocate_id()
+                session = session_for(item.id)
+                session.add(item)
+                session.commit()
             
             logger.info(f"Item created: {item.id}")
             
             # Возврат созданного товара
-            return schema.dump(item), 201
+            with span('serialize'):
+                return schema.dump(item), 201
             
         except ValidationError as e:
             logger.warning(f"Validation error: {e.messages}")
             return {'errors': e.messages}, 400
+        except GroupCommitTimeout as e:
+            # Запись снята с очереди и не будет создана: запрос можно безопасно повторить
+            logger.warning(f"Item not created: {str(e)}")
+            return {'error': 'Item was not created, retry later'}, 503, {'Retry-After': '1'}
         except Exception as e:
             db.session.rollback()
             logger.error(f"Error creating item: {str(e)}")
@@ -87,13 +120,16 @@ class ItemResource(Resource):
     def get(self, item_id):
         """Получение товара по ID."""
         try:
-            item = Item.query.get(item_id)
+            with span('db'):
+                session = session_for(item_id)
+                item = session.get(Item, item_id)
             
             if not item:
                 return {'error': 'Item not found'}, 404
             
-            schema = ItemSchema()
-            return schema.dump(item), 200
+            with span('serialize'):
+                schema = ItemSchema()
+                return schema.dump(item), 200
             
         except Exception as e:
             logger.error(f"Error getting item {item_id}: {str(e)}")
@@ -102,78 +138,180 @@ class ItemResource(Resource):
     def put(self, item_id):
         """Полное обновление товара."""
         try:
-            item = Item.query.get(item_id)
+            with span('db'):
+                session = session_for(item_id)
+                item = session.get(Item, item_id)
             
             if not item:
                 return {'error': 'Item not found'}, 404
             
             # Валидация входных данных
-            schema = ItemSchema()
-            data = schema.load(request.get_json())
+            with span('validate'):
+                schema = ItemSchema()
+                data = schema.load(request.get_json(silent=True))
             
             # Обновление полей
-            for key, value in data.items():
-                setattr(item, key, value)
-            
-            db.session.commit()
+            with span('db'):
+                for key, value in data.items():
+                    setattr(item, key, value)
+                
+                session.commit()
             
             logger.info(f"Item updated: {item_id}")
-            return schema.dump(item), 200
+            with span('serialize'):
+                return schema.dump(item), 200
             
         except ValidationError as e:
             return {'errors': e.messages}, 400
+        except StaleDataError:
+            # Товар удален параллельным запросом между чтением и UPDATE
+            session_for(item_id).rollback()
+            return {'error': 'Item not found'}, 404
         except Exception as e:
-            db.session.rollback()
+            session_for(item_id).rollback()
             logger.error(f"Error updating item {item_id}: {str(e)}")
             return {'error': 'Internal server error'}, 500
     
     def patch(self, item_id):
         """Частичное обновление товара."""
         try:
-            item = Item.query.get(item_id)
+            with span('db'):
+                session = session_for(item_id)
+                item = session.get(Item, item_id)
             
             if not item:
                 return {'error': 'Item not found'}, 404
             
             # Частичная валидация
-            data = request.get_json()
-            schema = ItemSchema(partial=True)
-            validated_data = schema.load(data)
+            with span('validate'):
+                data = request.get_json(silent=True)
+                schema = ItemSchema(partial=True)
+                validated_data = schema.load(data)
             
             # Обновление только переданных полей
-            for key, value in validated_data.items():
-                setattr(item, key, value)
-            
-            db.session.commit()
+            with span('db'):
+                for key, value in validated_data.items():
+                    setattr(item, key, value)
+                
+                session.commit()
             
             logger.info(f"Item partially updated: {item_id}")
             
             # Возврат полного объекта
-            full_schema = ItemSchema()
-            return full_schema.dump(item), 200
+            with span('serialize'):
+                full_schema = ItemSchema()
+                return full_schema.dump(item), 200
             
         except ValidationError as e:
             return {'errors': e.messages}, 400
+        except StaleDataError:
+            # Товар удален параллельным запросом между чтением и UPDATE
+            session_for(item_id).rollback()
+            return {'error': 'Item not found'}, 404
         except Exception as e:
-            db.session.rollback()
+            session_for(item_id).rollback()
             logger.error(f"Error patching item {item_id}: {str(e)}")
             return {'error': 'Internal server error'}, 500
     
     def delete(self, item_id):
         """Удаление товара."""
         try:
-            item = Item.query.get(item_id)
-            
-            if not item:
+            # Один DELETE без предварительного чтения: при параллельных удалениях
+            # успешным будет только запрос, который действительно удалил строку
+            with span('db'):
+                session = session_for(item_id)
+                result = session.execute(delete(Item).where(Item.id == item_id))
+                session.commit()
+            
+            if result.rowcount == 0:
                 return {'error': 'Item not found'}, 404
             
-            db.session.delete(item)
-            db.session.commit()
-            
             logger.info(f"Item deleted: {item_id}")
             return {'message': 'Item deleted successfully'}, 200
             
         except Exception as e:
-            db.session.rollback()
+            session_for(item_id).rollback()
             logger.error(f"Error deleting item {item_id}: {str(e)}")
+            return {'error': 'Internal server error'}, 500
+
+
+class ItemBulkResource(Resource):
+    """Ресурс для массовых операций с товарами (наполнение и очистка наборов данных)."""
+    
+    def post(self):
+        """Создание пачки товаров одной транзакцией (в шардированном режиме - одной на шард)."""
+        try:
+            payload = request.get_json(silent=True)
+            
+            # Ограничение размера пачки проверяется до валидации всех товаров
+            # (items другого типа отклоняет схема: "Not a valid list.")
+            max_items = current_app.config['BULK_MAX_ITEMS']
+            items = payload.get('items') if isinstance(payload, dict) else None
+            if isinstance(items, list) and len(items) > max_items:
+                return {'errors': {'items': [f"At most {max_items} items per request"]}}, 400
+            
+            with span('validate'):
+                data = ItemBulkSchema().load(payload)
+            
+            items = [Item(**item_data) for item_data in data['items']]
+            if data['tag'] is not None:
+                for item in items:
+                    if item.tag is None:
+                        item.tag = data['tag']
+            
+            with span('db'):
+                shards = get_item_shards()
+                if shards is not None:
+                    sessions = shards.add_all(items)
+                else:
+                    db.session.add_all(items)
+                    sessions = [db.session]
+                
+                # Сериализация после flush (ID и значения по умолчанию уже присвоены),
+                # но до коммита: иначе каждый товар перечитывался бы из БД отдельным запросом
+                for session in sessions:
+                    session.flush()
+            with span('serialize'):
+                created = ItemSchema(many=True).dump(items)
+            with span('db'):
+                for session in sessions:
+                    session.commit()
+            
+            logger.info(f"Items created in bulk: {len(created)}")
+            return {'items': created, 'count': len(created)}, 201
+            
+        except ValidationError as e:
+            logger.warning(f"Validation error: {e.messages}")
+            return {'errors': e.messages}, 400
+        except Exception as e:
+            db.session.rollback()
+            shards = get_item_shards()
+            if shards is not None:
+                shards.remove_sessions()
+            logger.error(f"Error creating items in bulk: {str(e)}")
+            return {'error': 'Internal server error'}, 500
+    
+    def delete(self):
+        """Удаление всех товаров с указанным тегом одним запросом к БД (к каждому шарду)."""
+        try:
+            with span('validate'):
+                params = ItemBulkDeleteSchema().load(request.args)
+            
+            with span('db'):
+                shards = get_item_shards()
+                if shards is not None:
+                    deleted = shards.delete_where(Item.tag == params['tag'])
+                else:
+                    deleted = db.session.execute(delete(Item).where(Item.tag == params['tag'])).rowcount
+                    db.session.commit()
+            
+            logger.info(f"Items deleted by tag '{params['tag']}': {deleted}")
+            return {'deleted': deleted}, 200
+            
+        except ValidationError as e:
+            logger.warning(f"Validation error: {e.messages}")
+            return {'errors': e.messages}, 400
+        except Exception as e:
+            db.session.rollback()
+            logger.error(f"Error deleting items by tag: {str(e)}")
             return {'error': 'Internal server error'}, 500
\ No newline at end of file
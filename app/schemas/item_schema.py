@@ -1,4 +1,4 @@
-from marshmallow import Schema, fields, validate, validates, ValidationError
+from marshmallow import Schema, fields, validate, validates, validates_schema, ValidationError
 
 class ItemSchema(Schema):
     """Схема для валидации товара."""
@@ -14,6 +14,7 @@ class ItemSchema(Schema):
     )
     description = fields.Str(allow_none=True, validate=validate.Length(max=500))
     in_stock = fields.Bool(missing=True)
+    tag = fields.Str(allow_none=True, validate=validate.Length(min=1, max=64))
     created_at = fields.DateTime(dump_only=True)
     updated_at = fields.DateTime(dump_only=True)
     
@@ -24,11 +25,35 @@ class ItemSchema(Schema):
             raise ValidationError("Price cannot be negative")
         return value
 
+# Наибольшее целое SQL (BIGINT, INTEGER SQLite): большие page и after_id
+# иначе переполняют OFFSET и параметр запроса (ответ 500 вместо 400)
+MAX_SQL_INTEGER = 2 ** 63 - 1
+
 class ItemQuerySchema(Schema):
     """Схема для query параметров (пагинация и фильтрация)."""
     
-    page = fields.Int(missing=1, validate=validate.Range(min=1))
+    page = fields.Int(missing=1, validate=validate.Range(min=1, max=MAX_SQL_INTEGER // 100))
     per_page = fields.Int(missing=20, validate=validate.Range(min=1, max=100))
     in_stock = fields.Bool(missing=None)
+    tag = fields.Str(missing=None, validate=validate.Length(min=1, max=64))
     min_price = fields.Float(missing=None, validate=validate.Range(min=0))
-    max_price = fields.Float(missing=None, validate=validate.Range(min=0))
\ No newline at end of file
+    max_price = fields.Float(missing=None, validate=validate.Range(min=0))
+    after_id = fields.Int(missing=None, validate=validate.Range(min=0, max=MAX_SQL_INTEGER))
+    
+    @validates_schema
+    def validate_cursor(self, data, **kwargs):
+        """Курсор after_id задает начало страницы сам, номер страницы с ним не используется."""
+        if data.get('after_id') is not None and data.get('page', 1) > 1:
+            raise ValidationError("Page cannot be combined with after_id", 'page')
+
+class ItemBulkSchema(Schema):
+    """Схема массового создания товаров."""
+    
+    items = fields.List(fields.Nested(ItemSchema), required=True, validate=validate.Length(min=1))
+    # Тег для товаров пачки, у которых не задан собственный
+    tag = fields.Str(missing=None, allow_none=True, validate=validate.Length(min=1, max=64))
+
+class ItemBulkDeleteSchema(Schema):
+    """Схема query параметров массового удаления товаров."""
+    
+    tag = fields.Str(required=True, validate=validate.Length(min=1, max=64))
\ No newline at end of file
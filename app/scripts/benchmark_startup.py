@@ -0,0 +1,101 @@
+"""
+Бенчмарк холодного старта приложения.
+
+Каждый прогон запускается в отдельном процессе интерпретатора и измеряет:
+импорт модуля app, создание приложения и первый запрос (через test client).
+Сравниваются обычный режим (create_all + Flask-Migrate при старте)
+и быстрый старт (FAST_STARTUP=true, схема создана заранее миграцией).
+
+    cd app
+    python scripts/benchmark_startup.py --runs 10
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+
+APP_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Код, выполняемый в дочернем процессе
+CHILD_CODE = """
+import json, time
+t0 = time.perf_counter()
+import app as module
+t1 = time.perf_counter()
+application = module.app
+t2 = time.perf_counter()
+response = application.test_client().get('/api/items?per_page=1')
+t3 = time.perf_counter()
+assert response.status_code == 200, response.status_code
+print(json.dumps({
+    'import_ms': (t1 - t0) * 1000,
+    'create_app_ms': (t2 - t1) * 1000,
+    'first_request_ms': (t3 - t2) * 1000,
+    'total_ms': (t3 - t0) * 1000
+}))
+"""
+
+def run_once(env):
+    """Один холодный старт в отдельном процессе."""
+    result = subprocess.run(
+        [sys.executable, '-c', CHILD_CODE],
+        cwd=APP_DIR,
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True
+    )
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+def summarize(samples):
+    """Медиана и минимум по каждой фазе старта."""
+    return {
+        phase: {
+            'median': statistics.median(s[phase] for s in samples),
+            'min': min(s[phase] for s in samples)
+        }
+        for phase in samples[0]
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description="Бенчмарк холодного старта приложения")
+    parser.add_argument('--runs', type=int, default=10, help="Число прогонов на режим")
+    args = parser.parse_args()
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        database_url = f"sqlite:///{os.path.join(tmp, 'startup.db')}"
+        base_env = dict(os.environ, DEV_DATABASE_URL=database_url, FLASK_ENV='development')
+        
+        # Схема для быстрого старта создается один раз миграцией
+        subprocess.run(
+            [sys.executable, 'manage.py', 'migrate'],
+            cwd=APP_DIR,
+            env=base_env,
+            capture_output=True,
+            check=True
+        )
+        
+        modes = {
+            'default': dict(base_env, FAST_STARTUP='false'),
+            'fast_startup': dict(base_env, FAST_STARTUP='true')
+        }
+        
+        results = {}
+        for mode, env in modes.items():
+            run_once(env)  # прогрев кэша байткода
+            results[mode] = summarize([run_once(env) for _ in range(args.runs)])
+    
+    print(f"{'phase':<18}" + ''.join(f"{mode:>28}" for mode in results))
+    for phase in results['default']:
+        row = ''.join(
+            f"{results[mode][phase]['median']:>14.1f} (min {results[mode][phase]['min']:>6.1f})"
+            for mode in results
+        )
+        print(f"{phase:<18}{row}")
+    print("\nВремя в миллисекундах: медиана (минимум)")
+
+if __name__ == '__main__':
+    main()
\ No newline at end of file
@@ -1,4 +1,9 @@
-from .base_api import BaseAPI
+from .base_api import BaseAPI, connection_stats, exchange_log, traffic_capture
+from .capture import TrafficCapture, read_capture
+from .exchange_log import ExchangeLog, LOG_MODES
 from .items_api import ItemsAPI
+from .async_base_api import AsyncBaseAPI, RetryError
+from .async_items_api import AsyncItemsAPI
+from .health_api import HealthAPI
 
-__all__ = ['BaseAPI', 'ItemsAPI']
\ No newline at end of file
+__all__ = ['BaseAPI', 'ItemsAPI', 'HealthAPI', 'AsyncBaseAPI', 'AsyncItemsAPI', 'RetryError', 'ExchangeLog', 'LOG_MODES', 'connection_stats', 'exchange_log', 'TrafficCapture', 'read_capture', 'traffic_capture']
\ No newline at end of file
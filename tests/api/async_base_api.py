@@ -0,0 +1,219 @@
+import asyncio
+import email.utils
+import logging
+import time
+from contextlib import nullcontext
+from typing import Optional
+import allure
+import httpx
+from api.base_api import RETRY_METHODS, RETRY_STATUSES, endpoint_label, exchange_log
+from api.transport import AsyncInProcessTransport, in_process_app
+from config import config
+from utils.latency import RequestTimer, latency_collector
+from utils.tracing import with_request_id
+
+logger = logging.getLogger(__name__)
+
+# Коды, для которых пауза перед повтором берется из Retry-After (как в urllib3)
+RETRY_AFTER_STATUSES = (413, 429, 503)
+BACKOFF_MAX = 120
+
+
+class RetryError(httpx.HTTPError):
+    """Повторы исчерпаны, а сервер продолжает отвечать кодом из RETRY_STATUSES."""
+    
+    def __init__(self, message: str, response: httpx.Response):
+        super().__init__(message)
+        self.response = response
+
+
+class AsyncBaseAPI:
+    """
+    Асинхронный базовый клиент API на httpx.
+    
+    Повторяет поведение BaseAPI: те же заголовки, повторы с экспоненциальной
+    паузой и учетом Retry-After, проверка expected_status и логирование
+    обменов в Allure через exchange_log. Соединения берутся из общего пула
+    httpx.AsyncClient, поэтому один процесс может держать тысячи
+    одновременных запросов без потока на каждый.
+    
+    Шаги Allure открываются уже после получения ответа и не охватывают
+    await: стек шагов общий для потока, и параллельные задачи иначе
+    вкладывали бы шаги друг в друга.
+    """
+    
+    def __init__(self, base_url: str = None, max_retries: Optional[int] = None):
+        self.base_url = base_url or config.api.base_url
+        self.max_retries = config.api.max_retries if max_retries is None else max_retries
+        self.timeout = config.api.timeout
+        self.client = httpx.AsyncClient(
+            headers=config.default_headers,
+            timeout=self.timeout,
+            limits=httpx.Limits(
+                max_connections=config.api.async_max_connections,
+                max_keepalive_connections=config.api.async_max_connections if config.api.keep_alive else 0
+            ),
+            # Режим inprocess: приложение в текущем процессе вместо сети
+            transport=AsyncInProcessTransport(in_process_app()) if config.api.transport == 'inprocess' else None
+        )
+    
+    def _backoff(self, errors: int) -> float:
+        """Пауза перед повтором после errors неудачных попыток (формула urllib3)."""
+        if errors <= 1:
+            return 0.0
+        return min(config.api.retry_backoff * (2 ** (errors - 1)), BACKOFF_MAX)
+    
+    @staticmethod
+    def _retry_after(response: httpx.Response) -> Optional[float]:
+        value = response.headers.get('Retry-After')
+        if response.status_code not in RETRY_AFTER_STATUSES or not value:
+            return None
+        try:
+            return max(float(value), 0.0)
+        except ValueError:
+            parsed = email.utils.parsedate_to_datetime(value)
+            return max(parsed.timestamp() - time.time(), 0.0)
+    
+    @staticmethod
+    def _trace(timer: RequestTimer):
+        """Обработчик событий httpx (extensions['trace']): время соединения и получения заголовков."""
+        connect_started = None
+        
+        async def trace(event_name: str, info: dict):
+            nonlocal connect_started
+            if event_name == 'connection.connect_tcp.started':
+                connect_started = time.perf_counter()
+            elif event_name == 'connection.connect_tcp.complete' and connect_started is not None:
+                timer.add_connect(time.perf_counter() - connect_started)
+            elif event_name.endswith('.receive_response_headers.complete'):
+                timer.headers_received()
+        
+        return trace
+    
+    async def _send(self, method: str, url: str, timer: RequestTimer, **kwargs) -> httpx.Response:
+        """Отправка запроса с повторами (статусы RETRY_STATUSES и ошибки соединения)."""
+        retryable = method in RETRY_METHODS
+        errors = 0
+        extensions = {'trace': self._trace(timer)}
+        
+        while True:
+            try:
+                response = await self.client.request(method, url, extensions=extensions, **kwargs)
+            except httpx.TransportError:
+                errors += 1
+                if not retryable or errors > self.max_retries:
+                    raise
+                await asyncio.sleep(self._backoff(errors))
+                continue
+            
+            if not retryable or response.status_code not in RETRY_STATUSES:
+                return response
+            
+            errors += 1
+            if errors > self.max_retries:
+                if self.max_retries > 0:
+                    raise RetryError(
+                        f"Max retries exceeded: {method} {url} (last status {response.status_code})",
+                        response
+                    )
+                return response
+            
+            retry_after = self._retry_after(response)
+            await asyncio.sleep(self._backoff(errors) if retry_after is None else retry_after)
+    
+    async def _timed_send(self, method: str, endpoint: str, url: str, **kwargs) -> httpx.Response:
+        """Отправка запроса с замером connect, TTFB и полного времени (latency_collector)."""
+        timer = RequestTimer()
+        label = endpoint_label(endpoint)
+        try:
+            response = await self._send(method, url, timer, **kwargs)
+        except RetryError as e:
+            timer.record(latency_collector, method, label, e.response.status_code)
+            raise
+        except httpx.HTTPError as e:
+            timer.record(latency_collector, method, label, type(e).__name__)
+            raise
+        
+        timer.record(latency_collector, method, label, response.status_code)
+        return response
+    
+    def _log_request(self, method: str, url: str, **kwargs):
+        """Логирование запроса."""
+        logger.info(f"🌐 {method} {url}")
+        exchange_log.request(method, url, kwargs.get('headers'), kwargs.get('json'))
+    
+    def _log_response(self, response: httpx.Response):
+        """Логирование ответа."""
+        logger.info(f"📥 Response: {response.status_code} ({response.elapsed.total_seconds():.3f}s)")
+        exchange_log.response(response)
+    
+    async def _request(
+        self,
+        method: str,
+        endpoint: str,
+        expected_status: int = None,
+        step: Optional[str] = None,
+        **kwargs
+    ) -> httpx.Response:
+        """Базовый метод для выполнения запросов (step - заголовок шага Allure)."""
+        url = f"{self.base_url}{endpoint}"
+        
+        if 'timeout' not in kwargs:
+            kwargs['timeout'] = self.timeout
+        
+        # Идентификатор запроса: по нему приложение записывает спаны обработки
+        if config.api.tracing:
+            kwargs['headers'] = with_request_id(kwargs.get('headers'))
+        
+        try:
+            response = await self._timed_send(method, endpoint, url, **kwargs)
+        except RetryError as e:
+            with allure.step(step) if step else nullcontext():
+                self._log_request(method, url, **kwargs)
+                self._log_response(e.response)
+            logger.error(f"Retries exhausted: {method} {url}")
+            raise
+        except httpx.TimeoutException:
+            with allure.step(step) if step else nullcontext():
+                self._log_request(method, url, **kwargs)
+            logger.error(f"Request timeout: {method} {url}")
+            raise
+        except httpx.TransportError:
+            with allure.step(step) if step else nullcontext():
+                self._log_request(method, url, **kwargs)
+            logger.error(f"Connection error: {method} {url}")
+            raise
+        
+        with allure.step(step) if step else nullcontext():
+            self._log_request(method, url, **kwargs)
+            self._log_response(response)
+            
+            if expected_status:
+                assert response.status_code == expected_status, \
+                    f"Expected status {expected_status}, got {response.status_code}"
+        
+        return response
+    
+    async def get(self, endpoint: str, **kwargs) -> httpx.Response:
+        return await self._request("GET", endpoint, **kwargs)
+    
+    async def post(self, endpoint: str, **kwargs) -> httpx.Response:
+        return await self._request("POST", endpoint, **kwargs)
+    
+    async def put(self, endpoint: str, **kwargs) -> httpx.Response:
+        return await self._request("PUT", endpoint, **kwargs)
+    
+    async def patch(self, endpoint: str, **kwargs) -> httpx.Response:
+        return await self._request("PATCH", endpoint, **kwargs)
+    
+    async def delete(self, endpoint: str, **kwargs) -> httpx.Response:
+        return await self._request("DELETE", endpoint, **kwargs)
+    
+    async def close(self):
+        await self.client.aclose()
+    
+    async def __aenter__(self):
+        return self
+    
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
\ No newline at end of file
@@ -0,0 +1,131 @@
+from typing import Any, Dict, List, Optional
+from .async_base_api import AsyncBaseAPI
+from .items_api import item_payload, list_params, patch_payload
+
+class AsyncItemsAPI(AsyncBaseAPI):
+    """Асинхронный клиент для работы с эндпоинтами товаров (тот же интерфейс, что у ItemsAPI)."""
+    
+    def __init__(self, base_url: str = None, max_retries: Optional[int] = None, tag: Optional[str] = None):
+        super().__init__(base_url, max_retries)
+        self.endpoint = "/items"
+        self.tag = tag
+    
+    async def get_all_items(
+        self,
+        page: int = 1,
+        per_page: int = 20,
+        in_stock: Optional[bool] = None,
+        min_price: Optional[float] = None,
+        max_price: Optional[float] = None,
+        after_id: Optional[int] = None,
+        tag: Optional[str] = None,
+        expected_status: int = 200
+    ):
+        """
+        Получение списка товаров с фильтрацией.
+        
+        after_id - курсор: только товары с ID больше указанного.
+        tag - только товары с указанным тегом.
+        """
+        return await self.get(
+            self.endpoint,
+            params=list_params(page, per_page, in_stock, min_price, max_price, after_id, tag),
+            expected_status=expected_status,
+            step="📋 Получение списка всех товаров"
+        )
+    
+    async def get_item(
+        self,
+        item_id: int,
+        expected_status: int = 200
+    ):
+        return await self.get(
+            f"{self.endpoint}/{item_id}",
+            expected_status=expected_status,
+            step=f"🔍 Получение товара по ID: {item_id}"
+        )
+    
+    async def create_item(
+        self,
+        name: str,
+        price: float,
+        description: Optional[str] = None,
+        in_stock: bool = True,
+        tag: Optional[str] = None,
+        expected_status: int = 201
+    ):
+        return await self.post(
+            self.endpoint,
+            json=item_payload(name, price, description, in_stock, tag or self.tag),
+            expected_status=expected_status,
+            step="➕ Создание нового товара"
+        )
+    
+    async def create_items_bulk(
+        self,
+        items: List[Dict[str, Any]],
+        tag: Optional[str] = None,
+        expected_status: int = 201
+    ):
+        """Создание пачки товаров одним запросом (тег - для товаров без собственного тега)."""
+        return await self.post(
+            f"{self.endpoint}/bulk",
+            json={"items": items, "tag": tag or self.tag},
+            expected_status=expected_status,
+            step="📦 Массовое создание товаров"
+        )
+    
+    async def update_item(
+        self,
+        item_id: int,
+        name: str,
+        price: float,
+        description: Optional[str] = None,
+        in_stock: bool = True,
+        expected_status: int = 200
+    ):
+        return await self.put(
+            f"{self.endpoint}/{item_id}",
+            json=item_payload(name, price, description, in_stock),
+            expected_status=expected_status,
+            step=f"📝 Полное обновление товара ID: {item_id}"
+        )
+    
+    async def patch_item(
+        self,
+        item_id: int,
+        name: Optional[str] = None,
+        price: Optional[float] = None,
+        description: Optional[str] = None,
+        in_stock: Optional[bool] = None,
+        expected_status: int = 200
+    ):
+        return await self.patch(
+            f"{self.endpoint}/{item_id}",
+            json=patch_payload(name, price, description, in_stock),
+            expected_status=expected_status,
+            step=f"✏️ Частичное обновление товара ID: {item_id}"
+        )
+    
+    async def delete_item(
+        self,
+        item_id: int,
+        expected_status: int = 200
+    ):
+        return await self.delete(
+            f"{self.endpoint}/{item_id}",
+            expected_status=expected_status,
+            step=f"🗑️ Удаление товара ID: {item_id}"
+        )
+    
+    async def delete_items_by_tag(
+        self,
+        tag: str,
+        expected_status: int = 200
+    ):
+        return await self.delete(
+            f"{self.endpoint}/bulk",
+            params={"tag": tag},
+            expected_status=expected_status,
+            step=f"🧹 Удаление товаров с тегом: {tag}"
+        )
\ No newline at end of file
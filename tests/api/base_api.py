@@ -1,19 +1,137 @@
 import requests
-import allure
-import json
 import logging
+import re
+import os
+import threading
+import time
 from typing import Optional, Dict, Any
 from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection, HTTPSConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
 from urllib3.util.retry import Retry
+from api.capture import TrafficCapture, created_ids
+from api.exchange_log import ExchangeLog
+from api.transport import TRANSPORTS, InProcessAdapter, in_process_app
 from config import config
+from utils.latency import RequestTimer, latency_collector
+from utils.tracing import with_request_id
 
 logger = logging.getLogger(__name__)
 
+# Логирование обменов в Allure (режим задается API_LOG_MODE)
+exchange_log = ExchangeLog(
+    mode=config.api.log_mode,
+    sample_rate=config.api.log_sample_rate,
+    buffer_size=config.api.log_buffer_size,
+    tracing=config.api.tracing,
+    trace_sink_file=config.api.trace_sink_file
+)
+
+# Запись трафика для воспроизведения (API_CAPTURE_FILE, у воркеров xdist - свой файл)
+traffic_capture = TrafficCapture(config.api.capture_file, os.getenv('PYTEST_XDIST_WORKER'))
+
+# Коды ответов и методы, для которых выполняются повторы
+RETRY_STATUSES = [429, 500, 502, 503, 504]
+RETRY_METHODS = ["GET", "POST", "PUT", "DELETE", "PATCH"]
+
+# Замер текущего запроса потока (время соединения и получения заголовков)
+_timing = threading.local()
+
+
+def endpoint_label(endpoint: str) -> str:
+    """Эндпоинт без конкретных ID (для группировки замеров): /items/5 -> /items/{id}."""
+    return re.sub(r'/\d+(?=/|$)', '/{id}', endpoint)
+
+
+# Суммарная статистика соединений всех клиентов процесса
+_total_stats = {'requests': 0, 'connections': 0}
+_total_stats_lock = threading.Lock()
+
+
+def connection_stats() -> Dict[str, int]:
+    """Суммарное число запросов и новых TCP соединений всех клиентов процесса."""
+    with _total_stats_lock:
+        return dict(_total_stats)
+
+
+class RequestCountingMixin:
+    """Статистика адаптера requests: число запросов и новых TCP соединений."""
+    
+    def __init__(self, *args, **kwargs):
+        self._stats = {'requests': 0, 'connections': 0}
+        self._stats_lock = threading.Lock()
+        super().__init__(*args, **kwargs)
+    
+    def _count(self, name: str):
+        with self._stats_lock:
+            self._stats[name] += 1
+        with _total_stats_lock:
+            _total_stats[name] += 1
+    
+    def stats_snapshot(self) -> Dict[str, int]:
+        with self._stats_lock:
+            return dict(self._stats)
+    
+    def send(self, request, *args, **kwargs):
+        self._count('requests')
+        response = super().send(request, *args, **kwargs)
+        # Тело ответа читается позже (в Session.send), здесь получены только заголовки
+        timer = getattr(_timing, 'timer', None)
+        if timer is not None:
+            timer.headers_received()
+        return response
+
+
+class CountingHTTPAdapter(RequestCountingMixin, HTTPAdapter):
+    """
+    HTTPAdapter, считающий запросы и новые TCP соединения.
+    
+    Без keep-alive каждое соединение закрывается после ответа, и число
+    соединений совпадает с числом запросов; с keep-alive соединения
+    переиспользуются из пула.
+    """
+    
+    def _counting_pool(self, pool_cls, connection_cls):
+        adapter = self
+        
+        class CountingConnection(connection_cls):
+            def connect(self):
+                started = time.perf_counter()
+                super().connect()
+                adapter._count('connections')
+                timer = getattr(_timing, 'timer', None)
+                if timer is not None:
+                    timer.add_connect(time.perf_counter() - started)
+        
+        return type(pool_cls.__name__, (pool_cls,), {'ConnectionCls': CountingConnection})
+    
+    def init_poolmanager(self, *args, **kwargs):
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            'http': self._counting_pool(HTTPConnectionPool, HTTPConnection),
+            'https': self._counting_pool(HTTPSConnectionPool, HTTPSConnection)
+        }
+
+
+class CountingInProcessAdapter(RequestCountingMixin, InProcessAdapter):
+    """InProcessAdapter со статистикой запросов (TCP соединений не открывается)."""
+
+
 class BaseAPI:
-    """Базовый класс для всех API клиентов."""
+    """
+    Базовый класс для всех API клиентов.
     
-    def __init__(self, base_url: str = None):
+    Транспорт задается API_TRANSPORT: http - реальные HTTP запросы,
+    inprocess - приложение в текущем процессе через Flask test client.
+    """
+    
+    def __init__(self, base_url: str = None, max_retries: Optional[int] = None):
+        if config.api.transport not in TRANSPORTS:
+            raise ValueError(
+                f"Unknown API transport: {config.api.transport} (expected one of {', '.join(TRANSPORTS)})"
+            )
         self.base_url = base_url or config.api.base_url
+        self.max_retries = config.api.max_retries if max_retries is None else max_retries
         self.session = self._create_session()
         self.timeout = config.api.timeout
         
@@ -23,15 +141,29 @@ class BaseAPI:
         
         # Настройка retry стратегии
         retry_strategy = Retry(
-            total=config.api.max_retries,
+            total=self.max_retries,
             backoff_factor=config.api.retry_backoff,
-            status_forcelist=[429, 500, 502, 503, 504],
-            allowed_methods=["GET", "POST", "PUT", "DELETE", "PATCH"]
+            status_forcelist=RETRY_STATUSES,
+            allowed_methods=RETRY_METHODS,
+            # Без повторов ответ возвращается как есть (а не RetryError)
+            raise_on_status=self.max_retries > 0,
+            # Без повторов таймаут чтения - Timeout, а не ConnectionError (MaxRetryError)
+            read=False if self.max_retries == 0 else None
         )
         
-        adapter = HTTPAdapter(max_retries=retry_strategy)
+        if config.api.transport == 'inprocess':
+            # Запросы выполняются приложением в текущем процессе, без сети и повторов
+            adapter = CountingInProcessAdapter(in_process_app())
+        else:
+            # Пулы соединений: при keep-alive соединения переиспользуются между запросами
+            adapter = CountingHTTPAdapter(
+                max_retries=retry_strategy,
+                pool_connections=config.pool_connections,
+                pool_maxsize=config.pool_maxsize
+            )
         session.mount("http://", adapter)
         session.mount("https://", adapter)
+        self._adapter = adapter
         
         # Установка заголовков по умолчанию
         session.headers.update(config.default_headers)
@@ -41,51 +173,42 @@ class BaseAPI:
     def _log_request(self, method: str, url: str, **kwargs):
         """Логирование запроса."""
         logger.info(f"🌐 {method} {url}")
-        
-        with allure.step(f"📤 Request: {method} {url}"):
-            # Логирование headers
-            headers = kwargs.get('headers', {})
-            if headers:
-                allure.attach(
-                    json.dumps(dict(headers), indent=2),
-                    name="Request Headers",
-                    attachment_type=allure.attachment_type.JSON
-                )
-            
-            # Логирование body
-            if kwargs.get('json'):
-                allure.attach(
-                    json.dumps(kwargs.get('json'), indent=2, ensure_ascii=False),
-                    name="Request Body",
-                    attachment_type=allure.attachment_type.JSON
-                )
+        exchange_log.request(method, url, kwargs.get('headers'), kwargs.get('json'))
     
     def _log_response(self, response: requests.Response):
         """Логирование ответа."""
         logger.info(f"📥 Response: {response.status_code} ({response.elapsed.total_seconds():.3f}s)")
+        exchange_log.response(response)
+    
+    def _timed_request(self, method: str, endpoint: str, url: str, **kwargs) -> requests.Response:
+        """Выполнение запроса с замером connect, TTFB и полного времени (latency_collector)."""
+        timer = _timing.timer = RequestTimer()
+        started = time.perf_counter()
+        try:
+            response = self.session.request(method, url, **kwargs)
+        except requests.exceptions.RequestException as e:
+            timer.record(latency_collector, method, endpoint_label(endpoint), type(e).__name__)
+            self._capture(method, url, kwargs, started, type(e).__name__)
+            raise
+        finally:
+            _timing.timer = None
         
-        with allure.step(f"📥 Response: {response.status_code}"):
-            # Логирование body
+        timer.record(latency_collector, method, endpoint_label(endpoint), response.status_code)
+        self._capture(method, url, kwargs, started, response.status_code, response)
+        return response
+    
+    def _capture(self, method: str, url: str, kwargs: Dict, started: float, status, response=None):
+        """Запись запроса в файл захвата трафика (если включен)."""
+        if not traffic_capture.enabled:
+            return
+        duration = time.perf_counter() - started
+        ids = []
+        if response is not None and method == 'POST':
             try:
-                response_json = response.json()
-                allure.attach(
-                    json.dumps(response_json, indent=2, ensure_ascii=False),
-                    name="Response Body",
-                    attachment_type=allure.attachment_type.JSON
-                )
-            except:
-                allure.attach(
-                    response.text,
-                    name="Response Body",
-                    attachment_type=allure.attachment_type.TEXT
-                )
-            
-            # Логирование времени выполнения
-            allure.attach(
-                f"Time: {response.elapsed.total_seconds():.3f}s",
-                name="Performance",
-                attachment_type=allure.attachment_type.TEXT
-            )
+                ids = created_ids(method, response.status_code, response.json())
+            except ValueError:
+                pass
+        traffic_capture.record(method, url, kwargs.get('params'), kwargs.get('json'), started, duration, status, ids)
     
     def _request(
         self,
@@ -100,10 +223,14 @@ class BaseAPI:
         if 'timeout' not in kwargs:
             kwargs['timeout'] = self.timeout
         
+        # Идентификатор запроса: по нему приложение записывает спаны обработки
+        if config.api.tracing:
+            kwargs['headers'] = with_request_id(kwargs.get('headers'))
+        
         self._log_request(method, url, **kwargs)
         
         try:
-            response = self.session.request(method, url, **kwargs)
+            response = self._timed_request(method, endpoint, url, **kwargs)
             self._log_response(response)
             
             if expected_status:
@@ -134,5 +261,9 @@ class BaseAPI:
     def delete(self, endpoint: str, **kwargs) -> requests.Response:
         return self._request("DELETE", endpoint, **kwargs)
     
+    def connection_stats(self) -> Dict[str, int]:
+        """Статистика соединений клиента: число запросов и открытых TCP соединений."""
+        return self._adapter.stats_snapshot()
+    
     def close(self):
         self.session.close()
\ No newline at end of file
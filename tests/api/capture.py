@@ -0,0 +1,162 @@
+import atexit
+import gzip
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, Iterable, List, Optional
+from urllib.parse import urlsplit
+
+# Версия формата файла записи трафика
+CAPTURE_FORMAT_VERSION = 1
+
+
+def created_ids(method: str, status: int, body: Any) -> List[int]:
+    """ID созданных ресурсов из ответа: POST /items -> [id], POST /items/bulk -> [id, ...]."""
+    if method != 'POST' or not 200 <= status < 300 or not isinstance(body, dict):
+        return []
+    if isinstance(body.get('id'), int):
+        return [body['id']]
+    items = body.get('items')
+    if isinstance(items, list) and 'count' in body:
+        return [item['id'] for item in items if isinstance(item, dict) and isinstance(item.get('id'), int)]
+    return []
+
+
+def capture_path(path: str, worker: Optional[str] = None) -> str:
+    """Файл записи процесса: у воркеров xdist - свой (capture.jsonl.gz -> capture.gw0.jsonl.gz)."""
+    if not worker:
+        return path
+    directory, name = os.path.split(path)
+    stem, dot, extension = name.partition('.')
+    return os.path.join(directory, f"{stem}.{worker}{dot}{extension}")
+
+
+class TrafficCapture:
+    """
+    Запись последовательности запросов клиента и их времени (режим захвата).
+    
+    Включается API_CAPTURE_FILE: каждый запрос BaseAPI записывается
+    строкой JSON в gzip файл. Первая строка - заголовок (версия формата
+    и время начала записи), далее по строке на запрос с короткими ключами:
+        
+        t   - смещение начала запроса от начала записи, с
+        s   - поток (процесс и поток клиента)
+        m   - метод
+        p   - путь URL (/api/items/5)
+        q   - query параметры (если есть)
+        b   - тело JSON (если есть)
+        st  - код ответа или имя исключения (Timeout, ConnectionError)
+        d   - длительность, мс
+        ids - ID созданных ресурсов (для сопоставления при воспроизведении)
+    
+    Файл открывается при первом запросе и закрывается при выходе из процесса.
+    Воспроизведение - пакет replay.
+    """
+    
+    def __init__(self, path: str = '', worker: Optional[str] = None):
+        self.path = capture_path(path, worker) if path else ''
+        self._file = None
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._started = 0.0
+        self._origin = 0.0
+    
+    @property
+    def enabled(self) -> bool:
+        return bool(self.path) and not getattr(self._local, 'suppressed', False)
+    
+    @contextmanager
+    def suppressed(self):
+        """Отключение записи в текущем потоке (например, при воспроизведении)."""
+        previous = getattr(self._local, 'suppressed', False)
+        self._local.suppressed = True
+        try:
+            yield
+        finally:
+            self._local.suppressed = previous
+    
+    def _open(self):
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._file = gzip.open(self.path, 'wt', encoding='utf-8')
+        self._started = time.time()
+        self._origin = time.perf_counter()
+        self._write({'capture': CAPTURE_FORMAT_VERSION, 'started': self._started})
+        atexit.register(self.close)
+    
+    def _write(self, record: Dict):
+        self._file.write(json.dumps(record, separators=(',', ':'), ensure_ascii=False) + '\n')
+    
+    def record(
+        self,
+        method: str,
+        url: str,
+        params: Optional[Dict],
+        body: Any,
+        started: float,
+        duration: float,
+        status,
+        ids: Iterable[int] = ()
+    ):
+        """Запись запроса; started - момент начала по time.perf_counter()."""
+        if not self.enabled:
+            return
+        
+        thread = threading.current_thread()
+        entry = {
+            's': f"{os.getpid()}:{thread.name}",
+            'm': method,
+            'p': urlsplit(url).path,
+            'st': status,
+            'd': round(duration * 1000, 3)
+        }
+        if params:
+            entry['q'] = params
+        if body is not None:
+            entry['b'] = body
+        ids = list(ids)
+        if ids:
+            entry['ids'] = ids
+        
+        with self._lock:
+            if self._file is None:
+                self._open()
+            entry['t'] = round(max(started - self._origin, 0.0), 6)
+            self._write(entry)
+    
+    def close(self):
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+
+def read_capture(paths: Iterable[str]) -> List[Dict]:
+    """
+    Записи одного или нескольких файлов захвата в порядке начала запросов.
+    
+    Файлы разных процессов (воркеров xdist) сводятся на общую шкалу времени
+    по времени начала записи; 't' - смещение от начала самой ранней записи.
+    """
+    captures = []
+    for path in paths:
+        with gzip.open(path, 'rt', encoding='utf-8') as f:
+            lines = iter(f)
+            header = json.loads(next(lines, 'null'))
+            if not isinstance(header, dict) or header.get('capture') != CAPTURE_FORMAT_VERSION:
+                raise ValueError(f"Not a traffic capture (format v{CAPTURE_FORMAT_VERSION}): {path}")
+            captures.append((header['started'], [json.loads(line) for line in lines if line.strip()]))
+    
+    if not captures:
+        return []
+    origin = min(started for started, _ in captures)
+    records = []
+    for started, entries in captures:
+        for entry in entries:
+            entry['t'] = round(entry['t'] + started - origin, 6)
+            records.append(entry)
+    records.sort(key=lambda entry: entry['t'])
+    return records
\ No newline at end of file
@@ -0,0 +1,171 @@
+import json
+import random
+import threading
+from collections import deque
+from contextlib import contextmanager
+from typing import Any, Dict, Optional
+import allure
+import requests
+from utils.tracing import RequestTrace, format_waterfall, request_trace, server_spans
+
+# Режимы логирования запросов/ответов в Allure
+LOG_MODES = ('full', 'on-failure-only', 'sampled', 'off')
+
+
+def attach_request(method: str, url: str, headers: Optional[Dict], body: Any):
+    """Шаг Allure с заголовками и телом запроса."""
+    with allure.step(f"📤 Request: {method} {url}"):
+        # Логирование headers
+        if headers:
+            allure.attach(
+                json.dumps(dict(headers), indent=2),
+                name="Request Headers",
+                attachment_type=allure.attachment_type.JSON
+            )
+        
+        # Логирование body
+        if body:
+            allure.attach(
+                json.dumps(body, indent=2, ensure_ascii=False),
+                name="Request Body",
+                attachment_type=allure.attachment_type.JSON
+            )
+
+
+def attach_response(
+    status_code: int,
+    text: str,
+    elapsed: float,
+    trace: Optional[RequestTrace] = None,
+    trace_sink_file: str = ''
+):
+    """Шаг Allure с телом и временем ответа (и водопадом времени запроса, если есть трасса)."""
+    with allure.step(f"📥 Response: {status_code}"):
+        # Логирование body
+        try:
+            allure.attach(
+                json.dumps(json.loads(text), indent=2, ensure_ascii=False),
+                name="Response Body",
+                attachment_type=allure.attachment_type.JSON
+            )
+        except ValueError:
+            allure.attach(
+                text,
+                name="Response Body",
+                attachment_type=allure.attachment_type.TEXT
+            )
+        
+        # Логирование времени выполнения
+        allure.attach(
+            f"Time: {elapsed:.3f}s",
+            name="Performance",
+            attachment_type=allure.attachment_type.TEXT
+        )
+        
+        # Водопад: соединение, сервер (спаны validate/db/serialize), TTFB и тело
+        if trace is not None:
+            allure.attach(
+                format_waterfall(trace, server_spans(trace, trace_sink_file)),
+                name="Timing Waterfall",
+                attachment_type=allure.attachment_type.TEXT
+            )
+
+
+class ExchangeLog:
+    """
+    Логирование обменов запрос/ответ в Allure.
+    
+    Режимы:
+        full            - каждый обмен сразу прикладывается к отчету
+        on-failure-only - обмены копятся в памяти (последние buffer_size)
+                          и попадают в отчет, только если тест упал
+        sampled         - в отчет попадает доля sample_rate обменов
+        off             - в отчет ничего не пишется
+    
+    Форматирование JSON и водопада времени (tracing) выполняется только
+    для обменов, которые действительно попадают в отчет.
+    """
+    
+    def __init__(
+        self,
+        mode: str = 'full',
+        sample_rate: float = 0.1,
+        buffer_size: int = 200,
+        tracing: bool = True,
+        trace_sink_file: str = ''
+    ):
+        if mode not in LOG_MODES:
+            raise ValueError(f"Unknown API log mode: {mode} (expected one of {', '.join(LOG_MODES)})")
+        self.mode = mode
+        self.sample_rate = sample_rate
+        self.tracing = tracing
+        self.trace_sink_file = trace_sink_file
+        self._buffer = deque(maxlen=buffer_size)
+        self._lock = threading.Lock()
+        self._random = random.Random()
+        # Решение по текущему обмену (запрос и ответ логируются одинаково)
+        self._local = threading.local()
+    
+    @contextmanager
+    def suppressed(self):
+        """Отключение логирования в текущем потоке (например, в воркерах нагрузки)."""
+        previous = getattr(self._local, 'suppressed', False)
+        self._local.suppressed = True
+        try:
+            yield
+        finally:
+            self._local.suppressed = previous
+    
+    def _decide(self) -> Optional[str]:
+        if getattr(self._local, 'suppressed', False):
+            return None
+        if self.mode == 'full':
+            return 'attach'
+        if self.mode == 'on-failure-only':
+            return 'buffer'
+        if self.mode == 'sampled' and self._random.random() < self.sample_rate:
+            return 'attach'
+        return None
+    
+    def request(self, method: str, url: str, headers: Optional[Dict] = None, body: Any = None):
+        """Логирование запроса (начало обмена)."""
+        decision = self._local.decision = self._decide()
+        if decision == 'attach':
+            attach_request(method, url, headers, body)
+        elif decision == 'buffer':
+            with self._lock:
+                self._buffer.append((attach_request, (method, url, headers, body)))
+    
+    def response(self, response: requests.Response):
+        """Логирование ответа (конец обмена)."""
+        decision = getattr(self._local, 'decision', None)
+        if decision is None:
+            return
+        # Замер запроса берется сейчас (последний в потоке), спаны разбираются при записи в отчет
+        args = (
+            response.status_code,
+            response.text,
+            response.elapsed.total_seconds(),
+            request_trace(response) if self.tracing else None,
+            self.trace_sink_file
+        )
+        if decision == 'attach':
+            attach_response(*args)
+        else:
+            with self._lock:
+                self._buffer.append((attach_response, args))
+    
+    def start_test(self):
+        """Очистка буфера перед новым тестом."""
+        with self._lock:
+            self._buffer.clear()
+    
+    def flush(self):
+        """Запись накопленных обменов в отчет (при падении теста)."""
+        with self._lock:
+            entries = list(self._buffer)
+            self._buffer.clear()
+        
+        for attach, args in entries:
+            attach(*args)
+        return len(entries)
\ No newline at end of file
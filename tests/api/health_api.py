@@ -0,0 +1,26 @@
+import allure
+from .base_api import BaseAPI
+from config import config
+
+class HealthAPI(BaseAPI):
+    """Клиент для служебных эндпоинтов (health, readiness)."""
+    
+    def __init__(self, base_url: str = None):
+        # Служебные эндпоинты находятся в корне сервиса, а не под /api
+        if base_url is None:
+            base_url = config.api.base_url
+            if base_url.endswith('/api'):
+                base_url = base_url[:-len('/api')]
+        super().__init__(base_url)
+    
+    @allure.step("💓 Проверка health")
+    def get_health(self, expected_status: int = 200):
+        return self.get("/health", expected_status=expected_status)
+    
+    @allure.step("🚦 Проверка готовности (/ready)")
+    def get_ready(self, expected_status: int = 200):
+        return self.get("/ready", expected_status=expected_status)
+    
+    @allure.step("🩺 Глубокая проверка здоровья (/health/deep)")
+    def get_deep_health(self, expected_status: int = 200):
+        return self.get("/health/deep", expected_status=expected_status)
\ No newline at end of file
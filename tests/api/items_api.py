@@ -1,13 +1,87 @@
 import allure
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List
 from .base_api import BaseAPI
 
+def list_params(
+    page: int = 1,
+    per_page: int = 20,
+    in_stock: Optional[bool] = None,
+    min_price: Optional[float] = None,
+    max_price: Optional[float] = None,
+    after_id: Optional[int] = None,
+    tag: Optional[str] = None
+) -> Dict[str, Any]:
+    """Параметры запроса списка товаров (общие для синхронного и асинхронного клиентов)."""
+    params = {
+        'page': page,
+        'per_page': per_page
+    }
+    
+    if in_stock is not None:
+        params['in_stock'] = str(in_stock).lower()
+    if min_price is not None:
+        params['min_price'] = min_price
+    if max_price is not None:
+        params['max_price'] = max_price
+    if after_id is not None:
+        params['after_id'] = after_id
+    if tag is not None:
+        params['tag'] = tag
+    
+    return params
+
+def item_payload(
+    name: str,
+    price: float,
+    description: Optional[str] = None,
+    in_stock: bool = True,
+    tag: Optional[str] = None
+) -> Dict[str, Any]:
+    """Тело запроса создания/полного обновления товара."""
+    data = {
+        "name": name,
+        "price": price,
+        "in_stock": in_stock
+    }
+    
+    if description is not None:
+        data["description"] = description
+    if tag is not None:
+        data["tag"] = tag
+    
+    return data
+
+def patch_payload(
+    name: Optional[str] = None,
+    price: Optional[float] = None,
+    description: Optional[str] = None,
+    in_stock: Optional[bool] = None
+) -> Dict[str, Any]:
+    """Тело запроса частичного обновления товара (только переданные поля)."""
+    data = {}
+    if name is not None:
+        data["name"] = name
+    if price is not None:
+        data["price"] = price
+    if description is not None:
+        data["description"] = description
+    if in_stock is not None:
+        data["in_stock"] = in_stock
+    
+    return data
+
 class ItemsAPI(BaseAPI):
-    """Клиент для работы с эндпоинтами товаров."""
+    """
+    Клиент для работы с эндпоинтами товаров.
     
-    def __init__(self, base_url: str = None):
-        super().__init__(base_url)
+    tag - пространство имен данных: создаваемые клиентом товары помечаются
+    этим тегом (если не указан другой), и их можно удалить одним запросом.
+    """
+    
+    def __init__(self, base_url: str = None, max_retries: Optional[int] = None, tag: Optional[str] = None):
+        super().__init__(base_url, max_retries)
         self.endpoint = "/items"
+        self.tag = tag
     
     @allure.step("📋 Получение списка всех товаров")
     def get_all_items(
@@ -17,26 +91,19 @@ class ItemsAPI(BaseAPI):
         in_stock: Optional[bool] = None,
         min_price: Optional[float] = None,
         max_price: Optional[float] = None,
+        after_id: Optional[int] = None,
+        tag: Optional[str] = None,
         expected_status: int = 200
     ):
         """
         Получение списка товаров с фильтрацией.
-        """
-        params = {
-            'page': page,
-            'per_page': per_page
-        }
-        
-        if in_stock is not None:
-            params['in_stock'] = str(in_stock).lower()
-        if min_price is not None:
-            params['min_price'] = min_price
-        if max_price is not None:
-            params['max_price'] = max_price
         
+        after_id - курсор: только товары с ID больше указанного.
+        tag - только товары с указанным тегом.
+        """
         return self.get(
             self.endpoint,
-            params=params,
+            params=list_params(page, per_page, in_stock, min_price, max_price, after_id, tag),
             expected_status=expected_status
         )
     
@@ -58,20 +125,26 @@ class ItemsAPI(BaseAPI):
         price: float,
         description: Optional[str] = None,
         in_stock: bool = True,
+        tag: Optional[str] = None,
         expected_status: int = 201
     ):
-        data = {
-            "name": name,
-            "price": price,
-            "in_stock": in_stock
-        }
-        
-        if description is not None:
-            data["description"] = description
-        
         return self.post(
             self.endpoint,
-            json=data,
+            json=item_payload(name, price, description, in_stock, tag or self.tag),
+            expected_status=expected_status
+        )
+    
+    @allure.step("📦 Массовое создание товаров")
+    def create_items_bulk(
+        self,
+        items: List[Dict[str, Any]],
+        tag: Optional[str] = None,
+        expected_status: int = 201
+    ):
+        """Создание пачки товаров одним запросом (тег - для товаров без собственного тега)."""
+        return self.post(
+            f"{self.endpoint}/bulk",
+            json={"items": items, "tag": tag or self.tag},
             expected_status=expected_status
         )
     
@@ -85,18 +158,9 @@ class ItemsAPI(BaseAPI):
         in_stock: bool = True,
         expected_status: int = 200
     ):
-        data = {
-            "name": name,
-            "price": price,
-            "in_stock": in_stock
-        }
-        
-        if description is not None:
-            data["description"] = description
-        
         return self.put(
             f"{self.endpoint}/{item_id}",
-            json=data,
+            json=item_payload(name, price, description, in_stock),
             expected_status=expected_status
         )
     
@@ -110,19 +174,9 @@ class ItemsAPI(BaseAPI):
         in_stock: Optional[bool] = None,
         expected_status: int = 200
     ):
-        data = {}
-        if name is not None:
-            data["name"] = name
-        if price is not None:
-            data["price"] = price
-        if description is not None:
-            data["description"] = description
-        if in_stock is not None:
-            data["in_stock"] = in_stock
-        
         return self.patch(
             f"{self.endpoint}/{item_id}",
-            json=data,
+            json=patch_payload(name, price, description, in_stock),
             expected_status=expected_status
         )
     
@@ -135,4 +189,16 @@ class ItemsAPI(BaseAPI):
         return self.delete(
             f"{self.endpoint}/{item_id}",
             expected_status=expected_status
+        )
+    
+    @allure.step("🧹 Удаление товаров с тегом: {tag}")
+    def delete_items_by_tag(
+        self,
+        tag: str,
+        expected_status: int = 200
+    ):
+        return self.delete(
+            f"{self.endpoint}/bulk",
+            params={"tag": tag},
+            expected_status=expected_status
         )
\ No newline at end of file
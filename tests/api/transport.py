@@ -0,0 +1,238 @@
+import atexit
+import importlib
+import io
+import os
+import sys
+import tempfile
+import threading
+from contextlib import contextmanager
+from urllib.parse import urlsplit
+import httpx
+import requests
+from requests.adapters import BaseAdapter
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+from config import config
+
+# Транспорты клиентов API (задается API_TRANSPORT)
+TRANSPORTS = ('http', 'inprocess')
+
+_app = None
+_app_lock = threading.Lock()
+
+# Модуль app приложения (импортируется один раз на процесс)
+_app_module = None
+_app_module_lock = threading.Lock()
+
+# Запросы к приложению в процессе выполняются по одному: соединение БД
+# транзакции теста (rollback_transaction) нельзя использовать из нескольких потоков
+_request_lock = threading.Lock()
+
+
+def _enable_sqlite_savepoints(engine):
+    """
+    Явный BEGIN для SQLite: pysqlite сам управляет транзакциями и без этого
+    SAVEPOINT не работает, а откат внешней транзакции не отменяет изменения.
+    """
+    # Зависимости приложения нужны только в режиме inprocess
+    from sqlalchemy import event
+    
+    @event.listens_for(engine, 'connect')
+    def disable_pysqlite_transactions(dbapi_connection, connection_record):
+        dbapi_connection.isolation_level = None
+    
+    @event.listens_for(engine, 'begin')
+    def begin(connection):
+        connection.exec_driver_sql('BEGIN')
+    
+    # Соединения, открытые до подписки (create_all при создании приложения)
+    engine.dispose()
+
+
+def _import_app_module():
+    """
+    Модуль app из каталога API_APP_DIR.
+    
+    У приложения и тестов есть модули с одинаковым именем config: на время
+    импорта приложения модуль тестов убирается из sys.modules, затем
+    возвращается. Модули приложения к этому моменту уже связаны со своим config.
+    """
+    global _app_module
+    with _app_module_lock:
+        if _app_module is None:
+            tests_config = sys.modules.pop('config')
+            sys.path.insert(0, config.api.app_dir)
+            try:
+                _app_module = importlib.import_module('app')
+            finally:
+                sys.path.remove(config.api.app_dir)
+                sys.modules['config'] = tests_config
+        return _app_module
+
+
+def import_app_module(name: str):
+    """Модуль приложения (middleware, database.sharding и т.п.) для проверок его классов напрямую."""
+    _import_app_module()
+    tests_config = sys.modules.pop('config')
+    sys.path.insert(0, config.api.app_dir)
+    try:
+        return importlib.import_module(name)
+    finally:
+        sys.path.remove(config.api.app_dir)
+        sys.modules['config'] = tests_config
+
+
+def create_in_process_app(database_url: str, **overrides):
+    """
+    Новое приложение create_app('testing') с БД database_url и измененной конфигурацией.
+    
+    Параметры - атрибуты конфигурации приложения, которые обычно задаются
+    переменными окружения (RATE_LIMIT_ENABLED=True, SHARD_DATABASE_URLS=[...]
+    и т.п.): так проверяются режимы, выключенные в общем приложении тестов.
+    """
+    module = _import_app_module()
+    with _app_module_lock:
+        testing = module.config['testing']
+        module.config['testing'] = type(
+            testing.__name__,
+            (testing,),
+            {'SQLALCHEMY_DATABASE_URI': database_url, **overrides}
+        )
+        try:
+            return module.create_app('testing')
+        finally:
+            module.config['testing'] = testing
+
+
+def in_process_app():
+    """
+    Приложение create_app('testing') из каталога API_APP_DIR в текущем процессе.
+    
+    Создается один раз на процесс, БД - API_INPROCESS_DATABASE_URL или
+    временный файл SQLite (отдельный для каждого воркера xdist).
+    """
+    global _app
+    with _app_lock:
+        if _app is not None:
+            return _app
+        
+        database_url = config.api.inprocess_database_url
+        if not database_url:
+            worker = os.getenv('PYTEST_XDIST_WORKER', 'main')
+            path = os.path.join(tempfile.gettempdir(), f"api-tests-{worker}-{os.getpid()}.db")
+            atexit.register(lambda: os.path.exists(path) and os.remove(path))
+            database_url = f"sqlite:///{path}"
+        
+        app = create_in_process_app(database_url)
+        
+        db = app.extensions['sqlalchemy']
+        with app.app_context():
+            # Только bind'ы этого приложения (метаданные bind'ов общие для приложений процесса)
+            db.create_all(bind_key=list(db.engines))
+            for engine in db.engines.values():
+                if engine.dialect.name == 'sqlite':
+                    _enable_sqlite_savepoints(engine)
+        
+        _app = app
+        return app
+
+
+@contextmanager
+def rollback_transaction(app):
+    """
+    Откат всех изменений основной БД, сделанных запросами внутри блока.
+    
+    Сессии запросов работают в SAVEPOINT внешней транзакции выделенного
+    соединения (commit приложения фиксирует только savepoint), в конце
+    блока внешняя транзакция откатывается. Шарды не охватываются.
+    """
+    db = app.extensions['sqlalchemy']
+    with app.app_context():
+        connection = db.engine.connect()
+    transaction = connection.begin()
+    
+    factory = db.session.session_factory
+    previous_class, previous_kw = factory.class_, dict(factory.kw)
+    
+    def get_bind(session, mapper=None, clause=None, bind=None, **kwargs):
+        return bind if bind is not None else connection
+    
+    factory.class_ = type('RollbackSession', (previous_class,), {'get_bind': get_bind})
+    factory.kw['join_transaction_mode'] = 'create_savepoint'
+    try:
+        yield
+    finally:
+        factory.class_ = previous_class
+        factory.kw.clear()
+        factory.kw.update(previous_kw)
+        transaction.rollback()
+        connection.close()
+
+
+class InProcessAdapter(BaseAdapter):
+    """
+    Адаптер requests, выполняющий запросы через Flask test client без сети.
+    
+    Путь URL передается приложению как есть (http://host/api/items -> /api/items),
+    поэтому клиенты и тесты работают без изменений. Повторов нет: ответы
+    приложения возвращаются сразу.
+    """
+    
+    def __init__(self, app):
+        super().__init__()
+        self.client = app.test_client()
+    
+    def send(self, request, stream=False, timeout=None, verify=True, cert=None, proxies=None):
+        url = urlsplit(request.url)
+        headers = {
+            name: value for name, value in request.headers.items()
+            if name.lower() not in ('content-length', 'host')
+        }
+        with _request_lock:
+            result = self.client.open(
+                url.path,
+                method=request.method,
+                query_string=url.query,
+                headers=headers,
+                data=request.body or b'',
+                base_url=f"{url.scheme}://{url.netloc}"
+            )
+        
+        response = requests.Response()
+        response.status_code = result.status_code
+        response.reason = result.status.partition(' ')[2]
+        response.headers = CaseInsensitiveDict(result.headers.items())
+        response.encoding = get_encoding_from_headers(response.headers)
+        response._content = result.get_data()
+        response.raw = io.BytesIO(response._content)
+        response.url = request.url
+        response.request = request
+        response.connection = self
+        return response
+    
+    def close(self):
+        pass
+
+
+class AsyncInProcessTransport(httpx.AsyncBaseTransport):
+    """
+    Транспорт httpx для AsyncBaseAPI через WSGI приложения без сети.
+    
+    Запрос обрабатывается синхронно в потоке цикла событий: сессия БД
+    (в том числе транзакция rollback_transaction) привязана к этому потоку.
+    """
+    
+    def __init__(self, app):
+        self._transport = httpx.WSGITransport(app=app)
+    
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        await request.aread()
+        with _request_lock:
+            response = self._transport.handle_request(request)
+        return httpx.Response(
+            status_code=response.status_code,
+            headers=response.headers,
+            # Поток, а не content: иначе httpx не закрывает его и не выставляет elapsed
+            stream=httpx.ByteStream(response.read()),
+            extensions=response.extensions
+        )
\ No newline at end of file
@@ -0,0 +1,13 @@
+from .baseline import BaselineStore
+from .stats import compare, mann_whitney_greater
+from .suite import BENCHMARKS, Benchmark, BenchmarkContext, create_context
+
+__all__ = [
+    'BaselineStore',
+    'compare',
+    'mann_whitney_greater',
+    'BENCHMARKS',
+    'Benchmark',
+    'BenchmarkContext',
+    'create_context'
+]
\ No newline at end of file
@@ -0,0 +1,55 @@
+import json
+import os
+import platform
+from datetime import datetime
+from typing import Dict, List, Optional
+
+
+class BaselineStore:
+    """
+    Базовые линии бенчмарков в виде JSON файлов (один файл на бенчмарк).
+    
+    Каталог задается BENCHMARK_BASELINE_DIR: это может быть каталог
+    в репозитории или артефакт CI, восстановленный перед прогоном.
+    Каждый запуск с --update-baselines добавляет прогон, хранятся
+    последние max_runs: по ним оценивается разброс между прогонами.
+    """
+    
+    def __init__(self, directory: str, max_runs: int = 5):
+        self.directory = directory
+        self.max_runs = max_runs
+    
+    def path(self, name: str) -> str:
+        return os.path.join(self.directory, f"{name}.json")
+    
+    def load(self, name: str) -> Optional[Dict]:
+        path = self.path(name)
+        if not os.path.exists(path):
+            return None
+        with open(path, encoding='utf-8') as f:
+            return json.load(f)
+    
+    def runs(self, name: str) -> List[List[float]]:
+        """Замеры (мс) сохраненных прогонов базовой линии."""
+        data = self.load(name)
+        return [run['samples_ms'] for run in data['runs']] if data else []
+    
+    def save(self, name: str, samples_ms: List[float], summary: Dict) -> str:
+        """Добавление прогона в базовую линию (хранятся последние max_runs прогонов)."""
+        os.makedirs(self.directory, exist_ok=True)
+        data = self.load(name) or {'benchmark': name, 'runs': []}
+        data['runs'].append({
+            'recorded_at': datetime.utcnow().isoformat(),
+            'environment': {
+                'python': platform.python_version(),
+                'host': platform.node()
+            },
+            'summary': summary,
+            'samples_ms': [round(value, 3) for value in samples_ms]
+        })
+        data['runs'] = data['runs'][-self.max_runs:]
+        
+        path = self.path(name)
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, indent=2)
+        return path
\ No newline at end of file
@@ -0,0 +1,109 @@
+import math
+import statistics
+from typing import Dict, Optional, Sequence, Tuple
+
+
+def _ranks(values: Sequence[float]) -> Tuple[list, float]:
+    """Ранги (средние для совпадающих значений) и поправка на связки sum(t^3 - t)."""
+    order = sorted(range(len(values)), key=lambda index: values[index])
+    ranks = [0.0] * len(values)
+    tie_term = 0.0
+    position = 0
+    
+    while position < len(order):
+        end = position
+        while end + 1 < len(order) and values[order[end + 1]] == values[order[position]]:
+            end += 1
+        average_rank = (position + end) / 2 + 1
+        for index in order[position:end + 1]:
+            ranks[index] = average_rank
+        ties = end - position + 1
+        tie_term += ties ** 3 - ties
+        position = end + 1
+    
+    return ranks, tie_term
+
+
+def mann_whitney_greater(current: Sequence[float], baseline: Sequence[float]) -> float:
+    """
+    Односторонний критерий Манна-Уитни: p-value гипотезы,
+    что значения current систематически больше значений baseline.
+    
+    Используется нормальное приближение с поправкой на связки
+    и на непрерывность (достаточно при 20+ замерах в каждой выборке).
+    """
+    n1, n2 = len(current), len(baseline)
+    if n1 == 0 or n2 == 0:
+        return 1.0
+    
+    ranks, tie_term = _ranks(list(current) + list(baseline))
+    u_current = sum(ranks[:n1]) - n1 * (n1 + 1) / 2
+    
+    n = n1 + n2
+    mean = n1 * n2 / 2
+    variance = n1 * n2 / 12 * ((n + 1) - tie_term / (n * (n - 1)))
+    if variance <= 0:
+        return 1.0
+    
+    z = (u_current - mean - 0.5) / math.sqrt(variance)
+    return 0.5 * math.erfc(z / math.sqrt(2))
+
+
+def compare(
+    current: Sequence[float],
+    baseline_runs: Optional[Sequence[Sequence[float]]],
+    alpha: float = 0.01,
+    threshold: float = 0.1
+) -> Dict:
+    """
+    Сравнение замеров с базовой линией из нескольких прогонов.
+    
+    Регрессия фиксируется, только если одновременно:
+      - сдвиг статистически значим относительно всех замеров базовой линии (p < alpha);
+      - медиана больше медианы самого медленного прогона базовой линии
+        больше чем на threshold (доля).
+    Второе условие учитывает разброс между прогонами (состояние машины,
+    кэши), который не виден внутри одного прогона; так шум и незначимые
+    на практике изменения не роняют прогон. Улучшение - симметрично,
+    относительно самого быстрого прогона.
+    """
+    result = {
+        'current_median_ms': round(statistics.median(current), 3),
+        'samples': len(current),
+        'alpha': alpha,
+        'threshold': threshold
+    }
+    runs = [run for run in (baseline_runs or []) if run]
+    if not runs:
+        result['status'] = 'no_baseline'
+        return result
+    
+    pooled = [value for run in runs for value in run]
+    run_medians = [statistics.median(run) for run in runs]
+    slowest, fastest = max(run_medians), min(run_medians)
+    current_median = statistics.median(current)
+    
+    change = (current_median - slowest) / slowest if slowest else 0.0
+    change_vs_fastest = (current_median - fastest) / fastest if fastest else 0.0
+    p_slower = mann_whitney_greater(current, pooled)
+    p_faster = mann_whitney_greater(pooled, current)
+    
+    if p_slower < alpha and change > threshold:
+        status = 'regression'
+    elif p_faster < alpha and change_vs_fastest < -threshold:
+        status = 'improvement'
+    else:
+        status = 'ok'
+    
+    result.update({
+        'status': status,
+        'baseline_median_ms': round(statistics.median(pooled), 3),
+        'baseline_run_medians_ms': [round(value, 3) for value in run_medians],
+        # Медиана, относительно которой считается median_change (самый медленный прогон)
+        'reference_median_ms': round(slowest, 3),
+        'baseline_samples': len(pooled),
+        'median_change': round(change, 4),
+        'p_value_slower': round(p_slower, 6),
+        'p_value_faster': round(p_faster, 6)
+    })
+    return result
\ No newline at end of file
@@ -0,0 +1,91 @@
+import random
+import uuid
+from typing import Callable, Dict, List, Optional
+from api.base_api import exchange_log
+from api.items_api import ItemsAPI
+from load.runner import LoadItemsAPI, quiet_client_logging
+from load.scenarios import random_payload
+from utils.latency import latency_collector
+
+
+class BenchmarkContext:
+    """
+    Набор данных бенчмарков: заранее созданные товары и товары, созданные замерами.
+    
+    Все товары помечаются тегом клиента и удаляются после прогона одним запросом.
+    """
+    
+    def __init__(self, client: ItemsAPI, seed: int = 42):
+        self.client = client
+        self.rng = random.Random(seed)
+        self.item_ids: List[int] = []
+    
+    def seed(self, size: int):
+        """Создание size товаров одним запросом (не входит в замеры)."""
+        response = self.client.create_items_bulk([random_payload(self.rng) for _ in range(size)])
+        self.item_ids.extend(item['id'] for item in response.json()['items'])
+    
+    def create(self) -> int:
+        response = self.client.create_item(**random_payload(self.rng))
+        return response.json()['id']
+    
+    def cleanup(self):
+        with quiet_client_logging(), exchange_log.suppressed():
+            self.client.delete_items_by_tag(self.client.tag)
+        self.item_ids = []
+
+
+class Benchmark:
+    """
+    Один бенчмарк: измеряемый запрос и необязательная подготовка.
+    
+    prepare(context) выполняется перед каждым замером и не входит в него
+    (например, создание товара для бенчмарка удаления).
+    """
+    
+    def __init__(self, name: str, measure: Callable, prepare: Optional[Callable] = None):
+        self.name = name
+        self.measure = measure
+        self.prepare = prepare
+    
+    def run(self, context: BenchmarkContext, iterations: int, warmup: int) -> List[float]:
+        """Замеры полного времени запроса (мс) без прогревочных итераций."""
+        samples_ms = []
+        
+        with quiet_client_logging(), exchange_log.suppressed():
+            for iteration in range(warmup + iterations):
+                argument = self.prepare(context) if self.prepare else None
+                response = self.measure(context, argument)
+                assert response.status_code < 400, \
+                    f"Benchmark '{self.name}' got status {response.status_code}: {response.text}"
+                if iteration >= warmup:
+                    samples_ms.append(latency_collector.last_sample().total * 1000)
+        
+        return samples_ms
+
+
+def _pick(context: BenchmarkContext) -> int:
+    return context.rng.choice(context.item_ids)
+
+
+BENCHMARKS: Dict[str, Benchmark] = {benchmark.name: benchmark for benchmark in [
+    Benchmark('list_per_page_10', lambda c, _: c.client.get_all_items(per_page=10)),
+    Benchmark('list_per_page_50', lambda c, _: c.client.get_all_items(per_page=50)),
+    Benchmark('list_per_page_100', lambda c, _: c.client.get_all_items(per_page=100)),
+    Benchmark('list_page_5', lambda c, _: c.client.get_all_items(page=5, per_page=20)),
+    Benchmark('list_filter_in_stock', lambda c, _: c.client.get_all_items(in_stock=True)),
+    Benchmark('list_filter_price', lambda c, _: c.client.get_all_items(min_price=100, max_price=500)),
+    Benchmark('list_cursor', lambda c, _: c.client.get_all_items(after_id=c.item_ids[len(c.item_ids) // 2])),
+    Benchmark('get_item', lambda c, _: c.client.get_item(_pick(c))),
+    Benchmark('create_item', lambda c, _: c.client.create_item(**random_payload(c.rng))),
+    Benchmark('patch_item', lambda c, _: c.client.patch_item(_pick(c), price=round(c.rng.uniform(1, 1000), 2))),
+    Benchmark('delete_item', lambda c, item_id: c.client.delete_item(item_id), prepare=lambda c: c.create())
+]}
+
+
+def create_context(dataset_size: int, seed: int = 42) -> BenchmarkContext:
+    """Контекст с клиентом без шагов Allure и повторов и с заранее созданными товарами."""
+    context = BenchmarkContext(LoadItemsAPI(max_retries=0, tag=f"benchmark-{uuid.uuid4().hex[:12]}"), seed)
+    with quiet_client_logging(), exchange_log.suppressed():
+        context.seed(dataset_size)
+    return context
\ No newline at end of file
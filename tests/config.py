@@ -14,6 +14,29 @@ class APIConfig:
     timeout: int = int(os.getenv("API_TIMEOUT", "30"))
     max_retries: int = int(os.getenv("API_MAX_RETRIES", "3"))
     retry_backoff: float = float(os.getenv("RETRY_BACKOFF", "1.0"))
+    # Переиспользование соединений (keep-alive) и размеры пулов HTTPAdapter;
+    # 0 - по числу параллельных воркеров (PARALLEL_WORKERS)
+    keep_alive: bool = os.getenv("API_KEEP_ALIVE", "false").lower() == "true"
+    pool_connections: int = int(os.getenv("API_POOL_CONNECTIONS", "0"))
+    pool_maxsize: int = int(os.getenv("API_POOL_MAXSIZE", "0"))
+    # Размер пула соединений асинхронного клиента (httpx)
+    async_max_connections: int = int(os.getenv("API_ASYNC_MAX_CONNECTIONS", "100"))
+    # Логирование запросов/ответов в Allure: full, on-failure-only, sampled, off
+    log_mode: str = os.getenv("API_LOG_MODE", "full")
+    log_sample_rate: float = float(os.getenv("API_LOG_SAMPLE_RATE", "0.1"))
+    log_buffer_size: int = int(os.getenv("API_LOG_BUFFER_SIZE", "200"))
+    # Транспорт: http - запросы к API_BASE_URL, inprocess - приложение из API_APP_DIR
+    # в текущем процессе через Flask test client (без сети, с откатом изменений после теста)
+    transport: str = os.getenv("API_TRANSPORT", "http")
+    app_dir: str = os.getenv("API_APP_DIR", str(Path(__file__).parent.parent / "app"))
+    # БД приложения в режиме inprocess; пусто - временный файл SQLite на процесс
+    inprocess_database_url: str = os.getenv("API_INPROCESS_DATABASE_URL", "")
+    # Запись трафика клиента для воспроизведения (python -m replay); пусто - без записи
+    capture_file: str = os.getenv("API_CAPTURE_FILE", "")
+    # Трассировка: X-Request-ID в каждом запросе и водопад времени (клиент и спаны сервера) в Allure;
+    # спаны берутся из Server-Timing или из файла трасс приложения (его TRACE_SINK_FILE)
+    tracing: bool = os.getenv("API_TRACING", "true").lower() == "true"
+    trace_sink_file: str = os.getenv("API_TRACE_SINK_FILE", "")
 
 @dataclass
 class TestConfig:
@@ -21,20 +44,146 @@ class TestConfig:
     log_level: str = os.getenv("LOG_LEVEL", "INFO")
     parallel_workers: int = int(os.getenv("PARALLEL_WORKERS", "4"))
     faker_seed: int = int(os.getenv("FAKER_SEED", "42"))
+    # Тег (пространство имен) данных сессии; пусто - уникальный тег на каждый запуск
+    data_tag: str = os.getenv("TEST_DATA_TAG", "")
+    # Размер общего набора данных (seeded_dataset) и пачки резерва товаров (created_item)
+    dataset_size: int = int(os.getenv("TEST_DATASET_SIZE", "100"))
+    item_reserve_batch: int = int(os.getenv("TEST_ITEM_RESERVE_BATCH", "20"))
+    # Длительности тестов для распределения между воркерами xdist (--duration-schedule)
+    durations_file: str = os.getenv(
+        "TEST_DURATIONS_FILE",
+        os.path.join(os.path.dirname(os.path.abspath(__file__)), ".test_durations.json")
+    )
+    # Пул заранее сгенерированных данных товаров (data.pools): размер и каталог кэша
+    data_pool_size: int = int(os.getenv("TEST_DATA_POOL_SIZE", "200000"))
+    data_pool_dir: str = os.getenv(
+        "TEST_DATA_POOL_DIR",
+        os.path.join(os.path.dirname(os.path.abspath(__file__)), ".data_pools")
+    )
+    # Проверка схем ответов: jsonschema или fastjsonschema (компилируемые валидаторы,
+    # нужен пакет fastjsonschema; описания ошибок в обоих случаях от jsonschema)
+    schema_backend: str = os.getenv("TEST_SCHEMA_BACKEND", "jsonschema")
+
+@dataclass
+class LoadConfig:
+    """Конфигурация нагрузочных прогонов (маркер load, python -m load)."""
+    scenario: str = os.getenv("LOAD_SCENARIO", "crud_mix")
+    workers: int = int(os.getenv("LOAD_WORKERS", "4"))
+    duration: float = float(os.getenv("LOAD_DURATION", "5"))
+    # 0 - фиксированная конкурентность без ограничения RPS
+    target_rps: float = float(os.getenv("LOAD_TARGET_RPS", "0"))
+    warmup: float = float(os.getenv("LOAD_WARMUP", "1"))
+    max_error_rate: float = float(os.getenv("LOAD_MAX_ERROR_RATE", "0.01"))
+    max_p99_ms: float = float(os.getenv("LOAD_MAX_P99_MS", "1000"))
+    # Распределенная нагрузка (load.distributed): число процессов-воркеров, адрес
+    # координатора для подключения реплик и ключ проверки подключений
+    processes: int = int(os.getenv("LOAD_PROCESSES", "1"))
+    coordinator_listen: str = os.getenv("LOAD_COORDINATOR_LISTEN", "127.0.0.1:0")
+    coordinator_authkey: str = os.getenv("LOAD_COORDINATOR_AUTHKEY", "load-coordinator")
+
+@dataclass
+class SoakConfig:
+    """Конфигурация длительных прогонов с поиском утечек (маркер soak, python -m load.soak)."""
+    scenario: str = os.getenv("SOAK_SCENARIO", "steady_mix")
+    duration: float = float(os.getenv("SOAK_DURATION", "7200"))
+    workers: int = int(os.getenv("SOAK_WORKERS", "4"))
+    # Постоянный RPS: задержки начала и конца прогона сравнимы между собой
+    target_rps: float = float(os.getenv("SOAK_TARGET_RPS", "50"))
+    # Период опроса /metrics и окна задержек клиента, с
+    interval: float = float(os.getenv("SOAK_INTERVAL", "15"))
+    # Начало прогона без анализа трендов (прогрев кэшей, пулов и аллокатора), с
+    warmup: float = float(os.getenv("SOAK_WARMUP", "300"))
+    # Пороги устойчивого роста (наклон Тейла-Сена) в час
+    max_rss_growth_mb_per_hour: float = float(os.getenv("SOAK_MAX_RSS_GROWTH_MB_PER_HOUR", "32"))
+    max_fd_growth_per_hour: float = float(os.getenv("SOAK_MAX_FD_GROWTH_PER_HOUR", "5"))
+    max_pool_growth_per_hour: float = float(os.getenv("SOAK_MAX_POOL_GROWTH_PER_HOUR", "2"))
+    # Порог дрейфа p50 задержки за анализируемую часть прогона (0.5 - рост на 50%)
+    max_latency_drift: float = float(os.getenv("SOAK_MAX_LATENCY_DRIFT", "0.5"))
+
+@dataclass
+class StressConfig:
+    """Конфигурация конкурентных изменений одного товара (маркер stress, scripts/contention.py)."""
+    workers: int = int(os.getenv("STRESS_WORKERS", "8"))
+    rounds: int = int(os.getenv("STRESS_ROUNDS", "5"))
+    # Фазы раунда: конкурентные PUT/PATCH/GET и запросы после одновременного DELETE, с
+    write_duration: float = float(os.getenv("STRESS_WRITE_DURATION", "1"))
+    delete_duration: float = float(os.getenv("STRESS_DELETE_DURATION", "0.3"))
+
+@dataclass
+class FuzzConfig:
+    """Конфигурация генеративной проверки валидации (маркер fuzz, scripts/fuzz.py)."""
+    cases: int = int(os.getenv("FUZZ_CASES", "5000"))
+    # Воркеры: процессы в режиме inprocess, потоки в режиме http
+    workers: int = int(os.getenv("FUZZ_WORKERS", "4"))
+    # Пустое значение - новый seed на каждый прогон (выводится в отчете)
+    seed: str = os.getenv("FUZZ_SEED", "")
+    # Нарушений, упрощаемых в одной задаче воркера (остальные только считаются)
+    max_failures: int = int(os.getenv("FUZZ_MAX_FAILURES", "20"))
+
+@dataclass
+class BenchmarkConfig:
+    """Конфигурация бенчмарков (маркер benchmark) и сравнения с базовыми линиями."""
+    baseline_dir: str = os.getenv(
+        "BENCHMARK_BASELINE_DIR",
+        os.path.join(os.path.dirname(os.path.abspath(__file__)), "benchmarks", "baselines")
+    )
+    iterations: int = int(os.getenv("BENCHMARK_ITERATIONS", "50"))
+    warmup: int = int(os.getenv("BENCHMARK_WARMUP", "5"))
+    dataset_size: int = int(os.getenv("BENCHMARK_DATASET_SIZE", "200"))
+    # Число хранимых прогонов базовой линии (для оценки разброса между прогонами)
+    baseline_runs: int = int(os.getenv("BENCHMARK_BASELINE_RUNS", "5"))
+    # Регрессия: p-value < alpha и рост медианы относительно самого медленного прогона больше threshold
+    alpha: float = float(os.getenv("BENCHMARK_ALPHA", "0.01"))
+    threshold: float = float(os.getenv("BENCHMARK_THRESHOLD", "0.2"))
+    # false - регрессия только отмечается в Allure, тест не падает
+    fail_on_regression: bool = os.getenv("BENCHMARK_FAIL_ON_REGRESSION", "true").lower() == "true"
+
+@dataclass
+class ReplayConfig:
+    """Конфигурация воспроизведения записанного трафика (python -m replay)."""
+    # Множитель скорости: 2 - вдвое быстрее записи, 0 - без пауз
+    speed: float = float(os.getenv("REPLAY_SPEED", "1"))
+    streams: int = int(os.getenv("REPLAY_STREAMS", "4"))
+    # Ожидание создания ресурса, на который ссылается запрос, с
+    dependency_timeout: float = float(os.getenv("REPLAY_DEPENDENCY_TIMEOUT", "5"))
+
+@dataclass
+class StubServerConfig:
+    """Конфигурация заглушки API (python -m stub_server): адрес и профиль отказов."""
+    host: str = os.getenv("STUB_HOST", "127.0.0.1")
+    port: int = int(os.getenv("STUB_PORT", "5002"))
+    # Распределение задержки: fixed:50, uniform:10,100, normal:50,10, lognormal:50,0.5, exponential:20, pareto:10,2 (мс)
+    latency: str = os.getenv("STUB_LATENCY", "fixed:0")
+    error_rate: float = float(os.getenv("STUB_ERROR_RATE", "0"))
+    error_status: int = int(os.getenv("STUB_ERROR_STATUS", "503"))
+    reset_rate: float = float(os.getenv("STUB_RESET_RATE", "0"))
+    # Скорость отправки ответа, байт/с (0 - без ограничения)
+    bandwidth: int = int(os.getenv("STUB_BANDWIDTH", "0"))
 
 class Config:
     """Главный класс конфигурации."""
     api = APIConfig()
     test = TestConfig()
+    load = LoadConfig()
+    soak = SoakConfig()
+    stress = StressConfig()
+    fuzz = FuzzConfig()
+    benchmark = BenchmarkConfig()
+    replay = ReplayConfig()
+    stub = StubServerConfig()
     
     # Заголовки по умолчанию
     default_headers = {
         "Content-Type": "application/json",
         "Accept": "application/json",
         "User-Agent": "API-Test-Framework/2.0",
-        "Connection": "close"
+        "Connection": "keep-alive" if api.keep_alive else "close"
     }
     
+    # Размеры пулов соединений (по умолчанию - по числу воркеров)
+    pool_connections = api.pool_connections or max(test.parallel_workers, 1)
+    pool_maxsize = api.pool_maxsize or max(test.parallel_workers, 1)
+    
     # Схемы ответов для валидации
     response_schemas = {
         "item": {
@@ -45,6 +194,7 @@ class Config:
                 "price": {"type": "number"},
                 "description": {"type": ["string", "null"]},
                 "in_stock": {"type": "boolean"},
+                "tag": {"type": ["string", "null"]},
                 "created_at": {"type": "string", "format": "date-time"},
                 "updated_at": {"type": ["string", "null"], "format": "date-time"}
             },
@@ -60,6 +210,7 @@ class Config:
                         "price": {"type": "number"},
                         "description": {"type": ["string", "null"]},
                         "in_stock": {"type": "boolean"},
+                        "tag": {"type": ["string", "null"]},
                         "created_at": {"type": "string", "format": "date-time"},
                         "updated_at": {"type": ["string", "null"], "format": "date-time"}
                     },
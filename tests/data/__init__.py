@@ -5,11 +5,19 @@ from .test_data import (
     BULK_TEST_DATA,
     BOUNDARY_VALUES
 )
+from .datasets import generate_dataset, ItemReserve
+from .pools import ItemDataPool, PoolCursor, build_item_pool, item_pool
 
 __all__ = [
     'create_item_test_data',
     'update_item_test_data',
     'generate_random_item',
     'BULK_TEST_DATA',
-    'BOUNDARY_VALUES'
+    'BOUNDARY_VALUES',
+    'generate_dataset',
+    'ItemReserve',
+    'ItemDataPool',
+    'PoolCursor',
+    'build_item_pool',
+    'item_pool'
 ]
\ No newline at end of file
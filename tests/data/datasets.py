@@ -0,0 +1,43 @@
+from typing import Any, Dict, List
+from .pools import item_pool
+
+
+def generate_dataset(size: int) -> List[Dict[str, Any]]:
+    """
+    Детерминированный набор товаров для тестов списков.
+    
+    Цены идут с шагом 10 (10, 20, ...), каждый третий товар не в наличии:
+    ожидаемый результат любого фильтра вычисляется по самому набору.
+    """
+    return [
+        {
+            'name': f"Dataset Item {index}",
+            'price': float(10 * (index + 1)),
+            'description': f"Товар набора данных #{index}",
+            'in_stock': index % 3 != 0
+        }
+        for index in range(size)
+    ]
+
+
+class ItemReserve:
+    """
+    Резерв заранее созданных товаров.
+    
+    Товары создаются пачками одним запросом (данные - из пула item_pool)
+    и выдаются тестам по одному: каждый товар достается только одному
+    тесту, поэтому тест может его изменять и удалять. Невыданные товары
+    удаляются вместе с остальными данными сессии по тегу клиента.
+    """
+    
+    def __init__(self, client, batch_size: int = 20):
+        self.client = client
+        self.batch_size = batch_size
+        self._items: List[Dict[str, Any]] = []
+    
+    def take(self) -> Dict[str, Any]:
+        """Следующий свободный товар (при пустом резерве создается новая пачка)."""
+        if not self._items:
+            response = self.client.create_items_bulk(item_pool().take(self.batch_size))
+            self._items = response.json()['items']
+        return self._items.pop(0)
\ No newline at end of file
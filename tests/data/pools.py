@@ -0,0 +1,200 @@
+import json
+import logging
+import mmap
+import os
+import random
+import struct
+import tempfile
+import threading
+from typing import Any, Dict, List, Optional, Tuple
+from faker import Faker
+from config import config
+
+logger = logging.getLogger(__name__)
+
+# Версия формата файла пула (меняется вместе со схемой генерации)
+POOL_FORMAT_VERSION = 1
+POOL_MAGIC = b'ITEMPOOL'
+
+# Запись товара: индекс названия, индекс описания, цена в копейках, наличие
+RECORD = struct.Struct('<HHIB')
+
+# Размер словарей Faker: товары пула - сочетания их элементов
+VOCABULARY_SIZE = 2048
+
+_HEADER_LENGTH = struct.Struct('<I')
+
+
+def _vocabulary(seed: int) -> Tuple[List[str], List[str]]:
+    """Названия и описания от Faker с заданным сидом."""
+    fake = Faker()
+    fake.seed_instance(seed)
+    names = [fake.catch_phrase()[:50] for _ in range(VOCABULARY_SIZE)]
+    descriptions = [fake.text(max_nb_chars=200) for _ in range(VOCABULARY_SIZE)]
+    return names, descriptions
+
+
+def build_item_pool(path: str, size: int, seed: int):
+    """
+    Генерация пула из size товаров в файл path.
+    
+    Формат: сигнатура, длина и JSON заголовка (параметры и словари Faker),
+    затем size записей RECORD фиксированной длины. Файл пишется во временный
+    и переименовывается: параллельные воркеры xdist не видят его недописанным.
+    """
+    names, descriptions = _vocabulary(seed)
+    header = json.dumps({
+        'version': POOL_FORMAT_VERSION,
+        'size': size,
+        'seed': seed,
+        'names': names,
+        'descriptions': descriptions
+    }, ensure_ascii=False).encode('utf-8')
+    
+    rng = random.Random(seed)
+    records = bytearray(RECORD.size * size)
+    for index in range(size):
+        RECORD.pack_into(
+            records,
+            index * RECORD.size,
+            rng.randrange(VOCABULARY_SIZE),
+            rng.randrange(VOCABULARY_SIZE),
+            rng.randrange(1, 1000000),
+            rng.random() < 0.7
+        )
+    
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    fd, temp_path = tempfile.mkstemp(dir=directory, suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(POOL_MAGIC)
+            f.write(_HEADER_LENGTH.pack(len(header)))
+            f.write(header)
+            f.write(records)
+        os.replace(temp_path, path)
+    except BaseException:
+        os.remove(temp_path)
+        raise
+
+
+class ItemDataPool:
+    """
+    Заранее сгенерированный пул данных товаров, отображенный в память (mmap).
+    
+    Товар index собирается из записи фиксированной длины по смещению,
+    файл целиком не читается. Названия дополняются номером товара,
+    поэтому все товары пула различаются.
+    """
+    
+    def __init__(self, path: str):
+        self.path = path
+        with open(path, 'rb') as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        
+        if self._mmap[:len(POOL_MAGIC)] != POOL_MAGIC:
+            self.close()
+            raise ValueError(f"Not an item pool file: {path}")
+        offset = len(POOL_MAGIC)
+        (header_length,) = _HEADER_LENGTH.unpack_from(self._mmap, offset)
+        offset += _HEADER_LENGTH.size
+        header = json.loads(self._mmap[offset:offset + header_length].decode('utf-8'))
+        
+        self.version = header['version']
+        self.size = header['size']
+        self.seed = header['seed']
+        self._names = header['names']
+        self._descriptions = header['descriptions']
+        self._records_offset = offset + header_length
+    
+    @classmethod
+    def open(cls, directory: str, size: int, seed: int) -> 'ItemDataPool':
+        """Пул из кэша в directory (при отсутствии или другой версии формата - генерируется)."""
+        path = os.path.join(directory, f"items-{seed}-{size}-v{POOL_FORMAT_VERSION}.pool")
+        if not os.path.exists(path):
+            logger.info(f"📦 Generating item data pool: {size} items (seed {seed})")
+            build_item_pool(path, size, seed)
+        return cls(path)
+    
+    def __len__(self) -> int:
+        return self.size
+    
+    def item(self, index: int) -> Dict[str, Any]:
+        name, description, price, in_stock = RECORD.unpack_from(
+            self._mmap, self._records_offset + index * RECORD.size
+        )
+        return {
+            'name': f"{self._names[name]} #{index}",
+            'price': price / 100,
+            'description': self._descriptions[description],
+            'in_stock': bool(in_stock)
+        }
+    
+    def close(self):
+        self._mmap.close()
+
+
+class PoolCursor:
+    """
+    Выдача товаров пула без повторов.
+    
+    Пул делится между воркерами xdist чередованием: воркер gwN из count
+    получает товары N, N + count, N + 2 * count, ... - разные воркеры
+    никогда не получают один товар. Внутри процесса выдача потокобезопасна.
+    При исчерпании своей части выдача начинается сначала (с предупреждением).
+    """
+    
+    def __init__(self, pool: ItemDataPool, partition: int = 0, partitions: int = 1):
+        self.pool = pool
+        self.partition = partition
+        self.partitions = max(partitions, 1)
+        self._position = 0
+        self._lock = threading.Lock()
+    
+    @property
+    def capacity(self) -> int:
+        """Число товаров в части пула этого курсора."""
+        return len(range(self.partition, len(self.pool), self.partitions))
+    
+    def take(self, count: int = 1) -> List[Dict[str, Any]]:
+        with self._lock:
+            start = self._position
+            self._position += count
+        capacity = self.capacity
+        if start + count > capacity:
+            logger.warning(
+                f"⚠️ Item data pool exhausted ({capacity} items per worker), items repeat; "
+                f"increase TEST_DATA_POOL_SIZE"
+            )
+        return [
+            self.pool.item(self.partition + (position % capacity) * self.partitions)
+            for position in range(start, start + count)
+        ]
+    
+    def take_one(self) -> Dict[str, Any]:
+        return self.take(1)[0]
+
+
+def worker_partition() -> Tuple[int, int]:
+    """Номер воркера xdist и число воркеров ((0, 1) без xdist)."""
+    worker = os.getenv('PYTEST_XDIST_WORKER')
+    if not worker:
+        return 0, 1
+    return int(worker.lstrip('gw')), int(os.getenv('PYTEST_XDIST_WORKER_COUNT', '1'))
+
+
+_cursor: Optional[PoolCursor] = None
+_cursor_lock = threading.Lock()
+
+
+def item_pool() -> PoolCursor:
+    """
+    Общий курсор пула товаров процесса (TEST_DATA_POOL_SIZE товаров,
+    сид FAKER_SEED, кэш в TEST_DATA_POOL_DIR), создается при первом вызове.
+    """
+    global _cursor
+    with _cursor_lock:
+        if _cursor is None:
+            pool = ItemDataPool.open(config.test.data_pool_dir, config.test.data_pool_size, config.test.faker_seed)
+            _cursor = PoolCursor(pool, *worker_partition())
+        return _cursor
\ No newline at end of file
@@ -0,0 +1,5 @@
+from .generators import CaseGenerator
+from .oracle import Violation, check, expected, shrink
+from .runner import FuzzRunner
+
+__all__ = ['CaseGenerator', 'Violation', 'check', 'expected', 'shrink', 'FuzzRunner']
\ No newline at end of file
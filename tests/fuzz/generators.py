@@ -0,0 +1,281 @@
+import json
+import random
+from typing import Any, Callable, Dict, List
+from stub_server.store import DESCRIPTION_MAX_LENGTH, FALSY, MAX_PER_PAGE, NAME_MAX_LENGTH, TAG_MAX_LENGTH, TRUTHY
+
+# Операции: создание и полное обновление (ItemSchema), частичное обновление
+# (ItemSchema(partial=True)), список (ItemQuerySchema), массовое создание
+# (ItemBulkSchema) и удаление по тегу (ItemBulkDeleteSchema); доли в потоке случаев
+OPERATIONS = {'create': 30, 'patch': 15, 'put': 10, 'list': 25, 'bulk_create': 12, 'bulk_delete': 8}
+
+# Начало тегов массового удаления: в остальных строках генератора символа нет,
+# поэтому удаление не затрагивает товары других случаев и товар для PATCH и PUT
+DELETE_TAG_PREFIX = '#'
+
+# Товаров в пачке массового создания
+BULK_SIZES = (1, 1, 2, 3, 5)
+
+# Символы строк: ASCII, кириллица, CJK, эмодзи (вне BMP), пробельные и служебные
+ALPHABETS = (
+    'abcdefghijklmnopqrstuvwxyz0123456789',
+    'абвгдеёжзийклмнопрстуфхцчшщъыьэюя',
+    '漢字テスト',
+    '😀🚀👨‍💻',
+    ' \t\n\r\u00a0\u200b',
+    '\'"\\<>&%;{}[]/',
+    '\x00\x01\x1f\x7f'
+)
+
+# Строки, опасные для SQL, шаблонов и разбора
+SPECIAL_STRINGS = (
+    "'; DROP TABLE items; --",
+    '<script>alert(1)</script>',
+    '%s%s%n',
+    '{{7*7}}',
+    '../../etc/passwd',
+    '\u202eRTL',
+    'NaN',
+    'null'
+)
+
+# Значения, не являющиеся объектом JSON, в теле запроса
+NON_OBJECTS = (None, [], [{}], 'item', 0, 1.5, True)
+
+# Значения неверного типа для любого поля
+WRONG_TYPES = ([], {}, [1], {'a': 1})
+
+# Некорректный JSON в теле запроса
+INVALID_JSON = (
+    '',
+    '{',
+    '{"name": ',
+    "{'name': 'item', 'price': 1}",
+    '{"name": "item", "price": 1,}',
+    '{"name": "item" "price": 1}',
+    '[1, 2',
+    'undefined',
+    '\ufeff{}',
+    '{"name": "item", "price": 01}'
+)
+
+
+class CaseGenerator:
+    """
+    Поток случаев для проверки контракта валидации (201/200 или 400).
+    
+    Случай строится из корректного значения каждого поля (в том числе
+    граничного: длины 1 и максимум, цена 0, строковые числа), затем к нему
+    применяется 0-3 мутации: неверное значение поля (длина максимум+1,
+    отрицательные и специальные числа, неверный тип, null), удаление
+    обязательного поля, неизвестное поле. Около трети случаев остаются
+    корректными. Небольшая доля - тело не объект JSON или некорректный JSON.
+    
+    Случай - словарь, сериализуемый в JSON:
+        {'op': 'create' | 'patch' | 'put' | 'bulk_create', 'body': ...} или {'op': ..., 'raw': '...'}
+        {'op': 'list' | 'bulk_delete', 'params': {'page': '2', ...}}
+    
+    Один seed дает одну и ту же последовательность случаев.
+    """
+    
+    def __init__(self, seed: int):
+        self.rng = random.Random(seed)
+        self._operations = list(OPERATIONS)
+        self._weights = list(OPERATIONS.values())
+    
+    def case(self) -> Dict[str, Any]:
+        op = self.rng.choices(self._operations, self._weights)[0]
+        if op == 'list':
+            return {'op': op, 'params': self.query()}
+        if op == 'bulk_delete':
+            return {'op': op, 'params': self.delete_query()}
+        
+        roll = self.rng.random()
+        if roll < 0.03:
+            return {'op': op, 'raw': self.rng.choice(INVALID_JSON)}
+        if roll < 0.06:
+            return {'op': op, 'body': self.rng.choice(NON_OBJECTS)}
+        if op == 'bulk_create':
+            return {'op': op, 'body': self.bulk()}
+        return {'op': op, 'body': self.item(partial=op == 'patch')}
+    
+    def cases(self, count: int) -> List[Dict[str, Any]]:
+        return [self.case() for _ in range(count)]
+    
+    # --- Строки и числа ---
+    
+    def text(self, length: int) -> str:
+        if length and self.rng.random() < 0.05:
+            return self.rng.choice(SPECIAL_STRINGS)[:length]
+        alphabet = ''.join(self.rng.sample(ALPHABETS, self.rng.randint(1, 3)))
+        return ''.join(self.rng.choice(alphabet) for _ in range(length))
+    
+    def length(self, minimum: int, maximum: int) -> int:
+        """Длина строки: чаще граничная."""
+        return self.rng.choice((minimum, minimum + 1, maximum - 1, maximum, self.rng.randint(minimum, maximum)))
+    
+    def number(self) -> Any:
+        return self.rng.choice((
+            0,
+            0.0,
+            -0.0,
+            0.01,
+            5e-324,
+            1e308,
+            10 ** 18,
+            self.rng.randint(1, 10 ** 6),
+            round(self.rng.uniform(0, 10000), self.rng.randint(0, 6)),
+            str(round(self.rng.uniform(0, 1000), 2)),
+            ' 7 ',
+            '1e3',
+            '1_000'
+        ))
+    
+    def bad_number(self) -> Any:
+        return self.rng.choice((
+            -0.01,
+            -1,
+            -1e308,
+            -self.rng.uniform(0, 10000),
+            float('nan'),
+            float('inf'),
+            float('-inf'),
+            10 ** 400,
+            'nan',
+            '-inf',
+            '1e400',
+            'abc',
+            '',
+            '1,5',
+            True,
+            False
+        ) + WRONG_TYPES)
+    
+    def boolean(self) -> Any:
+        return self.rng.choice(sorted(TRUTHY | FALSY, key=repr) + [1, 0])
+    
+    def bad_boolean(self) -> Any:
+        return self.rng.choice(('maybe', 'TrUe', '', ' true', 2, -1, 0.5, 'да') + WRONG_TYPES)
+    
+    # --- Тело товара ---
+    
+    def _valid_fields(self) -> Dict[str, Callable[[], Any]]:
+        return {
+            'name': lambda: self.text(self.length(1, NAME_MAX_LENGTH)),
+            'price': self.number,
+            'description': lambda: None if self.rng.random() < 0.2 else self.text(self.length(0, DESCRIPTION_MAX_LENGTH)),
+            'in_stock': self.boolean,
+            'tag': lambda: None if self.rng.random() < 0.2 else self.text(self.length(1, TAG_MAX_LENGTH))
+        }
+    
+    def _invalid_fields(self) -> Dict[str, Callable[[], Any]]:
+        def bad_string(minimum: int, maximum: int):
+            def generate():
+                roll = self.rng.random()
+                if roll < 0.4:
+                    return self.text(maximum + self.rng.choice((1, 2, maximum)))
+                if roll < 0.55 and minimum:
+                    return ''
+                return self.rng.choice((0, 1.5, True) + WRONG_TYPES)
+            return generate
+        
+        return {
+            'name': lambda: None if self.rng.random() < 0.1 else bad_string(1, NAME_MAX_LENGTH)(),
+            'price': lambda: None if self.rng.random() < 0.1 else self.bad_number(),
+            'description': bad_string(0, DESCRIPTION_MAX_LENGTH),
+            'in_stock': lambda: None if self.rng.random() < 0.1 else self.bad_boolean(),
+            'tag': bad_string(1, TAG_MAX_LENGTH)
+        }
+    
+    def item(self, partial: bool = False, mutate: bool = True) -> Dict[str, Any]:
+        valid = self._valid_fields()
+        body = {
+            name: generate() for name, generate in valid.items()
+            if name in ('name', 'price') and not partial or self.rng.random() < 0.5
+        }
+        
+        invalid = self._invalid_fields()
+        for _ in range(self.rng.choice((0, 0, 1, 1, 2, 3)) if mutate else 0):
+            mutation = self.rng.random()
+            if mutation < 0.7:
+                name = self.rng.choice(list(invalid))
+                body[name] = invalid[name]()
+            elif mutation < 0.85:
+                if body:
+                    del body[self.rng.choice(list(body))]
+            else:
+                body[self.rng.choice(('id', 'created_at', 'Name', 'price ', 'extra', ''))] = self.text(3)
+        return body
+    
+    # --- Массовые операции ---
+    
+    def bulk(self) -> Dict[str, Any]:
+        """Тело POST /items/bulk: товары пачки чаще корректны, ошибки - в самом списке и теге."""
+        body: Dict[str, Any] = {
+            'items': [self.item(mutate=self.rng.random() < 0.15) for _ in range(self.rng.choice(BULK_SIZES))]
+        }
+        if self.rng.random() < 0.5:
+            body['tag'] = None if self.rng.random() < 0.2 else self.text(self.length(1, TAG_MAX_LENGTH))
+        
+        for _ in range(self.rng.choice((0, 0, 0, 1, 2))):
+            mutation = self.rng.random()
+            if mutation < 0.4:
+                body['items'] = self.rng.choice((None, [], 'items', {}, 5, [None], [[]]))
+            elif mutation < 0.6:
+                body.pop('items', None)
+            elif mutation < 0.85:
+                body['tag'] = self.rng.choice(('', self.text(TAG_MAX_LENGTH + 1), 0, True) + WRONG_TYPES)
+            else:
+                body[self.rng.choice(('item', 'Items', 'count', ''))] = self.text(3)
+        return body
+    
+    def delete_query(self) -> Dict[str, str]:
+        """Query параметры DELETE /items/bulk."""
+        length = self.length(1, TAG_MAX_LENGTH)
+        params = {'tag': DELETE_TAG_PREFIX + self.text(length - 1)}
+        
+        roll = self.rng.random()
+        if roll < 0.15:
+            del params['tag']
+        elif roll < 0.3:
+            params['tag'] = self.rng.choice(('', DELETE_TAG_PREFIX + self.text(TAG_MAX_LENGTH)))
+        if self.rng.random() < 0.1:
+            params[self.rng.choice(('id', 'Tag', 'tag[]', 'all'))] = self.text(2)
+        return params
+    
+    # --- Query параметры списка ---
+    
+    def query(self) -> Dict[str, str]:
+        valid = {
+            'page': lambda: str(self.rng.choice((1, 2, self.rng.randint(1, 1000)))),
+            'per_page': lambda: str(self.length(1, MAX_PER_PAGE)),
+            'in_stock': lambda: str(self.rng.choice(sorted(value for value in TRUTHY | FALSY if isinstance(value, str)))),
+            'tag': lambda: self.text(self.length(1, TAG_MAX_LENGTH)),
+            'min_price': lambda: str(self.rng.choice((0, 0.5, self.rng.randint(0, 1000), '1e3'))),
+            'max_price': lambda: str(self.rng.choice((0, 100, 1e308, self.rng.randint(0, 10 ** 6)))),
+            'after_id': lambda: str(self.rng.choice((0, 1, self.rng.randint(0, 10 ** 6))))
+        }
+        invalid = {
+            'page': lambda: self.rng.choice(('0', '-1', '1.5', 'abc', '', '9' * 30, '9' * 5000)),
+            'per_page': lambda: self.rng.choice(('0', str(MAX_PER_PAGE + 1), '-5', '1e2', '')),
+            'in_stock': lambda: str(self.bad_boolean()),
+            'tag': lambda: self.rng.choice(('', self.text(TAG_MAX_LENGTH + 1))),
+            'min_price': lambda: self.rng.choice(('-0.01', '-1', 'nan', 'inf', '1e400', 'abc', '')),
+            'max_price': lambda: self.rng.choice(('-1', '-inf', 'NaN', 'x')),
+            'after_id': lambda: self.rng.choice(('-1', '1.0', 'abc', '9' * 25, ''))
+        }
+        
+        params = {name: generate() for name, generate in valid.items() if self.rng.random() < 0.3}
+        for _ in range(self.rng.choice((0, 0, 1, 1, 2))):
+            if self.rng.random() < 0.85:
+                name = self.rng.choice(list(invalid))
+                params[name] = invalid[name]()
+            else:
+                params[self.rng.choice(('sort', 'limit', 'Page', 'page[]'))] = self.text(2)
+        return params
+
+
+def encode(case: Dict[str, Any]) -> bytes:
+    """Тело запроса случая; json.dumps записывает NaN и Infinity, разбор JSON приложения их принимает."""
+    if 'raw' in case:
+        return case['raw'].encode('utf-8')
+    return json.dumps(case['body']).encode('utf-8')
\ No newline at end of file
@@ -0,0 +1,166 @@
+import json
+import math
+from typing import Any, Callable, Dict, FrozenSet, NamedTuple, Optional, Tuple
+from fuzz.generators import encode
+from stub_server.store import (
+    BULK_MAX_ITEMS,
+    ValidationFailed,
+    validate_bulk,
+    validate_bulk_delete,
+    validate_item,
+    validate_query
+)
+
+# Код успешного ответа операции
+SUCCESS_STATUS = {'create': 201, 'patch': 200, 'put': 200, 'list': 200, 'bulk_create': 201, 'bulk_delete': 200}
+
+
+class Violation(NamedTuple):
+    """Нарушение контракта: причина без конкретных значений (для группировки) и описание."""
+    signature: str
+    message: str
+
+
+def expected(case: Dict[str, Any]) -> Tuple[int, FrozenSet[str], Dict[str, Any]]:
+    """
+    Ожидаемый ответ на случай: код, поля с ошибками (для 400) и данные после валидации.
+    
+    Эталон - валидаторы заглушки (stub_server.store), повторяющие схемы
+    приложения; некорректный JSON разбирается как пустое тело (get_json(silent=True)).
+    Для bulk_create данные - {'items': [...]} с тегом пачки у товаров без своего.
+    """
+    op = case['op']
+    try:
+        if op == 'list':
+            data = validate_query(case['params'])
+        elif op == 'bulk_delete':
+            validate_bulk_delete(case['params'])
+            data = {}
+        else:
+            if 'raw' in case:
+                # Разбор байтов, как у приложения: json.loads определяет кодировку и пропускает BOM
+                try:
+                    body = json.loads(encode(case)) if case['raw'] else None
+                except ValueError:
+                    body = None
+            else:
+                body = case['body']
+            if op == 'bulk_create':
+                items = body.get('items') if isinstance(body, dict) else None
+                if isinstance(items, list) and len(items) > BULK_MAX_ITEMS:
+                    raise ValidationFailed({'items': [f"At most {BULK_MAX_ITEMS} items per request"]})
+                items, tag = validate_bulk(body)
+                data = {'items': [item if item.get('tag') is not None or tag is None else dict(item, tag=tag)
+                                  for item in items]}
+            else:
+                data = validate_item(body, partial=op == 'patch')
+    except ValidationFailed as e:
+        return 400, frozenset(str(name) for name in e.messages), {}
+    return SUCCESS_STATUS[op], frozenset(), data
+
+
+def _same(actual: Any, value: Any) -> bool:
+    if isinstance(value, float):
+        return isinstance(actual, (int, float)) and not isinstance(actual, bool) and math.isclose(actual, value, rel_tol=1e-15)
+    return actual == value
+
+
+def check(case: Dict[str, Any], status: Any, payload: Any) -> Optional[Violation]:
+    """
+    Нарушение контракта или None.
+    
+    Проверяется код ответа, поля с ошибками ответа 400 и, для созданного
+    или обновленного товара, что сохранены значения после валидации.
+    """
+    op = case['op']
+    status_code, error_fields, data = expected(case)
+    if status != status_code:
+        signature = f"{op}: status {status}, expected {status_code}"
+        return Violation(signature, signature)
+    
+    if status_code == 400:
+        errors = payload.get('errors') if isinstance(payload, dict) else None
+        if not isinstance(errors, dict):
+            return Violation(f"{op}: 400 without errors", f"{op}: 400 without errors: {payload!r}")
+        fields = frozenset(str(name) for name in errors)
+        if fields != error_fields:
+            return Violation(
+                f"{op}: error fields",
+                f"{op}: error fields {sorted(fields)}, expected {sorted(error_fields)}"
+            )
+        return None
+    
+    if op in ('list', 'bulk_delete'):
+        return None
+    if op == 'bulk_create':
+        stored = payload.get('items') if isinstance(payload, dict) else None
+        sent = data['items']
+    else:
+        stored, sent = [payload], [data]
+    if not isinstance(stored, list) or len(stored) != len(sent) or not all(isinstance(item, dict) for item in stored):
+        return Violation(f"{op}: response is not an item", f"{op}: response is not an item: {payload!r}")
+    for item, values in zip(stored, sent):
+        for name, value in values.items():
+            if not _same(item.get(name), value):
+                return Violation(
+                    f"{op}: field {name!r} changed",
+                    f"{op}: field {name!r} stored as {item.get(name)!r}, sent {value!r}"
+                )
+    return None
+
+
+def _simpler(value: Any):
+    """Упрощения значения: от самого простого к менее простым."""
+    if isinstance(value, dict):
+        for key in value:
+            yield {name: item for name, item in value.items() if name != key}
+        for key, item in value.items():
+            for simpler in _simpler(item):
+                yield {**value, key: simpler}
+    elif isinstance(value, list):
+        if value:
+            yield value[:len(value) // 2]
+            yield value[1:]
+    elif isinstance(value, str):
+        if len(value) > 1:
+            yield value[:1]
+            yield value[:len(value) // 2]
+            yield value[len(value) // 2:]
+            if any(char != 'a' for char in value):
+                yield 'a' * len(value)
+    elif isinstance(value, bool):
+        return
+    elif isinstance(value, int):
+        if value not in (0, 1):
+            yield 0
+            yield 1
+            yield value // 2
+    elif isinstance(value, float):
+        if math.isfinite(value) and value != int(value):
+            yield float(int(value))
+
+
+def shrink(case: Dict[str, Any], fails: Callable[[Dict[str, Any]], bool], max_attempts: int = 500) -> Dict[str, Any]:
+    """
+    Минимальный случай с тем же нарушением (жадное упрощение).
+    
+    Из тела или query параметров по очереди удаляются поля, строки
+    укорачиваются, числа заменяются на 0 и 1; изменение принимается, если
+    fails(случай) остается истинным. Останавливается, когда упрощений
+    не осталось или после max_attempts проверок.
+    """
+    key = 'params' if 'params' in case else 'raw' if 'raw' in case else 'body'
+    current = case[key]
+    attempts = 0
+    improved = True
+    while improved and attempts < max_attempts:
+        improved = False
+        for candidate in _simpler(current):
+            attempts += 1
+            if fails({**case, key: candidate}):
+                current = candidate
+                improved = True
+                break
+            if attempts >= max_attempts:
+                break
+    return {**case, key: current}
\ No newline at end of file
@@ -0,0 +1,264 @@
+import json
+import logging
+import multiprocessing
+import threading
+import time
+from collections import Counter
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from contextlib import contextmanager, nullcontext
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import urlsplit
+import requests
+from api.base_api import BaseAPI
+from api.transport import TRANSPORTS
+from config import config
+from fuzz.generators import CaseGenerator, encode
+from fuzz.oracle import check, shrink
+from load.runner import quiet_client_logging
+
+logger = logging.getLogger(__name__)
+
+# Случаев в одной задаче воркера: задачи с одним seed воспроизводимы независимо
+# от числа воркеров и порядка выполнения
+CHUNK_SIZE = 1000
+
+# Товар, на котором проверяются PATCH и PUT (создается в начале каждой задачи)
+PATCH_TARGET = {'name': 'Fuzz target', 'price': 1.0}
+
+# Логгеры ресурсов приложения: ошибка валидации - строка лога на каждый запрос
+APP_LOGGERS = ('resources',)
+
+
+@contextmanager
+def quiet_app_logging():
+    """Логи ресурсов приложения в процессе воркера только с уровня ERROR на время задачи."""
+    loggers = [logging.getLogger(name) for name in APP_LOGGERS]
+    previous = [app_logger.level for app_logger in loggers]
+    for app_logger in loggers:
+        app_logger.setLevel(logging.ERROR)
+    try:
+        yield
+    finally:
+        for app_logger, level in zip(loggers, previous):
+            app_logger.setLevel(level)
+
+
+class _HttpTarget:
+    """Запросы к сервису по HTTP (сессия с keep-alive на поток)."""
+    
+    def __init__(self, base_url: str):
+        self.client = BaseAPI(base_url, max_retries=0)
+    
+    def send(self, method: str, path: str, params: Optional[Dict] = None, data: Optional[bytes] = None):
+        try:
+            response = self.client.session.request(
+                method,
+                f"{self.client.base_url}{path}",
+                params=params,
+                data=data,
+                headers={'Content-Type': 'application/json'},
+                timeout=self.client.timeout
+            )
+        except requests.RequestException as e:
+            return type(e).__name__, None
+        try:
+            return response.status_code, response.json()
+        except ValueError:
+            return response.status_code, None
+    
+    @contextmanager
+    def batch(self):
+        yield
+
+
+class _InProcessTarget:
+    """
+    Запросы к create_app('testing') в процессе воркера через Flask test client.
+    
+    Изменения БД каждой задачи откатываются (rollback_transaction), поэтому
+    миллионы созданных товаров не накапливаются во временной БД воркера.
+    """
+    
+    def __init__(self, base_url: str):
+        # Зависимости приложения нужны только в режиме inprocess
+        from api.transport import in_process_app
+        
+        self.app = in_process_app()
+        self.client = self.app.test_client()
+        self.prefix = urlsplit(base_url).path.rstrip('/')
+    
+    def send(self, method: str, path: str, params: Optional[Dict] = None, data: Optional[bytes] = None):
+        result = self.client.open(
+            f"{self.prefix}{path}",
+            method=method,
+            query_string=params,
+            data=data,
+            content_type='application/json'
+        )
+        try:
+            return result.status_code, json.loads(result.get_data())
+        except ValueError:
+            return result.status_code, None
+    
+    @contextmanager
+    def batch(self):
+        from api.transport import rollback_transaction
+        with quiet_app_logging(), rollback_transaction(self.app):
+            yield
+
+
+# Цель запросов в процессе или потоке воркера (создается при первой задаче)
+_local = threading.local()
+
+
+def _target(transport: str, base_url: str):
+    target = getattr(_local, 'target', None)
+    if target is None:
+        target = _InProcessTarget(base_url) if transport == 'inprocess' else _HttpTarget(base_url)
+        _local.target = target
+    return target
+
+
+def _execute(target, case: Dict[str, Any], item_id: int) -> Tuple[Any, Any]:
+    op = case['op']
+    if op == 'list':
+        return target.send('GET', '/items', params=case['params'])
+    if op == 'bulk_delete':
+        return target.send('DELETE', '/items/bulk', params=case['params'])
+    if op in ('patch', 'put'):
+        return target.send(op.upper(), f"/items/{item_id}", data=encode(case))
+    if op == 'bulk_create':
+        return target.send('POST', '/items/bulk', data=encode(case))
+    return target.send('POST', '/items', data=encode(case))
+
+
+def run_chunk(transport: str, base_url: str, seed: int, chunk: int, size: int, max_failures: int = 20) -> Dict:
+    """
+    Задача воркера: size случаев генератора с seed + chunk, проверка ответов
+    и упрощение нарушений (не более max_failures на задачу).
+    """
+    target = _target(transport, base_url)
+    generator = CaseGenerator(seed + chunk)
+    statuses: Counter = Counter()
+    failures: List[Dict] = []
+    violations = 0
+    
+    with target.batch():
+        status, payload = target.send('POST', '/items', data=json.dumps(PATCH_TARGET).encode('utf-8'))
+        if status != 201:
+            raise RuntimeError(f"Cannot create PATCH target: {status} {payload}")
+        item_id = payload['id']
+        
+        for index in range(size):
+            case = generator.case()
+            status, payload = _execute(target, case, item_id)
+            statuses[f"{case['op']} {status}"] += 1
+            violation = check(case, status, payload)
+            if violation is None:
+                continue
+            
+            violations += 1
+            if len(failures) >= max_failures:
+                continue
+            
+            def fails(candidate: Dict[str, Any], signature: str = violation.signature) -> bool:
+                result = check(candidate, *_execute(target, candidate, item_id))
+                return result is not None and result.signature == signature
+            
+            minimal = shrink(case, fails)
+            failures.append({
+                'signature': violation.signature,
+                'problem': (check(minimal, *_execute(target, minimal, item_id)) or violation).message,
+                'case': minimal,
+                'original': case,
+                'seed': seed + chunk,
+                'index': index
+            })
+    
+    return {'cases': size, 'statuses': dict(statuses), 'violations': violations, 'failures': failures}
+
+
+class FuzzRunner:
+    """
+    Генеративная проверка контракта валидации схем /api/items
+    (ItemSchema, ItemQuerySchema, ItemBulkSchema, ItemBulkDeleteSchema).
+    
+    Случаи (fuzz.generators) делятся на задачи по CHUNK_SIZE с собственным
+    seed и выполняются параллельно: в режиме inprocess - процессами
+    (у каждого свое приложение create_app('testing') и временная БД), в
+    режиме http - потоками с keep-alive сессиями. Ответ сравнивается с
+    эталоном (fuzz.oracle): 201/200 для корректных данных со значениями после
+    валидации, 400 с теми же полями ошибок для некорректных, ни одного 5xx.
+    Нарушения упрощаются до минимального случая и группируются по причине.
+    """
+    
+    def __init__(
+        self,
+        cases: int = 10000,
+        workers: int = 4,
+        transport: Optional[str] = None,
+        base_url: Optional[str] = None,
+        seed: Optional[int] = None,
+        max_failures: int = 20
+    ):
+        transport = transport or config.api.transport
+        if transport not in TRANSPORTS:
+            raise ValueError(f"Unknown transport {transport!r}, expected one of {TRANSPORTS}")
+        if workers < 1:
+            raise ValueError("workers must be >= 1")
+        self.cases = cases
+        self.workers = workers
+        self.transport = transport
+        self.base_url = (base_url or config.api.base_url).rstrip('/')
+        self.seed = seed if seed is not None else int(time.time())
+        self.max_failures = max_failures
+    
+    def _executor(self) -> Executor:
+        if self.transport == 'inprocess':
+            # spawn: воркер импортирует приложение заново, без копии состояния родителя
+            return ProcessPoolExecutor(self.workers, mp_context=multiprocessing.get_context('spawn'))
+        return ThreadPoolExecutor(self.workers, thread_name_prefix='fuzz')
+    
+    def run(self) -> Dict:
+        """Прогон; возвращает число случаев, скорость, коды ответов и упрощенные нарушения."""
+        sizes = [min(CHUNK_SIZE, self.cases - start) for start in range(0, self.cases, CHUNK_SIZE)]
+        statuses: Counter = Counter()
+        problems: Dict[str, Dict] = {}
+        violations = 0
+        done = 0
+        
+        logger.info(
+            f"🎲 Fuzzing: {self.cases} случаев, {self.workers} воркеров ({self.transport}), seed {self.seed}"
+        )
+        
+        started = time.perf_counter()
+        with quiet_client_logging() if self.transport == 'http' else nullcontext(), self._executor() as executor:
+            futures = [
+                executor.submit(run_chunk, self.transport, self.base_url, self.seed, chunk, size, self.max_failures)
+                for chunk, size in enumerate(sizes)
+            ]
+            for future in as_completed(futures):
+                result = future.result()
+                done += result['cases']
+                statuses.update(result['statuses'])
+                violations += result['violations']
+                for failure in result['failures']:
+                    group = problems.setdefault(failure['signature'], {**failure, 'count': 0})
+                    group['count'] += 1
+        elapsed = max(time.perf_counter() - started, 1e-9)
+        
+        failures = sorted(problems.values(), key=lambda failure: -failure['count'])
+        if failures:
+            logger.warning(f"❌ Нарушений контракта: {violations} (причин: {len(failures)}, первая: {failures[0]['signature']})")
+        logger.info(f"📊 Fuzzing завершен: {done} случаев за {elapsed:.1f}s ({done / elapsed:.0f}/s)")
+        return {
+            'transport': self.transport,
+            'workers': self.workers,
+            'seed': self.seed,
+            'cases': done,
+            'elapsed_seconds': round(elapsed, 3),
+            'cases_per_second': round(done / elapsed, 1),
+            'statuses': dict(sorted(statuses.items())),
+            'violations': violations,
+            'failures': failures
+        }
\ No newline at end of file
@@ -0,0 +1,9 @@
+from .contention import ContentionRunner
+from .distributed import LoadCoordinator, run_worker
+from .histogram import LatencyHistogram
+from .runner import LoadRunner, LoadItemsAPI
+from .scenarios import SCENARIOS, Scenario, ItemPool
+from .soak import SoakRunner, analyze, format_trends
+from .stats import LoadStats, format_summary, theil_sen
+
+__all__ = ['LoadRunner', 'LoadItemsAPI', 'SCENARIOS', 'Scenario', 'ItemPool', 'LoadStats', 'format_summary', 'theil_sen', 'SoakRunner', 'analyze', 'format_trends', 'ContentionRunner', 'LoadCoordinator', 'run_worker', 'LatencyHistogram']
\ No newline at end of file
@@ -0,0 +1,98 @@
+"""
+Запуск нагрузки из командной строки (из каталога tests).
+    
+    python -m load --scenario crud_mix --workers 8 --duration 30
+    python -m load --rps 200 --workers 16 --output load-report.json
+    python -m load --base-url http://localhost:5001/api    # стек docker-compose
+
+Распределенная нагрузка (координатор и процессы-воркеры):
+    
+    python -m load --processes 4 --workers 8 --rps 2000    # 4 локальных процесса
+    python -m load --processes 4 --remote-workers --listen 0.0.0.0:7000
+    python -m load --connect coordinator:7000               # воркер (реплика)
+"""
+import argparse
+import json
+import logging
+import sys
+from config import config
+from load.distributed import LoadCoordinator, run_worker
+from load.runner import LoadRunner
+from load.scenarios import SCENARIOS
+from load.stats import format_summary
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Нагрузочный прогон API товаров")
+    parser.add_argument('--base-url', default=config.api.base_url, help="Базовый URL API")
+    parser.add_argument('--scenario', choices=sorted(SCENARIOS), default=config.load.scenario)
+    parser.add_argument('--workers', type=int, default=config.load.workers, help="Число потоков")
+    parser.add_argument('--duration', type=float, default=config.load.duration, help="Длительность, с")
+    parser.add_argument('--rps', type=float, default=config.load.target_rps or None,
+                        help="Целевой RPS (по умолчанию - без ограничения)")
+    parser.add_argument('--warmup', type=float, default=config.load.warmup, help="Прогрев без учета в статистике, с")
+    parser.add_argument('--keep-alive', action='store_true', default=config.api.keep_alive)
+    parser.add_argument('--seed', type=int, default=None)
+    parser.add_argument('--max-error-rate', type=float, default=None,
+                        help="Код выхода 1, если доля ошибок выше порога")
+    parser.add_argument('--output', default=None, help="Путь для JSON отчета")
+    parser.add_argument('--processes', type=int, default=config.load.processes,
+                        help="Число процессов-воркеров (больше 1 - распределенная нагрузка)")
+    parser.add_argument('--listen', default=config.load.coordinator_listen,
+                        help="Адрес координатора HOST:PORT (порт 0 - свободный)")
+    parser.add_argument('--remote-workers', action='store_true',
+                        help="Не запускать воркеры локально: ждать подключения реплик")
+    parser.add_argument('--connect', default=None, metavar='HOST:PORT',
+                        help="Запуск воркером координатора по адресу")
+    args = parser.parse_args()
+    
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+    
+    if args.connect:
+        result = run_worker(args.connect)
+        if 'error' in result:
+            sys.exit(1)
+        return
+    
+    if args.processes > 1 or args.remote_workers:
+        runner = LoadCoordinator(
+            SCENARIOS[args.scenario],
+            processes=args.processes,
+            workers=args.workers,
+            duration=args.duration,
+            target_rps=args.rps,
+            warmup=args.warmup,
+            base_url=args.base_url,
+            keep_alive=args.keep_alive,
+            seed=args.seed,
+            listen=args.listen,
+            spawn=not args.remote_workers
+        )
+    else:
+        runner = LoadRunner(
+            SCENARIOS[args.scenario],
+            workers=args.workers,
+            duration=args.duration,
+            target_rps=args.rps,
+            warmup=args.warmup,
+            base_url=args.base_url,
+            keep_alive=args.keep_alive,
+            seed=args.seed
+        )
+    report = runner.run()
+    
+    print(format_summary(report['summary']))
+    
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2, ensure_ascii=False)
+        print(f"\n✅ Отчет сохранен: {args.output}")
+    
+    error_rate = report['summary']['total']['error_rate']
+    if args.max_error_rate is not None and error_rate > args.max_error_rate:
+        print(f"❌ Доля ошибок {error_rate:.2%} выше порога {args.max_error_rate:.2%}")
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
\ No newline at end of file
@@ -0,0 +1,247 @@
+import logging
+import random
+import threading
+import time
+from typing import Dict, List, NamedTuple, Optional, Sequence, Union
+import requests
+from api.base_api import exchange_log
+from load.runner import LoadItemsAPI, quiet_client_logging
+from load.stats import LoadStats
+
+logger = logging.getLogger(__name__)
+
+# Операции над общим товаром: метод -> имя эндпоинта в отчете
+OPERATIONS = {
+    'GET': 'GET /items/{id}',
+    'PUT': 'PUT /items/{id}',
+    'PATCH': 'PATCH /items/{id}',
+    'DELETE': 'DELETE /items/{id}'
+}
+
+# Допустимые коды ответа при конкуренции: товар есть (200) или уже удален (404)
+ALLOWED_STATUSES = {200, 404}
+
+
+class Operation(NamedTuple):
+    """Запрос к общему товару: время начала и окончания (perf_counter), код ответа и записанное имя."""
+    worker: int
+    method: str
+    started: float
+    finished: float
+    status: Union[int, str]
+    token: Optional[str] = None
+
+
+def check_writes(writes: Sequence[Operation], final_name: str, initial_name: str) -> List[str]:
+    """
+    Потерянные обновления (проверка регистра): после конкурентных PUT/PATCH
+    имя товара должно быть записано подтвержденной записью, после окончания
+    которой не начиналась другая подтвержденная запись.
+    """
+    acknowledged = [write for write in writes if write.status == 200]
+    if final_name == initial_name:
+        if acknowledged:
+            return [f"Lost update: {len(acknowledged)} acknowledged writes, item still has the initial name"]
+        return []
+    
+    winner = next((write for write in writes if write.token == final_name), None)
+    if winner is None:
+        return [f"Unknown final name {final_name!r}: not written by any request"]
+    later = [write for write in acknowledged if write.started > winner.finished]
+    if later:
+        return [
+            f"Lost update: {len(later)} writes acknowledged after {winner.method} {winner.token!r} "
+            f"finished are not visible"
+        ]
+    return []
+
+
+def check_delete(operations: Sequence[Operation]) -> List[str]:
+    """
+    Инварианты удаления: ровно одно успешное DELETE, 404 на все запросы,
+    начатые после его окончания, и ни одного 404 до его начала.
+    """
+    deletes = [operation for operation in operations if operation.method == 'DELETE' and operation.status == 200]
+    if len(deletes) != 1:
+        return [f"Expected exactly one successful DELETE, got {len(deletes)}"]
+    
+    deleted = deletes[0]
+    violations = []
+    for operation in operations:
+        if operation.started > deleted.finished and operation.status != 404:
+            violations.append(f"{operation.method} after DELETE returned {operation.status}, expected 404")
+        if operation.finished < deleted.started and operation.status == 404:
+            violations.append(f"{operation.method} before DELETE returned 404")
+    return violations
+
+
+def check_statuses(operations: Sequence[Operation]) -> List[str]:
+    """Ни одного 5xx, исключения клиента или неожиданного кода ответа."""
+    return [
+        f"{operation.method} returned {operation.status}"
+        for operation in operations
+        if operation.status not in ALLOWED_STATUSES
+    ]
+
+
+class ContentionRunner:
+    """
+    Конкурентные изменения одного товара из многих потоков.
+    
+    Каждый раунд создает товар, затем workers потоков:
+        1. в течение write_duration секунд выполняют PUT/PATCH/GET
+           этого товара (каждая запись - уникальное имя);
+        2. останавливаются у барьера: последний поток читает товар
+           и проверяет, что подтвержденные записи не потеряны;
+        3. одновременно отправляют DELETE и продолжают PUT/PATCH/GET
+           еще delete_duration секунд.
+    
+    Проверяются инварианты (check_statuses, check_writes, check_delete):
+    нет 5xx, нет потерянных обновлений, ровно одно успешное удаление и
+    404 после него. Отчет содержит нарушения и пропускную способность
+    и задержки по операциям под конкуренцией.
+    """
+    
+    def __init__(
+        self,
+        workers: int = 8,
+        rounds: int = 5,
+        write_duration: float = 1.0,
+        delete_duration: float = 0.3,
+        base_url: Optional[str] = None,
+        keep_alive: bool = True,
+        seed: Optional[int] = None
+    ):
+        if workers < 2:
+            raise ValueError("workers must be >= 2")
+        self.workers = workers
+        self.rounds = rounds
+        self.write_duration = write_duration
+        self.delete_duration = delete_duration
+        self.base_url = base_url
+        self.keep_alive = keep_alive
+        self.seed = seed if seed is not None else random.randrange(2 ** 32)
+    
+    def _create_client(self) -> LoadItemsAPI:
+        client = LoadItemsAPI(self.base_url, max_retries=0)
+        client.session.headers['Connection'] = 'keep-alive' if self.keep_alive else 'close'
+        return client
+    
+    def _execute(self, client: LoadItemsAPI, method: str, item_id: int, worker: int, rng: random.Random,
+                 stats: LoadStats) -> Operation:
+        token = f"w{worker}-{rng.randrange(10 ** 9)}" if method in ('PUT', 'PATCH') else None
+        started = time.perf_counter()
+        try:
+            if method == 'GET':
+                response = client.get_item(item_id, expected_status=None)
+            elif method == 'PUT':
+                response = client.update_item(item_id, token, round(rng.uniform(1, 1000), 2), expected_status=None)
+            elif method == 'PATCH':
+                response = client.patch_item(item_id, name=token, expected_status=None)
+            else:
+                response = client.delete_item(item_id, expected_status=None)
+            status = response.status_code
+        except requests.RequestException as e:
+            status = type(e).__name__
+        finished = time.perf_counter()
+        stats.record(OPERATIONS[method], finished - started, status, status not in ALLOWED_STATUSES)
+        return Operation(worker, method, started, finished, status, token)
+    
+    def _worker(self, index: int, client: LoadItemsAPI, item_id: int, barrier: threading.Barrier,
+                rng: random.Random, stats: LoadStats, phases: Dict[str, List[Operation]]):
+        methods = ('PUT', 'PATCH', 'GET')
+        writes, deletes = [], []
+        
+        with exchange_log.suppressed():
+            deadline = time.perf_counter() + self.write_duration
+            while time.perf_counter() < deadline:
+                writes.append(self._execute(client, rng.choice(methods), item_id, index, rng, stats))
+            
+            barrier.wait()
+            deletes.append(self._execute(client, 'DELETE', item_id, index, rng, stats))
+            deadline = time.perf_counter() + self.delete_duration
+            while time.perf_counter() < deadline:
+                deletes.append(self._execute(client, rng.choice(methods), item_id, index, rng, stats))
+        
+        phases['writes'].extend(writes)
+        phases['deletes'].extend(deletes)
+    
+    def _round(self, number: int, clients: List[LoadItemsAPI], setup: LoadItemsAPI, stats: LoadStats) -> Dict:
+        initial_name = f"Contention item {number}"
+        response = setup.create_item(name=initial_name, price=1.0)
+        item_id = response.json()['id']
+        phases: Dict[str, List[Operation]] = {'writes': [], 'deletes': []}
+        snapshot = {}
+        
+        def read_after_writes():
+            # Выполняется одним потоком, когда все записи первой фазы завершены
+            response = setup.get_item(item_id, expected_status=None)
+            snapshot['status'] = response.status_code
+            snapshot['name'] = response.json().get('name') if response.status_code == 200 else None
+        
+        barrier = threading.Barrier(self.workers, action=read_after_writes)
+        threads = [
+            threading.Thread(
+                target=self._worker,
+                args=(index, clients[index], item_id, barrier, random.Random(self.seed + number * 1000 + index),
+                      stats, phases),
+                name=f"contention-{index}",
+                daemon=True
+            )
+            for index in range(self.workers)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        
+        operations = phases['writes'] + phases['deletes']
+        violations = check_statuses(operations)
+        if snapshot.get('status') != 200:
+            violations.append(f"GET after writes returned {snapshot.get('status')}, expected 200")
+        else:
+            violations.extend(check_writes(phases['writes'], snapshot['name'], initial_name))
+        violations.extend(check_delete(operations))
+        
+        return {'round': number, 'item_id': item_id, 'operations': len(operations), 'violations': violations}
+    
+    def run(self) -> Dict:
+        """Запуск раундов; возвращает нарушения инвариантов и сводку по операциям."""
+        stats = LoadStats()
+        setup = self._create_client()
+        clients = [self._create_client() for _ in range(self.workers)]
+        rounds = []
+        
+        logger.info(
+            f"⚔️ Конкуренция за товар: {self.workers} потоков, {self.rounds} раундов по "
+            f"{self.write_duration + self.delete_duration:g}s"
+        )
+        
+        with quiet_client_logging(), exchange_log.suppressed():
+            started = time.perf_counter()
+            for number in range(self.rounds):
+                rounds.append(self._round(number, clients, setup, stats))
+            elapsed = max(time.perf_counter() - started, 1e-9)
+        
+        for client in clients + [setup]:
+            client.close()
+        
+        violations = [f"round {result['round']}: {violation}" for result in rounds for violation in result['violations']]
+        summary = stats.summary(elapsed)
+        if violations:
+            logger.warning(f"❌ Нарушено инвариантов: {len(violations)} (первое: {violations[0]})")
+        logger.info(
+            f"📊 Конкуренция завершена: {summary['total']['requests']} запросов, "
+            f"{summary['total']['throughput_rps']} RPS, нарушений {len(violations)}"
+        )
+        return {
+            'workers': self.workers,
+            'rounds': self.rounds,
+            'write_duration_seconds': self.write_duration,
+            'delete_duration_seconds': self.delete_duration,
+            'keep_alive': self.keep_alive,
+            'seed': self.seed,
+            'elapsed_seconds': round(elapsed, 3),
+            'violations': violations,
+            'summary': summary
+        }
\ No newline at end of file
@@ -0,0 +1,232 @@
+import logging
+import os
+import socket
+import subprocess
+import sys
+import threading
+import time
+import traceback
+from multiprocessing.connection import Client, Connection, Listener
+from typing import Dict, List, Optional, Tuple
+from config import config
+from load.runner import LoadRunner
+from load.scenarios import SCENARIOS, Scenario
+from load.stats import LoadStats
+
+logger = logging.getLogger(__name__)
+
+# Каталог tests: рабочий каталог процессов-воркеров (python -m load --connect)
+TESTS_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def parse_address(address: str) -> Tuple[str, int]:
+    """host:port -> (host, port)."""
+    host, _, port = address.rpartition(':')
+    if not host or not port.isdigit():
+        raise ValueError(f"Expected HOST:PORT, got {address!r}")
+    return host, int(port)
+
+
+def run_worker(address: str, authkey: Optional[str] = None, connect_timeout: float = 60.0) -> Dict:
+    """
+    Процесс-воркер распределенной нагрузки.
+    
+    Подключается к координатору (повторяя попытки до connect_timeout:
+    реплики docker-compose могут стартовать раньше него), получает задание,
+    выполняет LoadRunner с общим моментом начала и отправляет отчет и
+    гистограммы. Ошибка прогона передается координатору.
+    """
+    authkey = (authkey or config.load.coordinator_authkey).encode()
+    deadline = time.monotonic() + connect_timeout
+    while True:
+        try:
+            connection = Client(parse_address(address), authkey=authkey)
+            break
+        except OSError:
+            if time.monotonic() >= deadline:
+                raise
+            time.sleep(0.5)
+    
+    with connection:
+        connection.send({'host': socket.gethostname(), 'pid': os.getpid()})
+        task = connection.recv()
+        logger.info(f"🛰️ Воркер {task['index']}: {task['target_rps'] or 'без ограничения'} RPS, seed {task['seed']}")
+        try:
+            runner = LoadRunner(
+                SCENARIOS[task['scenario']],
+                workers=task['workers'],
+                duration=task['duration'],
+                target_rps=task['target_rps'],
+                warmup=task['warmup'],
+                base_url=task['base_url'],
+                keep_alive=task['keep_alive'],
+                seed=task['seed'],
+                start_at=task['start_at']
+            )
+            report = runner.run()
+            result = {'index': task['index'], 'report': report, 'stats': runner.stats.to_dict()}
+        except Exception:
+            result = {'index': task['index'], 'error': traceback.format_exc()}
+        connection.send(result)
+    return result
+
+
+class LoadCoordinator:
+    """
+    Распределенная нагрузка: координатор и processes процессов-воркеров.
+    
+    Один процесс генератора ограничен GIL и одним ядром; координатор
+    раздает задание нескольким процессам (локальным - spawn=True, или
+    репликам docker-compose, подключающимся к listen) и сводит результаты.
+    Каждый воркер выполняет весь сценарий (та же смесь запросов) с долей
+    target_rps / processes, своим seed и workers потоками. Все начинают
+    в общий момент start_delay секунд после подключения последнего воркера.
+    
+    Задержки передаются гистограммами (load.histogram) и складываются:
+    перцентили сводного отчета считаются по всем запросам, а не усредняются
+    по процессам. Связь - multiprocessing.connection по TCP с authkey,
+    внешние сервисы не нужны.
+    """
+    
+    def __init__(
+        self,
+        scenario: Scenario,
+        processes: int = 2,
+        workers: int = 4,
+        duration: float = 10.0,
+        target_rps: Optional[float] = None,
+        warmup: float = 0.0,
+        base_url: Optional[str] = None,
+        keep_alive: bool = False,
+        seed: Optional[int] = None,
+        listen: str = '127.0.0.1:0',
+        spawn: bool = True,
+        authkey: Optional[str] = None,
+        start_delay: float = 2.0,
+        connect_timeout: float = 60.0
+    ):
+        if processes < 1:
+            raise ValueError("processes must be >= 1")
+        if target_rps is not None and target_rps <= 0:
+            raise ValueError("target_rps must be > 0")
+        self.scenario = scenario
+        self.processes = processes
+        self.workers = workers
+        self.duration = duration
+        self.target_rps = target_rps
+        self.warmup = warmup
+        self.base_url = base_url
+        self.keep_alive = keep_alive
+        self.seed = seed if seed is not None else int(time.time())
+        self.listen = listen
+        self.spawn = spawn
+        self.authkey = authkey or config.load.coordinator_authkey
+        self.start_delay = start_delay
+        self.connect_timeout = connect_timeout
+    
+    def _spawn(self, address: str) -> List[subprocess.Popen]:
+        env = dict(os.environ, LOAD_COORDINATOR_AUTHKEY=self.authkey)
+        return [
+            subprocess.Popen([sys.executable, '-m', 'load', '--connect', address], cwd=TESTS_DIR, env=env)
+            for _ in range(self.processes)
+        ]
+    
+    def _accept(self, listener: Listener) -> List[Tuple[Connection, Dict]]:
+        """Подключение всех воркеров (не дольше connect_timeout)."""
+        accepted: List[Tuple[Connection, Dict]] = []
+        
+        def accept():
+            while len(accepted) < self.processes:
+                connection = listener.accept()
+                accepted.append((connection, connection.recv()))
+        
+        thread = threading.Thread(target=accept, name='load-coordinator', daemon=True)
+        thread.start()
+        thread.join(self.connect_timeout)
+        if len(accepted) < self.processes:
+            raise RuntimeError(f"Only {len(accepted)} of {self.processes} load workers connected")
+        return accepted
+    
+    def _task(self, index: int, start_at: float) -> Dict:
+        return {
+            'index': index,
+            'scenario': self.scenario.name,
+            'workers': self.workers,
+            'duration': self.duration,
+            'target_rps': self.target_rps / self.processes if self.target_rps else None,
+            'warmup': self.warmup,
+            'base_url': self.base_url,
+            'keep_alive': self.keep_alive,
+            'seed': self.seed + index * 1000,
+            'start_at': start_at
+        }
+    
+    def run(self) -> Dict:
+        """Прогон; возвращает параметры, сводку по каждому процессу и общую сводку по эндпоинтам."""
+        host, port = parse_address(self.listen)
+        processes: List[subprocess.Popen] = []
+        connections: List[Tuple[Connection, Dict]] = []
+        with Listener((host, port), authkey=self.authkey.encode()) as listener:
+            address = f"{host}:{listener.address[1]}"
+            logger.info(
+                f"🛰️ Координатор нагрузки {address}: {self.processes} процессов по {self.workers} потоков, "
+                + (f"{self.target_rps} RPS" if self.target_rps else "без ограничения RPS")
+            )
+            try:
+                if self.spawn:
+                    processes = self._spawn(address)
+                connections = self._accept(listener)
+                
+                start_at = time.time() + self.start_delay
+                for index, (connection, _) in enumerate(connections):
+                    connection.send(self._task(index, start_at))
+                results = [connection.recv() for connection, _ in connections]
+            finally:
+                for connection, _ in connections:
+                    connection.close()
+                for process in processes:
+                    try:
+                        process.wait(timeout=30)
+                    except subprocess.TimeoutExpired:
+                        process.kill()
+        
+        failed = [result for result in results if 'error' in result]
+        if failed:
+            raise RuntimeError(f"Load worker {failed[0]['index']} failed:\n{failed[0]['error']}")
+        return self._merge(results, [hello for _, hello in connections])
+    
+    def _merge(self, results: List[Dict], hosts: List[Dict]) -> Dict:
+        stats = LoadStats()
+        per_process = []
+        for result, hello in zip(sorted(results, key=lambda result: result['index']), hosts):
+            stats.merge(LoadStats.from_dict(result['stats']))
+            total = result['report']['summary']['total']
+            per_process.append({
+                'index': result['index'],
+                'host': hello['host'],
+                'pid': hello['pid'],
+                'requests': total['requests'],
+                'throughput_rps': total['throughput_rps'],
+                'p99_ms': total['p99_ms']
+            })
+        
+        # Окна измерения процессов совпадают (общий момент начала): длительность - самая долгая
+        elapsed = max(result['report']['elapsed_seconds'] for result in results)
+        summary = stats.summary(elapsed)
+        logger.info(
+            f"📊 Распределенная нагрузка завершена: {summary['total']['requests']} запросов, "
+            f"{summary['total']['throughput_rps']} RPS, ошибок {summary['total']['error_rate']:.2%}"
+        )
+        return {
+            'scenario': self.scenario.name,
+            'processes': self.processes,
+            'workers': self.workers,
+            'duration_seconds': self.duration,
+            'target_rps': self.target_rps,
+            'warmup_seconds': self.warmup,
+            'keep_alive': self.keep_alive,
+            'seed': self.seed,
+            'elapsed_seconds': round(elapsed, 3),
+            'process_summaries': per_process,
+            'summary': summary
+        }
\ No newline at end of file
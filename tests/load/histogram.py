@@ -0,0 +1,104 @@
+from typing import Dict, Optional
+from utils.latency import percentile_rank
+
+# Единица счета гистограммы: значения в секундах хранятся в целых микросекундах
+UNITS_PER_SECOND = 1_000_000
+
+
+class LatencyHistogram:
+    """
+    Гистограмма задержек с фиксированной относительной точностью (как HDR Histogram).
+    
+    Значение v (мкс) попадает в корзину, у которой сохранены старшие
+    precision_bits + 1 бит v: до 2 ** precision_bits мкс корзины точные,
+    выше - логарифмически-линейные шириной не более v / 2 ** precision_bits
+    (0.8% при precision_bits=7). Память не зависит от числа запросов,
+    а гистограммы разных потоков и процессов складываются без потери
+    точности: merge суммирует счетчики одинаковых корзин.
+    
+    Перцентиль - верхняя граница корзины с рангом ceil(p * count)
+    (ближайший ранг, как utils.latency.percentile), но не больше точного
+    максимума: оценка не занижает задержку и завышает ее не больше чем
+    на ширину корзины.
+    """
+    
+    def __init__(self, precision_bits: int = 7):
+        if not 1 <= precision_bits <= 20:
+            raise ValueError("precision_bits must be between 1 and 20")
+        self.precision_bits = precision_bits
+        self.counts: Dict[int, int] = {}
+        self.count = 0
+        self.total = 0.0
+        self.min: Optional[float] = None
+        self.max: Optional[float] = None
+    
+    def _bucket(self, units: int) -> int:
+        """Нижняя граница корзины значения (мкс)."""
+        shift = max(units.bit_length() - 1 - self.precision_bits, 0)
+        return units >> shift << shift
+    
+    def _upper(self, bucket: int) -> int:
+        """Первое значение (мкс) после корзины."""
+        shift = max(bucket.bit_length() - 1 - self.precision_bits, 0)
+        return bucket + (1 << shift)
+    
+    def record(self, value: float):
+        """Задержка в секундах."""
+        units = max(int(value * UNITS_PER_SECOND), 0)
+        bucket = self._bucket(units)
+        self.counts[bucket] = self.counts.get(bucket, 0) + 1
+        self.count += 1
+        self.total += value
+        self.min = value if self.min is None else min(self.min, value)
+        self.max = value if self.max is None else max(self.max, value)
+    
+    def merge(self, other: 'LatencyHistogram') -> 'LatencyHistogram':
+        if other.precision_bits != self.precision_bits:
+            raise ValueError(
+                f"Cannot merge histograms with precision {other.precision_bits} and {self.precision_bits} bits"
+            )
+        for bucket, count in other.counts.items():
+            self.counts[bucket] = self.counts.get(bucket, 0) + count
+        self.count += other.count
+        self.total += other.total
+        if other.count:
+            self.min = other.min if self.min is None else min(self.min, other.min)
+            self.max = other.max if self.max is None else max(self.max, other.max)
+        return self
+    
+    def percentile(self, p: float) -> Optional[float]:
+        """Перцентиль p (0-100) в секундах."""
+        if not self.count:
+            return None
+        rank = percentile_rank(self.count, p)
+        seen = 0
+        for bucket in sorted(self.counts):
+            seen += self.counts[bucket]
+            if seen >= rank:
+                return min(max(self._upper(bucket) / UNITS_PER_SECOND, self.min), self.max)
+        return self.max
+    
+    @property
+    def mean(self) -> Optional[float]:
+        return self.total / self.count if self.count else None
+    
+    def to_dict(self) -> Dict:
+        """Сериализуемое представление (для передачи между процессами и в отчет)."""
+        return {
+            'precision_bits': self.precision_bits,
+            'counts': sorted(self.counts.items()),
+            'count': self.count,
+            'total': self.total,
+            'min': self.min,
+            'max': self.max
+        }
+    
+    @classmethod
+    def from_dict(cls, data: Dict) -> 'LatencyHistogram':
+        histogram = cls(data['precision_bits'])
+        histogram.counts = {int(bucket): count for bucket, count in data['counts']}
+        histogram.count = data['count']
+        histogram.total = data['total']
+        histogram.min = data['min']
+        histogram.max = data['max']
+        return histogram
\ No newline at end of file
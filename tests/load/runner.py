@@ -0,0 +1,193 @@
+import logging
+import random
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, Optional
+import requests
+from api.base_api import exchange_log
+from api.items_api import ItemsAPI
+from load.scenarios import ItemPool, Scenario
+from load.stats import LoadStats
+
+logger = logging.getLogger(__name__)
+
+
+class LoadItemsAPI(ItemsAPI):
+    """
+    ItemsAPI без шагов Allure.
+    
+    Шаги из потоков нагрузки попадали бы в текущий тест тысячами,
+    поэтому методы вызываются в исходном (недекорированном) виде.
+    """
+
+
+for _method in ('get_all_items', 'get_item', 'create_item', 'create_items_bulk', 'update_item', 'patch_item',
+                'delete_item', 'delete_items_by_tag'):
+    setattr(LoadItemsAPI, _method, getattr(ItemsAPI, _method).__wrapped__)
+
+
+@contextmanager
+def quiet_client_logging():
+    """Отключение построчного логирования запросов клиента на время нагрузки."""
+    client_logger = logging.getLogger('api.base_api')
+    previous = client_logger.level
+    client_logger.setLevel(logging.WARNING)
+    try:
+        yield
+    finally:
+        client_logger.setLevel(previous)
+
+
+class LoadRunner:
+    """
+    Генератор нагрузки на основе сценариев ItemsAPI.
+    
+    Режимы:
+        фиксированная конкурентность - каждый из workers потоков выполняет
+                                       запросы без пауз (target_rps=None)
+        целевой RPS                  - запросы запускаются по общему расписанию
+                                       с интервалом 1/target_rps; задержка
+                                       считается от запланированного момента,
+                                       поэтому отставание генератора не скрывает
+                                       рост времени ответа (coordinated omission)
+    
+    Запросы за первые warmup секунд в статистику не входят.
+    Клиенты работают без повторов (max_retries=0), чтобы ошибки
+    и задержки попадали в отчет как есть. start_at (time.time()) -
+    общий момент начала для нескольких процессов генератора
+    (load.distributed): после подготовки сценария прогон ждет его.
+    Результаты последнего прогона - в stats.
+    """
+    
+    def __init__(
+        self,
+        scenario: Scenario,
+        workers: int = 4,
+        duration: float = 10.0,
+        target_rps: Optional[float] = None,
+        warmup: float = 0.0,
+        base_url: Optional[str] = None,
+        keep_alive: bool = False,
+        seed: Optional[int] = None,
+        start_at: Optional[float] = None
+    ):
+        if workers < 1:
+            raise ValueError("workers must be >= 1")
+        if target_rps is not None and target_rps <= 0:
+            raise ValueError("target_rps must be > 0")
+        self.scenario = scenario
+        self.workers = workers
+        self.duration = duration
+        self.target_rps = target_rps
+        self.warmup = warmup
+        self.base_url = base_url
+        self.keep_alive = keep_alive
+        self.seed = seed if seed is not None else random.randrange(2 ** 32)
+        self.start_at = start_at
+        self.stats = LoadStats()
+        self._schedule_lock = threading.Lock()
+        self._next_slot = 0.0
+    
+    def _create_client(self) -> ItemsAPI:
+        client = LoadItemsAPI(self.base_url, max_retries=0)
+        client.session.headers['Connection'] = 'keep-alive' if self.keep_alive else 'close'
+        return client
+    
+    def _reserve_slot(self) -> float:
+        """Следующий момент запуска запроса по расписанию целевого RPS."""
+        with self._schedule_lock:
+            slot = self._next_slot
+            self._next_slot += 1.0 / self.target_rps
+            return slot
+    
+    def _worker(self, index: int, pool: ItemPool, stats: LoadStats, measure_from: float, deadline: float):
+        rng = random.Random(self.seed + index)
+        client = self._create_client()
+        
+        with exchange_log.suppressed():
+            while True:
+                if self.target_rps:
+                    started = self._reserve_slot()
+                    if started >= deadline:
+                        break
+                    delay = started - time.perf_counter()
+                    if delay > 0:
+                        time.sleep(delay)
+                else:
+                    started = time.perf_counter()
+                    if started >= deadline:
+                        break
+                
+                endpoint, action = self.scenario.choose(rng)
+                try:
+                    response = action(client, pool, rng)
+                    if response is None:
+                        continue
+                    status = response.status_code
+                    error = status >= 400
+                except requests.RequestException as e:
+                    status = type(e).__name__
+                    error = True
+                
+                if started >= measure_from:
+                    stats.record(endpoint, time.perf_counter() - started, status, error)
+        
+        client.close()
+    
+    def run(self) -> Dict:
+        """Запуск нагрузки; возвращает конфигурацию прогона и сводку по эндпоинтам."""
+        pool = ItemPool()
+        stats = self.stats = LoadStats()
+        setup_client = self._create_client()
+        
+        with quiet_client_logging(), exchange_log.suppressed():
+            self.scenario.setup(setup_client, pool, random.Random(self.seed))
+            
+            logger.info(
+                f"🚀 Нагрузка '{self.scenario.name}': {self.workers} воркеров, "
+                f"{self.duration}s, " + (f"{self.target_rps} RPS" if self.target_rps else "без ограничения RPS")
+            )
+            
+            if self.start_at is not None:
+                time.sleep(max(self.start_at - time.time(), 0.0))
+            started = time.perf_counter()
+            measure_from = started + self.warmup
+            deadline = measure_from + self.duration
+            self._next_slot = started
+            
+            threads = [
+                threading.Thread(
+                    target=self._worker,
+                    args=(index, pool, stats, measure_from, deadline),
+                    name=f"load-{index}",
+                    daemon=True
+                )
+                for index in range(self.workers)
+            ]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+            
+            elapsed = max(time.perf_counter() - measure_from, 1e-9)
+            self.scenario.teardown(setup_client, pool)
+        
+        setup_client.close()
+        
+        summary = stats.summary(elapsed)
+        logger.info(
+            f"📊 Нагрузка завершена: {summary['total']['requests']} запросов, "
+            f"{summary['total']['throughput_rps']} RPS, ошибок {summary['total']['error_rate']:.2%}"
+        )
+        return {
+            'scenario': self.scenario.name,
+            'workers': self.workers,
+            'duration_seconds': self.duration,
+            'target_rps': self.target_rps,
+            'warmup_seconds': self.warmup,
+            'keep_alive': self.keep_alive,
+            'seed': self.seed,
+            'elapsed_seconds': round(elapsed, 3),
+            'summary': summary
+        }
\ No newline at end of file
@@ -0,0 +1,139 @@
+import random
+import threading
+from typing import Callable, Dict, List, Optional, Tuple
+from api.items_api import ItemsAPI
+
+
+class ItemPool:
+    """Потокобезопасный набор ID товаров, созданных во время нагрузки."""
+    
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._ids: List[int] = []
+    
+    def add(self, item_id: int):
+        with self._lock:
+            self._ids.append(item_id)
+    
+    def pick(self, rng: random.Random) -> Optional[int]:
+        """Случайный ID без удаления из набора."""
+        with self._lock:
+            return rng.choice(self._ids) if self._ids else None
+    
+    def take(self, rng: random.Random) -> Optional[int]:
+        """Случайный ID с удалением из набора (для удаления товара)."""
+        with self._lock:
+            if not self._ids:
+                return None
+            index = rng.randrange(len(self._ids))
+            self._ids[index], self._ids[-1] = self._ids[-1], self._ids[index]
+            return self._ids.pop()
+    
+    def drain(self) -> List[int]:
+        with self._lock:
+            ids, self._ids = self._ids, []
+            return ids
+
+
+def random_payload(rng: random.Random) -> Dict:
+    """Данные товара для нагрузки (дешевле генерации через Faker)."""
+    return {
+        'name': f"Load item {rng.randrange(10 ** 9)}",
+        'price': round(rng.uniform(1, 1000), 2),
+        'in_stock': rng.random() < 0.8
+    }
+
+
+def list_items(client: ItemsAPI, pool: ItemPool, rng: random.Random):
+    return client.get_all_items(page=rng.randint(1, 5), per_page=20, expected_status=None)
+
+
+def get_item(client: ItemsAPI, pool: ItemPool, rng: random.Random):
+    item_id = pool.pick(rng)
+    if item_id is None:
+        return None
+    return client.get_item(item_id, expected_status=None)
+
+
+def create_item(client: ItemsAPI, pool: ItemPool, rng: random.Random):
+    response = client.create_item(**random_payload(rng), expected_status=None)
+    if response.status_code == 201:
+        pool.add(response.json()['id'])
+    return response
+
+
+def patch_item(client: ItemsAPI, pool: ItemPool, rng: random.Random):
+    item_id = pool.pick(rng)
+    if item_id is None:
+        return None
+    return client.patch_item(item_id, price=round(rng.uniform(1, 1000), 2), expected_status=None)
+
+
+def delete_item(client: ItemsAPI, pool: ItemPool, rng: random.Random):
+    item_id = pool.take(rng)
+    if item_id is None:
+        return None
+    return client.delete_item(item_id, expected_status=None)
+
+
+# Действие сценария: имя эндпоинта в отчете, вес и функция (client, pool, rng) -> response | None
+Action = Tuple[str, int, Callable]
+
+
+class Scenario:
+    """
+    Взвешенная смесь операций ItemsAPI.
+    
+    Перед нагрузкой создается seed_items товаров (не входят в статистику),
+    после нагрузки все товары из набора удаляются.
+    """
+    
+    def __init__(self, name: str, actions: List[Action], seed_items: int = 50):
+        self.name = name
+        self.actions = actions
+        self.seed_items = seed_items
+        self._names = [action[0] for action in actions]
+        self._functions = [action[2] for action in actions]
+        self._weights = [action[1] for action in actions]
+    
+    def choose(self, rng: random.Random) -> Tuple[str, Callable]:
+        """Случайное действие с учетом весов."""
+        index = rng.choices(range(len(self.actions)), weights=self._weights)[0]
+        return self._names[index], self._functions[index]
+    
+    def setup(self, client: ItemsAPI, pool: ItemPool, rng: random.Random):
+        for _ in range(self.seed_items):
+            create_item(client, pool, rng)
+    
+    def teardown(self, client: ItemsAPI, pool: ItemPool):
+        for item_id in pool.drain():
+            client.delete_item(item_id, expected_status=None)
+
+
+SCENARIOS = {
+    # Типичная смесь: преобладает чтение
+    'crud_mix': Scenario('crud_mix', [
+        ('GET /items', 50, list_items),
+        ('GET /items/{id}', 20, get_item),
+        ('POST /items', 15, create_item),
+        ('PATCH /items/{id}', 10, patch_item),
+        ('DELETE /items/{id}', 5, delete_item)
+    ]),
+    'read_only': Scenario('read_only', [
+        ('GET /items', 70, list_items),
+        ('GET /items/{id}', 30, get_item)
+    ]),
+    'write_heavy': Scenario('write_heavy', [
+        ('POST /items', 60, create_item),
+        ('PATCH /items/{id}', 30, patch_item),
+        ('DELETE /items/{id}', 10, delete_item)
+    ], seed_items=20),
+    # Длительный прогон (soak): создание и удаление уравновешены, объем данных не растет
+    'steady_mix': Scenario('steady_mix', [
+        ('GET /items', 45, list_items),
+        ('GET /items/{id}', 25, get_item),
+        ('POST /items', 10, create_item),
+        ('PATCH /items/{id}', 10, patch_item),
+        ('DELETE /items/{id}', 10, delete_item)
+    ], seed_items=200)
+}
\ No newline at end of file
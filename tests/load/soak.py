@@ -0,0 +1,263 @@
+import logging
+import statistics
+import threading
+import time
+from typing import Dict, List, Optional, Sequence, Tuple
+import requests
+from api.base_api import exchange_log
+from api.health_api import HealthAPI
+from config import config
+from load.runner import LoadRunner, quiet_client_logging
+from load.scenarios import Scenario
+from load.stats import theil_sen
+from utils.latency import latency_collector, percentile
+
+logger = logging.getLogger(__name__)
+
+# Ряды состояния процесса: имя в отчете -> (gauge /metrics, множитель)
+PROCESS_SERIES = {
+    'rss_mb': ('process.rss_bytes', 1 / 2 ** 20),
+    'open_fds': ('process.open_fds', 1),
+    'threads': ('process.threads', 1),
+    'pool_checked_out': ('db.pool.checked_out', 1),
+    'pool_connections': ('db.pool.connections', 1)
+}
+
+# Ряды задержки (мс): p50 окна клиента и p50 скользящего окна сервера
+LATENCY_SERIES = ('client_p50_ms', 'server_p50_ms')
+
+SERVER_LATENCY = 'request.latency_seconds'
+
+# Минимальный рост за анализируемый участок, считающийся нарушением: шум аллокатора
+# и округление целых рядов не должны давать ложных срабатываний на коротких прогонах
+GROWTH_FLOORS = {
+    'rss_mb': 8.0,
+    'open_fds': 2,
+    'threads': 2,
+    'pool_checked_out': 1,
+    'pool_connections': 1,
+    'client_p50_ms': 1.0,
+    'server_p50_ms': 1.0
+}
+
+
+def default_growth_limits() -> Dict[str, float]:
+    """Пороги роста рядов процесса в час (SoakConfig)."""
+    return {
+        'rss_mb': config.soak.max_rss_growth_mb_per_hour,
+        'open_fds': config.soak.max_fd_growth_per_hour,
+        'threads': config.soak.max_fd_growth_per_hour,
+        'pool_checked_out': config.soak.max_pool_growth_per_hour,
+        'pool_connections': config.soak.max_pool_growth_per_hour
+    }
+
+
+def _sustained(points: Sequence[Tuple[float, float]]) -> bool:
+    """Рост не разовый: медиана последней четверти ряда выше медианы первой."""
+    quarter = max(len(points) // 4, 1)
+    return statistics.median(y for _, y in points[-quarter:]) > statistics.median(y for _, y in points[:quarter])
+
+
+def analyze(
+    samples: Sequence[Dict],
+    warmup: float = 0.0,
+    growth_limits: Optional[Dict[str, float]] = None,
+    max_latency_drift: Optional[float] = None,
+    min_points: int = 8
+) -> List[Dict]:
+    """
+    Тренды рядов замеров после warmup (наклон Тейла-Сена).
+    
+    Ряды процесса сервера строятся отдельно для каждого pid (воркеры
+    gunicorn) и проверяются по росту в час; ряды задержки - по
+    относительному дрейфу за анализируемый участок. Нарушением считается
+    превышение порога при устойчивом росте (последняя четверть ряда
+    выше первой и рост не меньше GROWTH_FLOORS), а не разовый всплеск.
+    """
+    growth_limits = default_growth_limits() if growth_limits is None else growth_limits
+    max_latency_drift = config.soak.max_latency_drift if max_latency_drift is None else max_latency_drift
+    
+    series: Dict[Tuple[str, str], List[Tuple[float, float]]] = {}
+    for sample in samples:
+        if sample['t'] < warmup:
+            continue
+        for name in list(PROCESS_SERIES) + list(LATENCY_SERIES):
+            if sample.get(name) is None:
+                continue
+            source = 'client' if name == 'client_p50_ms' else f"pid {sample.get('pid')}"
+            series.setdefault((name, source), []).append((sample['t'], sample[name]))
+    
+    trends = []
+    for (name, source), points in sorted(series.items()):
+        if len(points) < min_points:
+            continue
+        slope, intercept = theil_sen(points)
+        start = intercept + slope * points[0][0]
+        end = intercept + slope * points[-1][0]
+        trend = {
+            'metric': name,
+            'source': source,
+            'points': len(points),
+            'start': round(start, 3),
+            'end': round(end, 3),
+            'slope_per_hour': round(slope * 3600, 3),
+            'sustained': _sustained(points) and end - start >= GROWTH_FLOORS[name]
+        }
+        if name in LATENCY_SERIES:
+            trend['drift'] = round((end - start) / start, 4) if start > 0 else 0.0
+            trend['limit'] = max_latency_drift
+            exceeded = trend['drift'] > max_latency_drift
+        else:
+            trend['limit'] = growth_limits.get(name)
+            exceeded = trend['limit'] is not None and trend['slope_per_hour'] > trend['limit']
+        trend['failed'] = exceeded and trend['sustained']
+        trends.append(trend)
+    return trends
+
+
+def format_trends(trends: Sequence[Dict]) -> str:
+    """Таблица трендов для вывода в консоль или в Allure."""
+    header = f"{'metric':<20}{'source':<14}{'start':>12}{'end':>12}{'per hour':>12}{'drift':>10}{'limit':>10}  result"
+    rows = [header, '-' * len(header)]
+    for trend in trends:
+        drift = f"{trend['drift']:.1%}" if 'drift' in trend else '-'
+        limit = trend['limit']
+        limit = '-' if limit is None else f"{limit:.0%}" if 'drift' in trend else f"{limit:g}"
+        rows.append(
+            f"{trend['metric']:<20}{trend['source']:<14}{trend['start']:>12}{trend['end']:>12}"
+            f"{trend['slope_per_hour']:>12}{drift:>10}{limit:>10}  {'FAIL' if trend['failed'] else 'ok'}"
+        )
+    return '\n'.join(rows)
+
+
+class SoakRunner:
+    """
+    Длительная нагрузка с периодическим снятием состояния сервера.
+    
+    Нагрузка - LoadRunner (по умолчанию с постоянным RPS, чтобы задержки
+    разных участков прогона были сравнимы). Каждые interval секунд
+    снимаются gauge процесса из /metrics (RSS, дескрипторы, потоки,
+    соединения пула БД, p50 задержки сервера) и p50/p99 запросов клиента
+    за интервал. По окончании ряды после warmup проверяются analyze.
+    """
+    
+    def __init__(
+        self,
+        scenario: Scenario,
+        duration: float = 7200.0,
+        interval: float = 15.0,
+        warmup: float = 300.0,
+        workers: int = 4,
+        target_rps: Optional[float] = 50.0,
+        base_url: Optional[str] = None,
+        keep_alive: bool = True,
+        seed: Optional[int] = None
+    ):
+        if interval <= 0:
+            raise ValueError("interval must be > 0")
+        self.scenario = scenario
+        self.duration = duration
+        self.interval = interval
+        self.warmup = warmup
+        self.workers = workers
+        self.target_rps = target_rps
+        self.base_url = base_url
+        self.keep_alive = keep_alive
+        self.seed = seed
+    
+    def _metrics_client(self) -> HealthAPI:
+        if self.base_url is None:
+            return HealthAPI()
+        root = self.base_url[:-len('/api')] if self.base_url.endswith('/api') else self.base_url
+        return HealthAPI(root)
+    
+    def _sample(self, client: HealthAPI, elapsed: float, since_seq: int) -> Tuple[Dict, int]:
+        """Замер: gauge процесса сервера и задержки клиента с since_seq."""
+        next_seq = latency_collector.next_seq()
+        window = [
+            sample for sample in latency_collector.samples(since_seq, next_seq)
+            if not sample.endpoint.startswith(('/metrics', '/health', '/ready'))
+        ]
+        totals = sorted(sample.total for sample in window)
+        
+        def ms(value):
+            return None if value is None else round(value * 1000, 3)
+        
+        sample = {
+            't': round(elapsed, 3),
+            'requests': len(window),
+            'errors': sum(1 for item in window if not isinstance(item.status, int) or item.status >= 400),
+            'client_p50_ms': ms(percentile(totals, 50)),
+            'client_p99_ms': ms(percentile(totals, 99))
+        }
+        try:
+            snapshot = client.get('/metrics', expected_status=200).json()
+        except (requests.RequestException, AssertionError, ValueError) as e:
+            logger.warning(f"⚠️ Soak: метрики сервера недоступны: {e}")
+            return sample, next_seq
+        
+        gauges = snapshot.get('gauges', {})
+        sample['pid'] = gauges.get('process.pid')
+        for name, (gauge, scale) in PROCESS_SERIES.items():
+            value = gauges.get(gauge)
+            sample[name] = None if value is None else round(value * scale, 3)
+        sample['server_p50_ms'] = ms(snapshot.get('histograms', {}).get(SERVER_LATENCY, {}).get('p50'))
+        return sample, next_seq
+    
+    def run(self) -> Dict:
+        """Прогон; возвращает замеры, тренды и сводку нагрузки."""
+        runner = LoadRunner(
+            self.scenario,
+            workers=self.workers,
+            duration=self.duration,
+            target_rps=self.target_rps,
+            base_url=self.base_url,
+            keep_alive=self.keep_alive,
+            seed=self.seed
+        )
+        load_report: Dict = {}
+        load = threading.Thread(target=lambda: load_report.update(runner.run()), name='soak-load', daemon=True)
+        client = self._metrics_client()
+        samples: List[Dict] = []
+        
+        logger.info(
+            f"🧪 Soak '{self.scenario.name}': {self.duration:.0f}s, замер каждые {self.interval:g}s, "
+            f"анализ после {self.warmup:.0f}s"
+        )
+        
+        seq = latency_collector.next_seq()
+        started = time.perf_counter()
+        load.start()
+        with quiet_client_logging(), exchange_log.suppressed():
+            while True:
+                load.join(self.interval)
+                if not load.is_alive():
+                    break
+                sample, seq = self._sample(client, time.perf_counter() - started, seq)
+                samples.append(sample)
+                logger.info(
+                    f"🧪 Soak {sample['t']:.0f}s: RSS {sample.get('rss_mb')} MB, fds {sample.get('open_fds')}, "
+                    f"pool {sample.get('pool_checked_out')}/{sample.get('pool_connections')}, "
+                    f"p50 {sample['client_p50_ms']} ms, {sample['requests']} запросов"
+                )
+        client.close()
+        
+        trends = analyze(samples, self.warmup)
+        failed = [f"{trend['metric']} ({trend['source']})" for trend in trends if trend['failed']]
+        if failed:
+            logger.warning(f"❌ Soak: устойчивый рост {', '.join(failed)}")
+        else:
+            logger.info(f"✅ Soak: устойчивого роста нет ({len(trends)} рядов)")
+        
+        return {
+            'scenario': self.scenario.name,
+            'duration_seconds': self.duration,
+            'interval_seconds': self.interval,
+            'warmup_seconds': self.warmup,
+            'workers': self.workers,
+            'target_rps': self.target_rps,
+            'failed': failed,
+            'trends': trends,
+            'samples': samples,
+            'load': load_report
+        }
\ No newline at end of file
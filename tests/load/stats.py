@@ -0,0 +1,148 @@
+import statistics
+import threading
+from collections import Counter
+from typing import Dict, Sequence, Tuple
+from load.histogram import LatencyHistogram
+
+
+class EndpointStats:
+    """Задержки (LatencyHistogram) и коды ответов одного эндпоинта."""
+    
+    def __init__(self, name: str):
+        self.name = name
+        self.histogram = LatencyHistogram()
+        self.statuses = Counter()
+        self.errors = 0
+    
+    def record(self, latency: float, status, error: bool):
+        self.histogram.record(latency)
+        self.statuses[str(status)] += 1
+        if error:
+            self.errors += 1
+    
+    def merge(self, other: 'EndpointStats'):
+        self.histogram.merge(other.histogram)
+        self.statuses.update(other.statuses)
+        self.errors += other.errors
+    
+    def summary(self, elapsed: float) -> Dict:
+        """Сводка: число запросов, пропускная способность, ошибки и перцентили (мс)."""
+        count = self.histogram.count
+        
+        def ms(value):
+            return None if value is None else round(value * 1000, 2)
+        
+        return {
+            'requests': count,
+            'throughput_rps': round(count / elapsed, 2) if elapsed > 0 else 0.0,
+            'errors': self.errors,
+            'error_rate': round(self.errors / count, 4) if count else 0.0,
+            'p50_ms': ms(self.histogram.percentile(50)),
+            'p95_ms': ms(self.histogram.percentile(95)),
+            'p99_ms': ms(self.histogram.percentile(99)),
+            'max_ms': ms(self.histogram.max),
+            'statuses': dict(self.statuses)
+        }
+    
+    def to_dict(self) -> Dict:
+        return {'histogram': self.histogram.to_dict(), 'statuses': dict(self.statuses), 'errors': self.errors}
+    
+    @classmethod
+    def from_dict(cls, name: str, data: Dict) -> 'EndpointStats':
+        stats = cls(name)
+        stats.histogram = LatencyHistogram.from_dict(data['histogram'])
+        stats.statuses.update(data['statuses'])
+        stats.errors = data['errors']
+        return stats
+
+
+class LoadStats:
+    """Потокобезопасный сбор результатов нагрузки по эндпоинтам."""
+    
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._endpoints: Dict[str, EndpointStats] = {}
+        self._total = EndpointStats('TOTAL')
+    
+    def record(self, endpoint: str, latency: float, status, error: bool):
+        with self._lock:
+            stats = self._endpoints.get(endpoint)
+            if stats is None:
+                stats = self._endpoints[endpoint] = EndpointStats(endpoint)
+            stats.record(latency, status, error)
+            self._total.record(latency, status, error)
+    
+    def summary(self, elapsed: float) -> Dict:
+        """Сводка по каждому эндпоинту и итог."""
+        with self._lock:
+            endpoints = {
+                name: stats.summary(elapsed)
+                for name, stats in sorted(self._endpoints.items())
+            }
+            return {'endpoints': endpoints, 'total': self._total.summary(elapsed)}
+    
+    def merge(self, other: 'LoadStats') -> 'LoadStats':
+        """Добавление результатов другого сборщика (другого процесса генератора нагрузки)."""
+        with self._lock:
+            for name, stats in other._endpoints.items():
+                self._endpoints.setdefault(name, EndpointStats(name)).merge(stats)
+            self._total.merge(other._total)
+        return self
+    
+    def to_dict(self) -> Dict:
+        """Гистограммы и коды ответов по эндпоинтам (для передачи координатору)."""
+        with self._lock:
+            return {
+                'endpoints': {name: stats.to_dict() for name, stats in self._endpoints.items()},
+                'total': self._total.to_dict()
+            }
+    
+    @classmethod
+    def from_dict(cls, data: Dict) -> 'LoadStats':
+        stats = cls()
+        stats._endpoints = {name: EndpointStats.from_dict(name, item) for name, item in data['endpoints'].items()}
+        stats._total = EndpointStats.from_dict('TOTAL', data['total'])
+        return stats
+
+
+def theil_sen(points: Sequence[Tuple[float, float]], max_points: int = 1000) -> Tuple[float, float]:
+    """
+    Оценка Тейла-Сена: медиана наклонов по всем парам точек и медианный сдвиг.
+    
+    В отличие от МНК, устойчива к выбросам (до ~29% точек): единичные
+    всплески задержки или памяти не дают ложного тренда. Длинные ряды
+    прореживаются до max_points точек (число пар растет квадратично).
+    """
+    if len(points) > max_points:
+        step = len(points) / max_points
+        points = [points[int(index * step)] for index in range(max_points)]
+    slopes = [
+        (y2 - y1) / (x2 - x1)
+        for index, (x1, y1) in enumerate(points)
+        for x2, y2 in points[index + 1:]
+        if x2 != x1
+    ]
+    if not slopes:
+        return 0.0, statistics.median(y for _, y in points) if points else 0.0
+    slope = statistics.median(slopes)
+    return slope, statistics.median(y - slope * x for x, y in points)
+
+
+def format_summary(summary: Dict) -> str:
+    """Таблица сводки для вывода в консоль или в Allure."""
+    columns = ('requests', 'throughput_rps', 'error_rate', 'p50_ms', 'p95_ms', 'p99_ms', 'max_ms')
+    header = f"{'endpoint':<24}" + ''.join(f"{column:>16}" for column in columns)
+    rows = [header, '-' * len(header)]
+    
+    def row(name, values):
+        cells = ''.join(
+            f"{'-' if values[column] is None else values[column]:>16}"
+            for column in columns
+        )
+        return f"{name:<24}{cells}"
+    
+    for name, values in summary['endpoints'].items():
+        rows.append(row(name, values))
+    rows.append('-' * len(header))
+    rows.append(row('TOTAL', summary['total']))
+    return '\n'.join(rows)
\ No newline at end of file
@@ -0,0 +1,3 @@
+from .engine import IdMap, ReplayEngine
+
+__all__ = ['IdMap', 'ReplayEngine']
\ No newline at end of file
@@ -0,0 +1,67 @@
+"""
+Воспроизведение записанного трафика из командной строки (из каталога tests).
+
+Запись: API_CAPTURE_FILE=capture.jsonl.gz pytest tests/ (у воркеров xdist -
+capture.gw0.jsonl.gz и т.д.) или python -m load с той же переменной.
+    
+    python -m replay capture.jsonl.gz --target http://localhost:5001
+    python -m replay capture.*.jsonl.gz --speed 4 --streams 16 --output replay-report.json
+    python -m replay capture.jsonl.gz --speed 0 --max-error-rate 0.01    # без пауз
+"""
+import argparse
+import json
+import logging
+import sys
+from api.capture import read_capture
+from config import config
+from load.stats import format_summary
+from replay.engine import ReplayEngine, default_target
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Воспроизведение записанного трафика API")
+    parser.add_argument('captures', nargs='+', help="Файлы записи (api.capture)")
+    parser.add_argument('--target', default=default_target(), help="Корень целевого сервиса")
+    parser.add_argument('--speed', type=float, default=config.replay.speed,
+                        help="Множитель скорости (2 - вдвое быстрее записи, 0 - без пауз)")
+    parser.add_argument('--streams', type=int, default=config.replay.streams, help="Число параллельных потоков")
+    parser.add_argument('--dependency-timeout', type=float, default=config.replay.dependency_timeout,
+                        help="Ожидание создания ресурса, на который ссылается запрос, с")
+    parser.add_argument('--no-keep-alive', dest='keep_alive', action='store_false')
+    parser.add_argument('--max-error-rate', type=float, default=None,
+                        help="Код выхода 1, если доля ошибок выше порога")
+    parser.add_argument('--output', default=None, help="Путь для JSON отчета")
+    args = parser.parse_args()
+    
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+    
+    report = ReplayEngine(
+        read_capture(args.captures),
+        target=args.target,
+        speed=args.speed,
+        streams=args.streams,
+        keep_alive=args.keep_alive,
+        dependency_timeout=args.dependency_timeout
+    ).run()
+    
+    print(format_summary(report['summary']))
+    print(
+        f"\nЗапись: {report['recorded_seconds']}s, {report['recorded_rps']} RPS; "
+        f"воспроизведение: {report['elapsed_seconds']}s, {report['summary']['total']['throughput_rps']} RPS; "
+        f"отставание от расписания p99 {report['lag_p99_ms']} мс; "
+        f"коды ответов отличаются: {report['status_mismatches']}"
+    )
+    
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2, ensure_ascii=False)
+        print(f"\n✅ Отчет сохранен: {args.output}")
+    
+    error_rate = report['summary']['total']['error_rate']
+    if args.max_error_rate is not None and error_rate > args.max_error_rate:
+        print(f"❌ Доля ошибок {error_rate:.2%} выше порога {args.max_error_rate:.2%}")
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
\ No newline at end of file
@@ -0,0 +1,236 @@
+import logging
+import re
+import threading
+import time
+from typing import Dict, List, Optional, Sequence
+import requests
+from api.base_api import BaseAPI, endpoint_label
+from api.capture import created_ids
+from config import config
+from load.runner import quiet_client_logging
+from load.stats import LoadStats
+from utils.latency import percentile
+
+logger = logging.getLogger(__name__)
+
+_ID_SEGMENT = re.compile(r'(?<=/)\d+(?=/|$)')
+
+
+def default_target() -> str:
+    """Корень сервиса (API_BASE_URL без суффикса /api): записаны полные пути запросов."""
+    base_url = config.api.base_url
+    if base_url.endswith('/api'):
+        base_url = base_url[:-len('/api')]
+    return base_url
+
+
+class IdMap:
+    """
+    Соответствие ID ресурсов записи и ID, созданных при воспроизведении.
+    
+    Запрос к ресурсу, созданному раньше в записи, ждет, пока создающий
+    запрос будет воспроизведен (потоки идут параллельно). ID ресурсов,
+    которые в записи не создавались, передаются как есть.
+    """
+    
+    def __init__(self, records: Sequence[Dict]):
+        self._condition = threading.Condition()
+        self._ids: Dict[int, int] = {}
+        # Индекс создающего запроса для каждого ID записи (последний, если ID повторялся)
+        self._creators: Dict[int, int] = {}
+        self._pending = set()
+        for index, record in enumerate(records):
+            for old_id in record.get('ids', ()):
+                self._creators[old_id] = index
+                self._pending.add(old_id)
+        self.unmapped = 0
+    
+    def resolve(self, old_id: int, index: int, timeout: float) -> int:
+        """ID при воспроизведении для запроса с индексом index."""
+        creator = self._creators.get(old_id)
+        if creator is None or creator >= index:
+            return old_id
+        with self._condition:
+            self._condition.wait_for(lambda: old_id not in self._pending, timeout)
+            new_id = self._ids.get(old_id)
+            if new_id is None:
+                self.unmapped += 1
+                return old_id
+            return new_id
+    
+    def bind(self, old_ids: Sequence[int], new_ids: Sequence[int]):
+        """Сопоставление созданных ресурсов по порядку; не созданные снимаются с ожидания."""
+        with self._condition:
+            for old_id, new_id in zip(old_ids, new_ids):
+                self._ids[old_id] = new_id
+            self._pending.difference_update(old_ids)
+            self._condition.notify_all()
+
+
+class ReplayEngine:
+    """
+    Воспроизведение записанного трафика (api.capture) на целевом сервисе.
+    
+    Запросы запускаются в моменты записи, деленные на speed (2 - вдвое
+    быстрее, 0 - без пауз), streams потоками: каждый поток берет следующий
+    по времени запрос. Задержка считается от запланированного момента, как
+    в режиме целевого RPS генератора нагрузки, поэтому отставание сервиса
+    не скрывается; отставание запуска от расписания - отдельная метрика (lag).
+    
+    ID созданных ресурсов заменяются на ID, созданные при воспроизведении
+    (в пути и в query параметрах *_id). Отчет сравнивает пропускную
+    способность и коды ответов с записью.
+    """
+    
+    def __init__(
+        self,
+        records: Sequence[Dict],
+        target: Optional[str] = None,
+        speed: float = 1.0,
+        streams: int = 4,
+        keep_alive: bool = True,
+        dependency_timeout: float = 5.0
+    ):
+        if streams < 1:
+            raise ValueError("streams must be >= 1")
+        if speed < 0:
+            raise ValueError("speed must be >= 0")
+        self.records = list(records)
+        self.target = (target or default_target()).rstrip('/')
+        self.speed = speed
+        self.streams = streams
+        self.keep_alive = keep_alive
+        self.dependency_timeout = dependency_timeout
+        self._next = 0
+        self._next_lock = threading.Lock()
+    
+    def _take(self) -> Optional[int]:
+        with self._next_lock:
+            if self._next >= len(self.records):
+                return None
+            self._next += 1
+            return self._next - 1
+    
+    def _create_client(self) -> BaseAPI:
+        client = BaseAPI(self.target, max_retries=0)
+        client.session.headers['Connection'] = 'keep-alive' if self.keep_alive else 'close'
+        return client
+    
+    def _prepare(self, record: Dict, index: int, ids: IdMap):
+        """Путь и query параметры запроса с ID воспроизведения."""
+        path = _ID_SEGMENT.sub(
+            lambda match: str(ids.resolve(int(match.group()), index, self.dependency_timeout)),
+            record['p']
+        )
+        params = dict(record.get('q') or {})
+        for name, value in params.items():
+            if name.endswith('id') and str(value).isdigit():
+                params[name] = ids.resolve(int(value), index, self.dependency_timeout)
+        return path, params or None
+    
+    def _stream(self, ids: IdMap, stats: LoadStats, lags: List[float], mismatches: List[int], origin: float):
+        client = self._create_client()
+        
+        while True:
+            index = self._take()
+            if index is None:
+                break
+            record = self.records[index]
+            
+            offset = record['t'] - self.records[0]['t']
+            scheduled = origin + offset / self.speed if self.speed else time.perf_counter()
+            delay = scheduled - time.perf_counter()
+            if delay > 0:
+                time.sleep(delay)
+            lags.append(max(time.perf_counter() - scheduled, 0.0))
+            
+            path, params = self._prepare(record, index, ids)
+            method = record['m']
+            try:
+                response = client.session.request(
+                    method,
+                    f"{self.target}{path}",
+                    params=params,
+                    json=record.get('b'),
+                    timeout=client.timeout
+                )
+                status = response.status_code
+                error = status >= 400
+                if record.get('ids'):
+                    try:
+                        body = response.json()
+                    except ValueError:
+                        body = None
+                    ids.bind(record['ids'], created_ids(method, status, body))
+            except requests.RequestException as e:
+                status = type(e).__name__
+                error = True
+                if record.get('ids'):
+                    ids.bind(record['ids'], ())
+            
+            if str(status) != str(record['st']):
+                mismatches.append(index)
+            stats.record(f"{method} {endpoint_label(record['p'])}", time.perf_counter() - scheduled, status, error)
+        
+        client.close()
+    
+    def run(self) -> Dict:
+        """Воспроизведение; возвращает параметры прогона, сравнение с записью и сводку по эндпоинтам."""
+        ids = IdMap(self.records)
+        stats = LoadStats()
+        lags: List[float] = []
+        mismatches: List[int] = []
+        
+        logger.info(
+            f"🔁 Воспроизведение {len(self.records)} запросов на {self.target}: "
+            f"{self.streams} потоков, " + (f"скорость x{self.speed:g}" if self.speed else "без пауз")
+        )
+        
+        with quiet_client_logging():
+            origin = time.perf_counter()
+            threads = [
+                threading.Thread(
+                    target=self._stream,
+                    args=(ids, stats, lags, mismatches, origin),
+                    name=f"replay-{index}",
+                    daemon=True
+                )
+                for index in range(self.streams)
+            ]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+            elapsed = max(time.perf_counter() - origin, 1e-9)
+        
+        recorded = self._recorded_seconds()
+        summary = stats.summary(elapsed)
+        lags.sort()
+        report = {
+            'target': self.target,
+            'requests': len(self.records),
+            'streams': self.streams,
+            'speed': self.speed,
+            'keep_alive': self.keep_alive,
+            'recorded_seconds': round(recorded, 3),
+            'recorded_rps': round(len(self.records) / recorded, 2) if recorded > 0 else None,
+            'elapsed_seconds': round(elapsed, 3),
+            'lag_p99_ms': round(percentile(lags, 99) * 1000, 2) if lags else None,
+            'lag_max_ms': round(lags[-1] * 1000, 2) if lags else None,
+            'status_mismatches': len(mismatches),
+            'unmapped_ids': ids.unmapped,
+            'summary': summary
+        }
+        logger.info(
+            f"📊 Воспроизведение завершено за {elapsed:.1f}s (запись - {recorded:.1f}s): "
+            f"{summary['total']['throughput_rps']} RPS, ошибок {summary['total']['error_rate']:.2%}, "
+            f"коды ответов отличаются у {len(mismatches)} запросов"
+        )
+        return report
+    
+    def _recorded_seconds(self) -> float:
+        """Длительность записи: от начала первого до конца последнего запроса."""
+        if not self.records:
+            return 0.0
+        end = max(record['t'] + record.get('d', 0) / 1000 for record in self.records)
+        return end - self.records[0]['t']
\ No newline at end of file
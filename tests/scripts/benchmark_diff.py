@@ -0,0 +1,88 @@
+"""
+Бенчмарк сравнения JSON списков товаров (compare_json_objects).
+
+Для списков из 100 и 10 000 товаров сравниваются обычный режим (DeepDiff
+с ignore_order) и сопоставление по id (key='id') в трех случаях: списки
+равны, изменено одно поле одного товара, порядок товаров перемешан.
+    
+    cd tests
+    python scripts/benchmark_diff.py --runs 5
+    python scripts/benchmark_diff.py --sizes 100 1000 --skip-deepdiff-above 1000
+"""
+import argparse
+import copy
+import os
+import random
+import statistics
+import sys
+import time
+
+TESTS_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, TESTS_DIR)
+
+from utils.helpers import compare_json_objects  # noqa: E402
+
+def make_items(size, seed=42):
+    """Ответ списка товаров из size элементов."""
+    rng = random.Random(seed)
+    items = [
+        {
+            'id': index + 1,
+            'name': f"Item {index + 1}",
+            'price': round(rng.uniform(1, 1000), 2),
+            'description': None,
+            'in_stock': rng.random() < 0.7,
+            'tag': 'benchmark',
+            'created_at': '2024-01-01T00:00:00',
+            'updated_at': None
+        }
+        for index in range(size)
+    ]
+    return {'items': items, 'total': size, 'page': 1, 'per_page': size, 'pages': 1}
+
+def make_cases(size):
+    """Пары (ожидаемый, фактический) для каждого случая."""
+    expected = make_items(size)
+    
+    changed = copy.deepcopy(expected)
+    changed['items'][size // 2]['price'] += 1
+    
+    shuffled = copy.deepcopy(expected)
+    random.Random(7).shuffle(shuffled['items'])
+    
+    return {
+        'equal': (expected, copy.deepcopy(expected)),
+        'one_field_changed': (expected, changed),
+        'shuffled': (expected, shuffled)
+    }
+
+def measure(expected, actual, key, runs):
+    """Медиана времени сравнения, мс."""
+    samples = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        compare_json_objects(expected, actual, key=key)
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples)
+
+def main():
+    parser = argparse.ArgumentParser(description="Бенчмарк сравнения JSON списков товаров")
+    parser.add_argument('--sizes', type=int, nargs='+', default=[100, 10000], help="Размеры списков")
+    parser.add_argument('--runs', type=int, default=5, help="Число замеров на случай")
+    parser.add_argument('--skip-deepdiff-above', type=int, default=None,
+                        help="Не замерять обычный режим для списков длиннее (он квадратичен)")
+    args = parser.parse_args()
+    
+    print(f"{'size':>7}  {'case':<20}{'deepdiff, ms':>16}{'key=id, ms':>14}")
+    for size in args.sizes:
+        for case, (expected, actual) in make_cases(size).items():
+            keyed = measure(expected, actual, 'id', args.runs)
+            if args.skip_deepdiff_above is not None and size > args.skip_deepdiff_above:
+                deepdiff = '-'
+            else:
+                deepdiff = f"{measure(expected, actual, None, args.runs):.2f}"
+            print(f"{size:>7}  {case:<20}{deepdiff:>16}{keyed:>14.2f}")
+    print("\nВремя в миллисекундах: медиана по замерам")
+
+if __name__ == '__main__':
+    main()
\ No newline at end of file
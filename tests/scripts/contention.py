@@ -0,0 +1,65 @@
+"""
+Конкурентные PUT/PATCH/DELETE одного товара из многих потоков с проверкой
+инвариантов (нет 5xx и потерянных обновлений, одно успешное удаление,
+404 после него) и замером пропускной способности под конкуренцией.
+Код выхода 1 - нарушены инварианты.
+    
+    cd tests
+    python scripts/contention.py --workers 32 --rounds 20
+    python scripts/contention.py --base-url http://localhost:5001/api --output contention-report.json
+"""
+import argparse
+import json
+import logging
+import os
+import sys
+
+TESTS_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, TESTS_DIR)
+
+from config import config  # noqa: E402
+from load.contention import ContentionRunner  # noqa: E402
+from load.stats import format_summary  # noqa: E402
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Конкурентные изменения одного товара")
+    parser.add_argument('--base-url', default=config.api.base_url, help="Базовый URL API")
+    parser.add_argument('--workers', type=int, default=config.stress.workers, help="Число потоков")
+    parser.add_argument('--rounds', type=int, default=config.stress.rounds, help="Число раундов (товаров)")
+    parser.add_argument('--write-duration', type=float, default=config.stress.write_duration,
+                        help="Фаза конкурентных PUT/PATCH/GET, с")
+    parser.add_argument('--delete-duration', type=float, default=config.stress.delete_duration,
+                        help="Фаза запросов после одновременного DELETE, с")
+    parser.add_argument('--no-keep-alive', dest='keep_alive', action='store_false')
+    parser.add_argument('--seed', type=int, default=None)
+    parser.add_argument('--output', default=None, help="Путь для JSON отчета")
+    args = parser.parse_args()
+    
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+    
+    report = ContentionRunner(
+        workers=args.workers,
+        rounds=args.rounds,
+        write_duration=args.write_duration,
+        delete_duration=args.delete_duration,
+        base_url=args.base_url,
+        keep_alive=args.keep_alive,
+        seed=args.seed
+    ).run()
+    
+    print(format_summary(report['summary']))
+    for violation in report['violations']:
+        print(f"❌ {violation}")
+    
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2, ensure_ascii=False)
+        print(f"\n✅ Отчет сохранен: {args.output}")
+    
+    if report['violations']:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
\ No newline at end of file
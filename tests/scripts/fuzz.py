@@ -0,0 +1,67 @@
+"""
+Генеративная проверка контракта валидации схем /api/items (товар, список, массовые операции):
+тысячи корректных и некорректных тел и query параметров в секунду,
+ответ 201/200 или 400 с ожидаемыми полями ошибок, ни одного 5xx.
+Нарушения упрощаются до минимального случая. Код выхода 1 - есть нарушения.
+    
+    cd tests
+    python scripts/fuzz.py --cases 100000 --workers 8 --transport inprocess
+    python scripts/fuzz.py --cases 1000000 --seed 42 --output fuzz-report.json
+"""
+import argparse
+import json
+import logging
+import os
+import sys
+
+TESTS_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, TESTS_DIR)
+
+from api.transport import TRANSPORTS  # noqa: E402
+from config import config  # noqa: E402
+from fuzz import FuzzRunner  # noqa: E402
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Генеративная проверка валидации API товаров")
+    parser.add_argument('--cases', type=int, default=config.fuzz.cases, help="Число случаев")
+    parser.add_argument('--workers', type=int, default=config.fuzz.workers,
+                        help="Воркеры: процессы (inprocess) или потоки (http)")
+    parser.add_argument('--transport', choices=TRANSPORTS, default=config.api.transport,
+                        help="inprocess - create_app('testing') в процессах воркеров, http - запущенный сервис")
+    parser.add_argument('--base-url', default=config.api.base_url, help="Базовый URL API")
+    parser.add_argument('--seed', type=int, default=int(config.fuzz.seed) if config.fuzz.seed else None)
+    parser.add_argument('--max-failures', type=int, default=config.fuzz.max_failures,
+                        help="Упрощаемых нарушений на задачу воркера")
+    parser.add_argument('--output', default=None, help="Путь для JSON отчета")
+    args = parser.parse_args()
+    
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+    
+    report = FuzzRunner(
+        cases=args.cases,
+        workers=args.workers,
+        transport=args.transport,
+        base_url=args.base_url,
+        seed=args.seed,
+        max_failures=args.max_failures
+    ).run()
+    
+    print(f"\n{report['cases']} случаев, {report['cases_per_second']}/s, seed {report['seed']}")
+    for status, count in report['statuses'].items():
+        print(f"  {status:<12}{count:>10}")
+    for failure in report['failures']:
+        print(f"❌ {failure['problem']} (x{failure['count']}, seed {failure['seed']}, случай {failure['index']})")
+        print(f"   {json.dumps(failure['case'], ensure_ascii=False)}")
+    
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2, ensure_ascii=False)
+        print(f"\n✅ Отчет сохранен: {args.output}")
+    
+    if report['violations']:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
\ No newline at end of file
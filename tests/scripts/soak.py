@@ -0,0 +1,68 @@
+"""
+Длительный (soak) прогон из командной строки: смешанная нагрузка ItemsAPI
+на часы с поиском утечек памяти, дескрипторов, соединений пула БД
+и дрейфа задержки. Код выхода 1 - найден устойчивый рост.
+    
+    cd tests
+    python scripts/soak.py --duration 14400 --rps 50 --output soak-report.json
+    python scripts/soak.py --base-url http://localhost:5001/api    # стек docker-compose
+"""
+import argparse
+import json
+import logging
+import os
+import sys
+
+TESTS_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, TESTS_DIR)
+
+from config import config  # noqa: E402
+from load.scenarios import SCENARIOS  # noqa: E402
+from load.soak import SoakRunner, format_trends  # noqa: E402
+from load.stats import format_summary  # noqa: E402
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Длительный прогон с поиском утечек и дрейфа задержки")
+    parser.add_argument('--base-url', default=config.api.base_url, help="Базовый URL API")
+    parser.add_argument('--scenario', choices=sorted(SCENARIOS), default=config.soak.scenario)
+    parser.add_argument('--duration', type=float, default=config.soak.duration, help="Длительность, с")
+    parser.add_argument('--interval', type=float, default=config.soak.interval, help="Период замеров, с")
+    parser.add_argument('--warmup', type=float, default=config.soak.warmup, help="Начало прогона без анализа, с")
+    parser.add_argument('--workers', type=int, default=config.soak.workers, help="Число потоков")
+    parser.add_argument('--rps', type=float, default=config.soak.target_rps or None,
+                        help="Целевой RPS (0 - без ограничения)")
+    parser.add_argument('--seed', type=int, default=None)
+    parser.add_argument('--output', default=None, help="Путь для JSON отчета")
+    args = parser.parse_args()
+    
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+    
+    report = SoakRunner(
+        SCENARIOS[args.scenario],
+        duration=args.duration,
+        interval=args.interval,
+        warmup=args.warmup,
+        workers=args.workers,
+        target_rps=args.rps or None,
+        base_url=args.base_url,
+        seed=args.seed
+    ).run()
+    
+    print(format_trends(report['trends']))
+    if report['load']:
+        print()
+        print(format_summary(report['load']['summary']))
+    
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2, ensure_ascii=False)
+        print(f"\n✅ Отчет сохранен: {args.output}")
+    
+    if report['failed']:
+        print(f"❌ Устойчивый рост: {', '.join(report['failed'])}")
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
\ No newline at end of file
@@ -0,0 +1,63 @@
+"""
+Ожидание готовности приложения перед запуском тестов.
+
+Опрашивает /ready (по умолчанию - в корне API_BASE_URL) с экспоненциальной
+паузой: тесты стартуют сразу после готовности сервиса, без фиксированных
+задержек. После готовности выполняет команду после "--" вместо себя.
+    
+    cd tests
+    python scripts/wait_for_app.py -- pytest tests/ -v
+    python scripts/wait_for_app.py --url http://localhost:5001/ready --timeout 120
+"""
+import argparse
+import os
+import sys
+import requests
+
+TESTS_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, TESTS_DIR)
+
+from config import config  # noqa: E402
+from utils.polling import Backoff, poll  # noqa: E402
+
+def default_url():
+    """URL /ready в корне сервиса (API_BASE_URL без суффикса /api)."""
+    base_url = config.api.base_url
+    if base_url.endswith('/api'):
+        base_url = base_url[:-len('/api')]
+    return f"{base_url}/ready"
+
+def main():
+    parser = argparse.ArgumentParser(description="Ожидание готовности приложения")
+    parser.add_argument('--url', default=default_url(), help="URL проверки готовности")
+    parser.add_argument('--timeout', type=float, default=60, help="Максимальное время ожидания, с")
+    parser.add_argument('command', nargs=argparse.REMAINDER, help="Команда после готовности (после --)")
+    args = parser.parse_args()
+    command = args.command[1:] if args.command[:1] == ['--'] else args.command
+    
+    print(f"⏳ Waiting for app: {args.url}")
+    statuses = []
+    
+    def ready():
+        statuses.append(requests.get(args.url, timeout=2).status_code)
+        return statuses[-1] == 200
+    
+    result, last_error = poll(
+        ready,
+        args.timeout,
+        'app ready',
+        backoff=Backoff(initial=0.1, maximum=2.0),
+        ignore=(requests.RequestException,)
+    )
+    if not result.ok:
+        reason = f": {last_error}" if last_error else f": status {statuses[-1]}" if statuses else ""
+        print(f"❌ App is not ready after {result.elapsed:.1f}s{reason}")
+        sys.exit(1)
+    print(f"✅ App is ready after {result.elapsed:.1f}s ({result.attempts} checks)")
+    
+    if command:
+        sys.stdout.flush()
+        os.execvp(command[0], command)
+
+if __name__ == '__main__':
+    main()
\ No newline at end of file
@@ -0,0 +1,11 @@
+from .faults import FaultProfile, LatencyDistribution
+from .server import StubServer
+from .store import ItemStore, ValidationFailed
+
+__all__ = [
+    'FaultProfile',
+    'LatencyDistribution',
+    'StubServer',
+    'ItemStore',
+    'ValidationFailed'
+]
\ No newline at end of file
@@ -0,0 +1,50 @@
+"""
+Запуск заглушки API товаров из командной строки (из каталога tests).
+    
+    python -m stub_server --port 5002
+    python -m stub_server --latency lognormal:30,0.6 --error-rate 0.05 --bandwidth 100000
+    API_BASE_URL=http://127.0.0.1:5002/api python -m load --duration 10
+"""
+import argparse
+import logging
+from config import config
+from stub_server.faults import FaultProfile
+from stub_server.server import StubServer
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Заглушка API товаров (хранилище в памяти)")
+    parser.add_argument('--host', default=config.stub.host)
+    parser.add_argument('--port', type=int, default=config.stub.port)
+    parser.add_argument('--latency', default=config.stub.latency,
+                        help="Распределение задержки, мс (fixed:50, uniform:10,100, lognormal:50,0.5, ...)")
+    parser.add_argument('--error-rate', type=float, default=config.stub.error_rate, help="Доля ответов с ошибкой")
+    parser.add_argument('--error-status', type=int, default=config.stub.error_status)
+    parser.add_argument('--retry-after', type=float, default=None, help="Retry-After ответов с ошибкой, с")
+    parser.add_argument('--reset-rate', type=float, default=config.stub.reset_rate,
+                        help="Доля запросов со сбросом соединения")
+    parser.add_argument('--bandwidth', type=int, default=config.stub.bandwidth, help="Скорость ответа, байт/с")
+    parser.add_argument('--seed', type=int, default=None)
+    args = parser.parse_args()
+    
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+    
+    faults = FaultProfile(
+        latency=args.latency,
+        error_rate=args.error_rate,
+        error_status=args.error_status,
+        retry_after=args.retry_after,
+        reset_rate=args.reset_rate,
+        bandwidth=args.bandwidth,
+        seed=args.seed
+    )
+    server = StubServer(args.host, args.port, faults)
+    print(f"🧪 Stub server: {server.api_url} (latency {args.latency}, error rate {args.error_rate:.2%})")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == '__main__':
+    main()
\ No newline at end of file
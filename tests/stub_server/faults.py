@@ -0,0 +1,97 @@
+import math
+import random
+import threading
+from typing import Callable, Dict, List, Optional
+
+
+class LatencyDistribution:
+    """
+    Распределение задержки ответа (мс), задается строкой:
+        
+        fixed:50              - всегда 50 мс
+        uniform:10,100        - равномерно от 10 до 100 мс
+        normal:50,10          - нормальное (среднее, ст. отклонение), не меньше 0
+        lognormal:50,0.5      - логнормальное с медианой 50 мс и sigma 0.5 (длинный хвост)
+        exponential:20        - экспоненциальное со средним 20 мс
+        pareto:10,2           - Парето с минимумом 10 мс и параметром формы 2
+    """
+    
+    KINDS: Dict[str, Callable[..., Callable[[random.Random], float]]] = {
+        'fixed': lambda value: lambda rng: value,
+        'uniform': lambda low, high: lambda rng: rng.uniform(low, high),
+        'normal': lambda mean, deviation: lambda rng: max(rng.gauss(mean, deviation), 0.0),
+        'lognormal': lambda median, sigma: lambda rng: rng.lognormvariate(math.log(median), sigma),
+        'exponential': lambda mean: lambda rng: rng.expovariate(1 / mean),
+        'pareto': lambda minimum, shape: lambda rng: minimum * rng.paretovariate(shape)
+    }
+    
+    def __init__(self, spec: str = 'fixed:0'):
+        kind, _, arguments = spec.partition(':')
+        if kind not in self.KINDS:
+            raise ValueError(f"Unknown latency distribution: {kind} (expected one of {', '.join(self.KINDS)})")
+        try:
+            self._sample = self.KINDS[kind](*(float(value) for value in arguments.split(',') if value))
+        except TypeError:
+            raise ValueError(f"Invalid latency distribution parameters: {spec}")
+        self.spec = spec
+    
+    def sample(self, rng: random.Random) -> float:
+        """Задержка в секундах."""
+        return self._sample(rng) / 1000
+    
+    def __repr__(self) -> str:
+        return f"LatencyDistribution({self.spec!r})"
+
+
+class FaultProfile:
+    """
+    Поведение заглушки: задержка, ошибки и ограничение пропускной способности.
+    
+    latency       - распределение задержки перед ответом
+    error_rate    - доля запросов, на которые возвращается error_status
+    retry_after   - заголовок Retry-After ответов с ошибкой (None - без заголовка)
+    reset_rate    - доля запросов, на которые соединение закрывается без ответа
+    bandwidth     - скорость отправки тела ответа, байт/с (0 - без ограничения)
+    
+    Кроме случайных ошибок можно задать точную последовательность:
+    fail_next(count) - следующие count запросов получат ошибку
+    (детерминированные проверки повторов клиента).
+    """
+    
+    def __init__(
+        self,
+        latency: str = 'fixed:0',
+        error_rate: float = 0.0,
+        error_status: int = 503,
+        retry_after: Optional[float] = None,
+        reset_rate: float = 0.0,
+        bandwidth: int = 0,
+        seed: Optional[int] = None
+    ):
+        self.latency = LatencyDistribution(latency)
+        self.error_rate = error_rate
+        self.error_status = error_status
+        self.retry_after = retry_after
+        self.reset_rate = reset_rate
+        self.bandwidth = bandwidth
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+        self._forced: List[int] = []
+    
+    def fail_next(self, count: int = 1, status: Optional[int] = None):
+        """Ошибка status (по умолчанию error_status) для следующих count запросов."""
+        with self._lock:
+            self._forced.extend([status or self.error_status] * count)
+    
+    def decide(self) -> Dict:
+        """Решение для очередного запроса: задержка (с), код ошибки или сброс соединения."""
+        with self._lock:
+            delay = self.latency.sample(self._rng)
+            if self._forced:
+                return {'delay': delay, 'status': self._forced.pop(0), 'reset': False}
+            roll = self._rng.random()
+        if roll < self.reset_rate:
+            return {'delay': delay, 'status': None, 'reset': True}
+        if roll < self.reset_rate + self.error_rate:
+            return {'delay': delay, 'status': self.error_status, 'reset': False}
+        return {'delay': delay, 'status': None, 'reset': False}
\ No newline at end of file
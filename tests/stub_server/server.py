@@ -0,0 +1,243 @@
+import json
+import logging
+import re
+import threading
+import time
+from datetime import datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, Optional, Tuple
+from urllib.parse import parse_qsl, urlsplit
+from .faults import FaultProfile
+from .store import (
+    BULK_MAX_ITEMS,
+    ItemStore,
+    ValidationFailed,
+    validate_bulk,
+    validate_bulk_delete,
+    validate_item,
+    validate_query
+)
+
+logger = logging.getLogger(__name__)
+
+_ITEM_PATH = re.compile(r'^/api/items/(\d+)$')
+
+NOT_FOUND = ({'error': 'Resource not found'}, 404)
+ITEM_NOT_FOUND = ({'error': 'Item not found'}, 404)
+METHOD_NOT_ALLOWED = ({'message': 'The method is not allowed for the requested URL.'}, 405)
+
+
+class StubRequestHandler(BaseHTTPRequestHandler):
+    """Обработчик запросов заглушки: контракт /api/items поверх ItemStore и профиля отказов."""
+    
+    protocol_version = 'HTTP/1.1'
+    # Заголовки и тело пишутся отдельно: без TCP_NODELAY ответ ждал бы отложенного ACK (~40 мс)
+    disable_nagle_algorithm = True
+    server: 'StubHTTPServer'
+    
+    def do_GET(self):
+        self._handle('GET')
+    
+    def do_POST(self):
+        self._handle('POST')
+    
+    def do_PUT(self):
+        self._handle('PUT')
+    
+    def do_PATCH(self):
+        self._handle('PATCH')
+    
+    def do_DELETE(self):
+        self._handle('DELETE')
+    
+    def log_message(self, format, *args):
+        # Построчный лог запросов заглушки не нужен (и замедляет нагрузку)
+        pass
+    
+    def _body(self) -> Any:
+        # Как request.get_json(silent=True) приложения: невалидный JSON - None (ответ 400 валидации)
+        length = int(self.headers.get('Content-Length') or 0)
+        raw = self.rfile.read(length) if length else b''
+        try:
+            return json.loads(raw) if raw else None
+        except ValueError:
+            return None
+    
+    def _handle(self, method: str):
+        url = urlsplit(self.path)
+        faults = self.server.faults
+        decision = faults.decide() if url.path.startswith('/api/') else None
+        
+        body = self._body()
+        
+        if decision is not None:
+            if decision['delay']:
+                time.sleep(decision['delay'])
+            if decision['reset']:
+                # Соединение закрывается без ответа (клиент получает ConnectionError)
+                self.server.count('reset')
+                self.close_connection = True
+                return
+            if decision['status'] is not None:
+                self.server.count(decision['status'])
+                headers = {}
+                if faults.retry_after is not None:
+                    headers['Retry-After'] = f"{faults.retry_after:g}"
+                self._send({'error': 'Injected failure'}, decision['status'], headers)
+                return
+        
+        try:
+            payload, status = self._route(method, url.path, dict(parse_qsl(url.query, keep_blank_values=True)), body)
+        except ValidationFailed as e:
+            payload, status = {'errors': e.messages}, 400
+        self.server.count(status)
+        self._send(payload, status)
+    
+    def _route(self, method: str, path: str, args: Dict[str, str], body: Any) -> Tuple[Dict, int]:
+        store = self.server.store
+        
+        if path == '/health':
+            return {'status': 'healthy', 'timestamp': datetime.utcnow().isoformat(), 'environment': 'stub'}, 200
+        if path == '/ready':
+            return {'status': 'ready', 'checks': {}}, 200
+        
+        if path == '/api/items':
+            if method == 'GET':
+                return store.list(validate_query(args)), 200
+            if method == 'POST':
+                return store.create(validate_item(body)), 201
+            return METHOD_NOT_ALLOWED
+        
+        if path == '/api/items/bulk':
+            if method == 'POST':
+                items = body.get('items') if isinstance(body, dict) else None
+                if isinstance(items, list) and len(items) > BULK_MAX_ITEMS:
+                    return {'errors': {'items': [f"At most {BULK_MAX_ITEMS} items per request"]}}, 400
+                items, tag = validate_bulk(body)
+                created = store.create_many(items, tag)
+                return {'items': created, 'count': len(created)}, 201
+            if method == 'DELETE':
+                return {'deleted': store.delete_by_tag(validate_bulk_delete(args))}, 200
+            return METHOD_NOT_ALLOWED
+        
+        match = _ITEM_PATH.match(path)
+        if match is None:
+            return NOT_FOUND
+        item_id = int(match.group(1))
+        
+        if method == 'GET':
+            item = store.get(item_id)
+            return (item, 200) if item else ITEM_NOT_FOUND
+        if method in ('PUT', 'PATCH'):
+            if store.get(item_id) is None:
+                return ITEM_NOT_FOUND
+            item = store.update(item_id, validate_item(body, partial=method == 'PATCH'))
+            return (item, 200) if item else ITEM_NOT_FOUND
+        if method == 'DELETE':
+            if not store.delete(item_id):
+                return ITEM_NOT_FOUND
+            return {'message': 'Item deleted successfully'}, 200
+        return METHOD_NOT_ALLOWED
+    
+    def _send(self, payload: Dict, status: int, headers: Optional[Dict[str, str]] = None):
+        body = json.dumps(payload).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        
+        bandwidth = self.server.faults.bandwidth
+        if not bandwidth:
+            self.wfile.write(body)
+            return
+        # Ограничение скорости: тело отправляется порциями по 50 мс
+        chunk = max(int(bandwidth * 0.05), 1)
+        for offset in range(0, len(body), chunk):
+            self.wfile.write(body[offset:offset + chunk])
+            self.wfile.flush()
+            time.sleep(len(body[offset:offset + chunk]) / bandwidth)
+
+
+class StubHTTPServer(ThreadingHTTPServer):
+    daemon_threads = True
+    request_queue_size = 256
+    
+    def __init__(self, address, store: ItemStore, faults: FaultProfile):
+        super().__init__(address, StubRequestHandler)
+        self.store = store
+        self.faults = faults
+        self._stats: Dict[str, int] = {}
+        self._stats_lock = threading.Lock()
+    
+    def count(self, outcome):
+        with self._stats_lock:
+            self._stats['requests'] = self._stats.get('requests', 0) + 1
+            self._stats[str(outcome)] = self._stats.get(str(outcome), 0) + 1
+    
+    def stats(self) -> Dict[str, int]:
+        with self._stats_lock:
+            return dict(self._stats)
+
+
+class StubServer:
+    """
+    Заглушка API товаров: контракт /api/items (и /health, /ready) поверх
+    хранилища в памяти, без Flask и БД.
+    
+    Позволяет проверять и измерять сам клиент (BaseAPI, повторы, таймауты,
+    генератор нагрузки), в том числе на медленном и сбоящем сервере:
+    задержки, ошибки и пропускная способность задаются FaultProfile
+    (только для /api/*). Порт 0 - свободный порт.
+        
+        with StubServer(faults=FaultProfile(latency='lognormal:20,0.5', error_rate=0.05)) as stub:
+            client = ItemsAPI(base_url=stub.api_url)
+    """
+    
+    def __init__(
+        self,
+        host: str = '127.0.0.1',
+        port: int = 0,
+        faults: Optional[FaultProfile] = None,
+        store: Optional[ItemStore] = None
+    ):
+        self.faults = faults or FaultProfile()
+        self.store = store or ItemStore()
+        self._server = StubHTTPServer((host, port), self.store, self.faults)
+        self._thread: Optional[threading.Thread] = None
+    
+    @property
+    def base_url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+    
+    @property
+    def api_url(self) -> str:
+        return f"{self.base_url}/api"
+    
+    def stats(self) -> Dict[str, int]:
+        """Число обработанных запросов: всего и по коду ответа ('reset' - сброс соединения)."""
+        return self._server.stats()
+    
+    def start(self) -> 'StubServer':
+        self._thread = threading.Thread(target=self._server.serve_forever, name='stub-server', daemon=True)
+        self._thread.start()
+        logger.info(f"🧪 Stub server started: {self.base_url}")
+        return self
+    
+    def serve_forever(self):
+        self._server.serve_forever()
+    
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+    
+    def __enter__(self) -> 'StubServer':
+        return self.start()
+    
+    def __exit__(self, *exc_info):
+        self.stop()
\ No newline at end of file
@@ -0,0 +1,319 @@
+import math
+import threading
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+# Ограничения контракта /api/items (как в схемах приложения; совпадение
+# проверяет tests/test_stub_validators.py)
+NAME_MAX_LENGTH = 100
+DESCRIPTION_MAX_LENGTH = 500
+TAG_MAX_LENGTH = 64
+MAX_PER_PAGE = 100
+MAX_SQL_INTEGER = 2 ** 63 - 1
+BULK_MAX_ITEMS = 1000
+
+# Значения bool, принимаемые marshmallow (fields.Boolean)
+TRUTHY = {True, 't', 'T', 'true', 'True', 'TRUE', '1', 'on', 'On', 'ON', 'y', 'Y', 'yes', 'Yes', 'YES'}
+FALSY = {False, 'f', 'F', 'false', 'False', 'FALSE', '0', 'off', 'Off', 'OFF', 'n', 'N', 'no', 'No', 'NO'}
+
+MISSING = "Missing data for required field."
+NULL = "Field may not be null."
+UNKNOWN = "Unknown field."
+INVALID_INPUT = "Invalid input type."
+
+Errors = Dict[str, Any]
+
+
+class ValidationFailed(Exception):
+    """Ошибки валидации в формате marshmallow ({'field': ['message', ...]})."""
+    
+    def __init__(self, messages: Errors):
+        super().__init__(messages)
+        self.messages = messages
+
+
+def _string(value, min_length: int, max_length: int, message: Optional[str] = None) -> str:
+    if not isinstance(value, str):
+        raise ValueError("Not a valid string.")
+    if len(value) < min_length or len(value) > max_length:
+        if message:
+            raise ValueError(message)
+        if min_length:
+            raise ValueError(f"Length must be between {min_length} and {max_length}.")
+        raise ValueError(f"Longer than maximum length {max_length}.")
+    return value
+
+
+def _number(value) -> float:
+    if isinstance(value, bool):
+        raise ValueError("Not a valid number.")
+    try:
+        number = float(value)
+    except (TypeError, ValueError):
+        raise ValueError("Not a valid number.")
+    except OverflowError:
+        raise ValueError("Number too large.")
+    if math.isnan(number) or math.isinf(number):
+        raise ValueError("Special numeric values (nan or infinity) are not permitted.")
+    return number
+
+
+def _integer(value) -> int:
+    if isinstance(value, bool):
+        raise ValueError("Not a valid integer.")
+    try:
+        number = int(value)
+    except (TypeError, ValueError):
+        raise ValueError("Not a valid integer.")
+    if isinstance(value, float) and value != number:
+        raise ValueError("Not a valid integer.")
+    return number
+
+
+def _boolean(value) -> bool:
+    try:
+        if value in TRUTHY:
+            return True
+        if value in FALSY:
+            return False
+    except TypeError:
+        pass
+    raise ValueError("Not a valid boolean.")
+
+
+def _at_least(value, minimum, maximum=None):
+    if value < minimum or (maximum is not None and value > maximum):
+        if maximum is None:
+            raise ValueError(f"Must be greater than or equal to {minimum}.")
+        raise ValueError(f"Must be greater than or equal to {minimum} and less than or equal to {maximum}.")
+    return value
+
+
+def _price(value) -> float:
+    price = _number(value)
+    if price < 0:
+        raise ValueError("Price must be non-negative")
+    return price
+
+
+# Поля товара: (преобразование, обязательное, допускает null)
+ITEM_FIELDS = {
+    'name': (lambda value: _string(value, 1, NAME_MAX_LENGTH, "Name must be between 1 and 100 characters"), True, False),
+    'price': (_price, True, False),
+    'description': (lambda value: _string(value, 0, DESCRIPTION_MAX_LENGTH), False, True),
+    'in_stock': (_boolean, False, False),
+    'tag': (lambda value: _string(value, 1, TAG_MAX_LENGTH), False, True)
+}
+
+# Query параметры списка: преобразование строки и значение по умолчанию
+QUERY_FIELDS = {
+    'page': (lambda value: _at_least(_integer(value), 1, MAX_SQL_INTEGER // MAX_PER_PAGE), 1),
+    'per_page': (lambda value: _at_least(_integer(value), 1, MAX_PER_PAGE), 20),
+    'in_stock': (_boolean, None),
+    'tag': (lambda value: _string(value, 1, TAG_MAX_LENGTH), None),
+    'min_price': (lambda value: _at_least(_number(value), 0), None),
+    'max_price': (lambda value: _at_least(_number(value), 0), None),
+    'after_id': (lambda value: _at_least(_integer(value), 0, MAX_SQL_INTEGER), None)
+}
+
+
+def validate_item(data: Any, partial: bool = False) -> Dict[str, Any]:
+    """Данные товара после валидации (как ItemSchema.load); ValidationFailed при ошибках."""
+    if not isinstance(data, dict):
+        raise ValidationFailed({'_schema': [INVALID_INPUT]})
+    
+    result, errors = {}, {}
+    for name, (convert, required, allow_none) in ITEM_FIELDS.items():
+        if name not in data:
+            if required and not partial:
+                errors[name] = [MISSING]
+            continue
+        value = data[name]
+        if value is None:
+            if allow_none:
+                result[name] = None
+            else:
+                errors[name] = [NULL]
+            continue
+        try:
+            result[name] = convert(value)
+        except ValueError as e:
+            errors[name] = [str(e)]
+    
+    for name in data:
+        if name not in ITEM_FIELDS:
+            errors[name] = [UNKNOWN]
+    if errors:
+        raise ValidationFailed(errors)
+    
+    if not partial:
+        result.setdefault('in_stock', True)
+    return result
+
+
+def validate_query(args: Dict[str, str]) -> Dict[str, Any]:
+    """Параметры списка (как ItemQuerySchema.load)."""
+    params, errors = {}, {}
+    for name, (convert, default) in QUERY_FIELDS.items():
+        if name not in args:
+            params[name] = default
+            continue
+        try:
+            params[name] = convert(args[name])
+        except ValueError as e:
+            errors[name] = [str(e)]
+    
+    for name in args:
+        if name not in QUERY_FIELDS:
+            errors[name] = [UNKNOWN]
+    if errors:
+        raise ValidationFailed(errors)
+    if params['after_id'] is not None and params['page'] > 1:
+        raise ValidationFailed({'page': ["Page cannot be combined with after_id"]})
+    return params
+
+
+def validate_bulk(data: Any) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+    """Товары и тег пачки (как ItemBulkSchema.load)."""
+    if not isinstance(data, dict):
+        raise ValidationFailed({'_schema': [INVALID_INPUT]})
+    
+    errors = {}
+    items = data.get('items')
+    validated = []
+    if 'items' not in data:
+        errors['items'] = [MISSING]
+    elif items is None:
+        errors['items'] = [NULL]
+    elif not isinstance(items, list):
+        errors['items'] = ["Not a valid list."]
+    elif not items:
+        errors['items'] = ["Shorter than minimum length 1."]
+    else:
+        item_errors = {}
+        for index, item in enumerate(items):
+            if item is None:
+                item_errors[index] = [NULL]
+                continue
+            try:
+                validated.append(validate_item(item))
+            except ValidationFailed as e:
+                item_errors[index] = e.messages
+        if item_errors:
+            errors['items'] = item_errors
+    
+    tag = data.get('tag')
+    if tag is not None:
+        try:
+            _string(tag, 1, TAG_MAX_LENGTH)
+        except ValueError as e:
+            errors['tag'] = [str(e)]
+    
+    for name in data:
+        if name not in ('items', 'tag'):
+            errors[name] = [UNKNOWN]
+    if errors:
+        raise ValidationFailed(errors)
+    return validated, tag
+
+
+def validate_bulk_delete(args: Dict[str, str]) -> str:
+    """Тег массового удаления (как ItemBulkDeleteSchema.load)."""
+    errors = {name: [UNKNOWN] for name in args if name != 'tag'}
+    if 'tag' not in args:
+        errors['tag'] = [MISSING]
+    else:
+        try:
+            _string(args['tag'], 1, TAG_MAX_LENGTH)
+        except ValueError as e:
+            errors['tag'] = [str(e)]
+    if errors:
+        raise ValidationFailed(errors)
+    return args['tag']
+
+
+class ItemStore:
+    """
+    Хранилище товаров в памяти с семантикой API приложения: порядок по ID,
+    фильтры и пагинация списка, массовые операции по тегу.
+    """
+    
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._items: Dict[int, Dict[str, Any]] = {}
+        self._next_id = 1
+    
+    def __len__(self) -> int:
+        return len(self._items)
+    
+    def _new(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        now = datetime.utcnow().isoformat()
+        item = {
+            'id': self._next_id,
+            'name': data['name'],
+            'price': data['price'],
+            'description': data.get('description'),
+            'in_stock': data.get('in_stock', True),
+            'tag': data.get('tag'),
+            'created_at': now,
+            'updated_at': now
+        }
+        self._items[item['id']] = item
+        self._next_id += 1
+        return item
+    
+    def list(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        with self._lock:
+            matched = [
+                item for item in self._items.values()
+                if (params['tag'] is None or item['tag'] == params['tag'])
+                and (params['in_stock'] is None or item['in_stock'] == params['in_stock'])
+                and (params['min_price'] is None or item['price'] >= params['min_price'])
+                and (params['max_price'] is None or item['price'] <= params['max_price'])
+                and (params['after_id'] is None or item['id'] > params['after_id'])
+            ]
+        page, per_page = params['page'], params['per_page']
+        start = (page - 1) * per_page
+        return {
+            'items': [dict(item) for item in matched[start:start + per_page]],
+            'total': len(matched),
+            'page': page,
+            'per_page': per_page,
+            'pages': math.ceil(len(matched) / per_page)
+        }
+    
+    def get(self, item_id: int) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            item = self._items.get(item_id)
+            return dict(item) if item else None
+    
+    def create(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        with self._lock:
+            return dict(self._new(data))
+    
+    def create_many(self, items: List[Dict[str, Any]], tag: Optional[str] = None) -> List[Dict[str, Any]]:
+        with self._lock:
+            return [
+                dict(self._new(item if item.get('tag') is not None or tag is None else dict(item, tag=tag)))
+                for item in items
+            ]
+    
+    def update(self, item_id: int, data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            item = self._items.get(item_id)
+            if item is None:
+                return None
+            item.update(data)
+            item['updated_at'] = datetime.utcnow().isoformat()
+            return dict(item)
+    
+    def delete(self, item_id: int) -> bool:
+        with self._lock:
+            return self._items.pop(item_id, None) is not None
+    
+    def delete_by_tag(self, tag: str) -> int:
+        with self._lock:
+            ids = [item_id for item_id, item in self._items.items() if item['tag'] == tag]
+            for item_id in ids:
+                del self._items[item_id]
+            return len(ids)
\ No newline at end of file
@@ -1,11 +1,20 @@
 import pytest
+import pytest_asyncio
 import allure
 import logging
 import json
+import uuid
+from collections import defaultdict
 from datetime import datetime
-from typing import Dict, Any, Generator
+from typing import Dict, Any, AsyncGenerator, Generator
+from api.base_api import connection_stats, exchange_log
 from api.items_api import ItemsAPI
+from api.async_items_api import AsyncItemsAPI
+from api.transport import in_process_app, rollback_transaction
+from api.health_api import HealthAPI
 from data.test_data import generate_random_item
+from data.datasets import ItemReserve, generate_dataset
+from utils.scheduling import DurationStore, plan_groups, worker_id
 from config import config
 
 # Настройка логирования
@@ -15,24 +24,171 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Маркеры тяжелых тестов, запускаемых только с явной опцией (любой из перечисленных)
+OPT_IN_MARKERS = {
+    'load': ('--run-load',),
+    'soak': ('--run-soak',),
+    'stress': ('--run-stress',),
+    'fuzz': ('--run-fuzz',),
+    'benchmark': ('--run-benchmarks', '--update-baselines')
+}
+
+# Длительности тестов: сохраненные (для --duration-schedule) и текущего прогона (для --store-durations)
+duration_store = DurationStore(config.test.durations_file)
+
+def pytest_addoption(parser):
+    parser.addoption("--run-load", action="store_true", default=False,
+                     help="Запуск нагрузочных тестов (маркер load)")
+    parser.addoption("--run-soak", action="store_true", default=False,
+                     help="Запуск длительных прогонов с поиском утечек (маркер soak)")
+    parser.addoption("--run-stress", action="store_true", default=False,
+                     help="Запуск конкурентных изменений одного товара (маркер stress)")
+    parser.addoption("--run-fuzz", action="store_true", default=False,
+                     help="Запуск генеративной проверки валидации (маркер fuzz)")
+    parser.addoption("--run-benchmarks", action="store_true", default=False,
+                     help="Запуск бенчмарков со сравнением с базовыми линиями (маркер benchmark)")
+    parser.addoption("--update-baselines", action="store_true", default=False,
+                     help="Запуск бенчмарков с записью результатов как новых базовых линий")
+    parser.addoption("--store-durations", action="store_true", default=False,
+                     help="Сохранение длительностей тестов в TEST_DURATIONS_FILE")
+    parser.addoption("--duration-schedule", action="store_true", default=False,
+                     help="Распределение тестов между воркерами xdist по сохраненным длительностям")
+
+def pytest_configure(config):
+    """Профиль --duration-schedule: группы тестов распределяются планировщиком loadgroup."""
+    if not config.getoption("--duration-schedule"):
+        return
+    
+    if hasattr(config, "workerinput"):
+        # Воркер разбирает только командную строку: имена групп к nodeid
+        # добавляются, если loadgroup включен и здесь
+        config.option.loadgroup = True
+    elif getattr(config.option, "dist", "no") != "no":
+        config.option.dist = "loadgroup"
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_collection_modifyitems(config, items):
+    """
+    Пропуск тестов с opt-in маркерами без соответствующей опции и,
+    с --duration-schedule, разбиение тестов на группы по воркерам.
+    
+    Группы (маркер xdist_group) строятся до того, как xdist добавит их
+    имена к nodeid, поэтому хук выполняется первым.
+    """
+    for marker, options in OPT_IN_MARKERS.items():
+        if any(config.getoption(option) for option in options):
+            continue
+        skip = pytest.mark.skip(reason=f"Нужна опция {' или '.join(options)}")
+        for item in items:
+            if marker in item.keywords:
+                item.add_marker(skip)
+    
+    workerinput = getattr(config, "workerinput", None)
+    if config.getoption("--duration-schedule") and workerinput is not None:
+        # Тесты с явной группой остаются в ней
+        scheduled = [item for item in items if not item.get_closest_marker("xdist_group")]
+        plan = plan_groups(
+            [item.nodeid for item in scheduled],
+            duration_store.load(),
+            workerinput["workercount"]
+        )
+        for item in scheduled:
+            item.add_marker(pytest.mark.xdist_group(f"duration_{plan[item.nodeid]}"))
+
+# Длительности фаз тестов текущего прогона
+_measured_durations = defaultdict(float)
+
+def pytest_runtest_logreport(report):
+    """Учет длительности фаз теста (в процессе-координаторе xdist или без xdist)."""
+    if worker_id() is None:
+        # В режиме loadgroup к nodeid добавлено имя группы
+        _measured_durations[report.nodeid.split("@")[0]] += report.duration
+
+def pytest_sessionfinish(session):
+    if session.config.getoption("--store-durations") and worker_id() is None and _measured_durations:
+        duration_store.save(dict(_measured_durations))
+        logger.info(f"⏱️ Длительности {len(_measured_durations)} тестов сохранены")
+
+@pytest.fixture(scope="session")
+def data_tag() -> str:
+    """
+    Тег (пространство имен) данных сессии: им помечаются товары, созданные тестами.
+    
+    У каждого воркера xdist своя сессия и свой тег, поэтому параллельные
+    воркеры не видят и не удаляют данные друг друга.
+    """
+    tag = config.test.data_tag or f"test-{uuid.uuid4().hex[:12]}"
+    return f"{tag}-{worker_id()}" if worker_id() else tag
+
 @pytest.fixture(scope="session")
-def api_client() -> Generator[ItemsAPI, None, None]:
-    """Фикстура, предоставляющая клиент API для всех тестов."""
+def api_client(data_tag) -> Generator[ItemsAPI, None, None]:
+    """
+    Фикстура, предоставляющая клиент API для всех тестов.
+    
+    Все товары, созданные клиентом, помечаются тегом сессии и удаляются
+    в конце сессии одним запросом.
+    """
     logger.info("🚀 Инициализация API клиента")
     
     with allure.step("🛠️ Инициализация API клиента"):
-        client = ItemsAPI()
+        client = ItemsAPI(tag=data_tag)
         allure.attach(
-            client.base_url,
+            f"{client.base_url}\nData tag: {data_tag}",
             name="API Base URL",
             attachment_type=allure.attachment_type.TEXT
         )
         
     yield client
     
+    logger.info(f"🧹 Удаление данных сессии (тег {data_tag})")
+    response = client.delete_items_by_tag(data_tag, expected_status=None)
+    if response.status_code == 200:
+        logger.info(f"Deleted {response.json()['deleted']} items")
+    else:
+        logger.warning(f"Session cleanup failed: {response.status_code}")
+    
     logger.info("🧹 Закрытие API клиента")
     client.close()
 
+@pytest.fixture(scope="session")
+def seeded_dataset(api_client, data_tag) -> Generator[Dict[str, Any], None, None]:
+    """
+    Общий набор товаров сессии (только для чтения), созданный одним запросом.
+    
+    Набор помечен собственным тегом: тесты списков фильтруют по нему и
+    получают предсказуемый результат независимо от остальных данных в БД.
+    Возвращает {'tag': ..., 'items': [...]} (товары упорядочены по ID).
+    """
+    tag = f"{data_tag}-dataset"
+    
+    with allure.step(f"📦 Setup: Создание набора данных ({config.test.dataset_size} товаров)"):
+        response = api_client.create_items_bulk(generate_dataset(config.test.dataset_size), tag=tag)
+        items = sorted(response.json()['items'], key=lambda item: item['id'])
+        logger.info(f"✅ Dataset seeded: {len(items)} items (tag {tag})")
+    
+    yield {'tag': tag, 'items': items}
+    
+    with allure.step("🧹 Teardown: Удаление набора данных"):
+        api_client.delete_items_by_tag(tag, expected_status=None)
+
+@pytest.fixture(scope="session")
+def item_reserve(api_client) -> ItemReserve:
+    """Резерв товаров, создаваемых пачками, для фикстуры created_item."""
+    return ItemReserve(api_client, config.test.item_reserve_batch)
+
+@pytest.fixture(scope="session")
+def health_client() -> Generator[HealthAPI, None, None]:
+    """Фикстура, предоставляющая клиент служебных эндпоинтов."""
+    client = HealthAPI()
+    yield client
+    client.close()
+
+@pytest_asyncio.fixture
+async def async_api_client(data_tag) -> AsyncGenerator[AsyncItemsAPI, None]:
+    """Фикстура асинхронного клиента API (для тестов с высокой конкурентностью)."""
+    async with AsyncItemsAPI(tag=data_tag) as client:
+        yield client
+
 @pytest.fixture
 def random_item_data() -> Dict[str, Any]:
     """Фикстура с случайными данными товара."""
@@ -48,57 +204,60 @@ def parametrized_item_data(request) -> Dict[str, Any]:
     """Параметризованная фикстура с разными типами товаров."""
     return request.param
 
-@pytest.fixture
-def created_item(api_client, request) -> Generator[Dict[str, Any], None, None]:
+@pytest.fixture(autouse=True)
+def inprocess_rollback() -> Generator[None, None, None]:
     """
-    Фикстура для создания товара и его автоматического удаления.
+    Режим API_TRANSPORT=inprocess: изменения БД, сделанные тестом, откатываются.
+    
+    Данные session фикстур (seeded_dataset) создаются до начала транзакции
+    теста и сохраняются.
     """
-    # Получение данных для создания
-    if hasattr(request, 'param') and request.param:
-        item_data = request.param
-    else:
-        item_data = generate_random_item()
+    if config.api.transport != 'inprocess':
+        yield
+        return
     
-    with allure.step(f"📦 Setup: Создание тестового товара"):
-        logger.info(f"Creating test item: {item_data['name']}")
-        
-        response = api_client.create_item(
-            name=item_data['name'],
-            price=item_data['price'],
-            description=item_data.get('description'),
-            in_stock=item_data.get('in_stock', True)
-        )
-        
-        assert response.status_code == 201, f"Failed to create item: {response.text}"
-        item = response.json()
-        
-        allure.attach(
-            json.dumps(item, indent=2, ensure_ascii=False),
-            name="Created Item",
-            attachment_type=allure.attachment_type.JSON
-        )
+    with rollback_transaction(in_process_app()):
+        yield
+
+@pytest.fixture
+def created_item(api_client, item_reserve, request) -> Dict[str, Any]:
+    """
+    Фикстура с новым товаром, принадлежащим только текущему тесту.
+    
+    Товар берется из резерва, созданного пачкой; товар с данными из
+    request.param создается отдельным запросом. Удаление не нужно:
+    товары сессии удаляются по тегу при закрытии api_client.
+    В режиме inprocess товар создается отдельным запросом внутри
+    транзакции теста (резерв откатился бы вместе с ней).
+    """
+    item_data = getattr(request, 'param', None)
+    if item_data or config.api.transport == 'inprocess':
+        item_data = item_data or generate_random_item()
         
-        logger.info(f"✅ Item created with ID: {item['id']}")
-    
-    yield item
-    
-    with allure.step("🧹 Teardown: Удаление тестового товара"):
-        logger.info(f"Deleting test item ID: {item['id']}")
-        try:
-            # Не ожидаем конкретный статус, принимаем 200 или 404
-            delete_response = api_client.delete_item(item['id'], expected_status=None)
-            if delete_response.status_code not in [200, 404]:
-                logger.warning(f"Unexpected delete status: {delete_response.status_code}")
-            else:
-                logger.info(f"Cleanup successful: {delete_response.status_code}")
-        except Exception as e:
-            logger.warning(f"Cleanup failed: {e}")
-        finally:
-            allure.attach(
-                f"Cleanup attempted with status: {delete_response.status_code if 'delete_response' in locals() else 'unknown'}",
-                name="Cleanup result",
-                attachment_type=allure.attachment_type.TEXT
+        with allure.step(f"📦 Setup: Создание тестового товара"):
+            logger.info(f"Creating test item: {item_data['name']}")
+            
+            response = api_client.create_item(
+                name=item_data['name'],
+                price=item_data['price'],
+                description=item_data.get('description'),
+                in_stock=item_data.get('in_stock', True)
             )
+            
+            assert response.status_code == 201, f"Failed to create item: {response.text}"
+            item = response.json()
+    else:
+        with allure.step(f"📦 Setup: Тестовый товар из резерва"):
+            item = item_reserve.take()
+    
+    allure.attach(
+        json.dumps(item, indent=2, ensure_ascii=False),
+        name="Created Item",
+        attachment_type=allure.attachment_type.JSON
+    )
+    logger.info(f"✅ Test item ID: {item['id']}")
+    
+    return item
 
 @pytest.fixture(autouse=True)
 def setup_test_logging(request):
@@ -107,11 +266,31 @@ def setup_test_logging(request):
     logger.info(f"▶️ Запуск теста: {test_name}")
     
     start_time = datetime.now()
+    connections_before = connection_stats()
     
     yield
     
     duration = (datetime.now() - start_time).total_seconds()
     logger.info(f"⏹️ Тест завершен: {test_name} (длительность: {duration:.2f}s)")
+    
+    # Статистика соединений за тест (новые TCP соединения против запросов)
+    connections_after = connection_stats()
+    requests_made = connections_after['requests'] - connections_before['requests']
+    connections_opened = connections_after['connections'] - connections_before['connections']
+    if requests_made:
+        logger.info(f"🔌 Соединения: {connections_opened} новых на {requests_made} запросов")
+        allure.attach(
+            f"Requests: {requests_made}\n"
+            f"New connections: {connections_opened}\n"
+            f"Keep-alive: {config.api.keep_alive}",
+            name="Connection stats",
+            attachment_type=allure.attachment_type.TEXT
+        )
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_runtest_setup(item):
+    """Очистка буфера обменов с API перед тестом (режим on-failure-only)."""
+    exchange_log.start_test()
 
 @pytest.hookimpl(tryfirst=True, hookwrapper=True)
 def pytest_runtest_makereport(item, call):
@@ -119,6 +298,10 @@ def pytest_runtest_makereport(item, call):
     outcome = yield
     rep = outcome.get_result()
     
+    # Накопленные запросы/ответы попадают в отчет только для упавших тестов
+    if rep.failed:
+        exchange_log.flush()
+    
     if rep.when == "call":
         setattr(item, "rep_call", rep)
         
@@ -0,0 +1,84 @@
+import json
+import statistics
+import warnings
+import allure
+import pytest
+from benchmarks import BENCHMARKS, BaselineStore, compare, create_context
+from utils.latency import percentile
+from config import config
+
+@pytest.fixture(scope="module")
+def benchmark_context():
+    """Набор товаров для бенчмарков (создается один раз на модуль)."""
+    context = create_context(config.benchmark.dataset_size)
+    yield context
+    context.cleanup()
+
+@pytest.fixture(scope="module")
+def baseline_store() -> BaselineStore:
+    return BaselineStore(config.benchmark.baseline_dir, config.benchmark.baseline_runs)
+
+def summarize_ms(samples_ms):
+    values = sorted(samples_ms)
+    return {
+        'count': len(values),
+        'mean': round(statistics.mean(values), 3),
+        'p50': round(percentile(values, 50), 3),
+        'p95': round(percentile(values, 95), 3),
+        'max': round(values[-1], 3)
+    }
+
+@allure.epic("REST API Тестирование")
+@allure.feature("Бенчмарки")
+@pytest.mark.benchmark
+class TestBenchmarks:
+    
+    @allure.story("Регрессии производительности")
+    @allure.title("Бенчмарк {name}")
+    @allure.severity(allure.severity_level.NORMAL)
+    @allure.tag("performance", "benchmark")
+    @pytest.mark.parametrize("name", list(BENCHMARKS))
+    def test_benchmark(self, name, benchmark_context, baseline_store, pytestconfig):
+        """Сравнение времени ответа с базовой линией (критерий Манна-Уитни + порог медианы)."""
+        
+        samples_ms = BENCHMARKS[name].run(
+            benchmark_context,
+            iterations=config.benchmark.iterations,
+            warmup=config.benchmark.warmup
+        )
+        summary = summarize_ms(samples_ms)
+        allure.attach(
+            json.dumps(summary, indent=2),
+            name="Benchmark summary",
+            attachment_type=allure.attachment_type.JSON
+        )
+        
+        if pytestconfig.getoption("--update-baselines"):
+            path = baseline_store.save(name, samples_ms, summary)
+            allure.attach(path, name="Baseline updated", attachment_type=allure.attachment_type.TEXT)
+            return
+        
+        result = compare(
+            samples_ms,
+            baseline_store.runs(name),
+            alpha=config.benchmark.alpha,
+            threshold=config.benchmark.threshold
+        )
+        allure.attach(
+            json.dumps(result, indent=2),
+            name="Baseline comparison",
+            attachment_type=allure.attachment_type.JSON
+        )
+        
+        if result['status'] == 'no_baseline':
+            pytest.skip(f"Нет базовой линии для '{name}' (запустите с --update-baselines)")
+        
+        if result['status'] == 'regression':
+            message = (
+                f"Regression in '{name}': median {result['reference_median_ms']}ms (slowest baseline run) -> "
+                f"{result['current_median_ms']}ms ({result['median_change']:+.1%}, p={result['p_value_slower']})"
+            )
+            allure.dynamic.tag("regression")
+            if config.benchmark.fail_on_regression:
+                pytest.fail(message)
+            warnings.warn(message)
\ No newline at end of file
@@ -0,0 +1,140 @@
+import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
+import allure
+import pytest
+from config import config
+from data import pools
+from data.pools import ItemDataPool, PoolCursor, build_item_pool, worker_partition
+
+# Небольшой пул: генерация занимает доли секунды
+POOL_SIZE = 300
+
+@pytest.fixture
+def pool(tmp_path):
+    pool = ItemDataPool.open(str(tmp_path), POOL_SIZE, config.test.faker_seed)
+    yield pool
+    pool.close()
+
+def names(items):
+    return [item['name'] for item in items]
+
+@allure.epic("REST API Тестирование")
+@allure.feature("Пул тестовых данных")
+class TestItemDataPool:
+    
+    @allure.story("Генерация")
+    @allure.title("Тест воспроизводимости пула при одном FAKER_SEED")
+    @allure.severity(allure.severity_level.NORMAL)
+    @allure.tag("test_data")
+    def test_build_is_deterministic(self, tmp_path):
+        """Один сид дает побайтно одинаковые файлы, другой - другие товары."""
+        
+        seed = config.test.faker_seed
+        for name, pool_seed in (('first', seed), ('second', seed), ('other', seed + 1)):
+            build_item_pool(str(tmp_path / f"{name}.pool"), POOL_SIZE, pool_seed)
+        
+        assert (tmp_path / "first.pool").read_bytes() == (tmp_path / "second.pool").read_bytes()
+        assert (tmp_path / "first.pool").read_bytes() != (tmp_path / "other.pool").read_bytes()
+        
+        pool = ItemDataPool(str(tmp_path / "first.pool"))
+        try:
+            items = [pool.item(index) for index in range(len(pool))]
+            assert (pool.size, pool.seed) == (POOL_SIZE, seed)
+            assert len(set(names(items))) == POOL_SIZE
+            assert all(0 < item['price'] < 10000 and item['description'] for item in items)
+        finally:
+            pool.close()
+    
+    @allure.story("Генерация")
+    @allure.title("Тест атомарной записи файла пула")
+    @allure.severity(allure.severity_level.NORMAL)
+    @allure.tag("test_data")
+    def test_build_is_atomic(self, tmp_path, monkeypatch):
+        """Сбой записи не оставляет ни недописанного пула, ни временного файла; прежний файл сохраняется."""
+        
+        path = tmp_path / "items.pool"
+        build_item_pool(str(path), POOL_SIZE, 1)
+        previous = path.read_bytes()
+        
+        def failing_replace(source, target):
+            raise OSError("disk full")
+        
+        monkeypatch.setattr(pools.os, 'replace', failing_replace)
+        with pytest.raises(OSError, match="disk full"):
+            build_item_pool(str(path), POOL_SIZE, 2)
+        
+        assert os.listdir(tmp_path) == ["items.pool"]
+        assert path.read_bytes() == previous
+    
+    @allure.story("Кэш")
+    @allure.title("Тест повторного использования сгенерированного пула")
+    @allure.severity(allure.severity_level.NORMAL)
+    @allure.tag("test_data")
+    def test_open_reuses_cached_pool(self, tmp_path, monkeypatch):
+        """Пул генерируется один раз на сочетание сида, размера и версии формата."""
+        
+        built = []
+        build = pools.build_item_pool
+        monkeypatch.setattr(pools, 'build_item_pool', lambda *args: built.append(args) or build(*args))
+        
+        first = ItemDataPool.open(str(tmp_path), POOL_SIZE, 7)
+        second = ItemDataPool.open(str(tmp_path), POOL_SIZE, 7)
+        other = ItemDataPool.open(str(tmp_path), POOL_SIZE, 8)
+        try:
+            assert len(built) == 2
+            assert first.path == second.path != other.path
+            assert first.item(5) == second.item(5)
+        finally:
+            for pool in (first, second, other):
+                pool.close()
+    
+    @allure.story("Курсор")
+    @allure.title("Тест выдачи товаров без повторов")
+    @allure.severity(allure.severity_level.CRITICAL)
+    @allure.tag("test_data")
+    def test_cursor_never_repeats(self, pool):
+        """Параллельная выдача из одного курсора не повторяет товары, пока часть пула не исчерпана."""
+        
+        cursor = PoolCursor(pool)
+        
+        with ThreadPoolExecutor(8) as executor:
+            batches = list(executor.map(lambda _: cursor.take(10), range(30)))
+        
+        taken = [name for batch in batches for name in names(batch)]
+        assert len(taken) == len(set(taken)) == POOL_SIZE
+    
+    @allure.story("Курсор")
+    @allure.title("Тест непересекающихся частей пула воркеров xdist")
+    @allure.severity(allure.severity_level.CRITICAL)
+    @allure.tag("test_data")
+    def test_worker_partitions_are_disjoint(self, pool, monkeypatch):
+        """Части воркеров gw0..gwN не пересекаются и вместе покрывают весь пул."""
+        
+        cursors = [PoolCursor(pool, partition, 3) for partition in range(3)]
+        slices = [set(names(cursor.take(cursor.capacity))) for cursor in cursors]
+        
+        assert [cursor.capacity for cursor in cursors] == [100, 100, 100]
+        assert not slices[0] & slices[1] and not slices[0] & slices[2] and not slices[1] & slices[2]
+        assert set().union(*slices) == set(names(pool.item(index) for index in range(POOL_SIZE)))
+        
+        monkeypatch.setenv('PYTEST_XDIST_WORKER', 'gw2')
+        monkeypatch.setenv('PYTEST_XDIST_WORKER_COUNT', '3')
+        assert worker_partition() == (2, 3)
+    
+    @allure.story("Курсор")
+    @allure.title("Тест исчерпания части пула")
+    @allure.severity(allure.severity_level.NORMAL)
+    @allure.tag("test_data")
+    def test_exhausted_cursor_wraps_with_warning(self, pool, caplog):
+        """После исчерпания своей части выдача начинается сначала с предупреждением, чужие товары не выдаются."""
+        
+        cursor = PoolCursor(pool, 1, 2)
+        first = names(cursor.take(cursor.capacity))
+        assert "exhausted" not in caplog.text
+        
+        with caplog.at_level(logging.WARNING, logger=pools.__name__):
+            again = names(cursor.take(3))
+        
+        assert again == first[:3]
+        assert "Item data pool exhausted (150 items per worker)" in caplog.text
\ No newline at end of file
@@ -0,0 +1,75 @@
+import json
+import allure
+import pytest
+from config import config
+from fuzz import CaseGenerator, FuzzRunner, expected, shrink
+
+@allure.epic("REST API Тестирование")
+@allure.feature("Генеративная проверка валидации")
+class TestFuzzTools:
+    
+    @allure.story("Генератор случаев")
+    @allure.title("Тест воспроизводимости и состава случаев")
+    @allure.severity(allure.severity_level.NORMAL)
+    @allure.tag("fuzz")
+    def test_generator_is_reproducible(self):
+        """Один seed - одна последовательность; корректных и некорректных случаев сопоставимо."""
+        
+        cases = CaseGenerator(42).cases(2000)
+        assert json.dumps(cases) == json.dumps(CaseGenerator(42).cases(2000))
+        
+        statuses = [expected(case)[0] for case in cases]
+        valid = sum(1 for status in statuses if status != 400) / len(statuses)
+        assert 0.2 < valid < 0.6, f"Unexpected share of valid cases {valid:.0%}"
+        assert {case['op'] for case in cases} == {'create', 'patch', 'put', 'list', 'bulk_create', 'bulk_delete'}
+    
+    @allure.story("Упрощение нарушений")
+    @allure.title("Тест упрощения случая до минимального")
+    @allure.severity(allure.severity_level.NORMAL)
+    @allure.tag("fuzz")
+    def test_shrink_to_minimal_case(self):
+        """Лишние поля удаляются, значения укорачиваются, пока нарушение сохраняется."""
+        
+        case = {
+            'op': 'create',
+            'body': {'name': 'Long item name', 'price': '12.50', 'tag': 'fuzz', 'in_stock': 'yes'}
+        }
+        
+        def fails(candidate):
+            # Условное нарушение: цена передана строкой
+            return isinstance(candidate['body'].get('price'), str)
+        
+        assert shrink(case, fails) == {'op': 'create', 'body': {'price': '1'}}
+
+@allure.epic("REST API Тестирование")
+@allure.feature("Генеративная проверка валидации")
+@pytest.mark.fuzz
+class TestFuzzContract:
+    
+    @allure.story("Контракт 201/400")
+    @allure.title("Генеративная проверка ItemSchema и ItemQuerySchema")
+    @allure.severity(allure.severity_level.CRITICAL)
+    @allure.tag("fuzz", "negative", "positive")
+    @pytest.mark.timeout(config.fuzz.cases / 50 + 120)
+    def test_validation_contract(self):
+        """Корректные данные сохраняются как есть, некорректные - 400 с полями ошибок, ни одного 5xx."""
+        
+        report = FuzzRunner(
+            cases=config.fuzz.cases,
+            workers=config.fuzz.workers,
+            seed=int(config.fuzz.seed) if config.fuzz.seed else None,
+            max_failures=config.fuzz.max_failures
+        ).run()
+        
+        allure.attach(
+            json.dumps(report, indent=2, ensure_ascii=False),
+            name="Fuzz report",
+            attachment_type=allure.attachment_type.JSON
+        )
+        
+        assert report['cases'] == config.fuzz.cases
+        assert not report['failures'], (
+            f"{report['violations']} contract violations (seed {report['seed']}):\n" +
+            '\n'.join(f"{failure['problem']}: {json.dumps(failure['case'], ensure_ascii=False)}"
+                      for failure in report['failures'][:20])
+        )
\ No newline at end of file
@@ -0,0 +1,125 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+import allure
+import pytest
+from api.transport import create_in_process_app
+
+# Проверки выполняются приложением в текущем процессе (app/requirements.app.txt)
+pytest.importorskip("flask")
+from sqlalchemy import text  # noqa: E402
+
+@pytest.fixture(scope="module")
+def app(tmp_path_factory):
+    """Приложение с групповым коммитом: пачка собирается 100 мс, ожидание записи - не больше 0.5 с."""
+    database = tmp_path_factory.mktemp("group-commit") / "items.db"
+    return create_in_process_app(
+        f"sqlite:///{database}",
+        GROUP_COMMIT_ENABLED=True,
+        GROUP_COMMIT_MAX_BATCH=50,
+        GROUP_COMMIT_MAX_DELAY_MS=100,
+        GROUP_COMMIT_TIMEOUT=0.5
+    )
+
+@pytest.fixture
+def committer(app, monkeypatch):
+    """Групповой коммит приложения с записью размеров сброшенных пачек (committer.batches)."""
+    committer = app.extensions['group_commit']
+    committer.batches = []
+    flush = committer._flush
+    
+    def recording_flush(batch):
+        committer.batches.append(len(batch))
+        flush(batch)
+    
+    monkeypatch.setattr(committer, '_flush', recording_flush)
+    return committer
+
+def count_items(app, name):
+    """Число товаров с названием name в БД приложения."""
+    with app.app_context():
+        return app.extensions['sqlalchemy'].session.execute(
+            text("SELECT COUNT(*) FROM items WHERE name = :name"), {'name': name}
+        ).scalar_one()
+
+@allure.epic("REST API Тестирование")
+@allure.feature("Групповой коммит")
+class TestGroupCommit:
+    
+    @allure.story("Пачки")
+    @allure.title("Тест сброса конкурентных записей одной пачкой")
+    @allure.severity(allure.severity_level.CRITICAL)
+    @allure.tag("positive", "group_commit")
+    def test_concurrent_writes_are_batched(self, committer):
+        """Одновременные записи сбрасываются несколькими пачками, каждый получает свою запись с ID."""
+        
+        with ThreadPoolExecutor(20) as executor:
+            created = list(executor.map(
+                lambda index: committer.submit({'name': f"Batched {index}", 'price': float(index)}),
+                range(20)
+            ))
+        
+        assert [item['name'] for item in created] == [f"Batched {index}" for index in range(20)]
+        assert len({item['id'] for item in created}) == 20
+        assert sum(committer.batches) == 20
+        assert max(committer.batches) > 1, f"No batching: {committer.batches}"
+    
+    @allure.story("Пачки")
+    @allure.title("Тест поштучного повтора после ошибки коммита пачки")
+    @allure.severity(allure.severity_level.CRITICAL)
+    @allure.tag("negative", "group_commit")
+    def test_failed_batch_falls_back_to_single_commits(self, app, committer):
+        """Ошибочная запись не роняет пачку: остальные записи создаются, ошибку получает только она."""
+        
+        payloads = [
+            {'name': 'Fallback first', 'price': 1.0},
+            {'name': None, 'price': 2.0},
+            {'name': 'Fallback last', 'price': 3.0}
+        ]
+        with ThreadPoolExecutor(len(payloads)) as executor:
+            futures = [executor.submit(committer.submit, payload) for payload in payloads]
+        
+        assert committer.batches == [3]
+        assert futures[0].result()['name'] == 'Fallback first'
+        assert futures[2].result()['name'] == 'Fallback last'
+        with pytest.raises(Exception, match='NOT NULL'):
+            futures[1].result()
+        assert count_items(app, 'Fallback first') == 1
+        assert count_items(app, 'Fallback last') == 1
+    
+    @allure.story("Таймаут")
+    @allure.title("Тест снятия записи с очереди по таймауту")
+    @allure.severity(allure.severity_level.CRITICAL)
+    @allure.tag("negative", "group_commit")
+    def test_timed_out_write_is_never_committed(self, app, committer, monkeypatch):
+        """По таймауту клиент получает 503, а запись не создается и после освобождения потока."""
+        
+        entered, release = threading.Event(), threading.Event()
+        factory = committer.factory
+        
+        def blocking_factory(**data):
+            # Фоновый поток застревает на первой записи (медленная БД)
+            if data['name'] == 'Blocking':
+                entered.set()
+                release.wait(10)
+            return factory(**data)
+        
+        monkeypatch.setattr(committer, 'factory', blocking_factory)
+        
+        with ThreadPoolExecutor(1) as executor:
+            blocking = executor.submit(committer.submit, {'name': 'Blocking', 'price': 1.0})
+            assert entered.wait(10)
+            
+            # Пока поток занят, новая запись ждет в очереди дольше GROUP_COMMIT_TIMEOUT
+            response = app.test_client().post('/api/items', json={'name': 'Timed out', 'price': 1.0})
+            
+            assert response.status_code == 503
+            assert response.headers['Retry-After'] == '1'
+            
+            release.set()
+            # Запись, уже взятая в пачку, дожидается коммита и после таймаута
+            assert blocking.result(timeout=10)['name'] == 'Blocking'
+        
+        # Следующая пачка проходит через поток после снятой с очереди записи
+        assert committer.submit({'name': 'After timeout', 'price': 1.0})['id']
+        assert count_items(app, 'Timed out') == 0
+        assert committer.batches == [1, 1]
\ No newline at end of file
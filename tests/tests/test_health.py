@@ -0,0 +1,75 @@
+import allure
+from utils.assertions import APIAssertions as Assert
+from utils.polling import wait_until
+
+@allure.epic("REST API Тестирование")
+@allure.feature("Готовность сервиса")
+class TestHealthAPI:
+    
+    @allure.story("Readiness")
+    @allure.title("Тест готовности сервиса к приему трафика")
+    @allure.severity(allure.severity_level.CRITICAL)
+    @allure.tag("smoke", "health")
+    def test_ready(self, health_client):
+        """
+        Тест эндпоинта /ready.
+        
+        БД и пул должны быть в порядке всегда; p99 за окно HEALTH_LATENCY_WINDOW
+        зависит от предыдущих тестов (нагрузочные могут превысить бюджет),
+        поэтому проверяется только согласованность ответа с проверкой задержек.
+        """
+        
+        response = health_client.get_ready(expected_status=None)
+        
+        data = response.json()
+        assert data['checks']['database'] == 'ok'
+        assert data['checks']['pool'] == 'ok'
+        ready = data['checks']['latency'] == 'ok'
+        assert data['status'] == ('ready' if ready else 'not_ready')
+        Assert.assert_status_code(response, 200 if ready else 503)
+    
+    @allure.story("Readiness")
+    @allure.title("Тест детальной проверки здоровья")
+    @allure.severity(allure.severity_level.NORMAL)
+    @allure.tag("positive", "health")
+    def test_deep_health(self, health_client):
+        """Тест эндпоинта /health/deep (отказ по задержкам допускается, только если p99 выше бюджета)."""
+        
+        response = health_client.get_deep_health(expected_status=None)
+        
+        checks = response.json()['checks']
+        assert checks['database']['latency_ms'] >= 0
+        assert checks['pool']['pools'], "Pool status is empty"
+        latency = checks['latency']
+        assert latency['budget_ms'] > 0
+        assert latency['window_s'] > 0
+        if latency['status'] == 'fail':
+            assert latency['p99_ms'] > latency['budget_ms']
+        Assert.assert_status_code(response, 200 if latency['status'] == 'ok' else 503)
+    
+    @allure.story("Readiness")
+    @allure.title("Тест кэширования результатов проверки")
+    @allure.severity(allure.severity_level.MINOR)
+    @allure.tag("positive", "health")
+    def test_deep_health_is_cached(self, health_client):
+        """Повторная проба в пределах TTL не выполняет проверки заново."""
+        
+        first = health_client.get_deep_health(expected_status=None).json()
+        second = health_client.get_deep_health(expected_status=None).json()
+        
+        assert first['timestamp'] == second['timestamp']
+    
+    @allure.story("Readiness")
+    @allure.title("Тест обновления результатов проверки после TTL")
+    @allure.severity(allure.severity_level.MINOR)
+    @allure.tag("positive", "health")
+    def test_deep_health_cache_expires(self, health_client):
+        """После истечения TTL кэша проба выполняется заново (ожидание без фиксированных пауз)."""
+        
+        first = health_client.get_deep_health(expected_status=None).json()
+        
+        wait_until(
+            lambda: health_client.get_deep_health(expected_status=None).json()['timestamp'] != first['timestamp'],
+            timeout=10,
+            name='deep health refreshed'
+        )
\ No newline at end of file
@@ -0,0 +1,144 @@
+import threading
+import allure
+import pytest
+from api.transport import create_in_process_app, import_app_module
+
+# Проверки выполняются приложением в текущем процессе (app/requirements.app.txt)
+pytest.importorskip("flask")
+
+class FakeClock:
+    """Управляемые монотонные часы гистограммы."""
+    
+    def __init__(self):
+        self.now = 1000.0
+    
+    def __call__(self):
+        return self.now
+
+@pytest.fixture(scope="module")
+def app(tmp_path_factory):
+    database = tmp_path_factory.mktemp("health") / "items.db"
+    return create_in_process_app(f"sqlite:///{database}", HEALTH_CACHE_TTL=0.0)
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+@pytest.fixture
+def checker(app, clock):
+    """Проверки без кэша: окно задержек 10 секунд, бюджет p99 100 мс, не меньше 5 замеров в окне."""
+    health = import_app_module('health')
+    histogram = import_app_module('metrics').Histogram(clock=clock)
+    return health.HealthChecker(
+        app, db_timeout=0.2, cache_ttl=0.0, p99_budget_ms=100.0,
+        min_samples=5, latency_window=10.0, histogram=histogram
+    )
+
+def observe(checker, seconds, count):
+    for _ in range(count):
+        checker.histogram.observe(seconds)
+
+@allure.epic("REST API Тестирование")
+@allure.feature("Готовность сервиса")
+class TestHealthChecks:
+    
+    @allure.story("Not ready")
+    @allure.title("Тест отказа в готовности по таймауту проверки БД")
+    @allure.severity(allure.severity_level.CRITICAL)
+    @allure.tag("negative", "health")
+    def test_database_timeout(self, checker, monkeypatch):
+        """Зависшая БД: проверка отказывает по таймауту и не запускает вторую, пока висит первая."""
+        
+        release = threading.Event()
+        monkeypatch.setattr(checker, '_ping_database', lambda: release.wait(10))
+        try:
+            result = checker.run()
+            assert result['status'] == 'not_ready'
+            assert result['checks']['database'] == {'status': 'fail', 'error': 'Timed out after 0.2s'}
+            
+            assert checker.check_database() == {'status': 'fail', 'error': 'Previous check still running'}
+        finally:
+            release.set()
+            checker._pending_ping.result(timeout=10)
+        
+        assert checker.check_database()['status'] == 'ok'
+    
+    @allure.story("Not ready")
+    @allure.title("Тест отказа в готовности при заполненном пуле соединений")
+    @allure.severity(allure.severity_level.CRITICAL)
+    @allure.tag("negative", "health")
+    def test_pool_saturation(self, checker):
+        """Пул, заполненный до порога, делает воркер неготовым."""
+        
+        checker.max_pool_utilization = 0.0
+        
+        result = checker.run()
+        assert result['status'] == 'not_ready'
+        assert result['checks']['pool']['status'] == 'fail'
+        assert result['checks']['database']['status'] == 'ok'
+    
+    @allure.story("Not ready")
+    @allure.title("Тест отказа в готовности при превышении бюджета p99 и восстановления")
+    @allure.severity(allure.severity_level.CRITICAL)
+    @allure.tag("negative", "health")
+    def test_latency_breach_and_recovery(self, checker, clock):
+        """Всплеск задержек делает воркер неготовым, пока не выйдет из окна HEALTH_LATENCY_WINDOW."""
+        
+        observe(checker, 0.5, 10)
+        
+        result = checker.run()
+        assert result['status'] == 'not_ready'
+        assert result['checks']['latency'] == {
+            'status': 'fail', 'budget_ms': 100.0, 'window_s': 10.0, 'samples': 10, 'p99_ms': 500.0
+        }
+        
+        # Замеры старше окна не учитываются, пустое окно не мешает готовности
+        clock.now += 10.5
+        result = checker.run()
+        assert result['status'] == 'ready'
+        assert result['checks']['latency'] == {
+            'status': 'ok', 'budget_ms': 100.0, 'window_s': 10.0, 'samples': 0, 'p99_ms': None
+        }
+        
+        observe(checker, 0.01, 10)
+        assert checker.check_latency()['p99_ms'] == 10.0
+    
+    @allure.story("Not ready")
+    @allure.title("Тест минимального числа замеров в окне")
+    @allure.severity(allure.severity_level.NORMAL)
+    @allure.tag("positive", "health")
+    def test_min_samples_within_window(self, checker, clock):
+        """Медленных замеров в окне меньше HEALTH_MIN_SAMPLES - готовность не снимается, старые не засчитываются."""
+        
+        observe(checker, 0.5, 10)
+        clock.now += 20
+        observe(checker, 0.5, 4)
+        
+        latency = checker.check_latency()
+        assert latency['status'] == 'ok'
+        assert latency['samples'] == 4
+        
+        observe(checker, 0.5, 1)
+        assert checker.check_latency()['status'] == 'fail'
+    
+    @allure.story("Not ready")
+    @allure.title("Тест ответа 503 эндпоинта /ready")
+    @allure.severity(allure.severity_level.NORMAL)
+    @allure.tag("negative", "health")
+    def test_ready_endpoint_returns_503(self, app, clock, monkeypatch):
+        """Неготовый воркер отвечает 503 на /ready и /health/deep, после выхода всплеска из окна - 200."""
+        
+        app_checker = app.extensions['health_checker']
+        histogram = import_app_module('metrics').Histogram(clock=clock)
+        monkeypatch.setattr(app_checker, 'histogram', histogram)
+        for _ in range(app_checker.min_samples):
+            histogram.observe(app_checker.p99_budget_ms / 1000 * 2)
+        client = app.test_client()
+        
+        response = client.get('/ready')
+        assert response.status_code == 503
+        assert response.get_json()['checks']['latency'] == 'fail'
+        assert client.get('/health/deep').get_json()['status'] == 'not_ready'
+        
+        clock.now += app_checker.latency_window + 1
+        assert client.get('/ready').status_code == 200
\ No newline at end of file
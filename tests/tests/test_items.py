@@ -2,6 +2,7 @@ import allure
 import pytest
 from data.test_data import create_item_test_data, update_item_test_data
 from utils.assertions import APIAssertions as Assert
+from utils.latency import latency_collector
 from config import config
 
 @allure.epic("REST API Тестирование")
@@ -217,100 +218,179 @@ class TestItemsAPI:
     @allure.title("Тест фильтрации товаров по цене")
     @allure.severity(allure.severity_level.NORMAL)
     @allure.tag("positive", "filter")
-    def test_filter_items_by_price(self, api_client):
-        """Тест фильтрации товаров по диапазону цен."""
-        
-        # Создаем товары с разными ценами
-        items_prices = [10, 50, 100, 200]
-        created_ids = []
-        
-        try:
-            for price in items_prices:
-                response = api_client.create_item(
-                    name=f"Price Test Item {price}",
-                    price=price
+    def test_filter_items_by_price(self, api_client, seeded_dataset):
+        """Тест фильтрации товаров по диапазону цен (на общем наборе данных)."""
+        
+        tag = seeded_dataset['tag']
+        prices = [item['price'] for item in seeded_dataset['items']]
+        
+        for min_price, max_price in [(50, None), (None, 100), (50, 150)]:
+            with allure.step(f"Фильтр: min_price={min_price}, max_price={max_price}"):
+                response = api_client.get_all_items(
+                    per_page=100,
+                    min_price=min_price,
+                    max_price=max_price,
+                    tag=tag
                 )
-                assert response.status_code == 201
-                created_ids.append(response.json()['id'])
-            
-            # Тест фильтрации по минимальной цене
-            response = api_client.get_all_items(min_price=50)
-            data = response.json()
-            
-            for item in data['items']:
-                assert item['price'] >= 50
-            
-            # Тест фильтрации по максимальной цене
-            response = api_client.get_all_items(max_price=100)
-            data = response.json()
-            
-            for item in data['items']:
-                assert item['price'] <= 100
-            
-            # Тест фильтрации по диапазону
-            response = api_client.get_all_items(min_price=50, max_price=150)
-            data = response.json()
-            
-            for item in data['items']:
-                assert 50 <= item['price'] <= 150
-        
-        finally:
-            # Очистка
-            for item_id in created_ids:
-                api_client.delete_item(item_id, expected_status=200)
+                data = response.json()
+                
+                expected = [
+                    price for price in prices
+                    if (min_price is None or price >= min_price)
+                    and (max_price is None or price <= max_price)
+                ]
+                assert data['total'] == len(expected)
+                
+                for item in data['items']:
+                    assert item['tag'] == tag
+                    if min_price is not None:
+                        assert item['price'] >= min_price
+                    if max_price is not None:
+                        assert item['price'] <= max_price
     
     @allure.story("Производительность")
     @allure.title("Тест времени ответа API")
     @allure.severity(allure.severity_level.NORMAL)
     @allure.tag("performance")
     def test_api_response_time(self, api_client):
-        """Тест времени ответа API."""
+        """Тест времени ответа API по распределению (p95 без прогревочных запросов)."""
         
-        response = api_client.get_all_items()
-        Assert.assert_response_time(response, 500)  # < 500ms
+        with latency_collector.window() as window:
+            for _ in range(30):
+                api_client.get_all_items()
+        
+        Assert.assert_p95_below(window, 500, warmup=5)  # p95 < 500ms
     
     @allure.story("Пагинация")
     @allure.title("Тест пагинации списка товаров")
     @allure.severity(allure.severity_level.NORMAL)
     @allure.tag("positive", "pagination")
-    def test_items_pagination(self, api_client):
-        """Тест пагинации списка товаров."""
+    def test_items_pagination(self, api_client, seeded_dataset):
+        """Тест пагинации списка товаров (на общем наборе данных)."""
         
-        # Создаем несколько товаров для теста пагинации
-        created_ids = []
-        try:
-            for i in range(15):
-                response = api_client.create_item(
-                    name=f"Pagination Item {i}",
-                    price=100 + i
-                )
-                assert response.status_code == 201
-                created_ids.append(response.json()['id'])
-            
-            # Первая страница
-            response = api_client.get_all_items(page=1, per_page=5)
-            data = response.json()
-            
-            assert data['page'] == 1
-            assert data['per_page'] == 5
-            assert len(data['items']) <= 5
-            assert data['total'] >= 15
-            
-            # Вторая страница
-            response2 = api_client.get_all_items(page=2, per_page=5)
-            data2 = response2.json()
+        tag = seeded_dataset['tag']
+        dataset_ids = [item['id'] for item in seeded_dataset['items']]
+        
+        # Первая страница
+        response = api_client.get_all_items(page=1, per_page=5, tag=tag)
+        data = response.json()
+        
+        assert data['page'] == 1
+        assert data['per_page'] == 5
+        assert data['total'] == len(dataset_ids)
+        assert data['pages'] == -(-len(dataset_ids) // 5)
+        
+        # Вторая страница
+        response2 = api_client.get_all_items(page=2, per_page=5, tag=tag)
+        data2 = response2.json()
+        
+        assert data2['page'] == 2
+        
+        # Страницы идут подряд по ID и не пересекаются
+        assert [item['id'] for item in data['items']] == dataset_ids[:5]
+        assert [item['id'] for item in data2['items']] == dataset_ids[5:10]
+    
+    @allure.story("Пагинация")
+    @allure.title("Тест курсорной пагинации списка товаров")
+    @allure.severity(allure.severity_level.NORMAL)
+    @allure.tag("positive", "pagination")
+    def test_items_cursor_pagination(self, api_client, seeded_dataset):
+        """Тест курсорной пагинации (after_id) на общем наборе данных."""
+        
+        tag = seeded_dataset['tag']
+        
+        # Обход набора страницами по 25 через курсор
+        after_id = 0
+        seen_ids = []
+        while True:
+            data = api_client.get_all_items(per_page=25, after_id=after_id, tag=tag).json()
+            page_ids = [item['id'] for item in data['items']]
             
-            assert data2['page'] == 2
-            assert len(data2['items']) <= 5
+            assert page_ids == sorted(page_ids), "Items are not ordered by ID"
+            assert all(item_id > after_id for item_id in page_ids)
             
-            # Проверяем, что товары на разных страницах разные
-            if len(data['items']) > 0 and len(data2['items']) > 0:
-                assert data['items'][0]['id'] != data2['items'][0]['id']
-        
-        finally:
-            # Очистка
-            for item_id in created_ids:
-                api_client.delete_item(item_id, expected_status=200)
+            seen_ids.extend(page_ids)
+            if len(page_ids) < 25:
+                break
+            after_id = page_ids[-1]
+        
+        assert seen_ids == [item['id'] for item in seeded_dataset['items']], "Cursor walk missed or duplicated items"
+    
+    @allure.story("Массовые операции")
+    @allure.title("Тест массового создания и удаления товаров по тегу")
+    @allure.severity(allure.severity_level.NORMAL)
+    @allure.tag("positive", "bulk")
+    def test_bulk_create_and_delete_by_tag(self, api_client, data_tag):
+        """Тест массового создания товаров и удаления по тегу."""
+        
+        tag = f"{data_tag}-bulk"
+        items = [{"name": f"Bulk Item {i}", "price": 10 + i} for i in range(5)]
+        
+        response = api_client.create_items_bulk(items, tag=tag)
+        data = response.json()
+        
+        assert data['count'] == 5
+        for created, source in zip(data['items'], items):
+            assert created['name'] == source['name']
+            assert created['tag'] == tag
+        
+        listed = api_client.get_all_items(tag=tag).json()
+        assert listed['total'] == 5
+        
+        delete_response = api_client.delete_items_by_tag(tag)
+        assert delete_response.json()['deleted'] == 5
+        
+        assert api_client.get_all_items(tag=tag).json()['total'] == 0
+    
+    @allure.story("Массовые операции")
+    @allure.title("Тест валидации массового создания товаров")
+    @allure.severity(allure.severity_level.NORMAL)
+    @allure.tag("negative", "bulk")
+    def test_bulk_create_invalid_item(self, api_client, data_tag):
+        """Пачка с невалидным товаром отклоняется целиком."""
+        
+        tag = f"{data_tag}-bulk-invalid"
+        items = [{"name": "Valid", "price": 10}, {"name": "", "price": 10}]
+        
+        response = api_client.create_items_bulk(items, tag=tag, expected_status=400)
+        Assert.assert_status_code(response, 400)
+        assert '1' in response.json()['errors']['items']
+        
+        assert api_client.get_all_items(tag=tag).json()['total'] == 0
+    
+    @allure.story("Массовые операции")
+    @allure.title("Тест пачки, в которой items - не список")
+    @allure.severity(allure.severity_level.NORMAL)
+    @allure.tag("negative", "bulk")
+    def test_bulk_create_items_not_a_list(self, api_client, data_tag):
+        """Строка или число вместо списка - обычная ошибка схемы, а не ограничение размера пачки или 500."""
+        
+        for items in ("x" * 1001, 1):
+            response = api_client.post("/items/bulk", json={"items": items, "tag": data_tag}, expected_status=400)
+            Assert.assert_status_code(response, 400)
+            assert response.json()['errors'] == {'items': ["Not a valid list."]}
+    
+    @allure.story("Валидация")
+    @allure.title("Тест некорректного JSON в теле запроса")
+    @allure.severity(allure.severity_level.NORMAL)
+    @allure.tag("negative", "validation")
+    def test_create_item_invalid_json(self, api_client):
+        """Тело, которое не разбирается как JSON, - ошибка валидации 400, а не 500."""
+        
+        response = api_client.post("/items", data='{"name": "Item", "price": 1,', expected_status=400)
+        Assert.assert_status_code(response, 400)
+        assert '_schema' in response.json()['errors']
+    
+    @allure.story("Валидация")
+    @allure.title("Тест слишком большого номера страницы")
+    @allure.severity(allure.severity_level.NORMAL)
+    @allure.tag("negative", "validation", "pagination")
+    def test_items_page_out_of_range(self, api_client):
+        """Номер страницы, переполняющий OFFSET запроса, отклоняется валидацией."""
+        
+        response = api_client.get("/items", params={"page": "9" * 30}, expected_status=400)
+        Assert.assert_status_code(response, 400)
+        assert 'page' in response.json()['errors']
     
     @allure.story("Комплексные тесты")
     @allure.title("Тест полного жизненного цикла товара")
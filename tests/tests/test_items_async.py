@@ -0,0 +1,50 @@
+import asyncio
+import allure
+import pytest
+from data.test_data import generate_random_item
+from utils.assertions import APIAssertions as Assert
+
+@allure.epic("REST API Тестирование")
+@allure.feature("Асинхронный клиент")
+class TestItemsAsyncAPI:
+    
+    @allure.story("CRUD операции")
+    @allure.title("Тест жизненного цикла товара через асинхронный клиент")
+    @allure.severity(allure.severity_level.NORMAL)
+    @allure.tag("positive", "async")
+    @pytest.mark.asyncio
+    async def test_item_lifecycle(self, async_api_client, random_item_data):
+        """Создание, чтение, обновление и удаление товара."""
+        
+        response = await async_api_client.create_item(**random_item_data)
+        item_id = response.json()['id']
+        
+        try:
+            response = await async_api_client.get_item(item_id)
+            Assert.assert_field_equal(response, 'name', random_item_data['name'])
+            
+            response = await async_api_client.patch_item(item_id, price=42.5)
+            Assert.assert_field_equal(response, 'price', 42.5)
+        finally:
+            await async_api_client.delete_item(item_id)
+        
+        await async_api_client.get_item(item_id, expected_status=404)
+    
+    @allure.story("Конкурентность")
+    @allure.title("Тест одновременного создания товаров")
+    @allure.severity(allure.severity_level.NORMAL)
+    @allure.tag("positive", "async", "concurrency")
+    @pytest.mark.asyncio
+    async def test_concurrent_create(self, async_api_client):
+        """Одновременно созданные товары получают уникальные ID."""
+        
+        count = 100
+        responses = await asyncio.gather(*(
+            async_api_client.create_item(**generate_random_item()) for _ in range(count)
+        ))
+        ids = [response.json()['id'] for response in responses]
+        
+        try:
+            assert len(set(ids)) == count, "Duplicate IDs for concurrently created items"
+        finally:
+            await asyncio.gather(*(async_api_client.delete_item(item_id) for item_id in ids))
\ No newline at end of file
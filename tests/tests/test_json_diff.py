@@ -0,0 +1,113 @@
+import allure
+import pytest
+from utils.assertions import APIAssertions as Assert
+from utils.helpers import compare_json_objects
+
+def items(*values):
+    """Ответ списка товаров: (id, price, created_at) -> {'items': [...]}."""
+    return {'items': [{'id': item_id, 'price': price, 'created_at': created} for item_id, price, created in values]}
+
+EXPECTED = items((1, 10.0, 't1'), (2, 20.0, 't2'), (3, 30.0, 't3'))
+
+@allure.epic("REST API Тестирование")
+@allure.feature("Сравнение JSON")
+class TestKeyedJsonDiff:
+    
+    @allure.story("Сопоставление по ключу")
+    @allure.title("Тест сравнения списков без учета порядка")
+    @allure.severity(allure.severity_level.NORMAL)
+    @allure.tag("diff")
+    def test_reordered_items_are_equal(self):
+        """Переставленные элементы равны в обоих режимах."""
+        
+        actual = items((3, 30.0, 't3'), (1, 10.0, 't1'), (2, 20.0, 't2'))
+        
+        assert compare_json_objects(EXPECTED, actual, key='id') == {}
+        assert not compare_json_objects(EXPECTED, actual)
+    
+    @allure.story("Сопоставление по ключу")
+    @allure.title("Тест добавленных, удаленных и измененных элементов")
+    @allure.severity(allure.severity_level.CRITICAL)
+    @allure.tag("diff")
+    def test_added_removed_and_changed_items(self):
+        """Пути элементов - по ключу: root['items'][id=N]; смена типа отличается от смены значения."""
+        
+        actual = items((4, 40.0, 't4'), (2, '20.0', 't2'), (1, 11.0, 't1'))
+        
+        diff = compare_json_objects(EXPECTED, actual, key='id')
+        
+        assert diff['iterable_item_removed'] == {"root['items'][id=3]": EXPECTED['items'][2]}
+        assert diff['iterable_item_added'] == {"root['items'][id=4]": actual['items'][0]}
+        assert diff['values_changed'] == {"root['items'][id=1]['price']": {'new_value': 11.0, 'old_value': 10.0}}
+        assert diff['type_changes'] == {"root['items'][id=2]['price']": {
+            'old_type': float, 'new_type': str, 'old_value': 20.0, 'new_value': '20.0'
+        }}
+    
+    @allure.story("Исключения")
+    @allure.title("Тест исключения путей по ключу, по индексу и шаблоном")
+    @allure.severity(allure.severity_level.CRITICAL)
+    @allure.tag("diff")
+    def test_exclude_paths(self):
+        """Исключения по индексу переводятся в пути по ключу, [*] действует на каждый элемент."""
+        
+        # Порядок изменен: индекс 0 в expected - товар id=1, в actual - id=3
+        actual = items((3, 30.0, 'x3'), (1, 15.0, 'x1'), (2, 25.0, 'x2'))
+        timestamps = "root['items'][*]['created_at']"
+        
+        diff = compare_json_objects(EXPECTED, actual, [timestamps], key='id')
+        assert set(diff['values_changed']) == {"root['items'][id=1]['price']", "root['items'][id=2]['price']"}
+        
+        keyed = ["root['items'][id=1]['price']", "root['items'][id=2]['price']", timestamps]
+        indexed = ["root['items'][0]['price']", "root['items'][1]['price']", timestamps]
+        assert compare_json_objects(EXPECTED, actual, keyed, key='id') == {}
+        assert compare_json_objects(EXPECTED, actual, indexed, key='id') == {}
+        
+        # Шаблон действует и без key (пути DeepDiff по индексу)
+        reordered = items((1, 10.0, 'x1'), (2, 20.0, 'x2'), (3, 30.0, 'x3'))
+        assert not compare_json_objects(EXPECTED, reordered, [timestamps])
+        assert compare_json_objects(EXPECTED, reordered, [timestamps], key='id') == {}
+    
+    @allure.story("Исключения")
+    @allure.title("Тест исключения удаленного элемента по индексу")
+    @allure.severity(allure.severity_level.NORMAL)
+    @allure.tag("diff")
+    def test_exclude_removed_item_by_index(self):
+        """Путь элемента по индексу исключает и его удаление."""
+        
+        actual = items((1, 10.0, 't1'), (2, 20.0, 't2'))
+        
+        assert compare_json_objects(EXPECTED, actual, ["root['items'][2]"], key='id') == {}
+        assert compare_json_objects(EXPECTED, actual, ["root['items'][id=3]"], key='id') == {}
+        assert compare_json_objects(EXPECTED, actual, ["root['items'][1]"], key='id') == {
+            'iterable_item_removed': {"root['items'][id=3]": EXPECTED['items'][2]}
+        }
+    
+    @allure.story("Сопоставление по ключу")
+    @allure.title("Тест сравнения списков с повторяющимся ключом")
+    @allure.severity(allure.severity_level.NORMAL)
+    @allure.tag("diff")
+    def test_duplicate_keys_fall_back_to_deepdiff(self):
+        """Список с повторами id сравнивается DeepDiff (пути по индексу), исключения при этом действуют."""
+        
+        expected = items((1, 10.0, 't1'), (1, 20.0, 't2'))
+        actual = items((1, 10.0, 'x1'), (1, 20.0, 't2'))
+        
+        diff = compare_json_objects(expected, actual, key='id')
+        assert diff == {'values_changed': {"root['items'][0]['created_at']": {'new_value': 'x1', 'old_value': 't1'}}}
+        assert diff == compare_json_objects(expected, actual)
+        
+        for exclude in ("root['items'][0]['created_at']", "root['items'][*]['created_at']"):
+            assert compare_json_objects(expected, actual, [exclude], key='id') == {}
+    
+    @allure.story("Исключения")
+    @allure.title("Тест исключения полей каждого товара в assert_json_contains")
+    @allure.severity(allure.severity_level.NORMAL)
+    @allure.tag("diff")
+    def test_assert_json_contains_excludes_every_item(self):
+        """Шаблон с [*] исключает поле во всех товарах ответа."""
+        
+        actual = items((2, 20.0, 'x2'), (1, 10.0, 'x1'), (3, 30.0, 'x3'))
+        
+        Assert.assert_json_contains(EXPECTED, actual, exclude=["root['items'][*]['created_at']"])
+        with pytest.raises(AssertionError, match=r"root\['items'\]\[id=1\]\['created_at'\]"):
+            Assert.assert_json_contains(EXPECTED, actual, exclude=["root['items'][*]['price']"])
\ No newline at end of file
@@ -0,0 +1,171 @@
+import json
+import random
+import allure
+import pytest
+from api.transport import import_app_module
+from load import LatencyHistogram, LoadCoordinator, LoadRunner, LoadStats, SCENARIOS, format_summary
+from config import config
+from utils.latency import percentile
+
+def run_load(**overrides):
+    """Прогон нагрузки с параметрами из LoadConfig и вложением отчета в Allure."""
+    params = dict(
+        workers=config.load.workers,
+        duration=config.load.duration,
+        target_rps=config.load.target_rps or None,
+        warmup=config.load.warmup,
+        keep_alive=config.api.keep_alive
+    )
+    params.update(overrides)
+    scenario = SCENARIOS[params.pop('scenario', config.load.scenario)]
+    
+    report = LoadRunner(scenario, **params).run()
+    
+    allure.attach(
+        format_summary(report['summary']),
+        name="Load summary",
+        attachment_type=allure.attachment_type.TEXT
+    )
+    allure.attach(
+        json.dumps(report, indent=2, ensure_ascii=False),
+        name="Load report",
+        attachment_type=allure.attachment_type.JSON
+    )
+    return report['summary']
+
+def lognormal_latencies(count, seed=42):
+    """Задержки с длинным хвостом (медиана ~20 мс), как у реального сервиса."""
+    rng = random.Random(seed)
+    return [rng.lognormvariate(-4, 0.8) for _ in range(count)]
+
+@allure.epic("REST API Тестирование")
+@allure.feature("Нагрузка")
+class TestLatencyHistogram:
+    
+    @allure.story("Гистограммы задержек")
+    @allure.title("Тест точности перцентилей гистограммы")
+    @allure.severity(allure.severity_level.NORMAL)
+    @allure.tag("load")
+    def test_percentiles_within_precision(self):
+        """Перцентиль не ниже точного и выше не больше чем на ширину корзины (1/128)."""
+        
+        values = lognormal_latencies(50000)
+        histogram = LatencyHistogram()
+        for value in values:
+            histogram.record(value)
+        
+        values.sort()
+        for p in (50, 90, 99, 99.9, 100):
+            exact = percentile(values, p)
+            estimate = histogram.percentile(p)
+            assert exact <= estimate <= exact * (1 + 1 / 128) + 1e-6, f"p{p}: {estimate} vs exact {exact}"
+        assert histogram.max == values[-1]
+        assert len(histogram.counts) < 1500
+    
+    @allure.story("Гистограммы задержек")
+    @allure.title("Тест слияния результатов нескольких процессов")
+    @allure.severity(allure.severity_level.NORMAL)
+    @allure.tag("load")
+    def test_merge_is_lossless(self):
+        """Сводка из сериализованных частей совпадает со сводкой по всем запросам сразу."""
+        
+        values = lognormal_latencies(20000)
+        combined = LoadStats()
+        parts = [LoadStats() for _ in range(4)]
+        for index, value in enumerate(values):
+            endpoint = 'GET /items' if index % 3 else 'POST /items'
+            status = 500 if index % 100 == 0 else 200
+            combined.record(endpoint, value, status, status >= 400)
+            parts[index % len(parts)].record(endpoint, value, status, status >= 400)
+        
+        merged = LoadStats()
+        for part in parts:
+            merged.merge(LoadStats.from_dict(json.loads(json.dumps(part.to_dict()))))
+        
+        assert merged.summary(10.0) == combined.summary(10.0)
+    
+    @allure.story("Гистограммы задержек")
+    @allure.title("Тест одного определения перцентиля у клиента и сервера")
+    @allure.severity(allure.severity_level.NORMAL)
+    @allure.tag("load")
+    def test_server_percentile_matches_client(self):
+        """Перцентили /metrics и клиентских замеров (soak сравнивает их напрямую) - один ближайший ранг."""
+        
+        pytest.importorskip("flask")
+        server_percentile = import_app_module('metrics').percentile
+        
+        for count in (1, 2, 7, 10, 99, 101, 1000):
+            values = sorted(lognormal_latencies(count, seed=count))
+            for p in (50, 90, 95, 99, 99.9, 100):
+                assert server_percentile(values, p) == percentile(values, p), f"p{p} of {count} values"
+
+@allure.epic("REST API Тестирование")
+@allure.feature("Нагрузка")
+@pytest.mark.load
+class TestLoad:
+    
+    @allure.story("Пропускная способность")
+    @allure.title("Нагрузка смешанным сценарием с фиксированной конкурентностью")
+    @allure.severity(allure.severity_level.NORMAL)
+    @allure.tag("performance", "load")
+    def test_fixed_concurrency(self):
+        """Доля ошибок и p99 в пределах порогов LoadConfig."""
+        
+        total = run_load()['total']
+        
+        assert total['requests'] > 0
+        assert total['error_rate'] <= config.load.max_error_rate, \
+            f"Error rate {total['error_rate']:.2%} exceeds {config.load.max_error_rate:.2%}"
+        assert total['p99_ms'] <= config.load.max_p99_ms, \
+            f"p99 {total['p99_ms']}ms exceeds {config.load.max_p99_ms}ms"
+    
+    @allure.story("Пропускная способность")
+    @allure.title("Нагрузка с целевым RPS")
+    @allure.severity(allure.severity_level.NORMAL)
+    @allure.tag("performance", "load")
+    def test_target_rps(self):
+        """Генератор выдерживает заданный RPS на сценарии чтения."""
+        
+        target_rps = 50
+        summary = run_load(scenario='read_only', target_rps=target_rps)
+        total = summary['total']
+        
+        assert total['error_rate'] <= config.load.max_error_rate
+        assert total['throughput_rps'] >= target_rps * 0.8, \
+            f"Throughput {total['throughput_rps']} RPS is below target {target_rps} RPS"
+    
+    @allure.story("Пропускная способность")
+    @allure.title("Распределенная нагрузка несколькими процессами")
+    @allure.severity(allure.severity_level.NORMAL)
+    @allure.tag("performance", "load", "distributed")
+    def test_distributed_load(self):
+        """Координатор делит RPS между процессами и сводит их гистограммы."""
+        
+        processes, target_rps = 2, 50
+        report = LoadCoordinator(
+            SCENARIOS['read_only'],
+            processes=processes,
+            workers=config.load.workers,
+            duration=config.load.duration,
+            target_rps=target_rps,
+            warmup=config.load.warmup,
+            keep_alive=config.api.keep_alive
+        ).run()
+        
+        allure.attach(
+            format_summary(report['summary']),
+            name="Distributed load summary",
+            attachment_type=allure.attachment_type.TEXT
+        )
+        allure.attach(
+            json.dumps(report, indent=2, ensure_ascii=False),
+            name="Distributed load report",
+            attachment_type=allure.attachment_type.JSON
+        )
+        
+        total = report['summary']['total']
+        assert len(report['process_summaries']) == processes
+        assert total['requests'] == sum(item['requests'] for item in report['process_summaries'])
+        assert total['error_rate'] <= config.load.max_error_rate
+        assert total['throughput_rps'] >= target_rps * 0.8, \
+            f"Throughput {total['throughput_rps']} RPS is below target {target_rps} RPS"
\ No newline at end of file
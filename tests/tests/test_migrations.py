@@ -0,0 +1,88 @@
+import os
+import sqlite3
+import subprocess
+import sys
+import allure
+import pytest
+from config import config
+
+# Команда выполняется из каталога приложения с его зависимостями (app/requirements.app.txt)
+pytest.importorskip("flask_migrate")
+
+# Схема, которую создавал db.create_all() до появления миграций (ревизия 0001)
+LEGACY_SCHEMA = """
+CREATE TABLE items (
+    id INTEGER NOT NULL PRIMARY KEY,
+    name VARCHAR(100) NOT NULL,
+    price FLOAT NOT NULL,
+    description VARCHAR(500),
+    in_stock BOOLEAN,
+    created_at DATETIME,
+    updated_at DATETIME
+)
+"""
+
+def manage(database, *args):
+    """Запуск `python manage.py <args> --config testing` на временной SQLite-базе."""
+    env = dict(os.environ, TEST_DATABASE_URL=f"sqlite:///{database}")
+    result = subprocess.run(
+        [sys.executable, 'manage.py', *args, '--config', 'testing'],
+        cwd=config.api.app_dir, env=env, capture_output=True, text=True, timeout=120
+    )
+    assert result.returncode == 0, result.stderr
+    return result.stdout
+
+def schema(database):
+    """Колонки items, индексы items и ревизия Alembic временной базы."""
+    with sqlite3.connect(database) as connection:
+        columns = {row[1] for row in connection.execute("PRAGMA table_info(items)")}
+        indexes = {row[1] for row in connection.execute("PRAGMA index_list(items)")}
+        revision = connection.execute("SELECT version_num FROM alembic_version").fetchone()[0]
+    return columns, indexes, revision
+
+@allure.epic("REST API Тестирование")
+@allure.feature("Миграции схемы")
+class TestMigrations:
+    
+    @allure.story("manage.py migrate")
+    @allure.title("Тест создания схемы миграциями на пустой базе")
+    @allure.severity(allure.severity_level.CRITICAL)
+    @allure.tag("positive", "migrations")
+    def test_migrate_empty_database(self, tmp_path):
+        """Пустая база получает таблицу items последней ревизии; повторный запуск ничего не меняет."""
+        
+        database = tmp_path / "items.db"
+        
+        output = manage(database, 'migrate')
+        
+        assert "Database migrated" in output
+        assert "stamped" not in output
+        columns, indexes, revision = schema(database)
+        assert {'id', 'name', 'price', 'tag'} <= columns
+        assert 'ix_items_tag' in indexes
+        assert revision == '0002'
+        
+        manage(database, 'migrate')
+        assert schema(database) == (columns, indexes, revision)
+    
+    @allure.story("manage.py migrate")
+    @allure.title("Тест пометки существующей схемы базовой ревизией")
+    @allure.severity(allure.severity_level.CRITICAL)
+    @allure.tag("positive", "migrations")
+    def test_migrate_legacy_database(self, tmp_path):
+        """База от create_all без alembic_version помечается ревизией 0001, затем применяется 0002 без потери данных."""
+        
+        database = tmp_path / "legacy.db"
+        with sqlite3.connect(database) as connection:
+            connection.execute(LEGACY_SCHEMA)
+            connection.execute("INSERT INTO items (name, price) VALUES ('Legacy', 1.5)")
+        
+        output = manage(database, 'migrate')
+        
+        assert "stamped with revision 0001" in output
+        columns, indexes, revision = schema(database)
+        assert 'tag' in columns
+        assert 'ix_items_tag' in indexes
+        assert revision == '0002'
+        with sqlite3.connect(database) as connection:
+            assert connection.execute("SELECT name, price, tag FROM items").fetchall() == [('Legacy', 1.5, None)]
\ No newline at end of file
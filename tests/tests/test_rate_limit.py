@@ -0,0 +1,229 @@
+import threading
+import allure
+import pytest
+from api.transport import create_in_process_app, import_app_module
+from utils.polling import wait_until
+
+# Проверки выполняются приложением в текущем процессе (app/requirements.app.txt)
+pytest.importorskip("flask")
+
+# Служебные пути, которые не ограничиваются и не сбрасываются
+EXEMPT = ('/health', '/health/deep', '/ready', '/metrics')
+
+@pytest.fixture(scope="module")
+def middleware():
+    return import_app_module('middleware')
+
+@pytest.fixture(scope="module")
+def limited_app(tmp_path_factory):
+    """
+    Приложение с лимитами: клиент - 2 запроса, воркер - 3 запроса (пополнение
+    раз в 100 секунд, в пределах теста корзины не наполняются). Клиент - X-Client-ID.
+    """
+    database = tmp_path_factory.mktemp("rate-limit") / "items.db"
+    return create_in_process_app(
+        f"sqlite:///{database}",
+        RATE_LIMIT_ENABLED=True,
+        RATE_LIMIT_PER_CLIENT=0.01,
+        RATE_LIMIT_PER_CLIENT_BURST=2,
+        RATE_LIMIT_GLOBAL=0.01,
+        RATE_LIMIT_GLOBAL_BURST=3,
+        RATE_LIMIT_CLIENT_HEADER='X-Client-ID'
+    )
+
+@pytest.fixture
+def limited_client(limited_app, middleware):
+    """Test client приложения с лимитами и пустыми корзинами."""
+    limited_app.extensions['rate_limiter'].backend = middleware.InMemoryRateLimitBackend()
+    return limited_app.test_client()
+
+@pytest.fixture(scope="module")
+def shedding_app(tmp_path_factory):
+    """Приложение со сбросом нагрузки при одном запросе в обработке и медленным эндпоинтом /api/slow."""
+    database = tmp_path_factory.mktemp("load-shedding") / "items.db"
+    app = create_in_process_app(
+        f"sqlite:///{database}",
+        LOAD_SHEDDING_ENABLED=True,
+        LOAD_SHEDDING_MAX_IN_FLIGHT=1,
+        LOAD_SHEDDING_RETRY_AFTER=3
+    )
+    app.release_slow = threading.Event()
+    
+    @app.route('/api/slow')
+    def slow():
+        app.release_slow.wait(10)
+        return {'status': 'done'}
+    
+    return app
+
+def get(client, path, client_id='client-a'):
+    return client.get(path, headers={'X-Client-ID': client_id})
+
+def rejected(client, reason):
+    """Счетчик отказов rate_limit.rejected.<reason> (из /metrics: эндпоинт не ограничивается)."""
+    return client.get('/metrics').get_json()['counters'].get(f"rate_limit.rejected.{reason}", 0)
+
+def response_metrics(client, status):
+    """Счетчики ответов с кодом status и число замеров времени запросов из /metrics."""
+    snapshot = client.get('/metrics').get_json()
+    counters = snapshot['counters']
+    latency = snapshot['histograms'].get('request.latency_seconds', {}).get('count', 0)
+    return counters.get(f"responses.{status // 100}xx", 0), counters.get(f"responses.rejected.{status}", 0), latency
+
+@allure.epic("REST API Тестирование")
+@allure.feature("Ограничение частоты и сброс нагрузки")
+class TestRateLimiting:
+    
+    @allure.story("Rate limiting")
+    @allure.title("Тест ответа 429 с Retry-After")
+    @allure.severity(allure.severity_level.CRITICAL)
+    @allure.tag("negative", "rate_limit")
+    def test_client_limit_returns_429(self, limited_client):
+        """После исчерпания корзины клиента - 429 и Retry-After до появления токена."""
+        
+        assert [get(limited_client, '/api/items').status_code for _ in range(2)] == [200, 200]
+        
+        response = get(limited_client, '/api/items')
+        assert response.status_code == 429
+        assert response.get_json() == {'error': 'Too many requests'}
+        # Токен появится через 1 / 0.01 = 100 секунд
+        assert response.headers['Retry-After'] == '100'
+    
+    @allure.story("Rate limiting")
+    @allure.title("Тест раздельных корзин клиента и воркера")
+    @allure.severity(allure.severity_level.CRITICAL)
+    @allure.tag("negative", "rate_limit")
+    def test_client_and_global_buckets(self, limited_client):
+        """Исчерпавший свою корзину клиент не мешает другим, пока не исчерпана общая корзина воркера."""
+        
+        client_rejects, global_rejects = rejected(limited_client, 'client'), rejected(limited_client, 'global')
+        
+        assert [get(limited_client, '/api/items', 'client-a').status_code for _ in range(3)] == [200, 200, 429]
+        assert rejected(limited_client, 'client') == client_rejects + 1
+        
+        # Третий токен воркера достается другому клиенту, четвертого нет ни у кого
+        assert get(limited_client, '/api/items', 'client-b').status_code == 200
+        assert get(limited_client, '/api/items', 'client-c').status_code == 429
+        assert rejected(limited_client, 'global') == global_rejects + 1
+    
+    @allure.story("Rate limiting")
+    @allure.title("Тест учета отклоненных запросов в метриках ответов")
+    @allure.severity(allure.severity_level.NORMAL)
+    @allure.tag("negative", "rate_limit", "metrics")
+    def test_rejected_requests_in_metrics(self, limited_client):
+        """Ответ 429 учитывается в responses.4xx и responses.rejected.429, но не в замерах времени запросов."""
+        
+        get(limited_client, '/api/items')
+        get(limited_client, '/api/items')
+        before = response_metrics(limited_client, 429)
+        
+        assert get(limited_client, '/api/items').status_code == 429
+        
+        client_errors, rejections, latency = response_metrics(limited_client, 429)
+        assert (client_errors, rejections) == (before[0] + 1, before[1] + 1)
+        assert latency == before[2]
+    
+    @allure.story("Rate limiting")
+    @allure.title("Тест: отказ по одной корзине не расходует другую")
+    @allure.severity(allure.severity_level.NORMAL)
+    @allure.tag("negative", "rate_limit")
+    def test_rejected_request_does_not_consume_tokens(self, middleware):
+        """Токены списываются, только если их хватает во всех корзинах."""
+        
+        backend = middleware.InMemoryRateLimitBackend()
+        client_a, client_b = ('client:a', 0.01, 1), ('client:b', 0.01, 1)
+        worker = ('global', 0.01, 1)
+        
+        assert backend.consume([client_b, worker]) == (None, 0.0)
+        
+        denied, retry_after = backend.consume([client_a, worker])
+        assert denied == 'global'
+        assert retry_after == pytest.approx(100, rel=0.01)
+        
+        # Токен клиента a не потрачен отказом по глобальной корзине
+        assert backend.consume([client_a]) == (None, 0.0)
+    
+    @allure.story("Rate limiting")
+    @allure.title("Тест вытеснения давно не использованных корзин")
+    @allure.severity(allure.severity_level.NORMAL)
+    @allure.tag("positive", "rate_limit")
+    def test_backend_evicts_least_recently_used(self, middleware):
+        """Сверх max_keys удаляются самые давние корзины пачкой до low_water, недавно обновленные сохраняются."""
+        
+        backend = middleware.InMemoryRateLimitBackend(max_keys=10, low_water=6)
+        for index in range(10):
+            backend.consume([(f"client:{index}", 0.01, 1)])
+        backend.consume([('client:0', 0.01, 1)])
+        assert len(backend._buckets) == 10
+        
+        backend.consume([('client:new', 0.01, 1)])
+        
+        assert list(backend._buckets) == ['client:6', 'client:7', 'client:8', 'client:9', 'client:0', 'client:new']
+        # Корзина client:0 сохранила состояние: токенов нет
+        assert backend.consume([('client:0', 0.01, 1)])[0] == 'client:0'
+    
+    @allure.story("Rate limiting")
+    @allure.title("Тест проверки конфигурации лимитов")
+    @allure.severity(allure.severity_level.MINOR)
+    @allure.tag("negative", "rate_limit")
+    def test_invalid_limits_are_rejected(self, middleware, tmp_path):
+        """Нулевая скорость отклоняется при запуске, интерфейс хранилища - абстрактный класс."""
+        
+        with pytest.raises(ValueError, match='RATE_LIMIT_GLOBAL must be > 0'):
+            create_in_process_app(f"sqlite:///{tmp_path / 'items.db'}", RATE_LIMIT_ENABLED=True, RATE_LIMIT_GLOBAL=0)
+        with pytest.raises(TypeError):
+            middleware.RateLimitBackend()
+    
+    @allure.story("Служебные пути")
+    @allure.title("Тест служебных путей без ограничений")
+    @allure.severity(allure.severity_level.NORMAL)
+    @allure.tag("positive", "rate_limit")
+    def test_exempt_paths(self, limited_client, middleware):
+        """Пробы и метрики не ограничиваются; пути, лишь начинающиеся так же (/healthz), ограничиваются."""
+        
+        for _ in range(3):
+            get(limited_client, '/api/items', 'client-a')
+        get(limited_client, '/api/items', 'client-b')
+        
+        for path in EXEMPT:
+            assert get(limited_client, path).status_code != 429, path
+        assert get(limited_client, '/healthz').status_code == 429
+        assert get(limited_client, '/metricsfoo').status_code == 429
+        
+        assert all(middleware.is_exempt(path) for path in EXEMPT)
+        assert not any(middleware.is_exempt(path) for path in ('/healthz', '/metricsfoo', '/readyz', '/api/health'))
+
+@allure.epic("REST API Тестирование")
+@allure.feature("Ограничение частоты и сброс нагрузки")
+class TestLoadShedding:
+    
+    @allure.story("Load shedding")
+    @allure.title("Тест ответа 503 при превышении числа запросов в обработке")
+    @allure.severity(allure.severity_level.CRITICAL)
+    @allure.tag("negative", "load_shedding")
+    def test_in_flight_limit_returns_503(self, shedding_app):
+        """Пока обрабатывается медленный запрос, новые получают 503 с Retry-After, служебные - нет."""
+        
+        client = shedding_app.test_client()
+        shedder = shedding_app.extensions['load_shedder']
+        slow = threading.Thread(target=lambda: shedding_app.test_client().get('/api/slow'))
+        slow.start()
+        try:
+            wait_until(lambda: shedder.in_flight == 1, timeout=5, name='slow request in flight')
+            
+            rejections = response_metrics(client, 503)[1]
+            response = client.get('/api/items')
+            assert response.status_code == 503
+            assert response_metrics(client, 503)[1] == rejections + 1
+            assert response.get_json() == {'error': 'Service overloaded'}
+            assert response.headers['Retry-After'] == '3'
+            
+            # Пробы и метрики не сбрасываются (у /ready свои проверки, поэтому только /health и /metrics)
+            assert client.get('/health').status_code == 200
+            assert client.get('/metrics').status_code == 200
+        finally:
+            shedding_app.release_slow.set()
+            slow.join(10)
+        
+        assert shedder.in_flight == 0
+        assert client.get('/api/items').status_code == 200
\ No newline at end of file
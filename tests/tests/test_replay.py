@@ -0,0 +1,67 @@
+import allure
+import pytest
+import api.base_api
+from api.capture import TrafficCapture, read_capture
+from api.items_api import ItemsAPI
+from config import config
+from replay import ReplayEngine
+from stub_server import StubServer
+
+# Клиенты в режиме inprocess не выполняют сетевых запросов
+pytestmark = pytest.mark.skipif(
+    config.api.transport == 'inprocess',
+    reason="Тестам воспроизведения нужен транспорт http (API_TRANSPORT=http)"
+)
+
+@pytest.fixture
+def capture_file(tmp_path, monkeypatch):
+    """Запись трафика клиентов в файл на время теста."""
+    capture = TrafficCapture(str(tmp_path / "capture.jsonl.gz"))
+    monkeypatch.setattr(api.base_api, 'traffic_capture', capture)
+    yield capture
+    capture.close()
+
+@allure.epic("REST API Тестирование")
+@allure.feature("Запись и воспроизведение трафика")
+class TestTrafficReplay:
+    
+    @allure.story("Воспроизведение")
+    @allure.title("Тест воспроизведения записи с заменой ID")
+    @allure.severity(allure.severity_level.NORMAL)
+    @allure.tag("positive", "stub", "replay")
+    def test_replay_remaps_created_ids(self, capture_file):
+        """Запросы к созданным товарам воспроизводятся с ID нового сервиса."""
+        
+        with StubServer() as recorded:
+            client = ItemsAPI(base_url=recorded.api_url)
+            first = client.create_item(name="Replay item", price=10.0).json()
+            batch = client.create_items_bulk([{'name': f"Bulk {i}", 'price': i} for i in range(3)], tag="replay")
+            bulk_ids = [item['id'] for item in batch.json()['items']]
+            client.patch_item(first['id'], price=25.0)
+            client.get_item(bulk_ids[1])
+            client.get_all_items(after_id=bulk_ids[0], tag="replay")
+            client.delete_item(bulk_ids[2])
+            client.close()
+        capture_file.close()
+        
+        records = read_capture([capture_file.path])
+        assert [record['m'] for record in records] == ['POST', 'POST', 'PATCH', 'GET', 'GET', 'DELETE']
+        assert records[1]['ids'] == bulk_ids
+        
+        with StubServer() as target:
+            # Новый сервис выдает другие ID: записанные ID в запросах не подойдут
+            target.store.create_many([{'name': f"Existing {i}", 'price': 1} for i in range(10)])
+            
+            report = ReplayEngine(records, target=target.base_url, speed=0, streams=3).run()
+            
+            assert report['status_mismatches'] == 0, report['summary']
+            assert report['unmapped_ids'] == 0
+            assert report['summary']['total']['requests'] == len(records)
+            replayed = target.store.list({
+                'tag': None, 'in_stock': None, 'min_price': None, 'max_price': None, 'after_id': 10,
+                'page': 1, 'per_page': 100
+            })['items']
+            # Потоки создают товары параллельно, порядок ID может отличаться от записи
+            assert sorted((item['name'], item['price']) for item in replayed) == [
+                ("Bulk 0", 0), ("Bulk 1", 1), ("Replay item", 25.0)
+            ]
\ No newline at end of file
@@ -0,0 +1,201 @@
+import sqlite3
+import allure
+import pytest
+from api.transport import create_in_process_app, import_app_module
+
+# Проверки выполняются приложением в текущем процессе (app/requirements.app.txt)
+pytest.importorskip("flask")
+from sqlalchemy import create_engine  # noqa: E402
+
+# Число SQLite-шардов приложений модуля
+SHARD_COUNT = 3
+
+def sharded_app(directory, **overrides):
+    """Приложение с SHARD_COUNT SQLite-шардами в каталоге directory."""
+    shard_urls = [f"sqlite:///{directory / f'shard{index}.db'}" for index in range(SHARD_COUNT)]
+    return create_in_process_app(
+        f"sqlite:///{directory / 'main.db'}",
+        FAST_STARTUP=False,
+        SHARD_DATABASE_URLS=shard_urls,
+        SQLALCHEMY_BINDS={f'shard_{index}': url for index, url in enumerate(shard_urls)},
+        **overrides
+    )
+
+def shard_ids(directory):
+    """ID товаров в файле каждого шарда (в обход приложения)."""
+    result = []
+    for index in range(SHARD_COUNT):
+        with sqlite3.connect(directory / f"shard{index}.db") as connection:
+            result.append({row[0] for row in connection.execute("SELECT id FROM items")})
+    return result
+
+def create_items(client, tag, count):
+    response = client.post('/api/items/bulk', json={
+        'tag': tag,
+        'items': [{'name': f"{tag} {index}", 'price': float(index + 1)} for index in range(count)]
+    })
+    assert response.status_code == 201, response.get_json()
+    return [item['id'] for item in response.get_json()['items']]
+
+def list_items(client, **params):
+    response = client.get('/api/items', query_string=params)
+    assert response.status_code == 200, response.get_json()
+    return response.get_json()
+
+@pytest.fixture(scope="module")
+def shards_dir(tmp_path_factory):
+    return tmp_path_factory.mktemp("hash-shards")
+
+@pytest.fixture(scope="module")
+def client(shards_dir):
+    """Три шарда по хэшу ID, смещение страниц - не больше 30 товаров."""
+    return sharded_app(shards_dir, SHARD_STRATEGY='hash', SHARD_MAX_OFFSET=30).test_client()
+
+@allure.epic("REST API Тестирование")
+@allure.feature("Шардирование")
+class TestSharding:
+    
+    @allure.story("Маршрутизация")
+    @allure.title("Тест размещения товаров по хэшу ID")
+    @allure.severity(allure.severity_level.CRITICAL)
+    @allure.tag("positive", "sharding")
+    def test_hash_routing(self, client, shards_dir):
+        """Товар хранится в шарде id % SHARD_COUNT и читается через API по ID."""
+        
+        created = create_items(client, 'hash-routing', 9)
+        created.append(client.post('/api/items', json={'name': 'Single', 'price': 1.0}).get_json()['id'])
+        
+        stored = shard_ids(shards_dir)
+        for item_id in created:
+            assert item_id in stored[item_id % SHARD_COUNT], f"Item {item_id} is not in shard {item_id % SHARD_COUNT}"
+        assert all(stored), f"Empty shard: {stored}"
+        assert client.get(f"/api/items/{created[-1]}").get_json()['name'] == 'Single'
+    
+    @allure.story("Маршрутизация")
+    @allure.title("Тест размещения товаров по диапазонам ID")
+    @allure.severity(allure.severity_level.CRITICAL)
+    @allure.tag("positive", "sharding")
+    def test_range_routing(self, tmp_path):
+        """Диапазоны по SHARD_RANGE_SIZE, ID за последним диапазоном попадают в последний шард."""
+        
+        client = sharded_app(tmp_path, SHARD_STRATEGY='range', SHARD_RANGE_SIZE=5).test_client()
+        
+        created = create_items(client, 'range-routing', 18)
+        
+        assert created == list(range(1, 19))
+        assert shard_ids(tmp_path) == [set(range(1, 6)), set(range(6, 11)), set(range(11, 19))]
+    
+    @allure.story("Списки")
+    @allure.title("Тест постраничного списка со всех шардов")
+    @allure.severity(allure.severity_level.CRITICAL)
+    @allure.tag("positive", "sharding")
+    def test_offset_pagination(self, client):
+        """Страницы идут по ID без повторов и пропусков; смещение дальше SHARD_MAX_OFFSET - 400."""
+        
+        created = create_items(client, 'offset-pages', 25)
+        
+        pages = [list_items(client, tag='offset-pages', per_page=7, page=page) for page in range(1, 5)]
+        
+        ids = [item['id'] for page in pages for item in page['items']]
+        assert ids == sorted(created)
+        assert [page['total'] for page in pages] == [25] * 4
+        assert pages[0]['pages'] == 4
+        assert list_items(client, tag='offset-pages', per_page=7, page=5)['items'] == []
+        
+        # (6 - 1) * 7 = 35 > SHARD_MAX_OFFSET
+        response = client.get('/api/items', query_string={'tag': 'offset-pages', 'per_page': 7, 'page': 6})
+        assert response.status_code == 400
+        assert 'after_id' in response.get_json()['errors']['page'][0]
+    
+    @allure.story("Списки")
+    @allure.title("Тест курсора after_id по всем шардам")
+    @allure.severity(allure.severity_level.CRITICAL)
+    @allure.tag("positive", "sharding")
+    def test_cursor_pagination(self, client):
+        """Обход курсором возвращает все товары всех шардов по порядку ID без повторов и пропусков."""
+        
+        created = create_items(client, 'cursor-pages', 40)
+        
+        ids, after_id = [], 0
+        while True:
+            items = list_items(client, tag='cursor-pages', per_page=6, after_id=after_id)['items']
+            if not items:
+                break
+            ids.extend(item['id'] for item in items)
+            after_id = items[-1]['id']
+        
+        assert ids == sorted(created)
+    
+    @allure.story("Списки")
+    @allure.title("Тест числа строк шарда при чтении курсором")
+    @allure.severity(allure.severity_level.NORMAL)
+    @allure.tag("negative", "sharding")
+    def test_cursor_reads_one_page_per_shard(self, client, monkeypatch):
+        """Курсор читает из каждого шарда не больше per_page строк; page > 1 вместе с after_id - 400 без чтения шардов."""
+        
+        created = sorted(create_items(client, 'cursor-limit', 30))
+        store = client.application.extensions['item_shards']
+        query_shard = store._query_shard
+        fetched = []
+        
+        def recording_query(engine, params, limit):
+            items, total = query_shard(engine, params, limit)
+            fetched.append(len(items))
+            return items, total
+        
+        monkeypatch.setattr(store, '_query_shard', recording_query)
+        
+        items = list_items(client, tag='cursor-limit', per_page=4, after_id=created[9])['items']
+        assert [item['id'] for item in items] == created[10:14]
+        assert len(fetched) == SHARD_COUNT
+        assert max(fetched) == 4, fetched
+        
+        fetched.clear()
+        response = client.get('/api/items', query_string={
+            'tag': 'cursor-limit', 'per_page': 4, 'page': 3, 'after_id': created[9]
+        })
+        assert response.status_code == 400
+        assert response.get_json()['errors'] == {'page': ["Page cannot be combined with after_id"]}
+        assert fetched == []
+    
+    @allure.story("Массовые операции")
+    @allure.title("Тест удаления по тегу во всех шардах")
+    @allure.severity(allure.severity_level.CRITICAL)
+    @allure.tag("positive", "sharding")
+    def test_bulk_delete_by_tag(self, client, shards_dir):
+        """Удаление по тегу затрагивает все шарды и только товары с этим тегом."""
+        
+        removed = create_items(client, 'bulk-delete', 12)
+        kept = create_items(client, 'bulk-keep', 6)
+        assert all(set(removed) & ids for ids in shard_ids(shards_dir))
+        
+        response = client.delete('/api/items/bulk', query_string={'tag': 'bulk-delete'})
+        
+        assert response.get_json() == {'deleted': 12}
+        assert list_items(client, tag='bulk-delete')['total'] == 0
+        assert [item['id'] for item in list_items(client, tag='bulk-keep')['items']] == kept
+        assert not set(removed) & set().union(*shard_ids(shards_dir))
+    
+    @allure.story("ID")
+    @allure.title("Тест непересекающихся блоков ID двух воркеров")
+    @allure.severity(allure.severity_level.CRITICAL)
+    @allure.tag("positive", "sharding")
+    def test_id_allocators_are_disjoint(self, tmp_path):
+        """Два аллокатора на одной последовательности получают разные блоки HiLo и не выдают общих ID."""
+        
+        sharding = import_app_module('database.sharding')
+        engine = create_engine(f"sqlite:///{tmp_path / 'ids.db'}")
+        first = sharding.IdAllocator(engine, 'items', block_size=5)
+        second = sharding.IdAllocator(engine, 'items', block_size=5)
+        first.ensure_sequence(1)
+        second.ensure_sequence(100)  # строка уже создана, начало не меняется
+        
+        first_ids, second_ids = [], []
+        for _ in range(12):
+            first_ids.append(first.next_id())
+            second_ids.append(second.next_id())
+        
+        assert not set(first_ids) & set(second_ids)
+        assert first_ids == list(range(1, 6)) + list(range(11, 16)) + [21, 22]
+        assert second_ids == list(range(6, 11)) + list(range(16, 21)) + [26, 27]
+        engine.dispose()
\ No newline at end of file
@@ -0,0 +1,85 @@
+import json
+import random
+import allure
+import pytest
+from config import config
+from load import SCENARIOS, SoakRunner, analyze, format_summary, format_trends
+
+def synthetic_samples(minutes=60, rss_growth_per_minute=0.0, latency_growth_per_minute=0.0, seed=42):
+    """Замеры раз в минуту с шумом и редкими всплесками (как у реального процесса)."""
+    rng = random.Random(seed)
+    samples = []
+    for minute in range(minutes):
+        spike = 40 if rng.random() < 0.1 else 0
+        samples.append({
+            't': minute * 60.0,
+            'pid': 100,
+            'rss_mb': 70 + rss_growth_per_minute * minute + rng.uniform(-1, 1) + spike,
+            'open_fds': 12 + (1 if rng.random() < 0.2 else 0),
+            'threads': 3,
+            'pool_checked_out': rng.choice([0, 0, 1]),
+            'pool_connections': 3,
+            'client_p50_ms': 10 + latency_growth_per_minute * minute + rng.uniform(-0.5, 0.5),
+            'server_p50_ms': 5 + rng.uniform(-0.2, 0.2)
+        })
+    return samples
+
+def failed_metrics(trends):
+    return {trend['metric'] for trend in trends if trend['failed']}
+
+@allure.epic("REST API Тестирование")
+@allure.feature("Длительные прогоны")
+class TestSoak:
+    
+    @allure.story("Анализ трендов")
+    @allure.title("Тест обнаружения устойчивого роста памяти и дрейфа задержки")
+    @allure.severity(allure.severity_level.NORMAL)
+    @allure.tag("performance", "soak")
+    def test_trend_analysis(self):
+        """Всплески не дают ложного тренда; устойчивый рост памяти и задержки обнаруживается."""
+        
+        stable = analyze(synthetic_samples())
+        assert failed_metrics(stable) == set(), format_trends(stable)
+        
+        # 0.8 MB в минуту - 48 MB в час при пороге 32 MB в час
+        leaking = analyze(synthetic_samples(rss_growth_per_minute=0.8), growth_limits={'rss_mb': 32})
+        assert failed_metrics(leaking) == {'rss_mb'}, format_trends(leaking)
+        
+        # Рост p50 с 10 до ~19 мс за час при пороге дрейфа 50%
+        drifting = analyze(synthetic_samples(latency_growth_per_minute=0.15), max_latency_drift=0.5)
+        assert failed_metrics(drifting) == {'client_p50_ms'}, format_trends(drifting)
+    
+    @allure.story("Утечки и дрейф")
+    @allure.title("Длительная нагрузка без утечек и дрейфа задержки")
+    @allure.severity(allure.severity_level.CRITICAL)
+    @allure.tag("performance", "soak")
+    @pytest.mark.soak
+    @pytest.mark.timeout(config.soak.duration + 600)
+    def test_soak(self):
+        """Память, дескрипторы, соединения пула и задержка не растут устойчиво под нагрузкой."""
+        
+        report = SoakRunner(
+            SCENARIOS[config.soak.scenario],
+            duration=config.soak.duration,
+            interval=config.soak.interval,
+            warmup=config.soak.warmup,
+            workers=config.soak.workers,
+            target_rps=config.soak.target_rps or None,
+            keep_alive=config.api.keep_alive
+        ).run()
+        
+        allure.attach(format_trends(report['trends']), name="Soak trends", attachment_type=allure.attachment_type.TEXT)
+        if report['load']:
+            allure.attach(
+                format_summary(report['load']['summary']),
+                name="Load summary",
+                attachment_type=allure.attachment_type.TEXT
+            )
+        allure.attach(
+            json.dumps(report, indent=2, ensure_ascii=False),
+            name="Soak report",
+            attachment_type=allure.attachment_type.JSON
+        )
+        
+        assert report['trends'], "Not enough samples after warmup to analyze trends"
+        assert not report['failed'], f"Sustained growth: {', '.join(report['failed'])}"
\ No newline at end of file
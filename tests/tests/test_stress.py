@@ -0,0 +1,41 @@
+import json
+import allure
+import pytest
+from config import config
+from load import ContentionRunner, format_summary
+
+@allure.epic("REST API Тестирование")
+@allure.feature("Конкурентные изменения")
+@pytest.mark.stress
+class TestContention:
+    
+    @allure.story("Инварианты")
+    @allure.title("Конкурентные PUT/PATCH/DELETE одного товара")
+    @allure.severity(allure.severity_level.CRITICAL)
+    @allure.tag("performance", "stress")
+    @pytest.mark.timeout(config.stress.rounds * (config.stress.write_duration + config.stress.delete_duration) + 120)
+    def test_concurrent_updates_of_one_item(self):
+        """Нет 5xx и потерянных обновлений, одно успешное удаление и 404 после него."""
+        
+        report = ContentionRunner(
+            workers=config.stress.workers,
+            rounds=config.stress.rounds,
+            write_duration=config.stress.write_duration,
+            delete_duration=config.stress.delete_duration,
+            keep_alive=config.api.keep_alive
+        ).run()
+        
+        allure.attach(
+            format_summary(report['summary']),
+            name="Contention summary",
+            attachment_type=allure.attachment_type.TEXT
+        )
+        allure.attach(
+            json.dumps(report, indent=2, ensure_ascii=False),
+            name="Contention report",
+            attachment_type=allure.attachment_type.JSON
+        )
+        
+        assert report['summary']['total']['requests'] > 0
+        assert not report['violations'], \
+            f"{len(report['violations'])} invariant violations:\n" + '\n'.join(report['violations'][:20])
\ No newline at end of file
@@ -0,0 +1,129 @@
+import allure
+import pytest
+import requests
+from api.items_api import ItemsAPI
+from config import config
+from load import LoadRunner, SCENARIOS
+from stub_server import FaultProfile, StubServer
+from utils.assertions import APIAssertions as Assert
+
+# Клиенты в режиме inprocess не выполняют сетевых запросов
+pytestmark = pytest.mark.skipif(
+    config.api.transport == 'inprocess',
+    reason="Тестам stub-сервера нужен транспорт http (API_TRANSPORT=http)"
+)
+
+@pytest.fixture
+def stub_server():
+    """Заглушка API на свободном порту (профиль отказов меняется в тесте)."""
+    with StubServer(faults=FaultProfile(seed=42)) as server:
+        yield server
+
+@allure.epic("REST API Тестирование")
+@allure.feature("Клиент API на заглушке")
+class TestClientOnStubServer:
+    
+    @allure.story("Контракт")
+    @allure.title("Тест контракта заглушки")
+    @allure.severity(allure.severity_level.NORMAL)
+    @allure.tag("positive", "stub")
+    def test_stub_contract(self, stub_server):
+        """Клиент работает с заглушкой так же, как с приложением."""
+        
+        client = ItemsAPI(base_url=stub_server.api_url, tag="stub")
+        
+        created = client.create_item(name="Stub item", price=10.0).json()
+        Assert.assert_json_schema(client.get_item(created['id']), config.response_schemas["item"])
+        
+        listed = client.get_all_items(tag="stub")
+        Assert.assert_json_schema(listed, config.response_schemas["items_list"])
+        assert [item['id'] for item in listed.json()['items']] == [created['id']]
+        
+        invalid = client.create_item(name="", price=-1, expected_status=400).json()
+        assert set(invalid['errors']) == {'name', 'price'}
+        
+        client.delete_item(created['id'])
+        client.get_item(created['id'], expected_status=404)
+        client.close()
+    
+    @allure.story("Отказы сервера")
+    @allure.title("Тест повтора запроса после ошибки сервера")
+    @allure.severity(allure.severity_level.NORMAL)
+    @allure.tag("negative", "stub", "retry")
+    def test_client_retries_server_error(self, stub_server):
+        """Ответ 503 повторяется клиентом; тест получает успешный ответ."""
+        
+        client = ItemsAPI(base_url=stub_server.api_url, max_retries=3)
+        stub_server.faults.fail_next(1)
+        
+        client.get_all_items()
+        
+        assert stub_server.stats()['503'] == 1
+        assert stub_server.stats()['200'] == 1
+        client.close()
+    
+    @allure.story("Отказы сервера")
+    @allure.title("Тест ответа с ошибкой без повторов")
+    @allure.severity(allure.severity_level.NORMAL)
+    @allure.tag("negative", "stub", "retry")
+    def test_client_without_retries_returns_error(self, stub_server):
+        """Без повторов ответ с ошибкой возвращается тесту как есть."""
+        
+        client = ItemsAPI(base_url=stub_server.api_url, max_retries=0)
+        stub_server.faults.fail_next(1, status=500)
+        
+        client.get_all_items(expected_status=500)
+        
+        assert stub_server.stats()['requests'] == 1
+        client.close()
+    
+    @allure.story("Отказы сервера")
+    @allure.title("Тест таймаута на медленном сервере")
+    @allure.severity(allure.severity_level.NORMAL)
+    @allure.tag("negative", "stub", "timeout")
+    def test_client_timeout_on_slow_server(self, stub_server):
+        """Ответ дольше таймаута клиента завершается исключением Timeout."""
+        
+        client = ItemsAPI(base_url=stub_server.api_url, max_retries=0)
+        client.timeout = 0.2
+        stub_server.faults.latency = FaultProfile(latency="fixed:500").latency
+        
+        with pytest.raises(requests.exceptions.Timeout):
+            client.get_all_items()
+        client.close()
+    
+    @allure.story("Отказы сервера")
+    @allure.title("Тест сброса соединения")
+    @allure.severity(allure.severity_level.MINOR)
+    @allure.tag("negative", "stub")
+    def test_client_connection_reset(self, stub_server):
+        """Закрытие соединения без ответа приводит к ConnectionError."""
+        
+        client = ItemsAPI(base_url=stub_server.api_url, max_retries=0)
+        stub_server.faults.reset_rate = 1.0
+        
+        with pytest.raises(requests.exceptions.ConnectionError):
+            client.get_all_items()
+        client.close()
+    
+    @allure.story("Нагрузка")
+    @allure.title("Тест учета ошибок генератором нагрузки")
+    @allure.severity(allure.severity_level.NORMAL)
+    @allure.tag("negative", "stub", "load")
+    def test_load_runner_counts_errors(self, stub_server):
+        """Доля ошибок в отчете нагрузки соответствует доле ошибок сервера."""
+        
+        stub_server.faults.error_rate = 0.2
+        
+        report = LoadRunner(
+            SCENARIOS['read_only'],
+            workers=2,
+            duration=1.0,
+            base_url=stub_server.api_url,
+            keep_alive=True,
+            seed=42
+        ).run()
+        
+        total = report['summary']['total']
+        assert total['requests'] > 50
+        assert 0.1 < total['error_rate'] < 0.3, f"Unexpected error rate {total['error_rate']:.2%}"
\ No newline at end of file
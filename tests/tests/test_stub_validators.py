@@ -0,0 +1,107 @@
+import allure
+import pytest
+from api.transport import import_app_module
+from fuzz import CaseGenerator
+from stub_server.store import (
+    DESCRIPTION_MAX_LENGTH,
+    MAX_PER_PAGE,
+    MAX_SQL_INTEGER,
+    NAME_MAX_LENGTH,
+    TAG_MAX_LENGTH,
+    ValidationFailed,
+    validate_bulk,
+    validate_bulk_delete,
+    validate_item,
+    validate_query
+)
+
+# Схемы приложения загружаются в текущем процессе (app/requirements.app.txt)
+pytest.importorskip("flask")
+from marshmallow import ValidationError  # noqa: E402
+
+# Граница в каждом ограничении заглушки: последнее допустимое и первое недопустимое значение
+ITEMS = [
+    {'name': 'x' * length, 'price': 1} for length in (0, 1, NAME_MAX_LENGTH, NAME_MAX_LENGTH + 1)
+] + [
+    {'name': 'Item', 'price': price} for price in (-0.01, 0, '1e3', 'nan', None, True)
+] + [
+    {'name': 'Item', 'price': 1, 'description': 'x' * length} for length in (0, DESCRIPTION_MAX_LENGTH, DESCRIPTION_MAX_LENGTH + 1)
+] + [
+    {'name': 'Item', 'price': 1, 'tag': tag} for tag in ('', 'x', 'x' * TAG_MAX_LENGTH, 'x' * (TAG_MAX_LENGTH + 1), None)
+] + [
+    {'name': 'Item', 'price': 1, 'in_stock': value} for value in ('yes', 'maybe', 1, None)
+] + [
+    {}, {'price': 1}, {'name': 'Item', 'price': 1, 'id': 5}, [], None
+]
+
+QUERIES = [
+    {'page': str(page)} for page in (0, 1, MAX_SQL_INTEGER // MAX_PER_PAGE, MAX_SQL_INTEGER // MAX_PER_PAGE + 1)
+] + [
+    {'per_page': str(per_page)} for per_page in (0, 1, MAX_PER_PAGE, MAX_PER_PAGE + 1)
+] + [
+    {'after_id': str(after_id)} for after_id in (-1, 0, MAX_SQL_INTEGER, MAX_SQL_INTEGER + 1)
+] + [
+    {'tag': 'x' * length} for length in (0, 1, TAG_MAX_LENGTH, TAG_MAX_LENGTH + 1)
+] + [
+    {'min_price': '-1'}, {'max_price': '0'}, {'in_stock': 'no'}, {'page': '2', 'after_id': '5'}, {'sort': 'id'}
+]
+
+BULKS = [
+    {'items': items} for items in ([], [{'name': 'Item', 'price': 1}], [{'name': '', 'price': 1}], 'x', 1, None)
+] + [
+    {'items': [{'name': 'Item', 'price': 1}], 'tag': tag} for tag in ('', 'x' * TAG_MAX_LENGTH, 'x' * (TAG_MAX_LENGTH + 1), None)
+] + [
+    {}, {'items': [{'name': 'Item', 'price': 1}], 'count': 1}, []
+]
+
+DELETES = [{'tag': 'x' * length} for length in (0, 1, TAG_MAX_LENGTH, TAG_MAX_LENGTH + 1)] + [{}, {'tag': 'x', 'all': '1'}]
+
+# Случаев генератора fuzz на каждый вид данных
+GENERATED_CASES = 300
+
+def stub_errors(validate, data):
+    """Ошибки валидаторов заглушки ({} - данные приняты)."""
+    try:
+        validate(data)
+    except ValidationFailed as e:
+        return e.messages
+    return {}
+
+def app_errors(schema, data):
+    """Ошибки схемы приложения ({} - данные приняты)."""
+    try:
+        schema.load(data)
+    except ValidationError as e:
+        return e.messages
+    return {}
+
+@pytest.fixture(scope="module")
+def schemas():
+    return import_app_module('schemas.item_schema')
+
+@allure.epic("REST API Тестирование")
+@allure.feature("Заглушка API")
+class TestStubValidators:
+    
+    @allure.story("Контракт")
+    @allure.title("Тест совпадения валидаторов заглушки со схемами приложения")
+    @allure.severity(allure.severity_level.CRITICAL)
+    @allure.tag("negative", "stub", "validation")
+    def test_validators_match_app_schemas(self, schemas):
+        """Граничные и сгенерированные данные принимаются и отклоняются одинаково, с теми же ошибками."""
+        
+        generator = CaseGenerator(44)
+        checks = [
+            (validate_item, schemas.ItemSchema(), ITEMS + [generator.item() for _ in range(GENERATED_CASES)]),
+            (lambda data: validate_item(data, partial=True), schemas.ItemSchema(partial=True),
+             ITEMS + [generator.item(partial=True) for _ in range(GENERATED_CASES)]),
+            (validate_query, schemas.ItemQuerySchema(), QUERIES + [generator.query() for _ in range(GENERATED_CASES)]),
+            (validate_bulk, schemas.ItemBulkSchema(), BULKS + [generator.bulk() for _ in range(GENERATED_CASES)]),
+            (validate_bulk_delete, schemas.ItemBulkDeleteSchema(), DELETES + [generator.delete_query() for _ in range(GENERATED_CASES)])
+        ]
+        
+        for validate, schema, cases in checks:
+            for data in cases:
+                assert stub_errors(validate, data) == app_errors(schema, data), (
+                    f"{type(schema).__name__}(partial={schema.partial}): {data!r}"
+                )
\ No newline at end of file
@@ -0,0 +1,158 @@
+import json
+import allure
+import pytest
+from api.transport import create_in_process_app
+from config import config
+from utils.latency import LatencySample
+from utils.tracing import (
+    REQUEST_ID_HEADER,
+    RequestTrace,
+    Span,
+    TraceSinkIndex,
+    format_waterfall,
+    parse_server_timing,
+    request_trace,
+    server_spans,
+    waterfall_rows
+)
+
+@allure.epic("REST API Тестирование")
+@allure.feature("Трассировка запросов")
+class TestTracing:
+    
+    @allure.story("Водопад времени")
+    @allure.title("Тест разбора Server-Timing и построения водопада")
+    @allure.severity(allure.severity_level.NORMAL)
+    @allure.tag("tracing")
+    def test_waterfall_places_server_spans(self):
+        """Спаны сервера помещаются внутрь ожидания первого байта со сдвигом на половину сетевого времени."""
+        
+        spans = parse_server_timing(
+            'validate;dur=0.5;start=0.1, db;dur=2;start=0.7, serialize;dur=0.25;start=3, '
+            'cache;desc="hit", broken;dur=x, total;dur=4'
+        )
+        assert spans == [
+            Span('validate', 0.1, 0.5),
+            Span('db', 0.7, 2.0),
+            Span('serialize', 3.0, 0.25),
+            Span('total', None, 4.0)
+        ]
+        
+        # connect 1 мс, TTFB 7 мс: на сеть и очереди остается 2 мс, по 1 мс до и после сервера
+        sample = LatencySample(0, 0.0, 'POST', '/items', 201, 0.001, 0.007, 0.008)
+        trace = RequestTrace('abc', sample, '')
+        rows = {name.strip(): (round(start, 6), round(duration, 6)) for name, start, duration in waterfall_rows(trace, spans)}
+        
+        assert rows['connect'] == (0.0, 1.0)
+        assert rows['server'] == (2.0, 4.0)
+        assert rows['validate'] == (2.1, 0.5)
+        assert rows['db'] == (2.7, 2.0)
+        assert rows['body'] == (7.0, 1.0)
+        
+        text = format_waterfall(trace, spans)
+        assert text.splitlines()[0] == f"POST /items 201  {REQUEST_ID_HEADER}: abc"
+        assert all(name in text for name in ('validate', 'db', 'serialize', 'ttfb', 'total'))
+    
+    @allure.story("Файл трасс")
+    @allure.title("Тест чтения спанов из локального файла трасс")
+    @allure.severity(allure.severity_level.NORMAL)
+    @allure.tag("tracing")
+    def test_spans_from_trace_sink(self, tmp_path):
+        """Без Server-Timing спаны берутся из файла TRACE_SINK_FILE приложения по X-Request-ID."""
+        
+        sink = tmp_path / "traces.jsonl"
+        records = [
+            {'request_id': request_id, 'method': 'GET', 'path': '/api/items', 'status': 200,
+             'start': 0.0, 'duration_ms': duration, 'spans': [{'name': 'db', 'start_ms': 0.2, 'duration_ms': 1.5}]}
+            for request_id, duration in (('other', 9.0), ('wanted', 3.0))
+        ]
+        sink.write_text(''.join(json.dumps(record) + '\n' for record in records), encoding='utf-8')
+        
+        spans = server_spans(RequestTrace('wanted', None, ''), str(sink))
+        assert spans == [Span('db', 0.2, 1.5), Span('total', None, 3.0)]
+        assert server_spans(RequestTrace('missing', None, ''), str(sink)) == []
+    
+    @allure.story("Файл трасс")
+    @allure.title("Тест дочитывания файла трасс с прошлой позиции")
+    @allure.severity(allure.severity_level.NORMAL)
+    @allure.tag("tracing")
+    def test_trace_sink_index_reads_appended_lines(self, tmp_path):
+        """Поиск читает только дописанные строки; недописанная строка ждет конца, укороченный файл индексируется заново."""
+        
+        sink = tmp_path / "traces.jsonl"
+        index = TraceSinkIndex(str(sink))
+        assert index.get('first') is None
+        
+        def line(request_id, duration):
+            return json.dumps({'request_id': request_id, 'duration_ms': duration}) + '\n'
+        
+        sink.write_text(line('first', 1.0) + line('second', 2.0), encoding='utf-8')
+        assert index.get('first')['duration_ms'] == 1.0
+        assert index.offset == sink.stat().st_size
+        
+        with sink.open('a', encoding='utf-8') as file:
+            file.write(line('first', 3.0) + line('third', 4.0)[:10])
+        assert index.get('first')['duration_ms'] == 3.0
+        assert index.get('third') is None
+        
+        with sink.open('a', encoding='utf-8') as file:
+            file.write(line('third', 4.0)[10:])
+        assert index.get('third')['duration_ms'] == 4.0
+        assert index.offset == sink.stat().st_size
+        
+        sink.write_text(line('fourth', 5.0), encoding='utf-8')
+        assert index.get('fourth')['duration_ms'] == 5.0
+        assert index.get('first') is None
+    
+    @allure.story("Файл трасс")
+    @allure.title("Тест записи трасс приложением в файл")
+    @allure.severity(allure.severity_level.NORMAL)
+    @allure.tag("tracing")
+    def test_app_writes_trace_sink(self, tmp_path):
+        """Приложение дописывает по строке на запрос в открытый файл, записи видны сразу после ответа."""
+        
+        pytest.importorskip("flask")
+        sink = tmp_path / "traces.jsonl"
+        app = create_in_process_app(
+            f"sqlite:///{tmp_path / 'items.db'}",
+            TRACING_ENABLED=True,
+            TRACE_SERVER_TIMING=False,
+            TRACE_SINK_FILE=str(sink)
+        )
+        client = app.test_client()
+        
+        request_ids = [f"sink-{index}" for index in range(3)]
+        for request_id in request_ids:
+            response = client.post('/api/items', json={'name': 'Traced', 'price': 1.0},
+                                   headers={REQUEST_ID_HEADER: request_id})
+            assert 'Server-Timing' not in response.headers
+            spans = server_spans(RequestTrace(request_id, None, ''), str(sink))
+            assert {'validate', 'db', 'serialize', 'total'} <= {span.name for span in spans}
+        
+        # Служебные пути в файл не пишутся
+        client.get('/health')
+        records = [json.loads(line) for line in sink.read_text(encoding='utf-8').splitlines()]
+        assert [record['request_id'] for record in records] == request_ids
+    
+    @allure.story("Корреляция с сервером")
+    @allure.title("Тест X-Request-ID и спанов сервера в ответе")
+    @allure.severity(allure.severity_level.CRITICAL)
+    @allure.tag("tracing", "positive")
+    @pytest.mark.skipif(not config.api.tracing, reason="API_TRACING is disabled")
+    def test_server_spans_for_request(self, api_client, random_item_data):
+        """Сервер возвращает идентификатор запроса клиента и спаны validate, db, serialize."""
+        
+        response = api_client.create_item(**random_item_data)
+        
+        sent = response.request.headers[REQUEST_ID_HEADER]
+        assert response.headers.get(REQUEST_ID_HEADER) == sent
+        
+        trace = request_trace(response)
+        spans = server_spans(trace, config.api.trace_sink_file)
+        if not spans:
+            pytest.skip("Server spans are not available (Server-Timing disabled and no API_TRACE_SINK_FILE)")
+        
+        names = [span.name for span in spans]
+        assert {'validate', 'db', 'serialize', 'total'} <= set(names)
+        total = spans[names.index('total')].duration_ms
+        assert all(span.start_ms + span.duration_ms <= total + 0.01 for span in spans if span.name != 'total')
\ No newline at end of file
@@ -0,0 +1,55 @@
+import allure
+import pytest
+import requests
+from api.transport import InProcessAdapter, in_process_app, rollback_transaction
+
+# Режим inprocess требует зависимостей приложения (app/requirements.app.txt)
+pytest.importorskip("flask")
+
+BASE_URL = "http://inprocess/api"
+
+@pytest.fixture(scope="module")
+def inprocess_session():
+    """Сессия requests, выполняющая запросы приложением в текущем процессе."""
+    session = requests.Session()
+    session.mount("http://", InProcessAdapter(in_process_app()))
+    yield session
+    session.close()
+
+@allure.epic("REST API Тестирование")
+@allure.feature("Транспорт inprocess")
+class TestInProcessTransport:
+    
+    @allure.story("Контракт")
+    @allure.title("Тест ответа приложения через Flask test client")
+    @allure.severity(allure.severity_level.NORMAL)
+    @allure.tag("positive", "transport")
+    def test_response_contract(self, inprocess_session):
+        """Ответ содержит статус, заголовки, JSON и время выполнения, как при HTTP."""
+        
+        response = inprocess_session.get(f"{BASE_URL}/items", params={"per_page": 1})
+        
+        assert response.status_code == 200
+        assert response.headers['Content-Type'].startswith('application/json')
+        assert response.json()['per_page'] == 1
+        assert response.elapsed.total_seconds() >= 0
+        
+        missing = inprocess_session.get(f"{BASE_URL}/items/999999999")
+        assert missing.status_code == 404
+        assert missing.reason == 'NOT FOUND'
+    
+    @allure.story("Изоляция данных")
+    @allure.title("Тест отката изменений после блока rollback_transaction")
+    @allure.severity(allure.severity_level.CRITICAL)
+    @allure.tag("positive", "transport")
+    def test_rollback_discards_changes(self, inprocess_session):
+        """Созданный внутри транзакции товар виден до отката и исчезает после."""
+        
+        with rollback_transaction(in_process_app()):
+            response = inprocess_session.post(f"{BASE_URL}/items", json={"name": "Rollback Item", "price": 1.0})
+            assert response.status_code == 201
+            item_id = response.json()['id']
+            
+            assert inprocess_session.get(f"{BASE_URL}/items/{item_id}").status_code == 200
+        
+        assert inprocess_session.get(f"{BASE_URL}/items/{item_id}").status_code == 404
\ No newline at end of file
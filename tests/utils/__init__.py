@@ -4,12 +4,55 @@ from .helpers import (
     wait_for_condition,
     extract_value_from_json
 )
-from .assertions import APIAssertions
+from .assertions import APIAssertions, attach_latency
+from .latency import LatencyCollector, LatencySample, latency_collector
+from .schemas import CompiledSchema, SchemaValidatorCache, schema_validators
+from .tracing import (
+    REQUEST_ID_HEADER,
+    RequestTrace,
+    Span,
+    TraceSinkIndex,
+    format_waterfall,
+    parse_server_timing,
+    read_trace_sink
+)
+from .polling import (
+    Backoff,
+    Deadline,
+    WaitTimeout,
+    poll,
+    poll_async,
+    wait_until,
+    wait_until_async,
+    wait_log
+)
 
 __all__ = [
     'validate_json_schema',
     'compare_json_objects',
     'wait_for_condition',
     'extract_value_from_json',
-    'APIAssertions'
+    'APIAssertions',
+    'attach_latency',
+    'LatencyCollector',
+    'LatencySample',
+    'latency_collector',
+    'CompiledSchema',
+    'SchemaValidatorCache',
+    'schema_validators',
+    'REQUEST_ID_HEADER',
+    'RequestTrace',
+    'Span',
+    'TraceSinkIndex',
+    'format_waterfall',
+    'parse_server_timing',
+    'read_trace_sink',
+    'Backoff',
+    'Deadline',
+    'WaitTimeout',
+    'poll',
+    'poll_async',
+    'wait_until',
+    'wait_until_async',
+    'wait_log'
 ]
\ No newline at end of file
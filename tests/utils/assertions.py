@@ -1,6 +1,26 @@
 import allure
+import json
 from typing import Any, List, Optional
 from .helpers import validate_json_schema, compare_json_objects
+from .latency import as_samples, percentile, summarize, throughput, to_csv, to_svg
+
+def attach_latency(samples, name: str = "Latency", threshold_ms: Optional[float] = None):
+    """Вложение замеров задержки в Allure: график, CSV и сводка перцентилей."""
+    allure.attach(
+        to_svg(samples, threshold_ms),
+        name=f"{name} chart",
+        attachment_type=allure.attachment_type.SVG
+    )
+    allure.attach(
+        to_csv(samples),
+        name=f"{name} samples",
+        attachment_type=allure.attachment_type.CSV
+    )
+    allure.attach(
+        json.dumps(summarize(samples), indent=2),
+        name=f"{name} summary",
+        attachment_type=allure.attachment_type.JSON
+    )
 
 class APIAssertions:
     """Класс с кастомными assertions для API тестирования."""
@@ -45,7 +65,45 @@ class APIAssertions:
     
     @staticmethod
     def assert_json_contains(expected: dict, actual: dict, exclude: List[str] = None):
-        """Проверка, что JSON содержит ожидаемые поля."""
+        """Проверка, что JSON содержит ожидаемые поля (списки товаров сопоставляются по id)."""
         with allure.step("Проверка содержимого JSON"):
-            diff = compare_json_objects(expected, actual, exclude)
-            assert not diff, f"JSON mismatch: {diff}"
\ No newline at end of file
+            diff = compare_json_objects(expected, actual, exclude, key='id')
+            assert not diff, f"JSON mismatch: {diff}"
+    
+    @staticmethod
+    def _assert_percentile_below(source, p: float, max_ms: float, warmup: int, metric: str, min_samples: int):
+        with allure.step(f"Проверка p{p:g} ({metric}): < {max_ms}ms"):
+            samples = as_samples(source, warmup)
+            attach_latency(samples, f"Latency p{p:g}", max_ms)
+            
+            assert len(samples) >= min_samples, \
+                f"Not enough samples for p{p:g}: {len(samples)} < {min_samples}"
+            value_ms = percentile(sorted(getattr(sample, metric) for sample in samples), p) * 1000
+            assert value_ms < max_ms, \
+                f"p{p:g} {metric} latency {value_ms:.2f}ms exceeds {max_ms}ms ({len(samples)} samples)"
+    
+    @staticmethod
+    def assert_p95_below(source, max_ms: float, warmup: int = 0, metric: str = 'total', min_samples: int = 20):
+        """
+        Проверка 95-го перцентиля задержки по выборке запросов.
+        
+        source - окно latency_collector.window() или список замеров;
+        первые warmup запросов отбрасываются как прогрев.
+        """
+        APIAssertions._assert_percentile_below(source, 95, max_ms, warmup, metric, min_samples)
+    
+    @staticmethod
+    def assert_p99_below(source, max_ms: float, warmup: int = 0, metric: str = 'total', min_samples: int = 100):
+        """Проверка 99-го перцентиля задержки (нужно не меньше min_samples замеров)."""
+        APIAssertions._assert_percentile_below(source, 99, max_ms, warmup, metric, min_samples)
+    
+    @staticmethod
+    def assert_throughput_above(source, min_rps: float, warmup: int = 0):
+        """Проверка пропускной способности (запросов в секунду) по выборке."""
+        with allure.step(f"Проверка пропускной способности: > {min_rps} RPS"):
+            samples = as_samples(source, warmup)
+            attach_latency(samples, "Throughput")
+            
+            rps = throughput(samples)
+            assert rps > min_rps, \
+                f"Throughput {rps:.2f} RPS is below {min_rps} RPS ({len(samples)} samples)"
\ No newline at end of file
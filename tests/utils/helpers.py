@@ -1,36 +1,182 @@
 import json
-import time
-from typing import Any, Dict, List
+import re
+from typing import Any, Dict, List, Optional
 from deepdiff import DeepDiff
-import jsonschema
-from jsonschema import validate
+from deepdiff.helper import add_root_to_paths
+from .polling import Backoff, poll
+from .schemas import schema_validators
 
 def validate_json_schema(instance: Dict, schema: Dict) -> bool:
     """
-    Валидация JSON по схеме.
+    Валидация JSON по схеме (подготовленные валидаторы из кэша).
     """
-    try:
-        validate(instance=instance, schema=schema)
-        return True
-    except jsonschema.ValidationError as e:
-        raise AssertionError(f"JSON schema validation failed: {e.message}")
+    schema_validators.validate(instance, schema)
+    return True
+
+def _json_equal(expected: Any, actual: Any) -> bool:
+    """Точное равенство JSON значений: в отличие от ==, True != 1 и 1 != 1.0 (как в DeepDiff)."""
+    if type(expected) is not type(actual):
+        return False
+    if type(expected) is dict:
+        return expected.keys() == actual.keys() and all(
+            _json_equal(value, actual[name]) for name, value in expected.items()
+        )
+    if type(expected) is list:
+        return len(expected) == len(actual) and all(map(_json_equal, expected, actual))
+    return expected == actual
+
+def _index_by_key(values: List, key: str) -> Optional[Dict]:
+    """Элементы списка по значению key или None, если список нельзя сопоставить по ключу."""
+    index = {}
+    for value in values:
+        if type(value) is not dict or key not in value or value[key] in index:
+            return None
+        index[value[key]] = value
+    return index
+
+class _ExcludedPaths:
+    """
+    Исключаемые пути сравнения: точные (root['items'][id=5]['price']) и шаблоны,
+    где [*] - любой элемент списка (root['items'][*]['created_at']).
+    """
+    
+    def __init__(self, paths: Optional[List[str]]):
+        paths = list(add_root_to_paths(paths) or ())
+        self.exact = {path for path in paths if '[*]' not in path}
+        self.patterns = [
+            re.compile(re.escape(path).replace(r'\[\*\]', r'\[[^\[\]]+\]'))
+            for path in paths if '[*]' in path
+        ]
+    
+    def __contains__(self, path: str) -> bool:
+        return path in self.exact or any(pattern.fullmatch(path) for pattern in self.patterns)
+    
+    def regex_paths(self) -> List[str]:
+        """Шаблоны для exclude_regex_paths DeepDiff."""
+        return [f"^{pattern.pattern}$" for pattern in self.patterns]
+    
+    def for_element(self, list_path: str, index: int, item_path: str) -> '_ExcludedPaths':
+        """Исключения элемента списка: пути по индексу (list_path[index]...) переводятся в путь по ключу."""
+        prefix = f"{list_path}[{index}]"
+        translated = {
+            item_path + path[len(prefix):] for path in self.exact
+            if path.startswith(prefix) and path[len(prefix):len(prefix) + 1] in ('', '[')
+        }
+        if not translated:
+            return self
+        element = _ExcludedPaths(None)
+        element.exact = self.exact | translated
+        element.patterns = self.patterns
+        return element
+
+def _merge_deepdiff(report: Dict, diff: DeepDiff, path: str):
+    """Добавление результата DeepDiff поддерева (пути от root) в отчет с путями от path."""
+    for report_type, changes in diff.items():
+        target = report.setdefault(report_type, {} if isinstance(changes, dict) else [])
+        if isinstance(changes, dict):
+            target.update({path + change[4:]: detail for change, detail in changes.items()})
+        else:
+            target.extend(path + change[4:] for change in changes)
+
+def _keyed_diff(expected: Any, actual: Any, path: str, key: str, excluded: _ExcludedPaths, report: Dict):
+    if path in excluded:
+        return
+    
+    if type(expected) is dict and type(actual) is dict:
+        for name in expected.keys() - actual.keys():
+            if f"{path}[{name!r}]" not in excluded:
+                report.setdefault('dictionary_item_removed', []).append(f"{path}[{name!r}]")
+        for name in actual.keys() - expected.keys():
+            if f"{path}[{name!r}]" not in excluded:
+                report.setdefault('dictionary_item_added', []).append(f"{path}[{name!r}]")
+        for name, value in expected.items():
+            if name in actual:
+                _keyed_diff(value, actual[name], f"{path}[{name!r}]", key, excluded, report)
+        return
+    
+    if type(expected) is list and type(actual) is list:
+        expected_index, actual_index = _index_by_key(expected, key), _index_by_key(actual, key)
+        if expected_index is None or actual_index is None:
+            # Списки без ключа (или с повторами ключа) - как в обычном режиме (без учета порядка);
+            # пути поддерева DeepDiff (от root) проверяются как полные пути от path
+            _merge_deepdiff(report, DeepDiff(
+                expected,
+                actual,
+                exclude_obj_callback=lambda obj, subpath: path + subpath[4:] in excluded,
+                ignore_order=True,
+                report_repetition=True
+            ), path)
+            return
+        for position, (value, item) in enumerate(expected_index.items()):
+            if value in actual_index and _json_equal(item, actual_index[value]):
+                continue
+            item_path = f"{path}[{key}={value!r}]"
+            item_excluded = excluded.for_element(path, position, item_path)
+            if value not in actual_index:
+                if item_path not in item_excluded:
+                    report.setdefault('iterable_item_removed', {})[item_path] = item
+            else:
+                _keyed_diff(item, actual_index[value], item_path, key, item_excluded, report)
+        for value, item in actual_index.items():
+            item_path = f"{path}[{key}={value!r}]"
+            if value not in expected_index and item_path not in excluded:
+                report.setdefault('iterable_item_added', {})[item_path] = item
+        return
+    
+    if type(expected) is not type(actual):
+        report.setdefault('type_changes', {})[path] = {
+            'old_type': type(expected),
+            'new_type': type(actual),
+            'old_value': expected,
+            'new_value': actual
+        }
+    elif expected != actual:
+        report.setdefault('values_changed', {})[path] = {'new_value': actual, 'old_value': expected}
 
 def compare_json_objects(
     expected: Dict,
     actual: Dict,
-    exclude_paths: List[str] = None
+    exclude_paths: List[str] = None,
+    key: Optional[str] = None
 ) -> Dict:
     """
     Сравнение двух JSON объектов с игнорированием определенных путей.
+    
+    Равные объекты сразу дают пустой результат, без построения diff.
+    С key списки словарей с уникальным полем key (например, товары по 'id')
+    сопоставляются по нему, и для каждого измененного элемента сравниваются
+    только его поля. Это линейно, тогда как DeepDiff с ignore_order
+    квадратичен по длине списка. Остальные списки (в том числе с повторами
+    key) сравниваются DeepDiff без учета порядка; формат результата тот же.
+    
+    Пути в результате с key: элемент списка - root['items'][id=5],
+    его поле - root['items'][id=5]['price']; без key - пути DeepDiff
+    (root['items'][0]['price']).
+    
+    exclude_paths в обоих режимах:
+      - точный путь: root['items'][id=5]['price'] или по индексу
+        root['items'][0]['price'] (индекс - позиция в expected, с key
+        переводится в путь элемента по ключу);
+      - шаблон с [*] - любой элемент списка: root['items'][*]['created_at']
+        исключает created_at каждого товара.
     """
-    diff = DeepDiff(
-        expected,
-        actual,
-        exclude_paths=exclude_paths,
-        ignore_order=True,
-        report_repetition=True
-    )
-    return diff
+    if _json_equal(expected, actual):
+        return {}
+    
+    excluded = _ExcludedPaths(exclude_paths)
+    if key is None:
+        return DeepDiff(
+            expected,
+            actual,
+            exclude_paths=excluded.exact or None,
+            exclude_regex_paths=excluded.regex_paths() or None,
+            ignore_order=True,
+            report_repetition=True
+        )
+    
+    report = {}
+    _keyed_diff(expected, actual, 'root', key, excluded, report)
+    return report
 
 def wait_for_condition(
     condition_func,
@@ -41,13 +187,16 @@ def wait_for_condition(
 ) -> bool:
     """
     Ожидание выполнения условия.
+    
+    Проверки начинаются часто, пауза растет до interval (utils.polling.poll).
     """
-    start_time = time.time()
-    while time.time() - start_time < timeout:
-        if condition_func(*args, **kwargs):
-            return True
-        time.sleep(interval)
-    return False
+    result, _ = poll(
+        lambda: condition_func(*args, **kwargs),
+        timeout,
+        getattr(condition_func, '__name__', 'condition'),
+        backoff=Backoff(initial=min(0.05, interval), maximum=interval)
+    )
+    return result.ok
 
 def extract_value_from_json(json_obj: Dict, path: str) -> Any:
     """
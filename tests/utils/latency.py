@@ -0,0 +1,256 @@
+import csv
+import io
+import itertools
+import math
+import threading
+import time
+from collections import deque
+from typing import Iterable, List, NamedTuple, Optional, Sequence, Union
+
+# Метрики задержки одного запроса
+METRICS = ('connect', 'ttfb', 'total')
+
+
+class LatencySample(NamedTuple):
+    """
+    Задержки одного запроса (в секундах).
+    
+    connect - установка TCP соединения (0.0, если соединение взято из пула)
+    ttfb    - от отправки запроса до получения заголовков ответа (включая connect)
+    total   - полное время запроса, включая чтение тела ответа
+    """
+    seq: int
+    started: float
+    method: str
+    endpoint: str
+    status: Union[int, str]
+    connect: float
+    ttfb: float
+    total: float
+
+
+def percentile_rank(count: int, p: float) -> int:
+    """Ранг (с 1) перцентиля p (0-100) среди count значений: ceil(p * count), ближайший ранг."""
+    return min(max(int(math.ceil(p / 100 * count)), 1), count)
+
+
+def percentile(sorted_values: Sequence[float], p: float) -> Optional[float]:
+    """Перцентиль p (0-100) отсортированного списка методом ближайшего ранга."""
+    if not sorted_values:
+        return None
+    return sorted_values[percentile_rank(len(sorted_values), p) - 1]
+
+
+class LatencyWindow:
+    """Выборка запросов, выполненных между открытием и закрытием окна."""
+    
+    def __init__(self, collector: 'LatencyCollector'):
+        self.collector = collector
+        self.start_seq = collector.next_seq()
+        self.end_seq: Optional[int] = None
+    
+    def close(self):
+        self.end_seq = self.collector.next_seq()
+    
+    @property
+    def samples(self) -> List[LatencySample]:
+        return self.collector.samples(self.start_seq, self.end_seq)
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+
+class LatencyCollector:
+    """
+    Сбор задержек всех запросов BaseAPI и AsyncBaseAPI.
+    
+    Хранит последние max_samples замеров; выборки берутся окнами:
+    
+        with latency_collector.window() as window:
+            ...
+        Assert.assert_p95_below(window, 200, warmup=5)
+    """
+    
+    def __init__(self, max_samples: int = 100000):
+        self._samples = deque(maxlen=max_samples)
+        self._seq = itertools.count()
+        self._last_seq = -1
+        self._lock = threading.Lock()
+        self._local = threading.local()
+    
+    def next_seq(self) -> int:
+        """Номер, который получит следующий замер."""
+        return self._last_seq + 1
+    
+    def record(
+        self,
+        method: str,
+        endpoint: str,
+        status: Union[int, str],
+        started: float,
+        connect: float,
+        ttfb: float,
+        total: float
+    ) -> LatencySample:
+        with self._lock:
+            seq = self._last_seq = next(self._seq)
+            sample = LatencySample(seq, started, method, endpoint, status, connect, ttfb, total)
+            self._samples.append(sample)
+        self._local.last = sample
+        return sample
+    
+    def last_sample(self) -> Optional[LatencySample]:
+        """Последний замер текущего потока."""
+        return getattr(self._local, 'last', None)
+    
+    def samples(self, start_seq: int = 0, end_seq: Optional[int] = None) -> List[LatencySample]:
+        with self._lock:
+            return [
+                sample for sample in self._samples
+                if sample.seq >= start_seq and (end_seq is None or sample.seq < end_seq)
+            ]
+    
+    def window(self) -> LatencyWindow:
+        return LatencyWindow(self)
+    
+    def reset(self):
+        with self._lock:
+            self._samples.clear()
+
+
+def as_samples(source: Union[LatencyWindow, Iterable[LatencySample]], warmup: int = 0) -> List[LatencySample]:
+    """Замеры окна или списка без первых warmup запросов (прогрев)."""
+    samples = source.samples if isinstance(source, LatencyWindow) else list(source)
+    return samples[warmup:]
+
+
+def throughput(samples: Sequence[LatencySample]) -> float:
+    """Запросов в секунду от начала первого до окончания последнего запроса."""
+    if not samples:
+        return 0.0
+    started = min(sample.started for sample in samples)
+    finished = max(sample.started + sample.total for sample in samples)
+    return len(samples) / max(finished - started, 1e-9)
+
+
+def summarize(samples: Sequence[LatencySample]) -> dict:
+    """Перцентили (мс) по каждой метрике и пропускная способность."""
+    result = {'count': len(samples), 'throughput_rps': round(throughput(samples), 2)}
+    for metric in METRICS:
+        values = sorted(getattr(sample, metric) for sample in samples)
+        result[metric] = {
+            name: None if value is None else round(value * 1000, 3)
+            for name, value in (
+                ('p50', percentile(values, 50)),
+                ('p95', percentile(values, 95)),
+                ('p99', percentile(values, 99)),
+                ('max', values[-1] if values else None)
+            )
+        }
+    return result
+
+
+def to_csv(samples: Sequence[LatencySample]) -> str:
+    """Замеры в CSV (время в миллисекундах, started - от начала выборки)."""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(['seq', 'started_ms', 'method', 'endpoint', 'status', 'connect_ms', 'ttfb_ms', 'total_ms'])
+    origin = samples[0].started if samples else 0.0
+    for sample in samples:
+        writer.writerow([
+            sample.seq,
+            round((sample.started - origin) * 1000, 3),
+            sample.method,
+            sample.endpoint,
+            sample.status,
+            round(sample.connect * 1000, 3),
+            round(sample.ttfb * 1000, 3),
+            round(sample.total * 1000, 3)
+        ])
+    return buffer.getvalue()
+
+
+def to_svg(samples: Sequence[LatencySample], threshold_ms: Optional[float] = None,
+           width: int = 800, height: int = 320) -> str:
+    """Временной ряд задержек (connect, TTFB, total) в SVG; threshold_ms - линия порога."""
+    colors = {'connect': '#9e9e9e', 'ttfb': '#1e88e5', 'total': '#e53935'}
+    left, right, top, bottom = 60, 20, 20, 40
+    plot_width = width - left - right
+    plot_height = height - top - bottom
+    
+    values_ms = [max(sample.total, sample.ttfb, sample.connect) * 1000 for sample in samples]
+    y_max = max(values_ms + [threshold_ms or 0.0, 1.0]) * 1.1
+    count = max(len(samples) - 1, 1)
+    
+    def x(index):
+        return left + plot_width * index / count
+    
+    def y(value_ms):
+        return top + plot_height * (1 - value_ms / y_max)
+    
+    parts = [
+        f'<svg xmlns="http://www.w3.org/2000/svg" width="{width}" height="{height}" '
+        f'font-family="sans-serif" font-size="11">',
+        f'<rect x="{left}" y="{top}" width="{plot_width}" height="{plot_height}" fill="none" stroke="#ccc"/>'
+    ]
+    
+    # Шкала Y
+    for step in range(5):
+        value = y_max * step / 4
+        parts.append(f'<text x="{left - 6}" y="{y(value) + 4:.1f}" text-anchor="end">{value:.0f}</text>')
+        parts.append(
+            f'<line x1="{left}" x2="{left + plot_width}" y1="{y(value):.1f}" y2="{y(value):.1f}" stroke="#eee"/>'
+        )
+    parts.append(f'<text x="14" y="{top + plot_height / 2}" transform="rotate(-90 14 {top + plot_height / 2})" '
+                 f'text-anchor="middle">ms</text>')
+    parts.append(f'<text x="{left + plot_width / 2}" y="{height - 8}" text-anchor="middle">request #</text>')
+    
+    for metric in METRICS:
+        points = ' '.join(
+            f"{x(index):.1f},{y(getattr(sample, metric) * 1000):.1f}"
+            for index, sample in enumerate(samples)
+        )
+        parts.append(f'<polyline points="{points}" fill="none" stroke="{colors[metric]}" stroke-width="1.2"/>')
+    
+    if threshold_ms is not None:
+        parts.append(
+            f'<line x1="{left}" x2="{left + plot_width}" y1="{y(threshold_ms):.1f}" y2="{y(threshold_ms):.1f}" '
+            f'stroke="#43a047" stroke-dasharray="6,4"/>'
+        )
+    
+    # Легенда
+    for index, metric in enumerate(METRICS):
+        legend_x = left + 10 + index * 90
+        parts.append(f'<rect x="{legend_x}" y="{top + 6}" width="12" height="3" fill="{colors[metric]}"/>')
+        parts.append(f'<text x="{legend_x + 16}" y="{top + 11}">{metric}</text>')
+    
+    parts.append('</svg>')
+    return '\n'.join(parts)
+
+
+class RequestTimer:
+    """Замер одного запроса: начало, время соединения и получение заголовков."""
+    
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.connect = 0.0
+        self.headers_at: Optional[float] = None
+    
+    def add_connect(self, seconds: float):
+        self.connect += seconds
+    
+    def headers_received(self):
+        if self.headers_at is None:
+            self.headers_at = time.perf_counter()
+    
+    def record(self, collector: LatencyCollector, method: str, endpoint: str, status) -> LatencySample:
+        finished = time.perf_counter()
+        ttfb = (self.headers_at or finished) - self.started
+        return collector.record(method, endpoint, status, self.started, self.connect, ttfb, finished - self.started)
+
+
+# Общий сборщик задержек процесса
+latency_collector = LatencyCollector()
\ No newline at end of file
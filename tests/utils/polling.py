@@ -0,0 +1,226 @@
+import asyncio
+import inspect
+import logging
+import random
+import threading
+import time
+from typing import Any, Awaitable, Callable, Iterator, List, NamedTuple, Optional, Tuple, Type, Union
+
+logger = logging.getLogger(__name__)
+
+
+class Deadline:
+    """
+    Крайний срок ожидания по монотонным часам (не зависит от перевода
+    системного времени).
+    
+    Один срок можно передать нескольким ожиданиям подряд или условию
+    long-poll: оно запрашивает сервер с таймаутом deadline.remaining().
+    """
+    
+    def __init__(self, timeout: float):
+        self.timeout = timeout
+        self.started = time.monotonic()
+        self._end = self.started + timeout
+    
+    def remaining(self) -> float:
+        return max(self._end - time.monotonic(), 0.0)
+    
+    def elapsed(self) -> float:
+        return time.monotonic() - self.started
+    
+    @property
+    def expired(self) -> bool:
+        return time.monotonic() >= self._end
+
+
+class Backoff:
+    """
+    Паузы между проверками: экспоненциальный рост от initial до maximum
+    с множителем factor и случайным разбросом +-jitter (доля паузы),
+    чтобы параллельные ожидания не опрашивали сервис синхронно.
+    """
+    
+    def __init__(
+        self,
+        initial: float = 0.05,
+        factor: float = 2.0,
+        maximum: float = 1.0,
+        jitter: float = 0.1,
+        rng: Optional[random.Random] = None
+    ):
+        self.initial = initial
+        self.factor = factor
+        self.maximum = maximum
+        self.jitter = jitter
+        self.rng = rng or random.Random()
+    
+    def delays(self) -> Iterator[float]:
+        delay = self.initial
+        while True:
+            yield delay * (1 + self.jitter * (2 * self.rng.random() - 1))
+            delay = min(delay * self.factor, self.maximum)
+
+
+class WaitResult(NamedTuple):
+    """Итог ожидания: выполнено ли условие, его последнее значение, число проверок и время (с)."""
+    name: str
+    ok: bool
+    value: Any
+    attempts: int
+    elapsed: float
+
+
+class WaitLog:
+    """Журнал ожиданий процесса: сколько длилось каждое и сколько проверок потребовалось."""
+    
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._results: List[WaitResult] = []
+    
+    def add(self, result: WaitResult):
+        with self._lock:
+            self._results.append(result)
+    
+    def results(self) -> List[WaitResult]:
+        with self._lock:
+            return list(self._results)
+    
+    def total_seconds(self) -> float:
+        return sum(result.elapsed for result in self.results())
+    
+    def clear(self):
+        with self._lock:
+            self._results = []
+
+
+# Общий журнал ожиданий
+wait_log = WaitLog()
+
+
+class WaitTimeout(AssertionError):
+    """Условие не выполнилось до крайнего срока."""
+    
+    def __init__(self, result: WaitResult, last_error: Optional[BaseException] = None):
+        message = f"Condition '{result.name}' not met in {result.elapsed:.2f}s ({result.attempts} attempts)"
+        if last_error is not None:
+            message += f", last error: {last_error!r}"
+        super().__init__(message)
+        self.result = result
+        self.last_error = last_error
+
+
+def event_wait(event: threading.Event) -> Callable[[float], None]:
+    """
+    Функция паузы для poll: ожидание прерывается событием (например,
+    его выставляет обработчик уведомления), после чего событие сбрасывается.
+    """
+    def wait(delay: float):
+        if event.wait(delay):
+            event.clear()
+    return wait
+
+
+def async_event_wait(event: asyncio.Event) -> Callable[[float], Awaitable[None]]:
+    """Функция паузы для poll_async, прерываемая asyncio.Event."""
+    async def wait(delay: float):
+        try:
+            await asyncio.wait_for(event.wait(), delay)
+            event.clear()
+        except asyncio.TimeoutError:
+            pass
+    return wait
+
+
+def _finish(name: str, ok: bool, value: Any, attempts: int, deadline: Deadline) -> WaitResult:
+    result = WaitResult(name, ok, value, attempts, deadline.elapsed())
+    wait_log.add(result)
+    status = "✅" if ok else "⏰"
+    logger.debug(f"{status} Wait '{name}': {result.elapsed:.3f}s, {attempts} attempts")
+    return result
+
+
+def poll(
+    condition: Callable[[], Any],
+    timeout: float = 30,
+    name: str = 'condition',
+    backoff: Optional[Backoff] = None,
+    deadline: Optional[Deadline] = None,
+    wait: Callable[[float], Any] = time.sleep,
+    ignore: Tuple[Type[BaseException], ...] = ()
+) -> Tuple[WaitResult, Optional[BaseException]]:
+    """
+    Проверка condition до истинного результата или крайнего срока.
+    
+    Пауза между проверками растет по backoff и не выходит за срок;
+    wait заменяет time.sleep (например, event_wait). Исключения из ignore
+    считаются невыполненным условием (сервис еще не отвечает).
+    Возвращает итог и последнее пойманное исключение.
+    """
+    deadline = deadline or Deadline(timeout)
+    delays = (backoff or Backoff()).delays()
+    attempts = 0
+    value, last_error = None, None
+    
+    while True:
+        attempts += 1
+        try:
+            value = condition()
+        except ignore as e:
+            value, last_error = None, e
+        if value:
+            return _finish(name, True, value, attempts, deadline), last_error
+        if deadline.expired:
+            return _finish(name, False, value, attempts, deadline), last_error
+        wait(min(next(delays), deadline.remaining()))
+
+
+async def poll_async(
+    condition: Callable[[], Union[Any, Awaitable[Any]]],
+    timeout: float = 30,
+    name: str = 'condition',
+    backoff: Optional[Backoff] = None,
+    deadline: Optional[Deadline] = None,
+    wait: Callable[[float], Awaitable[Any]] = asyncio.sleep,
+    ignore: Tuple[Type[BaseException], ...] = ()
+) -> Tuple[WaitResult, Optional[BaseException]]:
+    """Асинхронный вариант poll: condition может быть корутинной функцией."""
+    deadline = deadline or Deadline(timeout)
+    delays = (backoff or Backoff()).delays()
+    attempts = 0
+    value, last_error = None, None
+    
+    while True:
+        attempts += 1
+        try:
+            value = condition()
+            if inspect.isawaitable(value):
+                value = await value
+        except ignore as e:
+            value, last_error = None, e
+        if value:
+            return _finish(name, True, value, attempts, deadline), last_error
+        if deadline.expired:
+            return _finish(name, False, value, attempts, deadline), last_error
+        await wait(min(next(delays), deadline.remaining()))
+
+
+def wait_until(condition: Callable[[], Any], timeout: float = 30, name: str = 'condition', **kwargs) -> Any:
+    """Ожидание условия (параметры - как у poll); значение условия или WaitTimeout."""
+    result, last_error = poll(condition, timeout, name, **kwargs)
+    if not result.ok:
+        raise WaitTimeout(result, last_error)
+    return result.value
+
+
+async def wait_until_async(
+    condition: Callable[[], Union[Any, Awaitable[Any]]],
+    timeout: float = 30,
+    name: str = 'condition',
+    **kwargs
+) -> Any:
+    """Асинхронный вариант wait_until."""
+    result, last_error = await poll_async(condition, timeout, name, **kwargs)
+    if not result.ok:
+        raise WaitTimeout(result, last_error)
+    return result.value
\ No newline at end of file
@@ -0,0 +1,59 @@
+import heapq
+import json
+import os
+import statistics
+from typing import Dict, Iterable, List, Optional
+
+
+def worker_id() -> Optional[str]:
+    """Имя воркера pytest-xdist (gw0, gw1, ...) или None без xdist."""
+    return os.getenv('PYTEST_XDIST_WORKER')
+
+
+class DurationStore:
+    """
+    Измеренные длительности тестов (setup + call + teardown, секунды)
+    в JSON файле вида {nodeid: seconds}.
+    
+    Файл обновляется прогоном с --store-durations и используется
+    планировщиком --duration-schedule; его можно хранить в репозитории
+    или кэше CI.
+    """
+    
+    def __init__(self, path: str):
+        self.path = path
+    
+    def load(self) -> Dict[str, float]:
+        if not os.path.exists(self.path):
+            return {}
+        with open(self.path, encoding='utf-8') as f:
+            return json.load(f)
+    
+    def save(self, durations: Dict[str, float]):
+        """Обновление сохраненных длительностей (тесты, не попавшие в прогон, сохраняются)."""
+        merged = self.load()
+        merged.update({nodeid: round(seconds, 4) for nodeid, seconds in durations.items()})
+        with open(self.path, 'w', encoding='utf-8') as f:
+            json.dump(dict(sorted(merged.items())), f, indent=2)
+
+
+def plan_groups(nodeids: Iterable[str], durations: Dict[str, float], groups: int) -> Dict[str, int]:
+    """
+    Распределение тестов по groups группам с близкой суммарной длительностью
+    (жадный алгоритм LPT: тесты по убыванию длительности, каждый - в наименее
+    загруженную группу).
+    
+    Тесты без замера получают медианную длительность известных тестов.
+    Результат детерминирован: все воркеры xdist получают одинаковый план.
+    """
+    nodeids = sorted(nodeids)
+    default = statistics.median(durations.values()) if durations else 1.0
+    ordered = sorted(nodeids, key=lambda nodeid: -durations.get(nodeid, default))
+    
+    loads: List[tuple] = [(0.0, index) for index in range(max(groups, 1))]
+    plan = {}
+    for nodeid in ordered:
+        load, index = heapq.heappop(loads)
+        plan[nodeid] = index
+        heapq.heappush(loads, (load + durations.get(nodeid, default), index))
+    return plan
\ No newline at end of file
@@ -0,0 +1,109 @@
+import json
+import threading
+from typing import Callable, Dict, Optional, Tuple
+from jsonschema.exceptions import best_match
+from jsonschema.validators import validator_for
+from config import config
+
+# Бэкенды проверки схем (задается TEST_SCHEMA_BACKEND)
+SCHEMA_BACKENDS = ('jsonschema', 'fastjsonschema')
+
+
+class CompiledSchema:
+    """
+    Подготовленная проверка одной схемы.
+    
+    Метасхема проверяется и валидатор jsonschema создается один раз.
+    С бэкендом fastjsonschema схема дополнительно компилируется в функцию
+    Python: она только отвечает, валиден ли документ, а описание ошибки
+    строит валидатор jsonschema - сообщения совпадают с обычным режимом.
+    """
+    
+    def __init__(self, schema: Dict, backend: str = 'jsonschema'):
+        validator_class = validator_for(schema)
+        validator_class.check_schema(schema)
+        self.schema = schema
+        self.validator = validator_class(schema)
+        self.fast_check: Optional[Callable] = None
+        if backend == 'fastjsonschema':
+            self.fast_check = self._compile_fast(schema)
+    
+    @staticmethod
+    def _compile_fast(schema: Dict) -> Callable:
+        try:
+            import fastjsonschema
+        except ImportError as e:
+            raise ImportError(
+                "TEST_SCHEMA_BACKEND=fastjsonschema requires the fastjsonschema package"
+            ) from e
+        
+        # Форматы не проверяются, как и в jsonschema без format_checker
+        validate = fastjsonschema.compile(schema, use_formats=False)
+        
+        def check(instance) -> bool:
+            try:
+                validate(instance)
+                return True
+            except fastjsonschema.JsonSchemaException:
+                return False
+        
+        return check
+    
+    def error(self, instance) -> Optional[str]:
+        """Сообщение о наиболее релевантной ошибке или None для валидного документа."""
+        if self.fast_check is not None and self.fast_check(instance):
+            return None
+        error = best_match(self.validator.iter_errors(instance))
+        return error.message if error is not None else None
+
+
+class SchemaValidatorCache:
+    """
+    Кэш подготовленных проверок схем.
+    
+    Ключ - сама схема: сначала по id объекта (схемы из config.response_schemas
+    передаются одними и теми же словарями), затем по ее каноническому JSON
+    (одинаковые схемы, созданные в разных местах). Схемы из schemas
+    подготавливаются сразу. Схемы не должны изменяться после первой проверки.
+    """
+    
+    # Предел записей по id: защищает от роста кэша при схемах-литералах в тестах
+    max_identities = 256
+    
+    def __init__(self, backend: str = 'jsonschema', schemas: Optional[Dict[str, Dict]] = None):
+        if backend not in SCHEMA_BACKENDS:
+            raise ValueError(
+                f"Unknown schema backend: {backend} (expected one of {', '.join(SCHEMA_BACKENDS)})"
+            )
+        self.backend = backend
+        self._by_identity: Dict[int, Tuple[Dict, CompiledSchema]] = {}
+        self._by_content: Dict[str, CompiledSchema] = {}
+        self._lock = threading.Lock()
+        for schema in (schemas or {}).values():
+            self.get(schema)
+    
+    def get(self, schema: Dict) -> CompiledSchema:
+        cached = self._by_identity.get(id(schema))
+        if cached is not None and cached[0] is schema:
+            return cached[1]
+        
+        key = json.dumps(schema, sort_keys=True)
+        with self._lock:
+            compiled = self._by_content.get(key)
+            if compiled is None:
+                compiled = self._by_content[key] = CompiledSchema(schema, self.backend)
+            if len(self._by_identity) >= self.max_identities:
+                self._by_identity.clear()
+            # Ссылка на схему в записи не дает переиспользовать ее id другим объектом
+            self._by_identity[id(schema)] = (schema, compiled)
+        return compiled
+    
+    def validate(self, instance, schema: Dict):
+        """Проверка документа; AssertionError с описанием ошибки, как у jsonschema.validate."""
+        message = self.get(schema).error(instance)
+        if message is not None:
+            raise AssertionError(f"JSON schema validation failed: {message}")
+
+
+# Общий кэш: схемы ответов из конфигурации подготавливаются при импорте
+schema_validators = SchemaValidatorCache(config.test.schema_backend, config.response_schemas)
\ No newline at end of file
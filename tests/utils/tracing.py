@@ -0,0 +1,210 @@
+import json
+import os
+import threading
+import uuid
+from typing import Dict, List, Mapping, NamedTuple, Optional, Tuple
+from utils.latency import LatencySample, latency_collector
+
+# Заголовок идентификатора запроса (приложение возвращает его в ответе и пишет в трассу)
+REQUEST_ID_HEADER = 'X-Request-ID'
+
+# Заголовок со спанами обработки запроса на сервере
+SERVER_TIMING_HEADER = 'Server-Timing'
+
+# Ширина полосы водопада (символов)
+WATERFALL_WIDTH = 48
+
+
+class Span(NamedTuple):
+    """Спан сервера: начало от начала обработки запроса (None, если неизвестно) и длительность (мс)."""
+    name: str
+    start_ms: Optional[float]
+    duration_ms: float
+
+
+class RequestTrace(NamedTuple):
+    """Данные для водопада одного запроса: идентификатор, замер клиента и Server-Timing ответа."""
+    request_id: str
+    sample: Optional[LatencySample]
+    server_timing: str
+
+
+def new_request_id() -> str:
+    return uuid.uuid4().hex
+
+
+def with_request_id(headers: Optional[Mapping[str, str]]) -> Dict[str, str]:
+    """Заголовки запроса с новым X-Request-ID (переданный явно не заменяется)."""
+    headers = dict(headers or {})
+    if not any(name.lower() == REQUEST_ID_HEADER.lower() for name in headers):
+        headers[REQUEST_ID_HEADER] = new_request_id()
+    return headers
+
+
+def parse_server_timing(value: str) -> List[Span]:
+    """
+    Разбор Server-Timing: "validate;dur=0.42;start=0.07, total;dur=1.9".
+    
+    Параметр start - нестандартный (его пишет app/middleware/tracing.py);
+    метрики без dur или с нечисловыми значениями пропускаются.
+    """
+    spans = []
+    for entry in (value or '').split(','):
+        name, *params = [part.strip() for part in entry.split(';')]
+        values = {}
+        for param in params:
+            key, _, raw = param.partition('=')
+            values[key.strip().lower()] = raw.strip().strip('"')
+        if not name or 'dur' not in values:
+            continue
+        try:
+            start = float(values['start']) if 'start' in values else None
+            spans.append(Span(name, start, float(values['dur'])))
+        except ValueError:
+            continue
+    return spans
+
+
+class TraceSinkIndex:
+    """
+    Индекс файла TRACE_SINK_FILE приложения (JSON Lines): request_id -> позиция строки.
+    
+    Приложение только дописывает файл, поэтому при каждом поиске читаются
+    лишь строки, появившиеся после прошлого чтения (offset), а найденная
+    запись перечитывается по своей позиции. Недописанная последняя строка
+    откладывается до следующего поиска; файл, ставший короче или замененный
+    другим, индексируется заново.
+    """
+    
+    def __init__(self, path: str):
+        self.path = path
+        self.offset = 0
+        self._inode: Optional[int] = None
+        self._positions: Dict[str, int] = {}
+        self._lock = threading.Lock()
+    
+    def get(self, request_id: str) -> Optional[Dict]:
+        """Последняя запись с этим ID (None, если ее нет или файла нет)."""
+        with self._lock:
+            try:
+                with open(self.path, 'rb') as file:
+                    self._update(file)
+                    position = self._positions.get(request_id)
+                    if position is None:
+                        return None
+                    file.seek(position)
+                    return json.loads(file.readline())
+            except FileNotFoundError:
+                return None
+    
+    def _update(self, file):
+        stat = os.fstat(file.fileno())
+        if stat.st_ino != self._inode or stat.st_size < self.offset:
+            self._inode = stat.st_ino
+            self.offset = 0
+            self._positions.clear()
+        
+        file.seek(self.offset)
+        for line in file:
+            if not line.endswith(b'\n'):
+                break
+            try:
+                record = json.loads(line)
+            except ValueError:
+                record = None
+            if isinstance(record, dict) and 'request_id' in record:
+                self._positions[record['request_id']] = self.offset
+            self.offset += len(line)
+
+
+# Индексы файлов трасс по пути (общие для потоков процесса)
+_sink_indexes: Dict[str, TraceSinkIndex] = {}
+_sink_indexes_lock = threading.Lock()
+
+
+def read_trace_sink(path: str, request_id: str) -> Optional[Dict]:
+    """Трасса запроса из файла TRACE_SINK_FILE приложения (последняя запись с этим ID)."""
+    if not path:
+        return None
+    path = os.path.abspath(path)
+    with _sink_indexes_lock:
+        index = _sink_indexes.get(path)
+        if index is None:
+            index = _sink_indexes[path] = TraceSinkIndex(path)
+    return index.get(request_id)
+
+
+def request_trace(response) -> Optional[RequestTrace]:
+    """Трасса только что выполненного запроса потока (ответ requests или httpx)."""
+    request_id = response.headers.get(REQUEST_ID_HEADER)
+    if not request_id:
+        return None
+    return RequestTrace(request_id, latency_collector.last_sample(), response.headers.get(SERVER_TIMING_HEADER, ''))
+
+
+def server_spans(trace: RequestTrace, sink_file: str = '') -> List[Span]:
+    """Спаны сервера: из Server-Timing, а если заголовка нет - из локального файла трасс."""
+    if trace.server_timing:
+        return parse_server_timing(trace.server_timing)
+    record = read_trace_sink(sink_file, trace.request_id)
+    if record is None:
+        return []
+    spans = [Span(span['name'], span['start_ms'], span['duration_ms']) for span in record['spans']]
+    spans.append(Span('total', None, record['duration_ms']))
+    return spans
+
+
+def waterfall_rows(trace: RequestTrace, spans: List[Span]) -> List[Tuple[str, float, float]]:
+    """
+    Строки водопада: (название, начало, длительность) в мс от начала запроса клиентом.
+    
+    Часы клиента и сервера не сравниваются: обработка на сервере (total)
+    помещается внутрь ожидания первого байта после соединения, а остаток
+    (сеть и очереди) делится поровну до и после нее.
+    """
+    sample = trace.sample
+    server_total = next((span.duration_ms for span in spans if span.name == 'total'), None)
+    rows = []
+    offset = 0.0
+    if sample is not None:
+        connect, ttfb, total = sample.connect * 1000, sample.ttfb * 1000, sample.total * 1000
+        if connect > 0:
+            rows.append(('connect', 0.0, connect))
+        if server_total is not None:
+            offset = connect + max(ttfb - connect - server_total, 0.0) / 2
+    if server_total is not None:
+        rows.append(('server', offset, server_total))
+    for span in spans:
+        if span.name != 'total':
+            rows.append((f"  {span.name}", offset + (span.start_ms or 0.0), span.duration_ms))
+    if sample is not None:
+        rows.append(('ttfb', 0.0, ttfb))
+        rows.append(('body', ttfb, total - ttfb))
+        rows.append(('total', 0.0, total))
+    return rows
+
+
+def _bar(start: float, duration: float, scale: float) -> str:
+    begin = min(int(start * scale), WATERFALL_WIDTH - 1)
+    length = min(max(int(round(duration * scale)), 1), WATERFALL_WIDTH - begin)
+    return ' ' * begin + '█' * length + ' ' * (WATERFALL_WIDTH - begin - length)
+
+
+def format_waterfall(trace: RequestTrace, spans: List[Span]) -> str:
+    """Текстовый водопад запроса (вложение Allure)."""
+    rows = waterfall_rows(trace, spans)
+    sample = trace.sample
+    title = f"{REQUEST_ID_HEADER}: {trace.request_id}"
+    if sample is not None:
+        title = f"{sample.method} {sample.endpoint} {sample.status}  {title}"
+    if not rows:
+        return title
+    
+    end = max(start + duration for _, start, duration in rows)
+    scale = WATERFALL_WIDTH / end if end > 0 else 0.0
+    lines = [title, f"{'':<14}{'start ms':>10}{'dur ms':>10}"]
+    for name, start, duration in rows:
+        lines.append(f"{name:<14}{start:>10.3f}{duration:>10.3f}  |{_bar(start, duration, scale)}|")
+    if not spans:
+        lines.append("(спаны сервера недоступны: нет Server-Timing и записи в файле трасс)")
+    return '\n'.join(lines)
\ No newline at end of file